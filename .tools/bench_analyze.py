@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+analyze() of one large package: per rule an alias and two clauses, with
+conditions that mostly have nothing to share or simplify (a lux threshold
+repeats every 50 rules).
+
+  intern  : ExprTable.intern() of every clause condition of the IR
+  analyze : end-to-end analyze() with a fresh CompileContext
+
+Reports wall time (best of N) for each.
+
+    python .tools/bench_analyze.py [--rules 4000] [--repeat 5]
+"""
+
+import argparse
+import copy
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from hassl.cli import parse_hassl  # noqa: E402
+from hassl.context import CompileContext  # noqa: E402
+from hassl.semantics.analyzer import analyze  # noqa: E402
+from hassl.semantics.exprs import ExprTable  # noqa: E402
+
+def corpus(rules):
+    lines = ["package bench.analyze"]
+    for i in range(rules):
+        lines += [
+            f"alias l{i} = light.l{i}",
+            f"rule r{i}:",
+            f"  if (l{i} == off && sensor.lux_{i % 50} < 50) then l{i} = on",
+            f"  if (l{i} == on || binary_sensor.m{i} == off) not_by this then l{i} = off for 5m",
+        ]
+    return "\n".join(lines) + "\n"
+
+def best_of(fn, repeat, setup=lambda: None):
+    best = float("inf")
+    for _ in range(repeat):
+        arg = setup()
+        t0 = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rules", type=int, default=4000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    prog = parse_hassl(corpus(args.rules))
+    conds = [c["condition"] for r in analyze(prog, CompileContext()).rules for c in r.clauses]
+
+    def intern(trees):
+        table = ExprTable()
+        for tree in trees:
+            table.intern(tree)
+
+    print(f"{args.rules} rules, {len(conds)} conditions")
+    print(f"  {'intern':8s} {best_of(intern, args.repeat, lambda: copy.deepcopy(conds)) * 1000:9.2f} ms")
+    print(f"  {'analyze':8s} {best_of(lambda _: analyze(prog, CompileContext()), args.repeat) * 1000:9.2f} ms")
+
+if __name__ == "__main__":
+    main()
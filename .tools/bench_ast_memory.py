@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Memory held by the parsed AST of a large synthetic corpus.
+
+The corpus (default 50k top-level statements) mixes aliases, rules and
+schedules over a shared pool of entity ids, the way real packages refer to
+the same lights and sensors from many rules. The parsed Programs are
+measured as built by the compiler -- slotted nodes, interned identifiers --
+and again after converting them to an equivalent of the old layout: plain
+(__dict__) dataclasses and one str object per occurrence.
+
+    python .tools/bench_ast_memory.py [--statements 50000] [--entities 500]
+"""
+
+import argparse
+import dataclasses
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from hassl.ast import nodes  # noqa: E402
+from hassl.cli import parse_hassl  # noqa: E402
+from hassl.parser.loader import get_parser  # noqa: E402
+
+def corpus(statements, entities, files=50):
+    per_file = statements // files
+    out = []
+    for f in range(files):
+        lines = [f"package bench.p{f}"]
+        for i in range(per_file - 1):
+            e = (f * per_file + i) % entities
+            kind = i % 4
+            if kind == 0:
+                lines.append(f"alias l{i} = light.room_{e}_ceiling")
+            elif kind == 1:
+                lines.append(f"schedule s{i}:\n  on weekdays 07:00-08:30;")
+            else:
+                lines.append(
+                    f"rule r{i}:\n"
+                    f"  if (binary_sensor.motion_{e} == on && light.room_{e}_ceiling == off)\n"
+                    f"  then l{i - kind} = on for 5m"
+                )
+        out.append("\n".join(lines) + "\n")
+    return out
+
+# ---- the old layout: unslotted dataclasses, no shared strings ----
+
+_PLAIN = {}
+
+def _plain_class(cls):
+    if cls not in _PLAIN:
+        fields = [(f.name, f.type, f) for f in dataclasses.fields(cls)]
+        _PLAIN[cls] = dataclasses.make_dataclass(cls.__name__ + "Dict", fields)
+    return _PLAIN[cls]
+
+def _unshare(x):
+    if isinstance(x, str):
+        return (x + ".")[:-1]  # a fresh copy of the same text
+    if isinstance(x, list):
+        return [_unshare(v) for v in x]
+    if isinstance(x, tuple):
+        return tuple(_unshare(v) for v in x)
+    if isinstance(x, dict):
+        return {_unshare(k): _unshare(v) for k, v in x.items()}
+    if dataclasses.is_dataclass(x) and not isinstance(x, type):
+        cls = _plain_class(type(x))
+        return cls(**{f.name: _unshare(getattr(x, f.name)) for f in dataclasses.fields(x)})
+    return x
+
+def held(build):
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    obj = build()
+    secs = time.perf_counter() - t0
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size, secs
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--statements", type=int, default=50000)
+    ap.add_argument("--entities", type=int, default=500)
+    args = ap.parse_args()
+
+    get_parser(inline=True)
+    texts = corpus(args.statements, args.entities)
+    programs, compact, secs = held(lambda: [parse_hassl(t) for t in texts])
+    count = sum(len(p.statements) for p in programs)
+
+    assert not hasattr(programs[0].statements[1], "__dict__"), "nodes are not slotted"
+    legacy, loose, _ = held(lambda: [_unshare(p) for p in programs])
+    assert dataclasses.asdict(legacy[0]) == dataclasses.asdict(programs[0])
+
+    print(f"== {count} statements in {len(texts)} files (parsed in {secs:.2f}s) ==")
+    print(f"  dict nodes, unshared strings : {loose / 2**20:7.1f} MiB")
+    print(f"  slotted nodes, interned ids  : {compact / 2**20:7.1f} MiB")
+    print(f"  reduction                    : {100 * (1 - compact / loose):.0f}%")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Compare the two parse modes on large synthetic sources:
+
+  tree   : parse to a full parse tree, then transform it (parse_hassl(inline=False))
+  inline : HasslTransformer applied by the LALR parser while parsing; the
+           parser is called directly, so alias registries do not take the
+           line-scanner fast path of parse_hassl()
+
+Reports wall time (best of N) and peak traced memory for each mode.
+
+    python .tools/bench_inline_transform.py [--aliases 20000] [--rules 4000] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from hassl.cli import parse_hassl  # noqa: E402
+from hassl.parser.loader import get_parser  # noqa: E402
+
+def alias_source(n):
+    lines = ["package bench.aliases"]
+    lines += [f"alias light_{i} = light.room_{i}_ceiling" for i in range(n)]
+    return "\n".join(lines) + "\n"
+
+def rule_source(n):
+    lines = ["package bench.rules"]
+    for i in range(n):
+        lines.append(
+            f"alias m{i} = binary_sensor.motion_{i}\n"
+            f"alias l{i} = light.room_{i}\n"
+            f"rule r{i}:\n"
+            f"  if (m{i} == on && sun.sun != above_horizon) not_by this\n"
+            f"  then l{i} = on for 5m; wait (m{i} == off for 2m) l{i} = off\n"
+        )
+    return "\n".join(lines)
+
+MODES = {
+    "tree": lambda text: parse_hassl(text, inline=False),
+    "inline": lambda text: get_parser(inline=True).parse(text),
+}
+
+def measure(text, parse, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        parse(text)
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    parse(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--aliases", type=int, default=20000)
+    ap.add_argument("--rules", type=int, default=4000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    # build both parsers up front so only parsing is timed
+    get_parser()
+    get_parser(inline=True)
+
+    for label, text in (("aliases", alias_source(args.aliases)),
+                        ("rules", rule_source(args.rules))):
+        if MODES["tree"](text).to_dict() != MODES["inline"](text).to_dict():
+            raise SystemExit(f"[bench] {label}: inline and tree modes disagree")
+        print(f"== {label}: {len(text) / 1e6:.1f} MB ==")
+        results = {mode: measure(text, parse, args.repeat) for mode, parse in MODES.items()}
+        for mode, (secs, peak) in results.items():
+            print(f"  {mode:6s} {secs:7.3f}s  peak {peak / 2**20:7.1f} MiB")
+        (t_secs, t_peak), (i_secs, i_peak) = results["tree"], results["inline"]
+        print(f"  inline: {100 * (1 - i_secs / t_secs):.0f}% less time, "
+              f"{100 * (1 - i_peak / t_peak):.0f}% less peak memory")
+
+if __name__ == "__main__":
+    sys.exit(main())
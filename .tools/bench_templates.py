@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Template instantiation on a large synthetic corpus: one motion-light
+template used once per room with different arguments.
+
+  legacy : deep-copy + asdict + deep_subst of the whole body per use
+  plan   : SubstitutionPlan compiled once, clone + slot writes per use
+  analyze: end-to-end analyze() of the corpus (plans + memoized expansions)
+
+Reports wall time (best of N) for each.
+
+    python .tools/bench_templates.py [--rooms 300] [--repeat 5]
+"""
+
+import argparse
+import copy
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from hassl.ast.nodes import TemplateDecl, UseTemplate  # noqa: E402
+from hassl.cli import parse_hassl  # noqa: E402
+from hassl.context import CompileContext  # noqa: E402
+from hassl.semantics.analyzer import analyze  # noqa: E402
+from hassl.semantics.templates import SubstitutionPlan, bind_args, deep_subst  # noqa: E402
+
+def corpus(rooms):
+    lines = [
+        "package bench.templates",
+        "template rule motion_light(name, motion, lux, light, fan, override):",
+        "  if (motion == on && lux < 50 && override == off) then light = on; fan = on",
+        "  if (motion == off && override == off) then wait (motion == off for 5m) light = off",
+        "  if (lux > 200) then light = off; fan = off",
+    ]
+    for i in range(rooms):
+        lines.append(
+            f"use template motion_light(name=room_{i}, motion=binary_sensor.motion_{i}, "
+            f"lux=sensor.lux_{i}, light=light.room_{i}, fan=fan.room_{i}, "
+            f"override=input_boolean.override_{i})"
+        )
+    return "\n".join(lines) + "\n"
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rooms", type=int, default=300)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    prog = parse_hassl(corpus(args.rooms))
+    t = next(s for s in prog.statements if isinstance(s, TemplateDecl))
+    argmaps = [bind_args(t, u.args) for u in prog.statements if isinstance(u, UseTemplate)]
+
+    def legacy():
+        for argmap in argmaps:
+            deep_subst(asdict(copy.deepcopy(t.body)), argmap)
+
+    def plan():
+        p = SubstitutionPlan(t)
+        for argmap in argmaps:
+            p.apply(argmap)
+
+    def end_to_end():
+        analyze(prog, CompileContext())
+
+    print(f"{len(argmaps)} uses")
+    for label, fn in (("legacy", legacy), ("plan", plan), ("analyze", end_to_end)):
+        print(f"  {label:8s} {best_of(fn, args.repeat) * 1000:9.2f} ms")
+
+if __name__ == "__main__":
+    main()
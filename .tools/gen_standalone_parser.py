@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Regenerate hassl/parser/hassl_standalone.py from hassl/parser/hassl.lark.
+
+Uses Lark's standalone generator, so the shipped module carries the
+pre-built LALR tables and the default parse path needs neither the grammar
+file nor the lark package. Run this after every grammar change; until you
+do, hasslc notices the stale hash and falls back to the dynamic parser.
+
+    python .tools/gen_standalone_parser.py
+"""
+
+import hashlib
+import io
+import sys
+from pathlib import Path
+
+from lark.tools.standalone import gen_standalone
+from lark import Lark
+
+ROOT = Path(__file__).resolve().parents[1]
+GRAMMAR = ROOT / "hassl" / "parser" / "hassl.lark"
+OUTPUT = ROOT / "hassl" / "parser" / "hassl_standalone.py"
+
+def main():
+    grammar = GRAMMAR.read_text(encoding="utf-8")
+    sha = hashlib.sha256(grammar.encode("utf-8")).hexdigest()
+    # Must match the options hassl.parser.loader uses for the dynamic parser.
+    parser = Lark(grammar, start="start", parser="lalr", maybe_placeholders=False)
+
+    buf = io.StringIO()
+    gen_standalone(parser, out=buf)
+    OUTPUT.write_text(
+        "# Generated by .tools/gen_standalone_parser.py from hassl.lark -- do not edit.\n"
+        f"GRAMMAR_SHA256 = {sha!r}\n"
+        # lark's template uses typing.cast (Transformer_NonRecursive) without importing it
+        "from typing import cast\n"
+        + buf.getvalue(),
+        encoding="utf-8",
+    )
+    print(f"[ok] Wrote {OUTPUT.relative_to(ROOT)} (grammar {sha[:12]})")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,26 +1,26 @@
 from dataclasses import dataclass, asdict, field
 from typing import List, Any, Dict, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Alias:
     name: str
     entity: str
     private: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class Sync:
     kind: str
     members: List[str]
     name: str
     invert: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class IfClause:
     condition: Dict[str, Any]
     actions: List[Dict[str, Any]]
 
 # ---- NEW: Holiday sets & structured schedule windows ----
-@dataclass
+@dataclass(slots=True)
 class HolidaySet:
     id: str
     country: str
@@ -30,7 +30,7 @@ class HolidaySet:
     workdays: List[str] = field(default_factory=lambda: ["mon","tue","wed","thu","fri"])
     excludes: List[str] = field(default_factory=lambda: ["sat","sun","holiday"])
 
-@dataclass
+@dataclass(slots=True)
 class PeriodSelector:
     # kind = 'months' | 'dates' | 'range'
     kind: str
@@ -40,7 +40,7 @@ class PeriodSelector:
     #  - range:  {"start":"YYYY-MM-DD","end":"YYYY-MM-DD"}
     data: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleWindow:
     start: str                    # "HH:MM"
     end: str                      # "HH:MM"
@@ -49,7 +49,7 @@ class ScheduleWindow:
     holiday_ref: Optional[str] = None   # id from HolidaySet (for 'except'/'only')
     holiday_mode: Optional[str] = None  # "except" | "only" | None
 
-@dataclass
+@dataclass(slots=True)
 class Schedule:
     name: str
     # raw clauses as produced by the transformer (legacy form)
@@ -58,7 +58,7 @@ class Schedule:
     windows: List[ScheduleWindow] = field(default_factory=list)
     private: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class TemplateDecl:
     kind: str            # "rule" | "sync" | "schedule"
     name: str
@@ -66,19 +66,19 @@ class TemplateDecl:
     body: Any = None  # Rule | Sync | Schedule body shape
     private: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class UseTemplate:
     name: str            # template name being referenced
     args: list = field(default_factory=list)  # ["pos1", {"name":"kw","value":...}, ...] 
     as_name: Optional[str] = None
     
-@dataclass
+@dataclass(slots=True)
 class Rule:
     name: str
     # allow schedule dicts
     clauses: List[Any]
 
-@dataclass
+@dataclass(slots=True)
 class Program:
     statements: List[object]
     package: Optional[str] = None
@@ -1,51 +1,88 @@
 import argparse
-import os, json, glob
+import os, sys, time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Tuple, List
-from .parser.loader import load_grammar_text
-from .parser.transform import HasslTransformer
+from typing import Dict, Tuple, List, Iterable, Optional
+from .parser.loader import get_parser
+from .parser.cache import AstCache, DEFAULT_CACHE_DIR
+from .parser.transform import TreeTransformer
+from .parser.fastpath import try_fast_parse
+from .parser.sources import SourceIndex, BUNDLE_SUFFIX
+from .parser.headers import parse_header
 from .ast.nodes import Program, Alias, Schedule, TemplateDecl
-from lark import Lark
-from .semantics import analyzer as sem_analyzer
 from .semantics.analyzer import analyze
+from .context import CompileContext
+from .semantics.fingerprint import BuildState, package_fingerprints
+from .semantics.shake import describe, dropped, package_graph, reachable, shake
+from .semantics.modgraph import ModuleGraph, _normalize_module, _module_to_path  # noqa: F401 (re-exported)
 from .codegen.package import emit_package
 from .codegen import generate as codegen_generate
+from .codegen.json_emit import dump_json, FORMATS as JSON_FORMATS
+from .codegen.bundle import bundle_path, make_bundle, read_bundle, write_bundle
 
-def parse_hassl(text: str) -> Program:
-    grammar = load_grammar_text()
-    parser = Lark(grammar, start="start", parser="lalr", maybe_placeholders=False)
-    tree = parser.parse(text)
-    program = HasslTransformer().transform(tree)
+def parse_hassl(text: str, inline: bool = True) -> Program:
+    """
+    Parse HASSL source into a Program.
+    By default alias registries take the line-scanner fast path and anything
+    else is transformed inside the LALR parser (no intermediate parse tree);
+    inline=False always builds the full tree first and transforms it
+    afterwards, which is handy when debugging the grammar.
+    """
+    if inline:
+        prog = try_fast_parse(text)
+        if prog is not None:
+            return prog
+        return get_parser(inline=True).parse(text)
+    tree = get_parser().parse(text)
+    program = TreeTransformer().transform(tree)
     return program
 
+def parse_cached(text: str, cache: Optional[AstCache] = None, inline: bool = True) -> Program:
+    """parse_hassl() behind the AST cache; unchanged sources skip the parser entirely."""
+    if cache is None:
+        return parse_hassl(text, inline=inline)
+    prog = cache.get(text)
+    if prog is None:
+        prog = parse_hassl(text, inline=inline)
+        cache.put(text, prog)
+    return prog
 
-def _normalize_module(importing_pkg: str, mod: str) -> str:
+@dataclass
+class ParseStats:
+    files: int = 0
+    cached: int = 0              # files served from the AST cache
+    build_seconds: float = 0.0   # parser table construction (~0 when already built)
+    parse_seconds: float = 0.0   # lexing + parsing + transformation, all files
+
+def parse_many(texts: Iterable[str], inline: bool = True,
+               cache: Optional[AstCache] = None) -> Tuple[List[Program], ParseStats]:
     """
-    Resolve Python-like relative module notation to an absolute dotted id.
-    Examples (importing_pkg='home.addie.automations'):
-      '.shared'   -> 'home.addie.shared'
-      '..shared'  -> 'home.shared'
-      'std.shared' (absolute) stays 'std.shared'
+    Parse several sources with the shared parser.
+    Build time is reported separately so it does not skew per-file parse time;
+    the parser is only built if some source misses the cache.
     """
-    if not mod:
-        return mod
-    if not mod.startswith("."):
-        return mod  # already absolute
-    # Count leading dots
-    i = 0
-    while i < len(mod) and mod[i] == ".":
-        i += 1
-    rel = mod[i:]  # tail after dots (may be '')
-    base_parts = (importing_pkg or "").split(".")
-    # Pop one level per dot
-    up = i - 1  # '.x' means stay at same depth + replace last segment -> up=0
-    if up > 0 and up <= len(base_parts):
-        base_parts = base_parts[:len(base_parts) - up]
-    elif up > len(base_parts):
-        base_parts = []
-    if rel:
-        return ".".join([p for p in base_parts if p] + [rel])
-    return ".".join([p for p in base_parts if p])
+    stats = ParseStats()
+    built = False
+    programs: List[Program] = []
+    for text in texts:
+        prog = cache.get(text) if cache is not None else None
+        if prog is not None:
+            stats.cached += 1
+        else:
+            if not built:
+                t0 = time.perf_counter()
+                get_parser(inline=inline)
+                stats.build_seconds = time.perf_counter() - t0
+                built = True
+            t0 = time.perf_counter()
+            prog = parse_hassl(text, inline=inline)
+            stats.parse_seconds += time.perf_counter() - t0
+            if cache is not None:
+                cache.put(text, prog)
+        programs.append(prog)
+        stats.files += 1
+    return programs, stats
+
 
 def _derive_package_name(prog: Program, src_path: Path, module_root: Path | None) -> str:
     """
@@ -65,122 +102,78 @@ def _derive_package_name(prog: Program, src_path: Path, module_root: Path | None
             pass
     return src_path.stem
 
-def _collect_public_exports(prog: Program, pkg: str) -> Dict[Tuple[str,str,str], object]:
+def _collect_public_exports(prog, pkg: str) -> Dict[Tuple[str,str,str], object]:
     """
-    Build (pkg, kind, name) -> node for public alias/schedule in a single Program.
+    Build (pkg, kind, name) -> node for public alias/schedule/template statements.
     Accepts both Schedule nodes and transformer dicts {"type":"schedule_decl",...}.
+    prog is a Program or any iterable of statements (e.g. parser.stream.iter_statements),
+    consumed in a single pass.
     """
     out: Dict[Tuple[str,str,str], object] = {}
-    # Aliases
-    for s in prog.statements:
+    statements = prog.statements if isinstance(prog, Program) else prog
+    for s in statements:
         if isinstance(s, Alias):
             if not getattr(s, "private", False):
                 out[(pkg, "alias", s.name)] = s
-    # Schedules (either dicts from transformer or Schedule nodes)
-    for s in prog.statements:
-        if isinstance(s, Schedule):
+        elif isinstance(s, Schedule):
             if not getattr(s, "private", False):
                 out[(pkg, "schedule", s.name)] = s
         elif isinstance(s, dict) and s.get("type") == "schedule_decl" and not s.get("private", False):
             name = s.get("name")
             if isinstance(name, str) and name.strip():
                 out[(pkg, "schedule", name)] = Schedule(name=name, clauses=s.get("clauses", []) or [], private=False)
-
-        # Templates (public only)
-    for s in prog.statements:
-        if isinstance(s, TemplateDecl) and not getattr(s, "private", False):
+        elif isinstance(s, TemplateDecl) and not getattr(s, "private", False):
             out[(pkg, "template", s.name)] = s
-            
     return out
 
-def _scan_hassl_files(path: Path) -> List[Path]:
+def _scan_hassl_files(path: Path, cache_dir=None) -> List[Path]:
     if path.is_file():
         return [path]
-    return [Path(p) for p in glob.glob(str(path / "**" / "*.hassl"), recursive=True)]
-
-def _module_to_path(module_root: Path, module: str) -> Path:
-    return (module_root / Path(module.replace(".", "/"))).with_suffix(".hassl")
-
-def _ensure_imports_loaded(programs, module_root: Path):
-    """If imported packages aren't parsed yet, try to load their .hassl files from module_root."""
-    # Track both package names (from parsed files) and module ids (from import statements)
-    known_pkgs = {pkg for _, _, pkg in programs}
-    seen_modules: set[str] = set()  # abs_mod we've already attempted/loaded
-    seen_paths: set[Path] = set(p for p, _, _ in programs)
-
-    added = True
-    while added:
-        added = False
-        # iterate over a snapshot; we'll append to programs
-        for importer_path, prog, importer_pkg in list(programs):
-            for imp in getattr(prog, "imports", []) or []:
-                if not isinstance(imp, dict) or imp.get("type") != "import":
-                    continue
-
-                raw_mod = imp.get("module", "")
-                if not raw_mod or not module_root:
-                    continue
-
-                abs_mod = _normalize_module(importer_pkg, raw_mod)
-
-                # guard: avoid re-trying the same module or self-import
-                if abs_mod in seen_modules or abs_mod == importer_pkg:
-                    continue
-
-                # If we already have a program whose package == abs_mod, skip
-                if abs_mod in known_pkgs:
-                    seen_modules.add(abs_mod)
-                    continue
+    return SourceIndex(path, cache_dir).files
 
-                candidate = _module_to_path(module_root, abs_mod)
-                if not candidate.exists():
-                    print(f"[hasslc] Autoload candidate MISS for '{abs_mod}': {candidate}")
-                    seen_modules.add(abs_mod)  # mark as tried to avoid spamming
-                    continue
-
-                if candidate in seen_paths:
-                    # We’ve already parsed this exact file; mark its module and move on
-                    print(f"[hasslc] Autoload candidate SKIP (already loaded) for '{abs_mod}': {candidate}")
-                    seen_modules.add(abs_mod)
-                    continue
-
-                print(f"[hasslc] Autoload candidate FOUND for '{abs_mod}': {candidate}")
-                with open(candidate, "r", encoding="utf-8") as f:
-                    text = f.read()
-
-                p = parse_hassl(text)
-                # prefer declared package; otherwise bind to module id
-                pkg_name = p.package or abs_mod
-                p.package = pkg_name
-
-                programs.append((candidate, p, pkg_name))
-                known_pkgs.add(pkg_name)
-                seen_modules.add(abs_mod)
-                seen_paths.add(candidate)
-                added = True
-                
-def main():
-    print("[hasslc] Using CLI file:", __file__)
-    ap = argparse.ArgumentParser(prog="hasslc", description="HASSL Compiler")
-    ap.add_argument("input", help="Input .hassl file OR directory")
-    ap.add_argument("-o", "--out", default="./packages/out", help="Output directory root for HA package(s)")
-    ap.add_argument("--module-root", default=None, help="Optional root to derive package names from paths")
-    args = ap.parse_args()
+def _load_module(path: Path, cache: Optional[AstCache] = None, header_only: bool = False) -> Program:
+    if path.suffix == BUNDLE_SUFFIX:
+        return read_bundle(path).program()  # precompiled: no parsing at all
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    if header_only:
+        return parse_header(text)  # never cached: it is not the module's full AST
+    return parse_cached(text, cache)
 
-    in_path = Path(args.input)
-    out_root = Path(args.out)
-    module_root = Path(args.module_root).resolve() if args.module_root else None
-
-    src_files = _scan_hassl_files(in_path)
+def compile_tree(in_path: Path, out_root: Path, ctx: CompileContext,
+                 module_root: Optional[Path] = None) -> List[tuple[str, object]]:
+    """
+    Compile a .hassl file or directory into HA packages under out_root.
+    All per-build state lives in ctx, so independent builds may run
+    concurrently in one process. With ctx.cache_dir set, packages whose
+    source and imported interfaces are unchanged since the last build are
+    skipped (ctx.options["rebuild"] forces a full build).
+    Schedules, holiday sets and aliases that no rule or sync of the build
+    reaches are left out of the output unless ctx.options["tree_shake"] is
+    False; ctx.options["keep"] lists fnmatch patterns ("pkg.name") to keep.
+    Returns (package, IR) of the packages built, in build order.
+    """
+    # one walk per tree; imports are then resolved against root_index in memory
+    root_index = SourceIndex(module_root, ctx.cache_dir) if module_root else None
+    if root_index is not None and in_path.is_dir() and in_path.resolve() == module_root:
+        src_files = root_index.files
+    else:
+        src_files = _scan_hassl_files(in_path, ctx.cache_dir)
     if not src_files:
         raise SystemExit(f"[hasslc] No .hassl files found in {in_path}")
 
+    cache = ctx.ast_cache
+
     # Pass 0: parse all and assign/derive package names
-    programs: List[tuple[Path, Program, str]] = []
+    texts = []
     for p in src_files:
         with open(p, "r", encoding="utf-8") as f:
-            text = f.read()
-        prog = parse_hassl(text)
+            texts.append(f.read())
+    parsed, stats = parse_many(texts, cache=cache)
+    print(f"[hasslc] Parsed {stats.files} file(s) in {stats.parse_seconds:.3f}s "
+          f"({stats.cached} from cache, parser build {stats.build_seconds:.3f}s)")
+    programs: List[tuple[Path, Program, str]] = []
+    for p, prog in zip(src_files, parsed):
         pkg_name = _derive_package_name(prog, p, module_root)
         try:
             prog.package = pkg_name
@@ -188,40 +181,112 @@ def main():
             pass
         programs.append((p, prog, pkg_name))
 
-    # auto-load any missing imports from --module_root
-    _ensure_imports_loaded(programs, module_root)
+    # Module graph: auto-load any missing imports from --module_root, then
+    # analyze and emit packages after the packages they import
+    graph = ModuleGraph()
+    for p, prog, pkg_name in programs:
+        graph.add(p, prog, pkg_name)
+    # With header_only_deps, autoloaded packages are only read for their
+    # exports: rule/sync bodies are skipped, and they are not emitted.
+    # Neither are packages loaded from precompiled bundles.
+    header_only = bool(ctx.options.get("header_only_deps"))
+    loaded = graph.autoload(module_root, lambda path: _load_module(path, cache, header_only), index=root_index)
+    deps_only = {node.package for node in loaded
+                 if header_only or node.sources[0][0].suffix == BUNDLE_SUFFIX}
+    programs, cycles = graph.build_order()
+    for cycle in cycles:
+        print(f"[hasslc] WARNING: import cycle between packages: {', '.join(cycle)}")
     
     # Pass 1: collect public exports across all programs
-    GLOBAL_EXPORTS: Dict[Tuple[str,str,str], object] = {}
     for path, prog, pkg in programs:
-        GLOBAL_EXPORTS.update(_collect_public_exports(prog, pkg))
+        ctx.exports.update(_collect_public_exports(prog, pkg))
 
-    # publish global exports to analyzer
-    sem_analyzer.GLOBAL_EXPORTS = GLOBAL_EXPORTS
+    # Incremental builds: a package whose source and imported interfaces
+    # match the last build into out_root is left as it is
+    bundle_out = ctx.options.get("bundle_out")
+    shaking = ctx.options.get("tree_shake", True)
+    keep = sorted(ctx.options.get("keep") or [])
+    salt = "\0".join([ctx.json_format, "shake" if shaking else "no-shake"] + keep)
+    state = BuildState(ctx.cache_dir, out_root, salt=salt) if ctx.cache_dir else None
+    fingerprints = package_fingerprints(graph.nodes, ctx.exports) if state is not None else {}
+    fresh = set()
+    if state is not None and not ctx.options.get("rebuild"):
+        fresh = {pkg for pkg, (source, deps) in fingerprints.items()
+                 if state.up_to_date(pkg, source, deps) and (out_root / pkg.replace(".", "_")).is_dir()
+                 and (bundle_out is None or bundle_path(bundle_out, pkg).exists())
+                 and (not shaking or state.shake_info(pkg) is not None)}
 
     # Pass 2: analyze each program with global view
     os.makedirs(out_root, exist_ok=True)
     all_ir = []
-    for path, prog, pkg in programs:
+
+    def analyze_package(path, prog, pkg):
         print(f"[hasslc] Parsing {path}  (package: {pkg})")
-        print("[hasslc] AST:", json.dumps(prog.to_dict(), indent=2))
-        ir = analyze(prog)
-        print("[hasslc] IR:", json.dumps(ir.to_dict(), indent=2))
-        all_ir.append((pkg, ir))
+        print("[hasslc] AST:", end=" ")
+        dump_json(prog, sys.stdout, ctx.json_format)
+        print()
+        ir = analyze(prog, ctx)
+        for note in getattr(ir, "simplified", None) or []:
+            where = "arm when" if note["clause"] == "arm" else f"clause {note['clause']}"
+            tail = "; always false, no automation emitted" if note["unreachable"] else ""
+            print(f"[hasslc] Simplified rule {note['rule']} {where}: "
+                  f"{', '.join(note['eliminated'])}{tail}")
+        for note in getattr(ir, "merged_schedules", None) or []:
+            print(f"[hasslc] Merged schedule {note['schedule']} {note['kind']}: "
+                  f"{note['before']} -> {note['after']}")
+        ir_dict = ir.to_dict() if hasattr(ir, "to_dict") else ir
+        print("[hasslc] IR:", end=" ")
+        dump_json(ir_dict, sys.stdout, ctx.json_format)
+        print()
+        all_ir.append((pkg, ir, ir_dict))
+
+    for path, prog, pkg in programs:
+        if pkg in fresh:
+            print(f"[hasslc] Up to date: {path}  (package: {pkg})")
+            continue
+        if pkg in deps_only:
+            print(f"[hasslc] Dependency only (exports read from {path.suffix}): {path}  (package: {pkg})")
+            continue
+        analyze_package(path, prog, pkg)
+
+    # Tree shaking over the whole build: skipped packages take part through
+    # the graph recorded when they were built, and are rebuilt if what they
+    # drop has changed since
+    shake_info: Dict[str, dict] = {}
+    if shaking:
+        graphs = {pkg: package_graph(pkg, ir) for pkg, ir, _ in all_ir}
+        for pkg in fresh:
+            graphs[pkg] = state.shake_info(pkg)["graph"]
+        live = reachable(graphs, keep, _external_roots(graph, deps_only, graphs if bundle_out else (), ctx.exports))
+        for path, prog, pkg in programs:
+            if pkg in fresh and dropped(graphs[pkg], live) != state.shake_info(pkg)["dropped"]:
+                fresh.discard(pkg)
+                analyze_package(path, prog, pkg)
+        order = {pkg: i for i, (_path, _prog, pkg) in enumerate(programs)}
+        all_ir.sort(key=lambda entry: order[entry[0]])
+        for i, (pkg, ir, ir_dict) in enumerate(all_ir):
+            drop = dropped(graphs[pkg], live)
+            if drop:
+                print(f"[hasslc] Tree shaking {pkg}: dropped {describe(drop)}")
+                ir = shake(ir, pkg, drop)
+                all_ir[i] = (pkg, ir, ir.to_dict())
+        shake_info = {pkg: {"graph": g, "dropped": dropped(g, live)} for pkg, g in graphs.items()}
 
     # Emit: per package subdir
-    for pkg, ir in all_ir:
+    for pkg, ir, ir_dict in all_ir:
         # One-level output: flatten dotted package id into a single directory name
         # e.g., home.addie.automations -> packages/out/home_addie_automations/
         pkg_dir = out_root / pkg.replace(".", "_")
         print(f"[hasslc] Output directory (flat): {pkg_dir}")
         os.makedirs(pkg_dir, exist_ok=True)
-        ir_dict = ir.to_dict() if hasattr(ir, "to_dict") else ir
-        codegen_generate(ir_dict, str(pkg_dir))
+        codegen_generate(ir_dict, str(pkg_dir), ctx)
         emit_package(ir, str(pkg_dir))
         with open(pkg_dir / "DEBUG_ir.json", "w", encoding="utf-8") as dbg:
-            dbg.write(json.dumps(ir.to_dict(), indent=2))
+            dump_json(ir_dict, dbg, ctx.json_format)
         print(f"[hasslc] Package written to {pkg_dir}")
+        if bundle_out is not None:
+            bundle = make_bundle(pkg, [prog for _path, prog in graph.nodes[pkg].sources], ctx.exports)
+            print(f"[hasslc] Bundle written to {write_bundle(bundle, bundle_path(bundle_out, pkg))}")
 
     # Also drop a cross-project export table for debugging
     with open(out_root / "DEBUG_exports.json", "w", encoding="utf-8") as fp:
@@ -230,9 +295,73 @@ def main():
             if isinstance(v, Schedule): return "Schedule"
             if isinstance(v, TemplateDecl): return "Template"
             return type(v).__name__
-        printable = {f"{k[0]}::{k[1]}::{k[2]}": _kind(v) for k, v in GLOBAL_EXPORTS.items()}
-        json.dump(printable, fp, indent=2)
+        printable = {f"{k[0]}::{k[1]}::{k[2]}": _kind(v) for k, v in ctx.exports.items()}
+        dump_json(printable, fp, ctx.json_format)
     print(f"[hasslc] Global exports index written to {out_root / 'DEBUG_exports.json'}")
 
+    if state is not None:
+        for pkg, (source, deps) in fingerprints.items():
+            state.record(pkg, source, deps, shake_info.get(pkg))
+        state.save(keep=fingerprints)
+    return [(pkg, ir) for pkg, ir, _ in all_ir]
+
+def _external_roots(graph: ModuleGraph, deps_only: Iterable[str], bundled: Iterable[str], exports) -> List[str]:
+    """
+    Schedules used from outside the rules of the build, for tree shaking.
+    Packages in the build but not analyzed in it (header-only or bundled
+    dependencies) may use every schedule exported by a package they
+    import; a package written as a bundle is a library, and its exported
+    schedules are there for importers in other builds.
+    """
+    roots: List[str] = []
+    for pkg in bundled:
+        roots.extend(f"schedule:{pkg}.{name}" for name in exports.module_exports(pkg, "schedule"))
+    for pkg in deps_only:
+        for _path, prog in graph.nodes[pkg].sources:
+            for imp in getattr(prog, "imports", []) or []:
+                if not isinstance(imp, dict) or not imp.get("module"):
+                    continue
+                dep = exports.resolve_module(imp["module"])
+                roots.extend(f"schedule:{dep}.{name}" for name in exports.module_exports(dep, "schedule"))
+    return roots
+
+def main():
+    print("[hasslc] Using CLI file:", __file__)
+    ap = argparse.ArgumentParser(prog="hasslc", description="HASSL Compiler")
+    ap.add_argument("input", help="Input .hassl file OR directory")
+    ap.add_argument("-o", "--out", default="./packages/out", help="Output directory root for HA package(s)")
+    ap.add_argument("--module-root", default=None, help="Optional root to derive package names from paths")
+    ap.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Directory for the parsed-AST and source-index caches")
+    ap.add_argument("--no-ast-cache", action="store_true", help="Always re-parse every source file")
+    ap.add_argument("--rebuild", action="store_true",
+                    help="Re-analyze and re-emit every package, even those unchanged since the last build")
+    ap.add_argument("--header-only-deps", action="store_true",
+                    help="Read autoloaded imports for their exports only (skip rule/sync bodies; do not emit them)")
+    ap.add_argument("--bundle-out", default=None,
+                    help="Also write a precompiled .hasslpkg bundle per package under this directory")
+    ap.add_argument("--keep", action="append", default=[], metavar="PATTERN",
+                    help="Keep matching schedules/holidays/aliases (fnmatch on pkg.name) even if no rule uses them; repeatable")
+    ap.add_argument("--no-tree-shake", action="store_true",
+                    help="Emit every declared schedule, holiday set and alias, used or not")
+    ap.add_argument("--json-format", choices=JSON_FORMATS, default="pretty",
+                    help="Layout of the AST/IR dumps and DEBUG_*.json files")
+    args = ap.parse_args()
+
+    ctx = CompileContext(
+        ast_cache=None if args.no_ast_cache else AstCache(args.cache_dir),
+        cache_dir=args.cache_dir,
+        json_format=args.json_format,
+        options={"rebuild": args.rebuild, "header_only_deps": args.header_only_deps,
+                 "bundle_out": Path(args.bundle_out) if args.bundle_out else None,
+                 "tree_shake": not args.no_tree_shake, "keep": args.keep},
+    )
+    module_root = Path(args.module_root).resolve() if args.module_root else None
+    compile_tree(Path(args.input), Path(args.out), ctx, module_root)
+
+    if ctx.ast_cache is not None:
+        evicted = ctx.ast_cache.prune()
+        if evicted:
+            print(f"[hasslc] Evicted {evicted} stale AST cache entr{'y' if evicted == 1 else 'ies'}")
+
 if __name__ == "__main__":
     main()
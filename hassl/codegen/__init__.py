@@ -2,7 +2,7 @@ from pathlib import Path
 from .package import emit_package
 from .rules_min import generate_rules
 
-def generate(ir_obj, outdir):
+def generate(ir_obj, outdir, ctx=None):
     """
     Orchestrate codegen in a merge-safe order:
       1) emit_package: writes/merges helpers, scripts, and sync automations
@@ -18,5 +18,5 @@ def generate(ir_obj, outdir):
         pass
 
     # 2) Rules last (adds gate booleans; also merge-safe)
-    generate_rules(ir_obj if isinstance(ir_obj, dict) else getattr(ir_obj, "to_dict", lambda: ir_obj)(), outdir)
+    generate_rules(ir_obj if isinstance(ir_obj, dict) else getattr(ir_obj, "to_dict", lambda: ir_obj)(), outdir, ctx)
     return True
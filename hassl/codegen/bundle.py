@@ -0,0 +1,106 @@
+# hassl/codegen/bundle.py
+"""
+Precompiled package bundles (.hasslpkg).
+
+A bundle carries what importers need from a package, so a shared library
+can be distributed built and loaded without parsing or analysis: its
+package id and imports and its export table (public aliases, schedules
+and templates, template bodies included). The package's IR is not
+carried: importers read only exports, and the library's own YAML is
+emitted when the library is built.
+
+Layout: the MAGIC line, then a pickle of the payload dict. BUNDLE_FORMAT
+is bumped whenever the payload or the AST/IR classes change shape;
+bundles of another format are rejected rather than half-read. Like the
+AST cache, bundles are pickles: only load bundles you trust.
+
+Bundles live on the module path next to (or instead of) sources:
+std/shared.hasslpkg provides module std.shared, and an import resolves to
+the bundle when there is no std/shared.hassl.
+"""
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .. import __version__
+from ..ast.nodes import Program
+from ..parser.sources import BUNDLE_SUFFIX
+from ..semantics.exports import ExportRegistry
+from ..semantics.fingerprint import EXPORT_KINDS
+
+MAGIC = b"HASSLPKG\n"
+
+# Bump when the payload or the pickled AST/IR layout changes.
+BUNDLE_FORMAT = 4
+
+class BundleError(Exception):
+    pass
+
+@dataclass
+class Bundle:
+    package: str
+    imports: List[dict] = field(default_factory=list)
+    exports: Dict[Tuple[str, str], Any] = field(default_factory=dict)   # (kind, name) -> node
+    compiler: str = __version__         # hasslc version that built it
+
+    def program(self) -> Program:
+        """
+        Stand-in Program for the build: package, imports and the exported
+        declarations, so _collect_public_exports() reads back the same table.
+        """
+        return Program(statements=list(self.exports.values()), package=self.package,
+                       imports=list(self.imports))
+
+def bundle_path(root, package: str) -> Path:
+    return Path(root) / (package.replace(".", "/") + BUNDLE_SUFFIX)
+
+def make_bundle(package: str, programs: List[Program], exports) -> Bundle:
+    """Bundle for package from its parsed Programs and the build's (pkg, kind, name) export table."""
+    imports: List[dict] = []
+    for prog in programs:
+        for imp in getattr(prog, "imports", []) or []:
+            if imp not in imports:
+                imports.append(imp)
+    exports = ExportRegistry.of(exports)
+    own = {(kind, name): node for kind in EXPORT_KINDS
+           for name, node in exports.module_exports(package, kind).items()}
+    return Bundle(package=package, imports=imports, exports=own)
+
+def write_bundle(bundle: Bundle, path) -> Path:
+    path = Path(path)
+    payload = {
+        "format": BUNDLE_FORMAT,
+        "compiler": bundle.compiler,
+        "package": bundle.package,
+        "imports": bundle.imports,
+        "exports": bundle.exports,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=path.name, suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return path
+
+def read_bundle(path) -> Bundle:
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise BundleError(f"{path}: not a HASSL package bundle")
+            payload = pickle.load(f)
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+        raise BundleError(f"{path}: unreadable bundle ({e})") from e
+    fmt: Optional[int] = payload.get("format") if isinstance(payload, dict) else None
+    if fmt != BUNDLE_FORMAT:
+        raise BundleError(f"{path}: bundle format {fmt} is not supported "
+                          f"(expected {BUNDLE_FORMAT}); rebuild it with this hasslc")
+    return Bundle(package=payload["package"], imports=payload["imports"],
+                  exports=payload["exports"], compiler=payload["compiler"])
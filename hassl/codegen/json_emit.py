@@ -0,0 +1,77 @@
+# json_emit.py
+"""
+JSON output for ASTs, IR and debug tables.
+
+Produces exactly what json.dumps(x.to_dict(), indent=2) used to, without
+the to_dict() deep copy: dataclass nodes are turned into shallow field
+dicts only when the encoder reaches them, and the text is written to the
+file handle chunk by chunk instead of being built as one string.
+
+format="compact" drops all whitespace and is written in one piece by
+orjson when it is installed, or by the C json encoder otherwise (the
+output is the same either way).
+"""
+import io
+import json
+from dataclasses import fields, is_dataclass
+from typing import Any, IO
+
+from ..ast.nodes import Program
+
+try:  # optional accelerator for compact output
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+FORMATS = ("pretty", "compact")
+
+def _fields(obj) -> dict:
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+def _default(obj):
+    # Reached for nested nodes (IfClause in a Rule, ScheduleWindow in a
+    # Schedule, ...): the same shape dataclasses.asdict() gives them.
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _fields(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def jsonable(obj: Any) -> Any:
+    """Top-level shape of obj for JSON: Program.to_dict()/IRProgram.to_dict() without copying."""
+    if isinstance(obj, Program):
+        return {
+            "type": "Program",
+            "package": obj.package,
+            "imports": obj.imports,
+            "statements": [_statement(s) for s in obj.statements],
+        }
+    if hasattr(obj, "to_dict") and not isinstance(obj, dict):
+        # IRProgram.to_dict() only rebuilds the top-level rule/sync records
+        return obj.to_dict()
+    return obj
+
+def _statement(s):
+    if is_dataclass(s) and not isinstance(s, type):
+        d = _fields(s)
+        d["type"] = s.__class__.__name__
+        return d
+    return s
+
+def dump_json(obj: Any, fp: IO[str], format: str = "pretty") -> None:
+    """Write obj (Program, IRProgram or plain data) as JSON to the text file fp."""
+    data = jsonable(obj)
+    if format == "compact":
+        if orjson is not None:
+            fp.write(orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8"))
+            return
+        encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_default)
+        fp.write(encoder.encode(data))
+        return
+    if format != "pretty":
+        raise ValueError(f"unknown JSON format {format!r} (expected one of {FORMATS})")
+    for chunk in json.JSONEncoder(indent=2, default=_default).iterencode(data):
+        fp.write(chunk)
+
+def dumps_json(obj: Any, format: str = "pretty") -> str:
+    buf = io.StringIO()
+    dump_json(obj, buf, format)
+    return buf.getvalue()
@@ -1,6 +1,10 @@
 import os, re, yaml
 from pathlib import Path
+from typing import Optional
 from hassl.semantics import analyzer as sem_analyzer
+from hassl.semantics.aliases import resolve_package
+from hassl.semantics.exports import ExportRegistry
+from hassl.semantics.exprs import ExprTable, expr_children, fold_tree
 
 FRIENDLY_EVENT_TYPES = {
     # Friendly HASSL gesture -> legacy integration names and HA standard names.
@@ -12,6 +16,11 @@ FRIENDLY_EVENT_TYPES = {
     "multi_pressed": ("multi_press_complete", "multi_press_end"),
 }
 
+class _Dumper(yaml.SafeDumper):
+    """SafeDumper that writes shared (memoized) nodes in full, never as &anchors."""
+    def ignore_aliases(self, data):
+        return True
+
 # ----------------- slug helpers -----------------
 def _slug(s: str) -> str:
     return re.sub(r'[^a-z0-9]+', '_', str(s).lower()).strip('_')
@@ -158,15 +167,21 @@ def _schedule_sensor(name: str, pkg: str) -> str:
     base = str(name).split(".")[-1]
     return f"binary_sensor.hassl_schedule_{_slug(pkg)}_{_slug(base)}_active"
 
-def _alias_map(ir: dict) -> dict:
+def _build_exports(ctx=None) -> ExportRegistry:
+    """The build's exports: from ctx, else the legacy analyzer.GLOBAL_EXPORTS."""
+    if ctx is not None:
+        return ctx.exports
+    return ExportRegistry.of(getattr(sem_analyzer, "GLOBAL_EXPORTS", None))
+
+def _alias_map(ir: dict, exports: Optional[ExportRegistry] = None) -> dict:
     """
     Build alias -> entity_id mapping from the current IR and any imported exports.
     """
     amap = dict(ir.get("aliases", {}) or {})
-    # Pull in imported public aliases from GLOBAL_EXPORTS
-    for (pkg_name, kind, alias_name), obj in getattr(sem_analyzer, "GLOBAL_EXPORTS", {}).items():
-        if kind != "alias":
-            continue
+    # Pull in imported public aliases from the build's exports
+    if exports is None:
+        exports = _build_exports()
+    for (pkg_name, alias_name), obj in exports.of_kind("alias"):
         target = getattr(obj, "entity", None)
         if target is None and isinstance(obj, dict):
             target = obj.get("entity")
@@ -174,38 +189,6 @@ def _alias_map(ir: dict) -> dict:
             amap[str(alias_name)] = str(target)
     return amap
 
-def _resolve_name(name: str, aliases: dict) -> str:
-    """Return resolved entity_id if 'name' is an alias, else the original string."""
-    return aliases.get(str(name), str(name))
-
-def _resolve_expr_aliases(node, aliases: dict):
-    """
-    Walk the analyzer expr tree and replace bare alias tokens with entity_ids
-    so triggers/conditions are built against real entities.
-    """
-    if isinstance(node, dict) and "op" in node:
-        op = node["op"]
-        if op in ("and", "or"):
-            return {
-                "op": op,
-                "left": _resolve_expr_aliases(node["left"], aliases),
-                "right": _resolve_expr_aliases(node["right"], aliases),
-            }
-        if op == "not":
-            return {"op": "not", "value": _resolve_expr_aliases(node["value"], aliases)}
-        # binary compare
-        left = _resolve_expr_aliases(node.get("left"), aliases)
-        right = _resolve_expr_aliases(node.get("right"), aliases)
-        return {"op": op, "left": left, "right": right}
-    if isinstance(node, str):
-        # If it isn't already an entity_id (no dot) and matches an alias, swap it
-        if "." not in node and node in aliases:
-            return aliases[node]
-        return node
-    if isinstance(node, list):
-        return [_resolve_expr_aliases(x, aliases) for x in node]
-    return node
-
 def _pkg_slug(outdir: str) -> str:
     base = os.path.basename(os.path.abspath(outdir))
     s = re.sub(r'[^a-z0-9]+', '_', base.lower()).strip('_')
@@ -226,19 +209,6 @@ def _ctx_key_and_entity(entity_id: str, attr: str | None = None):
     return key, f"input_text.{key}", label
 
 # ----------------- utilities -----------------
-def _entity_ids_in_expr(expr):
-    ids = set()
-    if isinstance(expr, dict):
-        for _, v in expr.items():
-            ids.update(_entity_ids_in_expr(v))
-    elif isinstance(expr, list):
-        for v in expr:
-            ids.update(_entity_ids_in_expr(v))
-    elif isinstance(expr, str):
-        if "." in expr and all(part for part in expr.split(".")):
-            ids.add(expr)
-    return ids
-
 def _dur_to_hms(s):
     s = str(s).strip()
     m = re.fullmatch(r"(\d+)(ms|s|m|h|d)", s)
@@ -262,82 +232,127 @@ def _kelvin_to_mireds(k):
     except Exception:
         return 153
 
-def _expr_to_template(node):
-    def j(n):
-        if isinstance(n, dict) and "op" in n:
-            op = n["op"]
-            if op == "not":
-                return f"(not {j(n['value'])})"
-            if op == "and":
-                return f"(({j(n['left'])}) and ({j(n['right'])}))"
-            if op == "or":
-                return f"(({j(n['left'])}) or ({j(n['right'])}))"
-            left = n.get("left"); right = n.get("right")
+def _render_children(n):
+    # and/or operands and not's value; comparisons and operands are leaves
+    return expr_children(n) if isinstance(n, dict) else None
+
+def _render(node, exprs: Optional[ExprTable], name: str, leaf, combine):
+    """
+    Render an expression bottom-up without recursion (see exprs.fold_tree):
+    leaf() renders comparisons and operands, combine() and/or/not from
+    their rendered operands. With an ExprTable, interned subexpressions
+    are rendered once per build (memo keyed by structural id).
+    """
+    if exprs is None:
+        return fold_tree(node, leaf, combine, _render_children)
+    memo = exprs.memo(name)
+
+    def sid_of(n):
+        return exprs.id_of(n) if isinstance(n, dict) else None
+
+    def children(n):
+        return None if sid_of(n) in memo else _render_children(n)
+
+    def cached_leaf(n):
+        sid = sid_of(n)
+        if sid is None:
+            return leaf(n)
+        if sid not in memo:
+            memo[sid] = leaf(n)
+        return memo[sid]
+
+    def cached_combine(n, results):
+        out = combine(n, results)
+        sid = sid_of(n)
+        if sid is not None:
+            memo[sid] = out
+        return out
+
+    return fold_tree(node, cached_leaf, cached_combine, children)
+
+def _template_leaf(n):
+    if isinstance(n, dict) and "op" in n:
+        op = n["op"]
+        left = n.get("left"); right = n.get("right")
+        if isinstance(left, str) and "." in left:
+            l = f"states('{left}')"
+        else:
+            l = repr(left)
+        if isinstance(right, str) and right in ("on", "off"):
+            if n["op"] == "==":
+                return f"(is_state('{left}','{right}'))"
+            if n["op"] == "!=":
+                return f"(not is_state('{left}','{right}'))"
+        if isinstance(right, (int, float)):
             if isinstance(left, str) and "." in left:
-                l = f"states('{left}')"
+                l = f"({l}|float(0))"
+                r = f"{right}"
+                return f"({l} {op} {r})"
+        r = repr(right)
+        return f"({l} {op} {r})"
+    if isinstance(n, str) and "." in n:
+        return f"(is_state('{n}','on'))"
+    if isinstance(n, (int, float)):
+        return f"({n} != 0)"
+    return "(true)"
+
+def _template_combine(n, parts):
+    if n["op"] == "not":
+        return f"(not {parts[0]})"
+    # one flat, parenthesized list per and/or node: linear in the operands
+    return "(" + f" {n['op']} ".join(f"({p})" for p in parts) + ")"
+
+def _expr_to_template(node, exprs: Optional[ExprTable] = None):
+    return "{{ " + _render(node, exprs, "template", _template_leaf, _template_combine) + " }}"
+
+def _ha_leaf(node):
+    if isinstance(node, dict) and "op" in node:
+        op = node["op"]
+        left = node.get("left"); right = node.get("right")
+        if op == "event_is":
+            if not _is_event_entity(left):
+                raise ValueError("HASSL: 'is <gesture>' requires an event.* entity")
+            event_types = FRIENDLY_EVENT_TYPES.get(str(right), (str(right),))
+            return _event_entity_condition(left, event_types)
+        if op == "==" and _is_event_entity(left) and isinstance(right, str):
+            return _event_entity_condition(left, right)
+        if op == "==":
+            eid = left if isinstance(left, str) else str(left)
+            val = right
+            if isinstance(val, str) and val in ("on", "off"):
+                return {"condition": "state", "entity_id": eid, "state": val}
             else:
-                l = repr(left)
-            if isinstance(right, str) and right in ("on", "off"):
-                if n["op"] == "==":
-                    return f"(is_state('{left}','{right}'))"
-                if n["op"] == "!=":
-                    return f"(not is_state('{left}','{right}'))"
-            if isinstance(right, (int, float)):
-                if isinstance(left, str) and "." in left:
-                    l = f"({l}|float(0))"
-                    r = f"{right}"
-                    return f"({l} {op} {r})"
-            r = repr(right)
-            return f"({l} {op} {r})"
-        if isinstance(n, str) and "." in n:
-            return f"(is_state('{n}','on'))"
-        if isinstance(n, (int, float)):
-            return f"({n} != 0)"
-        return "(true)"
-    return "{{ " + j(node) + " }}"
-
-def _condition_to_ha(cond):
-    def cv(node):
-        if isinstance(node, dict) and "op" in node:
-            op = node["op"]
-            if op in ("and", "or"):
-                key = "and" if op == "and" else "or"
-                return {"condition": key, "conditions": [cv(node["left"]), cv(node["right"])]}
-            if op == "not":
-                return {"condition": "not", "conditions": [cv(node["value"])]}
-            left = node.get("left"); right = node.get("right")
-            if op == "event_is":
-                if not _is_event_entity(left):
-                    raise ValueError("HASSL: 'is <gesture>' requires an event.* entity")
-                event_types = FRIENDLY_EVENT_TYPES.get(str(right), (str(right),))
-                return _event_entity_condition(left, event_types)
-            if op == "==" and _is_event_entity(left) and isinstance(right, str):
-                return _event_entity_condition(left, right)
-            if op == "==":
-                eid = left if isinstance(left, str) else str(left)
-                val = right
-                if isinstance(val, str) and val in ("on", "off"):
-                    return {"condition": "state", "entity_id": eid, "state": val}
-                else:
-                    return {"condition": "template", "value_template": f"{{{{ states('{eid}')|float(0) == {val} }}}}"}
-            if op in ("<", ">", "<=", ">="):
-                eid = left if isinstance(left, str) else str(left)
-                return {"condition": "template", "value_template": f"{{{{ states('{eid}')|float(0) {op} {right} }}}}"}
-        if _is_button_entity(node):
-            # Button entities expose the time of their latest press as state;
-            # they are events, not persistent on/off values.  Restrict the
-            # condition to the button that actually triggered this run.
-            return _button_press_condition(node)
-        if _is_event_entity(node):
-            # Event entities also store the time of their latest emission as
-            # state. A bare event operand matches each real emission; compare
-            # it to an event type to select one specific interaction.
-            return _event_entity_condition(node)
-        if isinstance(node, str) and "." in node:
-            return {"condition": "state", "entity_id": node, "state": "on"}
-        return {"condition": "template", "value_template": "true"}
+                return {"condition": "template", "value_template": f"{{{{ states('{eid}')|float(0) == {val} }}}}"}
+        if op in ("<", ">", "<=", ">="):
+            eid = left if isinstance(left, str) else str(left)
+            return {"condition": "template", "value_template": f"{{{{ states('{eid}')|float(0) {op} {right} }}}}"}
+    if _is_button_entity(node):
+        # Button entities expose the time of their latest press as state;
+        # they are events, not persistent on/off values.  Restrict the
+        # condition to the button that actually triggered this run.
+        return _button_press_condition(node)
+    if _is_event_entity(node):
+        # Event entities also store the time of their latest emission as
+        # state. A bare event operand matches each real emission; compare
+        # it to an event type to select one specific interaction.
+        return _event_entity_condition(node)
+    if isinstance(node, str) and "." in node:
+        return {"condition": "state", "entity_id": node, "state": "on"}
+    return {"condition": "template", "value_template": "true"}
+
+def _ha_combine(node, conds):
+    if node["op"] == "not":
+        return {"condition": "not", "conditions": conds}
+    return {"condition": node["op"], "conditions": conds}
+
+def _condition_to_ha(cond, exprs: Optional[ExprTable] = None):
+    """
+    HA condition for an analyzer condition/expression. With an ExprTable,
+    rendered subconditions are shared between rules: dump the result with
+    _Dumper, which writes shared objects out in full instead of as anchors.
+    """
     expr = cond.get("expr", cond)
-    return cv(expr)
+    return _render(expr, exprs, "ha_condition", _ha_leaf, _ha_combine)
 
 
 # ----------------- schedule → conditions -----------------
@@ -518,7 +533,12 @@ def _collect_schedules(ir: dict):
 
 
 # ----------------- main generate -----------------
-def generate_rules(ir, outdir):
+def generate_rules(ir, outdir, ctx=None):
+    """
+    Write the rule automations for one package IR (dict) to outdir.
+    ctx: the build's CompileContext; without one, imported aliases and
+    schedules come from analyzer.GLOBAL_EXPORTS.
+    """
     # Always build outputs, even if there are no rules (schedules may still exist)
     rules = ir.get("rules", []) or []
     Path(outdir).mkdir(parents=True, exist_ok=True)
@@ -534,17 +554,19 @@ def generate_rules(ir, outdir):
     declared_schedules, inline_by_rule, use_by_rule = _collect_schedules(ir)
 
     # --- alias resolution map (local + imported public aliases) ---
-    aliases = _alias_map(ir)
+    exports = _build_exports(ctx)
+    aliases = _alias_map(ir, exports)
+    exprs_table = getattr(ctx, "exprs", None)
+    resolution = resolve_package(ir, aliases, exprs_table)
 
     if os.getenv("HASSL_DEBUG"):
         print("HASSL aliases:", aliases)  # should include {'master_lights': 'light....', 'master_stands': 'light....'}
         
-    # Build exported schedules map from GLOBAL_EXPORTS: base_name -> declaring_pkg
+    # Build exported schedules map from the build's exports: base_name -> declaring_pkg
     
     exported_sched_pkgs = {}
-    for (pkg_name, kind, sched_name), obj in getattr(sem_analyzer, "GLOBAL_EXPORTS", {}).items():
-        if kind == "schedule":
-            exported_sched_pkgs[str(sched_name)] = str(pkg_name)
+    for (pkg_name, sched_name), obj in exports.of_kind("schedule"):
+        exported_sched_pkgs[str(sched_name)] = str(pkg_name)
 
     # --- validation: every 'schedule use <name>' must be declared locally OR exported by imports ---
     declared_base_names = {str(nm).split(".")[-1] for nm in (declared_schedules.keys() if declared_schedules else [])}
@@ -566,7 +588,7 @@ def generate_rules(ir, outdir):
     # NOTE: No helper creation here — package.py owns schedule sensors.
 
     # ---- build automations (rules) ----
-    for rule in rules:
+    for rule, resolved in zip(rules, resolution.rules):
         rname = rule["name"]
         gate = _gate_entity(rname)
 
@@ -622,8 +644,7 @@ def generate_rules(ir, outdir):
         arm_when = rule.get("arm_when") if isinstance(rule, dict) else None
         armed_eid = _armed_entity(rname)
         if arm_when:
-            arm_expr = _resolve_expr_aliases(arm_when.get("expr", {}), aliases)
-            arm_entities = sorted(_entity_ids_in_expr(arm_expr))
+            arm_expr, arm_entities = resolved.arm.expr, resolved.arm.entities
             if not arm_entities:
                 raise ValueError(f"HASSL: rule '{rname}' arm condition must reference an entity")
 
@@ -646,7 +667,7 @@ def generate_rules(ir, outdir):
             arm_conditions = [
                 {"condition": "state", "entity_id": gate, "state": "on"},
                 *schedule_gate_conditions,
-                _condition_to_ha({"expr": arm_expr}),
+                _condition_to_ha({"expr": arm_expr}, exprs_table),
             ]
             if arm_qual:
                 arm_conditions.append(arm_qual)
@@ -683,6 +704,10 @@ def generate_rules(ir, outdir):
         for idx, clause in enumerate(rule["clauses"]):
             # A clause is condition-driven or a native clock/sun trigger.
             cname = f"{_slug(rname)}__{idx+1}"
+            if clause.get("type") != "at" and clause["condition"].get("expr") is False:
+                # always false (see analyzer simplification): no automation,
+                # and the clauses after it keep their ids
+                continue
             actions = clause["actions"]
             schedule_transition = None
             if clause.get("type") == "at":
@@ -718,10 +743,8 @@ def generate_rules(ir, outdir):
                 cond_ha = None
                 qual_cond = None
             else:
-                expr0 = clause["condition"].get("expr", {})
-                # resolve aliases inside the boolean expression
-                expr = _resolve_expr_aliases(expr0, aliases)
-                entities = sorted(_entity_ids_in_expr(expr))
+                # boolean expression with aliases resolved to entities
+                expr, entities = resolved.conditions[idx].expr, resolved.conditions[idx].entities
                 triggers = [
                     {"platform": "state", "entity_id": e} for e in entities
                 ] or [{"platform": "time", "at": "00:00:00"}]
@@ -729,7 +752,7 @@ def generate_rules(ir, outdir):
                 # rebuild condition dict with resolved expr
                 cond_in = dict(clause["condition"])
                 cond_in["expr"] = expr
-                cond_ha = _condition_to_ha(cond_in)
+                cond_ha = _condition_to_ha(cond_in, exprs_table)
                 qual = clause.get("condition", {}).get("not_by")
                 qual_cond = _not_by_condition(qual, entities, rname, ctx_inputs)
             gate_cond = {"condition": "state", "entity_id": gate, "state": "on"}
@@ -755,9 +778,10 @@ def generate_rules(ir, outdir):
                     sched_conds.extend(inline_schedule_conditions)
 
             act_list = []
-            for act in actions:
+            targets = resolved.targets[idx]
+            for j, act in enumerate(actions):
                 if act["type"] == "assign":
-                    eid = _resolve_name(act["target"], aliases)
+                    eid = targets[j]
                     service = "turn_on" if act["state"] == "on" else "turn_off"
 
                     # stamp parent context so NOT_BY can ignore our own writes
@@ -770,7 +794,7 @@ def generate_rules(ir, outdir):
                     act_list.append(_rule_context_stamp(rname, eid, ctx_inputs))
                     act_list.append({"service": f"homeassistant.{service}", "target": {"entity_id": eid}})
                 elif act["type"] == "attr_assign":
-                    eid = _resolve_name(act["entity"], aliases); attr = act["attr"]; val = act["value"]
+                    eid = targets[j]; attr = act["attr"]; val = act["value"]
                     # stamp parent context (attr-specific)
                     _k, _e, _label = _ctx_key_and_entity(eid, attr)
                     ctx_inputs[_k] = _label
@@ -802,12 +826,11 @@ def generate_rules(ir, outdir):
                     else:
                         act_list.append({"service": "homeassistant.turn_on", "target": {"entity_id": eid}, "data": {attr: val}})
                 elif act["type"] == "wait":
-                    cond_expr = act["condition"].get("expr", act["condition"])
-                    vt = _expr_to_template(_resolve_expr_aliases(cond_expr, aliases))
+                    vt = _expr_to_template(resolved.waits[(idx, j)].expr, exprs_table)
                     act_list.append({"wait_for_trigger": [{"platform": "template", "value_template": vt, "for": _dur_to_hms(act["for"])}]})
                     inner = act["then"]
                     if inner["type"] == "assign":
-                        eid = _resolve_name(inner["target"], aliases)
+                        eid = targets[j]
                         service = "turn_on" if inner["state"] == "on" else "turn_off"
                         # stamp parent context for the inner action
                         _k, _e, _label = _ctx_key_and_entity(eid, None)
@@ -872,7 +895,7 @@ def generate_rules(ir, outdir):
     out_path = Path(outdir) / f"rules_bundled_{pkg}.yaml"
     with open(out_path, "w") as f:
         # packages expect a mapping, not a bare list
-        yaml.safe_dump({"automation": bundled}, f, sort_keys=False)
+        yaml.dump({"automation": bundled}, f, Dumper=_Dumper, sort_keys=False)
 
     helpers_path = Path(outdir) / f"helpers_{pkg}.yaml"
 
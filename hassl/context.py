@@ -0,0 +1,32 @@
+# hassl/context.py
+"""
+Per-build state, passed explicitly through parse, analyze and codegen.
+
+A CompileContext holds what one compilation shares between its phases:
+the export registry of the packages in the build, the AST cache, the
+output options, template expansions and the interned condition
+expressions. Nothing here is process-global, so independent builds (a
+thread pool, a build server, parallel tests) can each use their own
+context at the same time.
+
+analyze() and generate_rules() still fall back to the module-level
+analyzer.GLOBAL_EXPORTS when no context is given, for callers that set it
+directly.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from .parser.cache import AstCache
+from .semantics.exports import ExportRegistry
+from .semantics.exprs import ExprTable
+from .semantics.templates import TemplateCache
+
+@dataclass
+class CompileContext:
+    exports: ExportRegistry = field(default_factory=ExportRegistry)
+    ast_cache: Optional[AstCache] = None
+    cache_dir: Optional[str] = None      # source-index cache; None disables it
+    json_format: str = "pretty"
+    options: Dict[str, Any] = field(default_factory=dict)   # free-form per-build settings
+    templates: TemplateCache = field(default_factory=TemplateCache)   # `use template` expansions
+    exprs: ExprTable = field(default_factory=ExprTable)   # interned conditions, render memos
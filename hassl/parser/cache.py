@@ -0,0 +1,120 @@
+# hassl/parser/cache.py
+"""
+Content-addressed cache of parsed Programs (.hassl-cache/ast/).
+
+An entry is keyed by the source text, the grammar hash and the compiler
+version, so any change to one of them is simply a miss; stale entries are
+never invalidated explicitly, only evicted by prune() (oldest first, by
+age and by total size). A hit refreshes the entry's mtime, which makes the
+size-based eviction least-recently-used.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from .. import __version__
+from ..ast.nodes import Program
+from .loader import grammar_sha
+
+# Bump when the pickled layout of the AST nodes (or what the transformer
+# puts in them) changes.
+CACHE_FORMAT = 4
+
+DEFAULT_CACHE_DIR = ".hassl-cache"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_AGE = 30 * 24 * 3600  # seconds
+
+class AstCache:
+    def __init__(self, root=DEFAULT_CACHE_DIR):
+        self.root = Path(root)
+        self.dir = self.root / "ast"
+        self.hits = 0
+        self.misses = 0
+        self._salt = f"{CACHE_FORMAT}\0{__version__}\0{grammar_sha()}\0".encode("utf-8")
+
+    def key(self, text: str) -> str:
+        h = hashlib.sha256(self._salt)
+        h.update(text.encode("utf-8"))
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.dir / key[:2] / f"{key}.pickle"
+
+    def get(self, text: str) -> Optional[Program]:
+        path = self._path(self.key(text))
+        try:
+            with open(path, "rb") as f:
+                prog = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # truncated/corrupt entry: drop it and re-parse
+            self._unlink(path)
+            self.misses += 1
+            return None
+        if not isinstance(prog, Program):
+            self._unlink(path)
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return prog
+
+    def put(self, text: str, prog: Program) -> None:
+        path = self._path(self.key(text))
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=path.name, suffix=".tmp", dir=path.parent)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(prog, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass  # read-only checkout, full disk, ...: caching is best effort
+
+    def prune(self, max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+              max_age: Optional[float] = DEFAULT_MAX_AGE) -> int:
+        """
+        Evict entries not used for max_age seconds, then the least recently
+        used ones until the store fits in max_bytes. Returns the number removed.
+        """
+        entries = []
+        for path in self.dir.glob("*/*.pickle"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort()
+
+        removed = 0
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, path in entries:
+            too_old = max_age is not None and now - mtime > max_age
+            too_big = max_bytes is not None and total > max_bytes
+            if not (too_old or too_big):
+                continue
+            if self._unlink(path):
+                removed += 1
+                total -= size
+        return removed
+
+    @staticmethod
+    def _unlink(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
@@ -0,0 +1,75 @@
+# hassl/parser/fastpath.py
+"""
+Line scanner for alias registries (.tools/dump_to_aliases.py output).
+
+Files made only of package, import and alias statements, one per line,
+are turned into a Program without going through the LALR parser: alias and
+package lines become nodes directly, and the (few) import lines are handed
+to the grammar in one batch so their nodes stay exactly what the
+transformer builds. Any other line -- another statement kind, a statement
+split over several lines, anything malformed -- makes try_fast_parse()
+return None and the caller does a full parse, which also reports errors.
+"""
+import re
+from sys import intern
+from typing import List, Optional
+
+from ..ast.nodes import Alias, Program
+from .transform import make_program
+
+_WS = r"[ \t\f\r]"
+_NAME = r"[a-zA-Z_][a-zA-Z0-9_]*"
+_SEG = rf"{_WS}*\.{_WS}*{_NAME}"
+_ENTITY = rf"{_NAME}(?:{_SEG})+"
+_MODULE = rf"{_NAME}(?:{_SEG})*"
+_END = rf"{_WS}*(?://[^\n]*)?"
+
+_BLANK = re.compile(_END)
+_ALIAS = re.compile(rf"{_WS}*(private{_WS}+)?alias{_WS}+({_NAME}){_WS}*={_WS}*({_ENTITY}){_END}")
+_PACKAGE = re.compile(rf"{_WS}*package{_WS}+({_ENTITY}){_END}")
+_IMPORT_ITEM = rf"{_NAME}(?:{_WS}+as{_WS}+{_NAME})?"
+_IMPORT = re.compile(
+    rf"{_WS}*import{_WS}+{_MODULE}"
+    rf"(?:{_WS}*\.\*|{_WS}*:{_WS}*{_IMPORT_ITEM}(?:{_WS}*,{_WS}*{_IMPORT_ITEM})*|{_WS}+as{_WS}+{_NAME})?"
+    rf"{_END}"
+)
+_SPACES = re.compile(rf"{_WS}+")
+
+def try_fast_parse(text: str) -> Optional[Program]:
+    """Program for an alias/package/import-only source, or None if it needs the full parser."""
+    statements: List[object] = []
+    import_lines: List[str] = []
+    import_slots: List[int] = []
+
+    alias_match = _ALIAS.fullmatch
+    append = statements.append
+    for line in text.split("\n"):
+        m = alias_match(line)
+        if m:
+            private, name, entity = m.groups()
+            if _SPACES.search(entity):
+                entity = _SPACES.sub("", entity)
+            append(Alias(intern(name), intern(entity), private is not None))
+            continue
+        if _BLANK.fullmatch(line):
+            continue
+        m = _PACKAGE.fullmatch(line)
+        if m:
+            statements.append({"type": "package", "name": _SPACES.sub("", m.group(1))})
+            continue
+        if _IMPORT.fullmatch(line):
+            import_slots.append(len(statements))
+            import_lines.append(line)
+            statements.append(None)
+            continue
+        return None
+
+    if import_lines:
+        from .loader import get_parser
+        parsed = get_parser(inline=True).parse("\n".join(import_lines)).statements
+        if len(parsed) != len(import_slots):
+            return None
+        for slot, stmt in zip(import_slots, parsed):
+            statements[slot] = stmt
+
+    return make_program(statements)
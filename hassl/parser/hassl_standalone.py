@@ -0,0 +1,3575 @@
+# Generated by .tools/gen_standalone_parser.py from hassl.lark -- do not edit.
+GRAMMAR_SHA256 = '5cbcd82abd68d322ef4408612dcd53f4be601df6170828577cecb839a632ad4f'
+from typing import cast
+# The file was automatically generated by Lark v1.3.1
+__version__ = "1.3.1"
+
+#
+#
+#   Lark Stand-alone Generator Tool
+# ----------------------------------
+# Generates a stand-alone LALR(1) parser
+#
+# Git:    https://github.com/erezsh/lark
+# Author: Erez Shinan (erezshin@gmail.com)
+#
+#
+#    >>> LICENSE
+#
+#    This tool and its generated code use a separate license from Lark,
+#    and are subject to the terms of the Mozilla Public License, v. 2.0.
+#    If a copy of the MPL was not distributed with this
+#    file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#    If you wish to purchase a commercial license for this tool and its
+#    generated code, you may contact me via email or otherwise.
+#
+#    If MPL2 is incompatible with your free or open-source project,
+#    contact me and we'll work it out.
+#
+#
+
+from copy import deepcopy
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import (
+    TypeVar, Generic, Type, Tuple, List, Dict, Iterator, Collection, Callable, Optional, FrozenSet, Any,
+    Union, Iterable, IO, TYPE_CHECKING, overload, Sequence,
+    Pattern as REPattern, ClassVar, Set, Mapping
+)
+
+
+class LarkError(Exception):
+    pass
+
+
+class ConfigurationError(LarkError, ValueError):
+    pass
+
+
+def assert_config(value, options: Collection, msg='Got %r, expected one of %s'):
+    if value not in options:
+        raise ConfigurationError(msg % (value, options))
+
+
+class GrammarError(LarkError):
+    pass
+
+
+class ParseError(LarkError):
+    pass
+
+
+class LexError(LarkError):
+    pass
+
+T = TypeVar('T')
+
+class UnexpectedInput(LarkError):
+    #--
+    line: int
+    column: int
+    pos_in_stream = None
+    state: Any
+    _terminals_by_name = None
+    interactive_parser: 'InteractiveParser'
+
+    def get_context(self, text: str, span: int=40) -> str:
+        #--
+        pos = self.pos_in_stream or 0
+        start = max(pos - span, 0)
+        end = pos + span
+        if not isinstance(text, bytes):
+            before = text[start:pos].rsplit('\n', 1)[-1]
+            after = text[pos:end].split('\n', 1)[0]
+            return before + after + '\n' + ' ' * len(before.expandtabs()) + '^\n'
+        else:
+            before = text[start:pos].rsplit(b'\n', 1)[-1]
+            after = text[pos:end].split(b'\n', 1)[0]
+            return (before + after + b'\n' + b' ' * len(before.expandtabs()) + b'^\n').decode("ascii", "backslashreplace")
+
+    def match_examples(self, parse_fn: 'Callable[[str], Tree]',
+                             examples: Union[Mapping[T, Iterable[str]], Iterable[Tuple[T, Iterable[str]]]],
+                             token_type_match_fallback: bool=False,
+                             use_accepts: bool=True
+                         ) -> Optional[T]:
+        #--
+        assert self.state is not None, "Not supported for this exception"
+
+        if isinstance(examples, Mapping):
+            examples = examples.items()
+
+        candidate = (None, False)
+        for i, (label, example) in enumerate(examples):
+            assert not isinstance(example, str), "Expecting a list"
+
+            for j, malformed in enumerate(example):
+                try:
+                    parse_fn(malformed)
+                except UnexpectedInput as ut:
+                    if ut.state == self.state:
+                        if (
+                            use_accepts
+                            and isinstance(self, UnexpectedToken)
+                            and isinstance(ut, UnexpectedToken)
+                            and ut.accepts != self.accepts
+                        ):
+                            logger.debug("Different accepts with same state[%d]: %s != %s at example [%s][%s]" %
+                                         (self.state, self.accepts, ut.accepts, i, j))
+                            continue
+                        if (
+                            isinstance(self, (UnexpectedToken, UnexpectedEOF))
+                            and isinstance(ut, (UnexpectedToken, UnexpectedEOF))
+                        ):
+                            if ut.token == self.token:  ##
+
+                                logger.debug("Exact Match at example [%s][%s]" % (i, j))
+                                return label
+
+                            if token_type_match_fallback:
+                                ##
+
+                                if (ut.token.type == self.token.type) and not candidate[-1]:
+                                    logger.debug("Token Type Fallback at example [%s][%s]" % (i, j))
+                                    candidate = label, True
+
+                        if candidate[0] is None:
+                            logger.debug("Same State match at example [%s][%s]" % (i, j))
+                            candidate = label, False
+
+        return candidate[0]
+
+    def _format_expected(self, expected):
+        if self._terminals_by_name:
+            d = self._terminals_by_name
+            expected = [d[t_name].user_repr() if t_name in d else t_name for t_name in expected]
+        return "Expected one of: \n\t* %s\n" % '\n\t* '.join(expected)
+
+
+class UnexpectedEOF(ParseError, UnexpectedInput):
+    #--
+    expected: 'List[Token]'
+
+    def __init__(self, expected, state=None, terminals_by_name=None):
+        super(UnexpectedEOF, self).__init__()
+
+        self.expected = expected
+        self.state = state
+        from .lexer import Token
+        self.token = Token("<EOF>", "")  ##
+
+        self.pos_in_stream = -1
+        self.line = -1
+        self.column = -1
+        self._terminals_by_name = terminals_by_name
+
+
+    def __str__(self):
+        message = "Unexpected end-of-input. "
+        message += self._format_expected(self.expected)
+        return message
+
+
+class UnexpectedCharacters(LexError, UnexpectedInput):
+    #--
+
+    allowed: Set[str]
+    considered_tokens: Set[Any]
+
+    def __init__(self, seq, lex_pos, line, column, allowed=None, considered_tokens=None, state=None, token_history=None,
+                 terminals_by_name=None, considered_rules=None):
+        super(UnexpectedCharacters, self).__init__()
+
+        ##
+
+        self.line = line
+        self.column = column
+        self.pos_in_stream = lex_pos
+        self.state = state
+        self._terminals_by_name = terminals_by_name
+
+        self.allowed = allowed
+        self.considered_tokens = considered_tokens
+        self.considered_rules = considered_rules
+        self.token_history = token_history
+
+        if isinstance(seq, bytes):
+            self.char = seq[lex_pos:lex_pos + 1].decode("ascii", "backslashreplace")
+        else:
+            self.char = seq[lex_pos]
+        self._context = self.get_context(seq)
+
+
+    def __str__(self):
+        message = "No terminal matches '%s' in the current parser context, at line %d col %d" % (self.char, self.line, self.column)
+        message += '\n\n' + self._context
+        if self.allowed:
+            message += self._format_expected(self.allowed)
+        if self.token_history:
+            message += '\nPrevious tokens: %s\n' % ', '.join(repr(t) for t in self.token_history)
+        return message
+
+
+class UnexpectedToken(ParseError, UnexpectedInput):
+    #--
+
+    expected: Set[str]
+    considered_rules: Set[str]
+
+    def __init__(self, token, expected, considered_rules=None, state=None, interactive_parser=None, terminals_by_name=None, token_history=None):
+        super(UnexpectedToken, self).__init__()
+
+        ##
+
+        self.line = getattr(token, 'line', '?')
+        self.column = getattr(token, 'column', '?')
+        self.pos_in_stream = getattr(token, 'start_pos', None)
+        self.state = state
+
+        self.token = token
+        self.expected = expected  ##
+
+        self._accepts = NO_VALUE
+        self.considered_rules = considered_rules
+        self.interactive_parser = interactive_parser
+        self._terminals_by_name = terminals_by_name
+        self.token_history = token_history
+
+
+    @property
+    def accepts(self) -> Set[str]:
+        if self._accepts is NO_VALUE:
+            self._accepts = self.interactive_parser and self.interactive_parser.accepts()
+        return self._accepts
+
+    def __str__(self):
+        message = ("Unexpected token %r at line %s, column %s.\n%s"
+                   % (self.token, self.line, self.column, self._format_expected(self.accepts or self.expected)))
+        if self.token_history:
+            message += "Previous tokens: %r\n" % self.token_history
+
+        return message
+
+
+
+class VisitError(LarkError):
+    #--
+
+    obj: 'Union[Tree, Token]'
+    orig_exc: Exception
+
+    def __init__(self, rule, obj, orig_exc):
+        message = 'Error trying to process rule "%s":\n\n%s' % (rule, orig_exc)
+        super(VisitError, self).__init__(message)
+
+        self.rule = rule
+        self.obj = obj
+        self.orig_exc = orig_exc
+
+
+class MissingVariableError(LarkError):
+    pass
+
+
+import sys, re
+import logging
+from dataclasses import dataclass
+from typing import Generic, AnyStr
+
+logger: logging.Logger = logging.getLogger("lark")
+logger.addHandler(logging.StreamHandler())
+##
+
+##
+
+logger.setLevel(logging.CRITICAL)
+
+
+NO_VALUE = object()
+
+T = TypeVar("T")
+
+
+def classify(seq: Iterable, key: Optional[Callable] = None, value: Optional[Callable] = None) -> Dict:
+    d: Dict[Any, Any] = {}
+    for item in seq:
+        k = key(item) if (key is not None) else item
+        v = value(item) if (value is not None) else item
+        try:
+            d[k].append(v)
+        except KeyError:
+            d[k] = [v]
+    return d
+
+
+def _deserialize(data: Any, namespace: Dict[str, Any], memo: Dict) -> Any:
+    if isinstance(data, dict):
+        if '__type__' in data:  ##
+
+            class_ = namespace[data['__type__']]
+            return class_.deserialize(data, memo)
+        elif '@' in data:
+            return memo[data['@']]
+        return {key:_deserialize(value, namespace, memo) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [_deserialize(value, namespace, memo) for value in data]
+    return data
+
+
+_T = TypeVar("_T", bound="Serialize")
+
+class Serialize:
+    #--
+
+    def memo_serialize(self, types_to_memoize: List) -> Any:
+        memo = SerializeMemoizer(types_to_memoize)
+        return self.serialize(memo), memo.serialize()
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        if memo and memo.in_types(self):
+            return {'@': memo.memoized.get(self)}
+
+        fields = getattr(self, '__serialize_fields__')
+        res = {f: _serialize(getattr(self, f), memo) for f in fields}
+        res['__type__'] = type(self).__name__
+        if hasattr(self, '_serialize'):
+            self._serialize(res, memo)
+        return res
+
+    @classmethod
+    def deserialize(cls: Type[_T], data: Dict[str, Any], memo: Dict[int, Any]) -> _T:
+        namespace = getattr(cls, '__serialize_namespace__', [])
+        namespace = {c.__name__:c for c in namespace}
+
+        fields = getattr(cls, '__serialize_fields__')
+
+        if '@' in data:
+            return memo[data['@']]
+
+        inst = cls.__new__(cls)
+        for f in fields:
+            try:
+                setattr(inst, f, _deserialize(data[f], namespace, memo))
+            except KeyError as e:
+                raise KeyError("Cannot find key for class", cls, e)
+
+        if hasattr(inst, '_deserialize'):
+            inst._deserialize()
+
+        return inst
+
+
+class SerializeMemoizer(Serialize):
+    #--
+
+    __serialize_fields__ = 'memoized',
+
+    def __init__(self, types_to_memoize: List) -> None:
+        self.types_to_memoize = tuple(types_to_memoize)
+        self.memoized = Enumerator()
+
+    def in_types(self, value: Serialize) -> bool:
+        return isinstance(value, self.types_to_memoize)
+
+    def serialize(self) -> Dict[int, Any]:  ##
+
+        return _serialize(self.memoized.reversed(), None)
+
+    @classmethod
+    def deserialize(cls, data: Dict[int, Any], namespace: Dict[str, Any], memo: Dict[Any, Any]) -> Dict[int, Any]:  ##
+
+        return _deserialize(data, namespace, memo)
+
+
+try:
+    import regex
+    _has_regex = True
+except ImportError:
+    _has_regex = False
+
+if sys.version_info >= (3, 11):
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+else:
+    import sre_parse
+    import sre_constants
+
+categ_pattern = re.compile(r'\\p{[A-Za-z_]+}')
+
+def get_regexp_width(expr: str) -> Union[Tuple[int, int], List[int]]:
+    if _has_regex:
+        ##
+
+        ##
+
+        ##
+
+        regexp_final = re.sub(categ_pattern, 'A', expr)
+    else:
+        if re.search(categ_pattern, expr):
+            raise ImportError('`regex` module must be installed in order to use Unicode categories.', expr)
+        regexp_final = expr
+    try:
+        ##
+
+        return [int(x) for x in sre_parse.parse(regexp_final).getwidth()]
+    except sre_constants.error:
+        if not _has_regex:
+            raise ValueError(expr)
+        else:
+            ##
+
+            ##
+
+            c = regex.compile(regexp_final)
+            ##
+
+            ##
+
+            MAXWIDTH = getattr(sre_parse, "MAXWIDTH", sre_constants.MAXREPEAT)
+            if c.match('') is None:
+                ##
+
+                return 1, int(MAXWIDTH)
+            else:
+                return 0, int(MAXWIDTH)
+
+
+@dataclass(frozen=True)
+class TextSlice(Generic[AnyStr]):
+    #--
+    text: AnyStr
+    start: int
+    end: int
+
+    def __post_init__(self):
+        if not isinstance(self.text, (str, bytes)):
+            raise TypeError("text must be str or bytes")
+
+        if self.start < 0:
+            object.__setattr__(self, 'start', self.start + len(self.text))
+            assert self.start >=0
+
+        if self.end is None:
+            object.__setattr__(self, 'end', len(self.text))
+        elif self.end < 0:
+            object.__setattr__(self, 'end', self.end + len(self.text))
+            assert self.end <= len(self.text)
+
+    @classmethod
+    def cast_from(cls, text: 'TextOrSlice') -> 'TextSlice[AnyStr]':
+        if isinstance(text, TextSlice):
+            return text
+
+        return cls(text, 0, len(text))
+
+    def is_complete_text(self):
+        return self.start == 0 and self.end == len(self.text)
+
+    def __len__(self):
+        return self.end - self.start
+
+    def count(self, substr: AnyStr):
+        return self.text.count(substr, self.start, self.end)
+
+    def rindex(self, substr: AnyStr):
+        return self.text.rindex(substr, self.start, self.end)
+
+
+TextOrSlice = Union[AnyStr, 'TextSlice[AnyStr]']
+LarkInput = Union[AnyStr, TextSlice[AnyStr], Any]
+
+
+
+class Meta:
+
+    empty: bool
+    line: int
+    column: int
+    start_pos: int
+    end_line: int
+    end_column: int
+    end_pos: int
+    orig_expansion: 'List[TerminalDef]'
+    match_tree: bool
+
+    def __init__(self):
+        self.empty = True
+
+
+_Leaf_T = TypeVar("_Leaf_T")
+Branch = Union[_Leaf_T, 'Tree[_Leaf_T]']
+
+
+class Tree(Generic[_Leaf_T]):
+    #--
+
+    data: str
+    children: 'List[Branch[_Leaf_T]]'
+
+    def __init__(self, data: str, children: 'List[Branch[_Leaf_T]]', meta: Optional[Meta]=None) -> None:
+        self.data = data
+        self.children = children
+        self._meta = meta
+
+    @property
+    def meta(self) -> Meta:
+        if self._meta is None:
+            self._meta = Meta()
+        return self._meta
+
+    def __repr__(self):
+        return 'Tree(%r, %r)' % (self.data, self.children)
+
+    __match_args__ = ("data", "children")
+
+    def _pretty_label(self):
+        return self.data
+
+    def _pretty(self, level, indent_str):
+        yield f'{indent_str*level}{self._pretty_label()}'
+        if len(self.children) == 1 and not isinstance(self.children[0], Tree):
+            yield f'\t{self.children[0]}\n'
+        else:
+            yield '\n'
+            for n in self.children:
+                if isinstance(n, Tree):
+                    yield from n._pretty(level+1, indent_str)
+                else:
+                    yield f'{indent_str*(level+1)}{n}\n'
+
+    def pretty(self, indent_str: str='  ') -> str:
+        #--
+        return ''.join(self._pretty(0, indent_str))
+
+    def __rich__(self, parent:Optional['rich.tree.Tree']=None) -> 'rich.tree.Tree':
+        #--
+        return self._rich(parent)
+
+    def _rich(self, parent):
+        if parent:
+            tree = parent.add(f'[bold]{self.data}[/bold]')
+        else:
+            import rich.tree
+            tree = rich.tree.Tree(self.data)
+
+        for c in self.children:
+            if isinstance(c, Tree):
+                c._rich(tree)
+            else:
+                tree.add(f'[green]{c}[/green]')
+
+        return tree
+
+    def __eq__(self, other):
+        try:
+            return self.data == other.data and self.children == other.children
+        except AttributeError:
+            return False
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self) -> int:
+        return hash((self.data, tuple(self.children)))
+
+    def iter_subtrees(self) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        queue = [self]
+        subtrees = dict()
+        for subtree in queue:
+            subtrees[id(subtree)] = subtree
+            queue += [c for c in reversed(subtree.children)
+                      if isinstance(c, Tree) and id(c) not in subtrees]
+
+        del queue
+        return reversed(list(subtrees.values()))
+
+    def iter_subtrees_topdown(self):
+        #--
+        stack = [self]
+        stack_append = stack.append
+        stack_pop = stack.pop
+        while stack:
+            node = stack_pop()
+            if not isinstance(node, Tree):
+                continue
+            yield node
+            for child in reversed(node.children):
+                stack_append(child)
+
+    def find_pred(self, pred: 'Callable[[Tree[_Leaf_T]], bool]') -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return filter(pred, self.iter_subtrees())
+
+    def find_data(self, data: str) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return self.find_pred(lambda t: t.data == data)
+
+
+from functools import wraps, update_wrapper
+from inspect import getmembers, getmro
+
+_Return_T = TypeVar('_Return_T')
+_Return_V = TypeVar('_Return_V')
+_Leaf_T = TypeVar('_Leaf_T')
+_Leaf_U = TypeVar('_Leaf_U')
+_R = TypeVar('_R')
+_FUNC = Callable[..., _Return_T]
+_DECORATED = Union[_FUNC, type]
+
+class _DiscardType:
+    #--
+
+    def __repr__(self):
+        return "lark.visitors.Discard"
+
+Discard = _DiscardType()
+
+##
+
+
+class _Decoratable:
+    #--
+
+    @classmethod
+    def _apply_v_args(cls, visit_wrapper):
+        mro = getmro(cls)
+        assert mro[0] is cls
+        libmembers = {name for _cls in mro[1:] for name, _ in getmembers(_cls)}
+        for name, value in getmembers(cls):
+
+            ##
+
+            if name.startswith('_') or (name in libmembers and name not in cls.__dict__):
+                continue
+            if not callable(value):
+                continue
+
+            ##
+
+            if isinstance(cls.__dict__[name], _VArgsWrapper):
+                continue
+
+            setattr(cls, name, _VArgsWrapper(cls.__dict__[name], visit_wrapper))
+        return cls
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Transformer(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+    __visit_tokens__ = True   ##
+
+
+    def __init__(self,  visit_tokens: bool=True) -> None:
+        self.__visit_tokens__ = visit_tokens
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            try:
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    return f.visit_wrapper(f, tree.data, children, tree.meta)
+                else:
+                    return f(children)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(tree.data, tree, e)
+
+    def _call_userfunc_token(self, token):
+        try:
+            f = getattr(self, token.type)
+        except AttributeError:
+            return self.__default_token__(token)
+        else:
+            try:
+                return f(token)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(token.type, token, e)
+
+    def _transform_children(self, children):
+        for c in children:
+            if isinstance(c, Tree):
+                res = self._transform_tree(c)
+            elif self.__visit_tokens__ and isinstance(c, Token):
+                res = self._call_userfunc_token(c)
+            else:
+                res = c
+
+            if res is not Discard:
+                yield res
+
+    def _transform_tree(self, tree):
+        children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree, children)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        #--
+        res = list(self._transform_children([tree]))
+        if not res:
+            return None     ##
+
+        assert len(res) == 1
+        return res[0]
+
+    def __mul__(
+            self: 'Transformer[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V,]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        #--
+        return TransformerChain(self, other)
+
+    def __default__(self, data, children, meta):
+        #--
+        return Tree(data, children, meta)
+
+    def __default_token__(self, token):
+        #--
+        return token
+
+
+def merge_transformers(base_transformer=None, **transformers_to_merge):
+    #--
+    if base_transformer is None:
+        base_transformer = Transformer()
+    for prefix, transformer in transformers_to_merge.items():
+        for method_name in dir(transformer):
+            method = getattr(transformer, method_name)
+            if not callable(method):
+                continue
+            if method_name.startswith("_") or method_name == "transform":
+                continue
+            prefixed_method = prefix + "__" + method_name
+            if hasattr(base_transformer, prefixed_method):
+                raise AttributeError("Cannot merge: method '%s' appears more than once" % prefixed_method)
+
+            setattr(base_transformer, prefixed_method, method)
+
+    return base_transformer
+
+
+class InlineTransformer(Transformer):   ##
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            return f(*children)
+
+
+class TransformerChain(Generic[_Leaf_T, _Return_T]):
+
+    transformers: 'Tuple[Union[Transformer, TransformerChain], ...]'
+
+    def __init__(self, *transformers: 'Union[Transformer, TransformerChain]') -> None:
+        self.transformers = transformers
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for t in self.transformers:
+            tree = t.transform(tree)
+        return cast(_Return_T, tree)
+
+    def __mul__(
+            self: 'TransformerChain[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        return TransformerChain(*self.transformers + (other,))
+
+
+class Transformer_InPlace(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):           ##
+
+        return self._call_userfunc(tree)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for subtree in tree.iter_subtrees():
+            subtree.children = list(self._transform_children(subtree.children))
+
+        return self._transform_tree(tree)
+
+
+class Transformer_NonRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        rev_postfix = []
+        q: List[Branch[_Leaf_T]] = [tree]
+        while q:
+            t = q.pop()
+            rev_postfix.append(t)
+            if isinstance(t, Tree):
+                q += t.children
+
+        ##
+
+        stack: List = []
+        for x in reversed(rev_postfix):
+            if isinstance(x, Tree):
+                size = len(x.children)
+                if size:
+                    args = stack[-size:]
+                    del stack[-size:]
+                else:
+                    args = []
+
+                res = self._call_userfunc(x, args)
+                if res is not Discard:
+                    stack.append(res)
+
+            elif self.__visit_tokens__ and isinstance(x, Token):
+                res = self._call_userfunc_token(x)
+                if res is not Discard:
+                    stack.append(res)
+            else:
+                stack.append(x)
+
+        result, = stack  ##
+
+        ##
+
+        ##
+
+        ##
+
+        return cast(_Return_T, result)
+
+
+class Transformer_InPlaceRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):
+        tree.children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree)
+
+
+##
+
+
+class VisitorBase:
+    def _call_userfunc(self, tree):
+        return getattr(self, tree.data, self.__default__)(tree)
+
+    def __default__(self, tree):
+        #--
+        return tree
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Visitor(VisitorBase, ABC, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees():
+            self._call_userfunc(subtree)
+        return tree
+
+    def visit_topdown(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees_topdown():
+            self._call_userfunc(subtree)
+        return tree
+
+
+class Visitor_Recursive(VisitorBase, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit(child)
+
+        self._call_userfunc(tree)
+        return tree
+
+    def visit_topdown(self,tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        self._call_userfunc(tree)
+
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit_topdown(child)
+
+        return tree
+
+
+class Interpreter(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        ##
+
+        ##
+
+        return self._visit_tree(tree)
+
+    def _visit_tree(self, tree: Tree[_Leaf_T]):
+        f = getattr(self, tree.data)
+        wrapper = getattr(f, 'visit_wrapper', None)
+        if wrapper is not None:
+            return f.visit_wrapper(f, tree.data, tree.children, tree.meta)
+        else:
+            return f(tree)
+
+    def visit_children(self, tree: Tree[_Leaf_T]) -> List:
+        return [self._visit_tree(child) if isinstance(child, Tree) else child
+                for child in tree.children]
+
+    def __getattr__(self, name):
+        return self.__default__
+
+    def __default__(self, tree):
+        return self.visit_children(tree)
+
+
+_InterMethod = Callable[[Type[Interpreter], _Return_T], _R]
+
+def visit_children_decor(func: _InterMethod) -> _InterMethod:
+    #--
+    @wraps(func)
+    def inner(cls, tree):
+        values = cls.visit_children(tree)
+        return func(cls, values)
+    return inner
+
+##
+
+
+def _apply_v_args(obj, visit_wrapper):
+    try:
+        _apply = obj._apply_v_args
+    except AttributeError:
+        return _VArgsWrapper(obj, visit_wrapper)
+    else:
+        return _apply(visit_wrapper)
+
+
+class _VArgsWrapper:
+    #--
+    base_func: Callable
+
+    def __init__(self, func: Callable, visit_wrapper: Callable[[Callable, str, list, Any], Any]):
+        if isinstance(func, _VArgsWrapper):
+            func = func.base_func
+        self.base_func = func
+        self.visit_wrapper = visit_wrapper
+        update_wrapper(self, func)
+
+    def __call__(self, *args, **kwargs):
+        return self.base_func(*args, **kwargs)
+
+    def __get__(self, instance, owner=None):
+        try:
+            ##
+
+            ##
+
+            g = type(self.base_func).__get__
+        except AttributeError:
+            return self
+        else:
+            return _VArgsWrapper(g(self.base_func, instance, owner), self.visit_wrapper)
+
+    def __set_name__(self, owner, name):
+        try:
+            f = type(self.base_func).__set_name__
+        except AttributeError:
+            return
+        else:
+            f(self.base_func, owner, name)
+
+
+def _vargs_inline(f, _data, children, _meta):
+    return f(*children)
+def _vargs_meta_inline(f, _data, children, meta):
+    return f(meta, *children)
+def _vargs_meta(f, _data, children, meta):
+    return f(meta, children)
+def _vargs_tree(f, data, children, meta):
+    return f(Tree(data, children, meta))
+
+
+def v_args(inline: bool = False, meta: bool = False, tree: bool = False, wrapper: Optional[Callable] = None) -> Callable[[_DECORATED], _DECORATED]:
+    #--
+    if tree and (meta or inline):
+        raise ValueError("Visitor functions cannot combine 'tree' with 'meta' or 'inline'.")
+
+    func = None
+    if meta:
+        if inline:
+            func = _vargs_meta_inline
+        else:
+            func = _vargs_meta
+    elif inline:
+        func = _vargs_inline
+    elif tree:
+        func = _vargs_tree
+
+    if wrapper is not None:
+        if func is not None:
+            raise ValueError("Cannot use 'wrapper' along with 'tree', 'meta' or 'inline'.")
+        func = wrapper
+
+    def _visitor_args_dec(obj):
+        return _apply_v_args(obj, func)
+    return _visitor_args_dec
+
+
+
+TOKEN_DEFAULT_PRIORITY = 0
+
+
+class Symbol(Serialize):
+    __slots__ = ('name',)
+
+    name: str
+    is_term: ClassVar[bool] = NotImplemented
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __eq__(self, other):
+        if not isinstance(other, Symbol):
+            return NotImplemented
+        return self.is_term == other.is_term and self.name == other.name
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.name)
+
+    fullrepr = property(__repr__)
+
+    def renamed(self, f):
+        return type(self)(f(self.name))
+
+
+class Terminal(Symbol):
+    __serialize_fields__ = 'name', 'filter_out'
+
+    is_term: ClassVar[bool] = True
+
+    def __init__(self, name: str, filter_out: bool = False) -> None:
+        self.name = name
+        self.filter_out = filter_out
+
+    @property
+    def fullrepr(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.filter_out)
+
+    def renamed(self, f):
+        return type(self)(f(self.name), self.filter_out)
+
+
+class NonTerminal(Symbol):
+    __serialize_fields__ = 'name',
+
+    is_term: ClassVar[bool] = False
+
+    def serialize(self, memo=None) -> Dict[str, Any]:
+        ##
+
+        ##
+
+        return {'name': str(self.name), '__type__': 'NonTerminal'}
+
+
+class RuleOptions(Serialize):
+    __serialize_fields__ = 'keep_all_tokens', 'expand1', 'priority', 'template_source', 'empty_indices'
+
+    keep_all_tokens: bool
+    expand1: bool
+    priority: Optional[int]
+    template_source: Optional[str]
+    empty_indices: Tuple[bool, ...]
+
+    def __init__(self, keep_all_tokens: bool=False, expand1: bool=False, priority: Optional[int]=None, template_source: Optional[str]=None, empty_indices: Tuple[bool, ...]=()) -> None:
+        self.keep_all_tokens = keep_all_tokens
+        self.expand1 = expand1
+        self.priority = priority
+        self.template_source = template_source
+        self.empty_indices = empty_indices
+
+    def __repr__(self):
+        return 'RuleOptions(%r, %r, %r, %r)' % (
+            self.keep_all_tokens,
+            self.expand1,
+            self.priority,
+            self.template_source
+        )
+
+
+class Rule(Serialize):
+    #--
+    __slots__ = ('origin', 'expansion', 'alias', 'options', 'order', '_hash')
+
+    __serialize_fields__ = 'origin', 'expansion', 'order', 'alias', 'options'
+    __serialize_namespace__ = Terminal, NonTerminal, RuleOptions
+
+    origin: NonTerminal
+    expansion: Sequence[Symbol]
+    order: int
+    alias: Optional[str]
+    options: RuleOptions
+    _hash: int
+
+    def __init__(self, origin: NonTerminal, expansion: Sequence[Symbol],
+                 order: int=0, alias: Optional[str]=None, options: Optional[RuleOptions]=None):
+        self.origin = origin
+        self.expansion = expansion
+        self.alias = alias
+        self.order = order
+        self.options = options or RuleOptions()
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def _deserialize(self):
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def __str__(self):
+        return '<%s : %s>' % (self.origin.name, ' '.join(x.name for x in self.expansion))
+
+    def __repr__(self):
+        return 'Rule(%r, %r, %r, %r)' % (self.origin, self.expansion, self.alias, self.options)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, Rule):
+            return False
+        return self.origin == other.origin and self.expansion == other.expansion
+
+
+
+from contextlib import suppress
+from copy import copy
+
+try:  ##
+
+    has_interegular = bool(interegular)
+except NameError:
+    has_interegular = False
+
+class Pattern(Serialize, ABC):
+    #--
+
+    value: str
+    flags: Collection[str]
+    raw: Optional[str]
+    type: ClassVar[str]
+
+    def __init__(self, value: str, flags: Collection[str] = (), raw: Optional[str] = None) -> None:
+        self.value = value
+        self.flags = frozenset(flags)
+        self.raw = raw
+
+    def __repr__(self):
+        return repr(self.to_regexp())
+
+    ##
+
+    def __hash__(self):
+        return hash((type(self), self.value, self.flags))
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self.value == other.value and self.flags == other.flags
+
+    @abstractmethod
+    def to_regexp(self) -> str:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def min_width(self) -> int:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def max_width(self) -> int:
+        raise NotImplementedError()
+
+    def _get_flags(self, value):
+        for f in self.flags:
+            value = ('(?%s:%s)' % (f, value))
+        return value
+
+
+class PatternStr(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw'
+
+    type: ClassVar[str] = "str"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(re.escape(self.value))
+
+    @property
+    def min_width(self) -> int:
+        return len(self.value)
+
+    @property
+    def max_width(self) -> int:
+        return len(self.value)
+
+
+class PatternRE(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw', '_width'
+
+    type: ClassVar[str] = "re"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(self.value)
+
+    _width = None
+    def _get_width(self):
+        if self._width is None:
+            self._width = get_regexp_width(self.to_regexp())
+        return self._width
+
+    @property
+    def min_width(self) -> int:
+        return self._get_width()[0]
+
+    @property
+    def max_width(self) -> int:
+        return self._get_width()[1]
+
+
+class TerminalDef(Serialize):
+    #--
+    __serialize_fields__ = 'name', 'pattern', 'priority'
+    __serialize_namespace__ = PatternStr, PatternRE
+
+    name: str
+    pattern: Pattern
+    priority: int
+
+    def __init__(self, name: str, pattern: Pattern, priority: int = TOKEN_DEFAULT_PRIORITY) -> None:
+        assert isinstance(pattern, Pattern), pattern
+        self.name = name
+        self.pattern = pattern
+        self.priority = priority
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.pattern)
+
+    def user_repr(self) -> str:
+        if self.name.startswith('__'):  ##
+
+            return self.pattern.raw or self.name
+        else:
+            return self.name
+
+_T = TypeVar('_T', bound="Token")
+
+class Token(str):
+    #--
+    __slots__ = ('type', 'start_pos', 'value', 'line', 'column', 'end_line', 'end_column', 'end_pos')
+
+    __match_args__ = ('type', 'value')
+
+    type: str
+    start_pos: Optional[int]
+    value: Any
+    line: Optional[int]
+    column: Optional[int]
+    end_line: Optional[int]
+    end_column: Optional[int]
+    end_pos: Optional[int]
+
+
+    @overload
+    def __new__(
+            cls,
+            type: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':
+        ...
+
+    @overload
+    def __new__(
+            cls,
+            type_: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':        ...
+
+    def __new__(cls, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return cls._future_new(*args, **kwargs)
+
+
+    @classmethod
+    def _future_new(cls, type, value, start_pos=None, line=None, column=None, end_line=None, end_column=None, end_pos=None):
+        inst = super(Token, cls).__new__(cls, value)
+
+        inst.type = type
+        inst.start_pos = start_pos
+        inst.value = value
+        inst.line = line
+        inst.column = column
+        inst.end_line = end_line
+        inst.end_column = end_column
+        inst.end_pos = end_pos
+        return inst
+
+    @overload
+    def update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    @overload
+    def update(self, type_: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    def update(self, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return self._future_update(*args, **kwargs)
+
+    def _future_update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        return Token.new_borrow_pos(
+            type if type is not None else self.type,
+            value if value is not None else self.value,
+            self
+        )
+
+    @classmethod
+    def new_borrow_pos(cls: Type[_T], type_: str, value: Any, borrow_t: 'Token') -> _T:
+        return cls(type_, value, borrow_t.start_pos, borrow_t.line, borrow_t.column, borrow_t.end_line, borrow_t.end_column, borrow_t.end_pos)
+
+    def __reduce__(self):
+        return (self.__class__, (self.type, self.value, self.start_pos, self.line, self.column))
+
+    def __repr__(self):
+        return 'Token(%r, %r)' % (self.type, self.value)
+
+    def __deepcopy__(self, memo):
+        return Token(self.type, self.value, self.start_pos, self.line, self.column)
+
+    def __eq__(self, other):
+        if isinstance(other, Token) and self.type != other.type:
+            return False
+
+        return str.__eq__(self, other)
+
+    __hash__ = str.__hash__
+
+
+class LineCounter:
+    #--
+
+    __slots__ = 'char_pos', 'line', 'column', 'line_start_pos', 'newline_char'
+
+    def __init__(self, newline_char):
+        self.newline_char = newline_char
+        self.char_pos = 0
+        self.line = 1
+        self.column = 1
+        self.line_start_pos = 0
+
+    def __eq__(self, other):
+        if not isinstance(other, LineCounter):
+            return NotImplemented
+
+        return self.char_pos == other.char_pos and self.newline_char == other.newline_char
+
+    def feed(self, token: TextOrSlice, test_newline=True):
+        #--
+        if test_newline:
+            newlines = token.count(self.newline_char)
+            if newlines:
+                self.line += newlines
+                self.line_start_pos = self.char_pos + token.rindex(self.newline_char) + 1
+
+        self.char_pos += len(token)
+        self.column = self.char_pos - self.line_start_pos + 1
+
+
+class UnlessCallback:
+    def __init__(self, scanner: 'Scanner'):
+        self.scanner = scanner
+
+    def __call__(self, t: Token):
+        res = self.scanner.fullmatch(t.value)
+        if res is not None:
+            t.type = res
+        return t
+
+
+class CallChain:
+    def __init__(self, callback1, callback2, cond):
+        self.callback1 = callback1
+        self.callback2 = callback2
+        self.cond = cond
+
+    def __call__(self, t):
+        t2 = self.callback1(t)
+        return self.callback2(t) if self.cond(t2) else t2
+
+
+def _get_match(re_, regexp, s, flags):
+    m = re_.match(regexp, s, flags)
+    if m:
+        return m.group(0)
+
+def _create_unless(terminals, g_regex_flags, re_, use_bytes):
+    tokens_by_type = classify(terminals, lambda t: type(t.pattern))
+    assert len(tokens_by_type) <= 2, tokens_by_type.keys()
+    embedded_strs = set()
+    callback = {}
+    for retok in tokens_by_type.get(PatternRE, []):
+        unless = []
+        for strtok in tokens_by_type.get(PatternStr, []):
+            if strtok.priority != retok.priority:
+                continue
+            s = strtok.pattern.value
+            if s == _get_match(re_, retok.pattern.to_regexp(), s, g_regex_flags):
+                unless.append(strtok)
+                if strtok.pattern.flags <= retok.pattern.flags:
+                    embedded_strs.add(strtok)
+        if unless:
+            callback[retok.name] = UnlessCallback(Scanner(unless, g_regex_flags, re_, use_bytes=use_bytes))
+
+    new_terminals = [t for t in terminals if t not in embedded_strs]
+    return new_terminals, callback
+
+
+class Scanner:
+    def __init__(self, terminals, g_regex_flags, re_, use_bytes):
+        self.terminals = terminals
+        self.g_regex_flags = g_regex_flags
+        self.re_ = re_
+        self.use_bytes = use_bytes
+
+        self.allowed_types = {t.name for t in self.terminals}
+
+        self._mres = self._build_mres(terminals, len(terminals))
+
+    def _build_mres(self, terminals, max_size):
+        ##
+
+        ##
+
+        ##
+
+        mres = []
+        while terminals:
+            pattern = u'|'.join(u'(?P<%s>%s)' % (t.name, t.pattern.to_regexp()) for t in terminals[:max_size])
+            if self.use_bytes:
+                pattern = pattern.encode('latin-1')
+            try:
+                mre = self.re_.compile(pattern, self.g_regex_flags)
+            except AssertionError:  ##
+
+                return self._build_mres(terminals, max_size // 2)
+
+            mres.append(mre)
+            terminals = terminals[max_size:]
+        return mres
+
+    def match(self, text: TextSlice, pos):
+        for mre in self._mres:
+            m = mre.match(text.text, pos, text.end)
+            if m:
+                return m.group(0), m.lastgroup
+
+
+    def fullmatch(self, text: str) -> Optional[str]:
+        for mre in self._mres:
+            m = mre.fullmatch(text)
+            if m:
+                return m.lastgroup
+        return None
+
+def _regexp_has_newline(r: str):
+    #--
+    return '\n' in r or '\\n' in r or '\\s' in r or '[^' in r or ('(?s' in r and '.' in r)
+
+
+class LexerState:
+    #--
+
+    __slots__ = 'text', 'line_ctr', 'last_token'
+
+    text: TextSlice
+    line_ctr: LineCounter
+    last_token: Optional[Token]
+
+    def __init__(self, text: TextSlice, line_ctr: Optional[LineCounter] = None, last_token: Optional[Token]=None):
+        if isinstance(text, TextSlice):
+            if line_ctr is None:
+                line_ctr = LineCounter(b'\n' if isinstance(text.text, bytes) else '\n')
+
+                if text.start > 0:
+                    ##
+
+                    line_ctr.feed(TextSlice(text.text, 0, text.start))
+
+            if not (text.start <= line_ctr.char_pos <= text.end):
+                raise ValueError("LineCounter.char_pos is out of bounds")
+
+        self.text = text
+        self.line_ctr = line_ctr
+        self.last_token = last_token
+
+
+    def __eq__(self, other):
+        if not isinstance(other, LexerState):
+            return NotImplemented
+
+        return self.text == other.text and self.line_ctr == other.line_ctr and self.last_token == other.last_token
+
+    def __copy__(self):
+        return type(self)(self.text, copy(self.line_ctr), self.last_token)
+
+
+class LexerThread:
+    #--
+
+    def __init__(self, lexer: 'Lexer', lexer_state: Optional[LexerState]):
+        self.lexer = lexer
+        self.state = lexer_state
+
+    @classmethod
+    def from_text(cls, lexer: 'Lexer', text_or_slice: TextOrSlice) -> 'LexerThread':
+        text = TextSlice.cast_from(text_or_slice)
+        return cls(lexer, LexerState(text))
+
+    @classmethod
+    def from_custom_input(cls, lexer: 'Lexer', text: Any) -> 'LexerThread':
+        return cls(lexer, LexerState(text))
+
+    def lex(self, parser_state):
+        if self.state is None:
+            raise TypeError("Cannot lex: No text assigned to lexer state")
+        return self.lexer.lex(self.state, parser_state)
+
+    def __copy__(self):
+        return type(self)(self.lexer, copy(self.state))
+
+    _Token = Token
+
+
+_Callback = Callable[[Token], Token]
+
+class Lexer(ABC):
+    #--
+    @abstractmethod
+    def lex(self, lexer_state: LexerState, parser_state: Any) -> Iterator[Token]:
+        return NotImplemented
+
+    def make_lexer_state(self, text: str):
+        #--
+        return LexerState(TextSlice.cast_from(text))
+
+
+def _check_regex_collisions(terminal_to_regexp: Dict[TerminalDef, str], comparator, strict_mode, max_collisions_to_show=8):
+    if not comparator:
+        comparator = interegular.Comparator.from_regexes(terminal_to_regexp)
+
+    ##
+
+    ##
+
+    max_time = 2 if strict_mode else 0.2
+
+    ##
+
+    if comparator.count_marked_pairs() >= max_collisions_to_show:
+        return
+    for group in classify(terminal_to_regexp, lambda t: t.priority).values():
+        for a, b in comparator.check(group, skip_marked=True):
+            assert a.priority == b.priority
+            ##
+
+            comparator.mark(a, b)
+
+            ##
+
+            message = f"Collision between Terminals {a.name} and {b.name}. "
+            try:
+                example = comparator.get_example_overlap(a, b, max_time).format_multiline()
+            except ValueError:
+                ##
+
+                example = "No example could be found fast enough. However, the collision does still exists"
+            if strict_mode:
+                raise LexError(f"{message}\n{example}")
+            logger.warning("%s The lexer will choose between them arbitrarily.\n%s", message, example)
+            if comparator.count_marked_pairs() >= max_collisions_to_show:
+                logger.warning("Found 8 regex collisions, will not check for more.")
+                return
+
+
+class AbstractBasicLexer(Lexer):
+    terminals_by_name: Dict[str, TerminalDef]
+
+    @abstractmethod
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        ...
+
+    @abstractmethod
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        ...
+
+    def lex(self, state: LexerState, parser_state: Any) -> Iterator[Token]:
+        with suppress(EOFError):
+            while True:
+                yield self.next_token(state, parser_state)
+
+
+class BasicLexer(AbstractBasicLexer):
+    terminals: Collection[TerminalDef]
+    ignore_types: FrozenSet[str]
+    newline_types: FrozenSet[str]
+    user_callbacks: Dict[str, _Callback]
+    callback: Dict[str, _Callback]
+    re: ModuleType
+
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        terminals = list(conf.terminals)
+        assert all(isinstance(t, TerminalDef) for t in terminals), terminals
+
+        self.re = conf.re_module
+
+        if not conf.skip_validation:
+            ##
+
+            terminal_to_regexp = {}
+            for t in terminals:
+                regexp = t.pattern.to_regexp()
+                try:
+                    self.re.compile(regexp, conf.g_regex_flags)
+                except self.re.error:
+                    raise LexError("Cannot compile token %s: %s" % (t.name, t.pattern))
+
+                if t.pattern.min_width == 0:
+                    raise LexError("Lexer does not allow zero-width terminals. (%s: %s)" % (t.name, t.pattern))
+                if t.pattern.type == "re":
+                    terminal_to_regexp[t] = regexp
+
+            if not (set(conf.ignore) <= {t.name for t in terminals}):
+                raise LexError("Ignore terminals are not defined: %s" % (set(conf.ignore) - {t.name for t in terminals}))
+
+            if has_interegular:
+                _check_regex_collisions(terminal_to_regexp, comparator, conf.strict)
+            elif conf.strict:
+                raise LexError("interegular must be installed for strict mode. Use `pip install 'lark[interegular]'`.")
+
+        ##
+
+        self.newline_types = frozenset(t.name for t in terminals if _regexp_has_newline(t.pattern.to_regexp()))
+        self.ignore_types = frozenset(conf.ignore)
+
+        terminals.sort(key=lambda x: (-x.priority, -x.pattern.max_width, -len(x.pattern.value), x.name))
+        self.terminals = terminals
+        self.user_callbacks = conf.callbacks
+        self.g_regex_flags = conf.g_regex_flags
+        self.use_bytes = conf.use_bytes
+        self.terminals_by_name = conf.terminals_by_name
+
+        self._scanner: Optional[Scanner] = None
+
+    def _build_scanner(self) -> Scanner:
+        terminals, self.callback = _create_unless(self.terminals, self.g_regex_flags, self.re, self.use_bytes)
+        assert all(self.callback.values())
+
+        for type_, f in self.user_callbacks.items():
+            if type_ in self.callback:
+                ##
+
+                self.callback[type_] = CallChain(self.callback[type_], f, lambda t: t.type == type_)
+            else:
+                self.callback[type_] = f
+
+        return Scanner(terminals, self.g_regex_flags, self.re, self.use_bytes)
+
+    @property
+    def scanner(self) -> Scanner:
+        if self._scanner is None:
+            self._scanner = self._build_scanner()
+        return self._scanner
+
+    def match(self, text, pos):
+        return self.scanner.match(text, pos)
+
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        line_ctr = lex_state.line_ctr
+        while line_ctr.char_pos < lex_state.text.end:
+            res = self.match(lex_state.text, line_ctr.char_pos)
+            if not res:
+                allowed = self.scanner.allowed_types - self.ignore_types
+                if not allowed:
+                    allowed = {"<END-OF-FILE>"}
+                raise UnexpectedCharacters(lex_state.text.text, line_ctr.char_pos, line_ctr.line, line_ctr.column,
+                                           allowed=allowed, token_history=lex_state.last_token and [lex_state.last_token],
+                                           state=parser_state, terminals_by_name=self.terminals_by_name)
+
+            value, type_ = res
+
+            ignored = type_ in self.ignore_types
+            t = None
+            if not ignored or type_ in self.callback:
+                t = Token(type_, value, line_ctr.char_pos, line_ctr.line, line_ctr.column)
+            line_ctr.feed(value, type_ in self.newline_types)
+            if t is not None:
+                t.end_line = line_ctr.line
+                t.end_column = line_ctr.column
+                t.end_pos = line_ctr.char_pos
+                if t.type in self.callback:
+                    t = self.callback[t.type](t)
+                if not ignored:
+                    if not isinstance(t, Token):
+                        raise LexError("Callbacks must return a token (returned %r)" % t)
+                    lex_state.last_token = t
+                    return t
+
+        ##
+
+        raise EOFError(self)
+
+
+class ContextualLexer(Lexer):
+    lexers: Dict[int, AbstractBasicLexer]
+    root_lexer: AbstractBasicLexer
+
+    BasicLexer: Type[AbstractBasicLexer] = BasicLexer
+
+    def __init__(self, conf: 'LexerConf', states: Dict[int, Collection[str]], always_accept: Collection[str]=()) -> None:
+        terminals = list(conf.terminals)
+        terminals_by_name = conf.terminals_by_name
+
+        trad_conf = copy(conf)
+        trad_conf.terminals = terminals
+
+        if has_interegular and not conf.skip_validation:
+            comparator = interegular.Comparator.from_regexes({t: t.pattern.to_regexp() for t in terminals})
+        else:
+            comparator = None
+        lexer_by_tokens: Dict[FrozenSet[str], AbstractBasicLexer] = {}
+        self.lexers = {}
+        for state, accepts in states.items():
+            key = frozenset(accepts)
+            try:
+                lexer = lexer_by_tokens[key]
+            except KeyError:
+                accepts = set(accepts) | set(conf.ignore) | set(always_accept)
+                lexer_conf = copy(trad_conf)
+                lexer_conf.terminals = [terminals_by_name[n] for n in accepts if n in terminals_by_name]
+                lexer = self.BasicLexer(lexer_conf, comparator)
+                lexer_by_tokens[key] = lexer
+
+            self.lexers[state] = lexer
+
+        assert trad_conf.terminals is terminals
+        trad_conf.skip_validation = True  ##
+
+        self.root_lexer = self.BasicLexer(trad_conf, comparator)
+
+    def lex(self, lexer_state: LexerState, parser_state: 'ParserState') -> Iterator[Token]:
+        try:
+            while True:
+                lexer = self.lexers[parser_state.position]
+                yield lexer.next_token(lexer_state, parser_state)
+        except EOFError:
+            pass
+        except UnexpectedCharacters as e:
+            ##
+
+            ##
+
+            try:
+                last_token = lexer_state.last_token  ##
+
+                token = self.root_lexer.next_token(lexer_state, parser_state)
+                raise UnexpectedToken(token, e.allowed, state=parser_state, token_history=[last_token], terminals_by_name=self.root_lexer.terminals_by_name)
+            except UnexpectedCharacters:
+                raise e  ##
+
+
+
+
+_ParserArgType: 'TypeAlias' = 'Literal["earley", "lalr", "cyk", "auto"]'
+_LexerArgType: 'TypeAlias' = 'Union[Literal["auto", "basic", "contextual", "dynamic", "dynamic_complete"], Type[Lexer]]'
+_LexerCallback = Callable[[Token], Token]
+ParserCallbacks = Dict[str, Callable]
+
+class LexerConf(Serialize):
+    __serialize_fields__ = 'terminals', 'ignore', 'g_regex_flags', 'use_bytes', 'lexer_type'
+    __serialize_namespace__ = TerminalDef,
+
+    terminals: Collection[TerminalDef]
+    re_module: ModuleType
+    ignore: Collection[str]
+    postlex: 'Optional[PostLex]'
+    callbacks: Dict[str, _LexerCallback]
+    g_regex_flags: int
+    skip_validation: bool
+    use_bytes: bool
+    lexer_type: Optional[_LexerArgType]
+    strict: bool
+
+    def __init__(self, terminals: Collection[TerminalDef], re_module: ModuleType, ignore: Collection[str]=(), postlex: 'Optional[PostLex]'=None,
+                 callbacks: Optional[Dict[str, _LexerCallback]]=None, g_regex_flags: int=0, skip_validation: bool=False, use_bytes: bool=False, strict: bool=False):
+        self.terminals = terminals
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+        assert len(self.terminals) == len(self.terminals_by_name)
+        self.ignore = ignore
+        self.postlex = postlex
+        self.callbacks = callbacks or {}
+        self.g_regex_flags = g_regex_flags
+        self.re_module = re_module
+        self.skip_validation = skip_validation
+        self.use_bytes = use_bytes
+        self.strict = strict
+        self.lexer_type = None
+
+    def _deserialize(self):
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+
+    def __deepcopy__(self, memo=None):
+        return type(self)(
+            deepcopy(self.terminals, memo),
+            self.re_module,
+            deepcopy(self.ignore, memo),
+            deepcopy(self.postlex, memo),
+            deepcopy(self.callbacks, memo),
+            deepcopy(self.g_regex_flags, memo),
+            deepcopy(self.skip_validation, memo),
+            deepcopy(self.use_bytes, memo),
+        )
+
+class ParserConf(Serialize):
+    __serialize_fields__ = 'rules', 'start', 'parser_type'
+
+    rules: List['Rule']
+    callbacks: ParserCallbacks
+    start: List[str]
+    parser_type: _ParserArgType
+
+    def __init__(self, rules: List['Rule'], callbacks: ParserCallbacks, start: List[str]):
+        assert isinstance(start, list)
+        self.rules = rules
+        self.callbacks = callbacks
+        self.start = start
+
+
+from functools import partial, wraps
+from itertools import product
+
+
+class ExpandSingleChild:
+    def __init__(self, node_builder):
+        self.node_builder = node_builder
+
+    def __call__(self, children):
+        if len(children) == 1:
+            return children[0]
+        else:
+            return self.node_builder(children)
+
+
+
+class PropagatePositions:
+    def __init__(self, node_builder, node_filter=None):
+        self.node_builder = node_builder
+        self.node_filter = node_filter
+
+    def __call__(self, children):
+        res = self.node_builder(children)
+
+        if isinstance(res, Tree):
+            ##
+
+            ##
+
+            ##
+
+            ##
+
+
+            res_meta = res.meta
+
+            first_meta = self._pp_get_meta(children)
+            if first_meta is not None:
+                if not hasattr(res_meta, 'line'):
+                    ##
+
+                    res_meta.line = getattr(first_meta, 'container_line', first_meta.line)
+                    res_meta.column = getattr(first_meta, 'container_column', first_meta.column)
+                    res_meta.start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+                    res_meta.empty = False
+
+                res_meta.container_line = getattr(first_meta, 'container_line', first_meta.line)
+                res_meta.container_column = getattr(first_meta, 'container_column', first_meta.column)
+                res_meta.container_start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+
+            last_meta = self._pp_get_meta(reversed(children))
+            if last_meta is not None:
+                if not hasattr(res_meta, 'end_line'):
+                    res_meta.end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                    res_meta.end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                    res_meta.end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+                    res_meta.empty = False
+
+                res_meta.container_end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                res_meta.container_end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                res_meta.container_end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+
+        return res
+
+    def _pp_get_meta(self, children):
+        for c in children:
+            if self.node_filter is not None and not self.node_filter(c):
+                continue
+            if isinstance(c, Tree):
+                if not c.meta.empty:
+                    return c.meta
+            elif isinstance(c, Token):
+                return c
+            elif hasattr(c, '__lark_meta__'):
+                return c.__lark_meta__()
+
+def make_propagate_positions(option):
+    if callable(option):
+        return partial(PropagatePositions, node_filter=option)
+    elif option is True:
+        return PropagatePositions
+    elif option is False:
+        return None
+
+    raise ConfigurationError('Invalid option for propagate_positions: %r' % option)
+
+
+class ChildFilter:
+    def __init__(self, to_include, append_none, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+        self.append_none = append_none
+
+    def __call__(self, children):
+        filtered = []
+
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                filtered += children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR(ChildFilter):
+    #--
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR_NoPlaceholders(ChildFilter):
+    #--
+    def __init__(self, to_include, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand in self.to_include:
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+        return self.node_builder(filtered)
+
+
+def _should_expand(sym):
+    return not sym.is_term and sym.name.startswith('_')
+
+
+def maybe_create_child_filter(expansion, keep_all_tokens, ambiguous, _empty_indices: List[bool]):
+    ##
+
+    if _empty_indices:
+        assert _empty_indices.count(False) == len(expansion)
+        s = ''.join(str(int(b)) for b in _empty_indices)
+        empty_indices = [len(ones) for ones in s.split('0')]
+        assert len(empty_indices) == len(expansion)+1, (empty_indices, len(expansion))
+    else:
+        empty_indices = [0] * (len(expansion)+1)
+
+    to_include = []
+    nones_to_add = 0
+    for i, sym in enumerate(expansion):
+        nones_to_add += empty_indices[i]
+        if keep_all_tokens or not (sym.is_term and sym.filter_out):
+            to_include.append((i, _should_expand(sym), nones_to_add))
+            nones_to_add = 0
+
+    nones_to_add += empty_indices[len(expansion)]
+
+    if _empty_indices or len(to_include) < len(expansion) or any(to_expand for i, to_expand,_ in to_include):
+        if _empty_indices or ambiguous:
+            return partial(ChildFilter if ambiguous else ChildFilterLALR, to_include, nones_to_add)
+        else:
+            ##
+
+            return partial(ChildFilterLALR_NoPlaceholders, [(i, x) for i,x,_ in to_include])
+
+
+class AmbiguousExpander:
+    #--
+    def __init__(self, to_expand, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+        self.to_expand = to_expand
+
+    def __call__(self, children):
+        def _is_ambig_tree(t):
+            return hasattr(t, 'data') and t.data == '_ambig'
+
+        ##
+
+        ##
+
+        ##
+
+        ##
+
+        ambiguous = []
+        for i, child in enumerate(children):
+            if _is_ambig_tree(child):
+                if i in self.to_expand:
+                    ambiguous.append(i)
+
+                child.expand_kids_by_data('_ambig')
+
+        if not ambiguous:
+            return self.node_builder(children)
+
+        expand = [child.children if i in ambiguous else (child,) for i, child in enumerate(children)]
+        return self.tree_class('_ambig', [self.node_builder(list(f)) for f in product(*expand)])
+
+
+def maybe_create_ambiguous_expander(tree_class, expansion, keep_all_tokens):
+    to_expand = [i for i, sym in enumerate(expansion)
+                 if keep_all_tokens or ((not (sym.is_term and sym.filter_out)) and _should_expand(sym))]
+    if to_expand:
+        return partial(AmbiguousExpander, to_expand, tree_class)
+
+
+class AmbiguousIntermediateExpander:
+    #--
+
+    def __init__(self, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+
+    def __call__(self, children):
+        def _is_iambig_tree(child):
+            return hasattr(child, 'data') and child.data == '_iambig'
+
+        def _collapse_iambig(children):
+            #--
+
+            ##
+
+            ##
+
+            if children and _is_iambig_tree(children[0]):
+                iambig_node = children[0]
+                result = []
+                for grandchild in iambig_node.children:
+                    collapsed = _collapse_iambig(grandchild.children)
+                    if collapsed:
+                        for child in collapsed:
+                            child.children += children[1:]
+                        result += collapsed
+                    else:
+                        new_tree = self.tree_class('_inter', grandchild.children + children[1:])
+                        result.append(new_tree)
+                return result
+
+        collapsed = _collapse_iambig(children)
+        if collapsed:
+            processed_nodes = [self.node_builder(c.children) for c in collapsed]
+            return self.tree_class('_ambig', processed_nodes)
+
+        return self.node_builder(children)
+
+
+
+def inplace_transformer(func):
+    @wraps(func)
+    def f(children):
+        ##
+
+        tree = Tree(func.__name__, children)
+        return func(tree)
+    return f
+
+
+def apply_visit_wrapper(func, name, wrapper):
+    if wrapper is _vargs_meta or wrapper is _vargs_meta_inline:
+        raise NotImplementedError("Meta args not supported for internal transformer; use YourTransformer().transform(parser.parse()) instead")
+
+    @wraps(func)
+    def f(children):
+        return wrapper(func, name, children, None)
+    return f
+
+
+class ParseTreeBuilder:
+    def __init__(self, rules, tree_class, propagate_positions=False, ambiguous=False, maybe_placeholders=False):
+        self.tree_class = tree_class
+        self.propagate_positions = propagate_positions
+        self.ambiguous = ambiguous
+        self.maybe_placeholders = maybe_placeholders
+
+        self.rule_builders = list(self._init_builders(rules))
+
+    def _init_builders(self, rules):
+        propagate_positions = make_propagate_positions(self.propagate_positions)
+
+        for rule in rules:
+            options = rule.options
+            keep_all_tokens = options.keep_all_tokens
+            expand_single_child = options.expand1
+
+            wrapper_chain = list(filter(None, [
+                (expand_single_child and not rule.alias) and ExpandSingleChild,
+                maybe_create_child_filter(rule.expansion, keep_all_tokens, self.ambiguous, options.empty_indices if self.maybe_placeholders else None),
+                propagate_positions,
+                self.ambiguous and maybe_create_ambiguous_expander(self.tree_class, rule.expansion, keep_all_tokens),
+                self.ambiguous and partial(AmbiguousIntermediateExpander, self.tree_class)
+            ]))
+
+            yield rule, wrapper_chain
+
+    def create_callback(self, transformer=None):
+        callbacks = {}
+
+        default_handler = getattr(transformer, '__default__', None)
+        if default_handler:
+            def default_callback(data, children):
+                return default_handler(data, children, None)
+        else:
+            default_callback = self.tree_class
+
+        for rule, wrapper_chain in self.rule_builders:
+
+            user_callback_name = rule.alias or rule.options.template_source or rule.origin.name
+            try:
+                f = getattr(transformer, user_callback_name)
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    f = apply_visit_wrapper(f, user_callback_name, wrapper)
+                elif isinstance(transformer, Transformer_InPlace):
+                    f = inplace_transformer(f)
+            except AttributeError:
+                f = partial(default_callback, user_callback_name)
+
+            for w in wrapper_chain:
+                f = w(f)
+
+            if rule in callbacks:
+                raise GrammarError("Rule '%s' already exists" % (rule,))
+
+            callbacks[rule] = f
+
+        return callbacks
+
+
+
+class Action:
+    def __init__(self, name):
+        self.name = name
+    def __str__(self):
+        return self.name
+    def __repr__(self):
+        return str(self)
+
+Shift = Action('Shift')
+Reduce = Action('Reduce')
+
+StateT = TypeVar("StateT")
+
+class ParseTableBase(Generic[StateT]):
+    states: Dict[StateT, Dict[str, Tuple]]
+    start_states: Dict[str, StateT]
+    end_states: Dict[str, StateT]
+
+    def __init__(self, states, start_states, end_states):
+        self.states = states
+        self.start_states = start_states
+        self.end_states = end_states
+
+    def serialize(self, memo):
+        tokens = Enumerator()
+
+        states = {
+            state: {tokens.get(token): ((1, arg.serialize(memo)) if action is Reduce else (0, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in self.states.items()
+        }
+
+        return {
+            'tokens': tokens.reversed(),
+            'states': states,
+            'start_states': self.start_states,
+            'end_states': self.end_states,
+        }
+
+    @classmethod
+    def deserialize(cls, data, memo):
+        tokens = data['tokens']
+        states = {
+            state: {tokens[token]: ((Reduce, Rule.deserialize(arg, memo)) if action==1 else (Shift, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in data['states'].items()
+        }
+        return cls(states, data['start_states'], data['end_states'])
+
+class ParseTable(ParseTableBase['State']):
+    #--
+    pass
+
+
+class IntParseTable(ParseTableBase[int]):
+    #--
+
+    @classmethod
+    def from_ParseTable(cls, parse_table: ParseTable):
+        enum = list(parse_table.states)
+        state_to_idx: Dict['State', int] = {s:i for i,s in enumerate(enum)}
+        int_states = {}
+
+        for s, la in parse_table.states.items():
+            la = {k:(v[0], state_to_idx[v[1]]) if v[0] is Shift else v
+                  for k,v in la.items()}
+            int_states[ state_to_idx[s] ] = la
+
+
+        start_states = {start:state_to_idx[s] for start, s in parse_table.start_states.items()}
+        end_states = {start:state_to_idx[s] for start, s in parse_table.end_states.items()}
+        return cls(int_states, start_states, end_states)
+
+
+
+class ParseConf(Generic[StateT]):
+    __slots__ = 'parse_table', 'callbacks', 'start', 'start_state', 'end_state', 'states'
+
+    parse_table: ParseTableBase[StateT]
+    callbacks: ParserCallbacks
+    start: str
+
+    start_state: StateT
+    end_state: StateT
+    states: Dict[StateT, Dict[str, tuple]]
+
+    def __init__(self, parse_table: ParseTableBase[StateT], callbacks: ParserCallbacks, start: str):
+        self.parse_table = parse_table
+
+        self.start_state = self.parse_table.start_states[start]
+        self.end_state = self.parse_table.end_states[start]
+        self.states = self.parse_table.states
+
+        self.callbacks = callbacks
+        self.start = start
+
+class ParserState(Generic[StateT]):
+    __slots__ = 'parse_conf', 'lexer', 'state_stack', 'value_stack'
+
+    parse_conf: ParseConf[StateT]
+    lexer: LexerThread
+    state_stack: List[StateT]
+    value_stack: list
+
+    def __init__(self, parse_conf: ParseConf[StateT], lexer: LexerThread, state_stack=None, value_stack=None):
+        self.parse_conf = parse_conf
+        self.lexer = lexer
+        self.state_stack = state_stack or [self.parse_conf.start_state]
+        self.value_stack = value_stack or []
+
+    @property
+    def position(self) -> StateT:
+        return self.state_stack[-1]
+
+    ##
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ParserState):
+            return NotImplemented
+        return len(self.state_stack) == len(other.state_stack) and self.position == other.position
+
+    def __copy__(self):
+        return self.copy()
+
+    def copy(self, deepcopy_values=True) -> 'ParserState[StateT]':
+        return type(self)(
+            self.parse_conf,
+            self.lexer, ##
+
+            copy(self.state_stack),
+            deepcopy(self.value_stack) if deepcopy_values else copy(self.value_stack),
+        )
+
+    def feed_token(self, token: Token, is_end=False) -> Any:
+        state_stack = self.state_stack
+        value_stack = self.value_stack
+        states = self.parse_conf.states
+        end_state = self.parse_conf.end_state
+        callbacks = self.parse_conf.callbacks
+
+        while True:
+            state = state_stack[-1]
+            try:
+                action, arg = states[state][token.type]
+            except KeyError:
+                expected = {s for s in states[state].keys() if s.isupper()}
+                raise UnexpectedToken(token, expected, state=self, interactive_parser=None)
+
+            assert arg != end_state
+
+            if action is Shift:
+                ##
+
+                assert not is_end
+                state_stack.append(arg)
+                value_stack.append(token if token.type not in callbacks else callbacks[token.type](token))
+                return
+            else:
+                ##
+
+                rule = arg
+                size = len(rule.expansion)
+                if size:
+                    s = value_stack[-size:]
+                    del state_stack[-size:]
+                    del value_stack[-size:]
+                else:
+                    s = []
+
+                value = callbacks[rule](s) if callbacks else s
+
+                _action, new_state = states[state_stack[-1]][rule.origin.name]
+                assert _action is Shift
+                state_stack.append(new_state)
+                value_stack.append(value)
+
+                if is_end and state_stack[-1] == end_state:
+                    return value_stack[-1]
+
+
+class LALR_Parser(Serialize):
+    def __init__(self, parser_conf: ParserConf, debug: bool=False, strict: bool=False):
+        analysis = LALR_Analyzer(parser_conf, debug=debug, strict=strict)
+        analysis.compute_lalr()
+        callbacks = parser_conf.callbacks
+
+        self._parse_table = analysis.parse_table
+        self.parser_conf = parser_conf
+        self.parser = _Parser(analysis.parse_table, callbacks, debug)
+
+    @classmethod
+    def deserialize(cls, data, memo, callbacks, debug=False):
+        inst = cls.__new__(cls)
+        inst._parse_table = IntParseTable.deserialize(data, memo)
+        inst.parser = _Parser(inst._parse_table, callbacks, debug)
+        return inst
+
+    def serialize(self, memo: Any = None) -> Dict[str, Any]:
+        return self._parse_table.serialize(memo)
+
+    def parse_interactive(self, lexer: LexerThread, start: str):
+        return self.parser.parse(lexer, start, start_interactive=True)
+
+    def parse(self, lexer, start, on_error=None):
+        try:
+            return self.parser.parse(lexer, start)
+        except UnexpectedInput as e:
+            if on_error is None:
+                raise
+
+            while True:
+                if isinstance(e, UnexpectedCharacters):
+                    s = e.interactive_parser.lexer_thread.state
+                    p = s.line_ctr.char_pos
+
+                if not on_error(e):
+                    raise e
+
+                if isinstance(e, UnexpectedCharacters):
+                    ##
+
+                    if p == s.line_ctr.char_pos:
+                        s.line_ctr.feed(s.text.text[p:p+1])
+
+                try:
+                    return e.interactive_parser.resume_parse()
+                except UnexpectedToken as e2:
+                    if (isinstance(e, UnexpectedToken)
+                        and e.token.type == e2.token.type == '$END'
+                        and e.interactive_parser == e2.interactive_parser):
+                        ##
+
+                        raise e2
+                    e = e2
+                except UnexpectedCharacters as e2:
+                    e = e2
+
+
+class _Parser:
+    parse_table: ParseTableBase
+    callbacks: ParserCallbacks
+    debug: bool
+
+    def __init__(self, parse_table: ParseTableBase, callbacks: ParserCallbacks, debug: bool=False):
+        self.parse_table = parse_table
+        self.callbacks = callbacks
+        self.debug = debug
+
+    def parse(self, lexer: LexerThread, start: str, value_stack=None, state_stack=None, start_interactive=False):
+        parse_conf = ParseConf(self.parse_table, self.callbacks, start)
+        parser_state = ParserState(parse_conf, lexer, state_stack, value_stack)
+        if start_interactive:
+            return InteractiveParser(self, parser_state, parser_state.lexer)
+        return self.parse_from_state(parser_state)
+
+
+    def parse_from_state(self, state: ParserState, last_token: Optional[Token]=None):
+        #--
+        try:
+            token = last_token
+            for token in state.lexer.lex(state):
+                assert token is not None
+                state.feed_token(token)
+
+            end_token = Token.new_borrow_pos('$END', '', token) if token else Token('$END', '', 0, 1, 1)
+            return state.feed_token(end_token, True)
+        except UnexpectedInput as e:
+            try:
+                e.interactive_parser = InteractiveParser(self, state, state.lexer)
+            except NameError:
+                pass
+            raise e
+        except Exception as e:
+            if self.debug:
+                print("")
+                print("STATE STACK DUMP")
+                print("----------------")
+                for i, s in enumerate(state.state_stack):
+                    print('%d)' % i , s)
+                print("")
+
+            raise
+
+
+class InteractiveParser:
+    #--
+    def __init__(self, parser, parser_state: ParserState, lexer_thread: LexerThread):
+        self.parser = parser
+        self.parser_state = parser_state
+        self.lexer_thread = lexer_thread
+        self.result = None
+
+    @property
+    def lexer_state(self) -> LexerThread:
+        warnings.warn("lexer_state will be removed in subsequent releases. Use lexer_thread instead.", DeprecationWarning)
+        return self.lexer_thread
+
+    def feed_token(self, token: Token):
+        #--
+        return self.parser_state.feed_token(token, token.type == '$END')
+
+    def iter_parse(self) -> Iterator[Token]:
+        #--
+        for token in self.lexer_thread.lex(self.parser_state):
+            yield token
+            self.result = self.feed_token(token)
+
+    def exhaust_lexer(self) -> List[Token]:
+        #--
+        return list(self.iter_parse())
+
+
+    def feed_eof(self, last_token=None):
+        #--
+        eof = Token.new_borrow_pos('$END', '', last_token) if last_token is not None else self.lexer_thread._Token('$END', '', 0, 1, 1)
+        return self.feed_token(eof)
+
+
+    def __copy__(self):
+        #--
+        return self.copy()
+
+    def copy(self, deepcopy_values=True):
+        return type(self)(
+            self.parser,
+            self.parser_state.copy(deepcopy_values=deepcopy_values),
+            copy(self.lexer_thread),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, InteractiveParser):
+            return False
+
+        return self.parser_state == other.parser_state and self.lexer_thread == other.lexer_thread
+
+    def as_immutable(self):
+        #--
+        p = copy(self)
+        return ImmutableInteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+    def pretty(self):
+        #--
+        out = ["Parser choices:"]
+        for k, v in self.choices().items():
+            out.append('\t- %s -> %r' % (k, v))
+        out.append('stack size: %s' % len(self.parser_state.state_stack))
+        return '\n'.join(out)
+
+    def choices(self):
+        #--
+        return self.parser_state.parse_conf.parse_table.states[self.parser_state.position]
+
+    def accepts(self):
+        #--
+        accepts = set()
+        conf_no_callbacks = copy(self.parser_state.parse_conf)
+        ##
+
+        ##
+
+        conf_no_callbacks.callbacks = {}
+        for t in self.choices():
+            if t.isupper(): ##
+
+                new_cursor = self.copy(deepcopy_values=False)
+                new_cursor.parser_state.parse_conf = conf_no_callbacks
+                try:
+                    new_cursor.feed_token(self.lexer_thread._Token(t, ''))
+                except UnexpectedToken:
+                    pass
+                else:
+                    accepts.add(t)
+        return accepts
+
+    def resume_parse(self):
+        #--
+        return self.parser.parse_from_state(self.parser_state, last_token=self.lexer_thread.state.last_token)
+
+
+
+class ImmutableInteractiveParser(InteractiveParser):
+    #--
+
+    result = None
+
+    def __hash__(self):
+        return hash((self.parser_state, self.lexer_thread))
+
+    def feed_token(self, token):
+        c = copy(self)
+        c.result = InteractiveParser.feed_token(c, token)
+        return c
+
+    def exhaust_lexer(self):
+        #--
+        cursor = self.as_mutable()
+        cursor.exhaust_lexer()
+        return cursor.as_immutable()
+
+    def as_mutable(self):
+        #--
+        p = copy(self)
+        return InteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+
+
+def _wrap_lexer(lexer_class):
+    future_interface = getattr(lexer_class, '__future_interface__', 0)
+    if future_interface == 2:
+        return lexer_class
+    elif future_interface == 1:
+        class CustomLexerWrapper1(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+            def lex(self, lexer_state, parser_state):
+                if isinstance(lexer_state.text, TextSlice) and not lexer_state.text.is_complete_text():
+                    raise TypeError("Interface=1 Custom Lexer don't support TextSlice")
+                lexer_state.text = lexer_state.text
+                return self.lexer.lex(lexer_state, parser_state)
+        return CustomLexerWrapper1
+    elif future_interface == 0:
+        class CustomLexerWrapper0(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+
+            def lex(self, lexer_state, parser_state):
+                if isinstance(lexer_state.text, TextSlice):
+                    if not lexer_state.text.is_complete_text():
+                        raise TypeError("Interface=0 Custom Lexer don't support TextSlice")
+                    return self.lexer.lex(lexer_state.text.text)
+                return self.lexer.lex(lexer_state.text)
+        return CustomLexerWrapper0
+    else:
+        raise ValueError(f"Unknown __future_interface__ value {future_interface}, integer 0-2 expected")
+
+
+def _deserialize_parsing_frontend(data, memo, lexer_conf, callbacks, options):
+    parser_conf = ParserConf.deserialize(data['parser_conf'], memo)
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    parser = cls.deserialize(data['parser'], memo, callbacks, options.debug)
+    parser_conf.callbacks = callbacks
+    return ParsingFrontend(lexer_conf, parser_conf, options, parser=parser)
+
+
+_parser_creators: 'Dict[str, Callable[[LexerConf, Any, Any], Any]]' = {}
+
+
+class ParsingFrontend(Serialize):
+    __serialize_fields__ = 'lexer_conf', 'parser_conf', 'parser'
+
+    lexer_conf: LexerConf
+    parser_conf: ParserConf
+    options: Any
+
+    def __init__(self, lexer_conf: LexerConf, parser_conf: ParserConf, options, parser=None):
+        self.parser_conf = parser_conf
+        self.lexer_conf = lexer_conf
+        self.options = options
+
+        ##
+
+        if parser:  ##
+
+            self.parser = parser
+        else:
+            create_parser = _parser_creators.get(parser_conf.parser_type)
+            assert create_parser is not None, "{} is not supported in standalone mode".format(
+                    parser_conf.parser_type
+                )
+            self.parser = create_parser(lexer_conf, parser_conf, options)
+
+        ##
+
+        lexer_type = lexer_conf.lexer_type
+        self.skip_lexer = False
+        if lexer_type in ('dynamic', 'dynamic_complete'):
+            assert lexer_conf.postlex is None
+            self.skip_lexer = True
+            return
+
+        if isinstance(lexer_type, type):
+            assert issubclass(lexer_type, Lexer)
+            self.lexer = _wrap_lexer(lexer_type)(lexer_conf)
+        elif isinstance(lexer_type, str):
+            create_lexer = {
+                'basic': create_basic_lexer,
+                'contextual': create_contextual_lexer,
+            }[lexer_type]
+            self.lexer = create_lexer(lexer_conf, self.parser, lexer_conf.postlex, options)
+        else:
+            raise TypeError("Bad value for lexer_type: {lexer_type}")
+
+        if lexer_conf.postlex:
+            self.lexer = PostLexConnector(self.lexer, lexer_conf.postlex)
+
+    def _verify_start(self, start=None):
+        if start is None:
+            start_decls = self.parser_conf.start
+            if len(start_decls) > 1:
+                raise ConfigurationError("Lark initialized with more than 1 possible start rule. Must specify which start rule to parse", start_decls)
+            start ,= start_decls
+        elif start not in self.parser_conf.start:
+            raise ConfigurationError("Unknown start rule %s. Must be one of %r" % (start, self.parser_conf.start))
+        return start
+
+    def _make_lexer_thread(self, text: Optional[LarkInput]) -> Union[LarkInput, LexerThread, None]:
+        cls = (self.options and self.options._plugins.get('LexerThread')) or LexerThread
+        if self.skip_lexer:
+            return text
+        if text is None:
+            return cls(self.lexer, None)
+        if isinstance(text, (str, bytes, TextSlice)):
+            return cls.from_text(self.lexer, text)
+        return cls.from_custom_input(self.lexer, text)
+
+    def parse(self, text: Optional[LarkInput], start=None, on_error=None):
+        if self.lexer_conf.lexer_type in ("dynamic", "dynamic_complete"):
+            if isinstance(text, TextSlice) and not text.is_complete_text():
+                raise TypeError(f"Lexer {self.lexer_conf.lexer_type} does not support text slices.")
+
+        chosen_start = self._verify_start(start)
+        kw = {} if on_error is None else {'on_error': on_error}
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse(stream, chosen_start, **kw)
+
+    def parse_interactive(self, text: Optional[TextOrSlice]=None, start=None):
+        ##
+
+        ##
+
+        chosen_start = self._verify_start(start)
+        if self.parser_conf.parser_type != 'lalr':
+            raise ConfigurationError("parse_interactive() currently only works with parser='lalr' ")
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse_interactive(stream, chosen_start)
+
+
+def _validate_frontend_args(parser, lexer) -> None:
+    assert_config(parser, ('lalr', 'earley', 'cyk'))
+    if not isinstance(lexer, type):     ##
+
+        expected = {
+            'lalr': ('basic', 'contextual'),
+            'earley': ('basic', 'dynamic', 'dynamic_complete'),
+            'cyk': ('basic', ),
+         }[parser]
+        assert_config(lexer, expected, 'Parser %r does not support lexer %%r, expected one of %%s' % parser)
+
+
+def _get_lexer_callbacks(transformer, terminals):
+    result = {}
+    for terminal in terminals:
+        callback = getattr(transformer, terminal.name, None)
+        if callback is not None:
+            result[terminal.name] = callback
+    return result
+
+class PostLexConnector:
+    def __init__(self, lexer, postlexer):
+        self.lexer = lexer
+        self.postlexer = postlexer
+
+    def lex(self, lexer_state, parser_state):
+        i = self.lexer.lex(lexer_state, parser_state)
+        return self.postlexer.process(i)
+
+
+
+def create_basic_lexer(lexer_conf, parser, postlex, options) -> BasicLexer:
+    cls = (options and options._plugins.get('BasicLexer')) or BasicLexer
+    return cls(lexer_conf)
+
+def create_contextual_lexer(lexer_conf: LexerConf, parser, postlex, options) -> ContextualLexer:
+    cls = (options and options._plugins.get('ContextualLexer')) or ContextualLexer
+    parse_table: ParseTableBase[int] = parser._parse_table
+    states: Dict[int, Collection[str]] = {idx:list(t.keys()) for idx, t in parse_table.states.items()}
+    always_accept: Collection[str] = postlex.always_accept if postlex else ()
+    return cls(lexer_conf, states, always_accept=always_accept)
+
+def create_lalr_parser(lexer_conf: LexerConf, parser_conf: ParserConf, options=None) -> LALR_Parser:
+    debug = options.debug if options else False
+    strict = options.strict if options else False
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    return cls(parser_conf, debug=debug, strict=strict)
+
+_parser_creators['lalr'] = create_lalr_parser
+
+
+
+
+class PostLex(ABC):
+    @abstractmethod
+    def process(self, stream: Iterator[Token]) -> Iterator[Token]:
+        return stream
+
+    always_accept: Iterable[str] = ()
+
+class LarkOptions(Serialize):
+    #--
+
+    start: List[str]
+    debug: bool
+    strict: bool
+    transformer: 'Optional[Transformer]'
+    propagate_positions: Union[bool, str]
+    maybe_placeholders: bool
+    cache: Union[bool, str]
+    cache_grammar: bool
+    regex: bool
+    g_regex_flags: int
+    keep_all_tokens: bool
+    tree_class: Optional[Callable[[str, List], Any]]
+    parser: _ParserArgType
+    lexer: _LexerArgType
+    ambiguity: 'Literal["auto", "resolve", "explicit", "forest"]'
+    postlex: Optional[PostLex]
+    priority: 'Optional[Literal["auto", "normal", "invert"]]'
+    lexer_callbacks: Dict[str, Callable[[Token], Token]]
+    use_bytes: bool
+    ordered_sets: bool
+    edit_terminals: Optional[Callable[[TerminalDef], TerminalDef]]
+    import_paths: 'List[Union[str, Callable[[Union[None, str, PackageResource], str], Tuple[str, str]]]]'
+    source_path: Optional[str]
+
+    OPTIONS_DOC = r"""
+    **===  General Options  ===**
+
+    start
+            The start symbol. Either a string, or a list of strings for multiple possible starts (Default: "start")
+    debug
+            Display debug information and extra warnings. Use only when debugging (Default: ``False``)
+            When used with Earley, it generates a forest graph as "sppf.png", if 'dot' is installed.
+    strict
+            Throw an exception on any potential ambiguity, including shift/reduce conflicts, and regex collisions.
+    transformer
+            Applies the transformer to every parse tree (equivalent to applying it after the parse, but faster)
+    propagate_positions
+            Propagates positional attributes into the 'meta' attribute of all tree branches.
+            Sets attributes: (line, column, end_line, end_column, start_pos, end_pos,
+                              container_line, container_column, container_end_line, container_end_column)
+            Accepts ``False``, ``True``, or a callable, which will filter which nodes to ignore when propagating.
+    maybe_placeholders
+            When ``True``, the ``[]`` operator returns ``None`` when not matched.
+            When ``False``,  ``[]`` behaves like the ``?`` operator, and returns no value at all.
+            (default= ``True``)
+    cache
+            Cache the results of the Lark grammar analysis, for x2 to x3 faster loading. LALR only for now.
+
+            - When ``False``, does nothing (default)
+            - When ``True``, caches to a temporary file in the local directory
+            - When given a string, caches to the path pointed by the string
+    cache_grammar
+            For use with ``cache`` option. When ``True``, the unanalyzed grammar is also included in the cache.
+            Useful for classes that require the ``Lark.grammar`` to be present (e.g. Reconstructor).
+            (default= ``False``)
+    regex
+            When True, uses the ``regex`` module instead of the stdlib ``re``.
+    g_regex_flags
+            Flags that are applied to all terminals (both regex and strings)
+    keep_all_tokens
+            Prevent the tree builder from automagically removing "punctuation" tokens (Default: ``False``)
+    tree_class
+            Lark will produce trees comprised of instances of this class instead of the default ``lark.Tree``.
+
+    **=== Algorithm Options ===**
+
+    parser
+            Decides which parser engine to use. Accepts "earley" or "lalr". (Default: "earley").
+            (there is also a "cyk" option for legacy)
+    lexer
+            Decides whether or not to use a lexer stage
+
+            - "auto" (default): Choose for me based on the parser
+            - "basic": Use a basic lexer
+            - "contextual": Stronger lexer (only works with parser="lalr")
+            - "dynamic": Flexible and powerful (only with parser="earley")
+            - "dynamic_complete": Same as dynamic, but tries *every* variation of tokenizing possible.
+    ambiguity
+            Decides how to handle ambiguity in the parse. Only relevant if parser="earley"
+
+            - "resolve": The parser will automatically choose the simplest derivation
+              (it chooses consistently: greedy for tokens, non-greedy for rules)
+            - "explicit": The parser will return all derivations wrapped in "_ambig" tree nodes (i.e. a forest).
+            - "forest": The parser will return the root of the shared packed parse forest.
+
+    **=== Misc. / Domain Specific Options ===**
+
+    postlex
+            Lexer post-processing (Default: ``None``) Only works with the basic and contextual lexers.
+    priority
+            How priorities should be evaluated - "auto", ``None``, "normal", "invert" (Default: "auto")
+    lexer_callbacks
+            Dictionary of callbacks for the lexer. May alter tokens during lexing. Use with caution.
+    use_bytes
+            Accept an input of type ``bytes`` instead of ``str``.
+    ordered_sets
+            Should Earley use ordered-sets to achieve stable output (~10% slower than regular sets. Default: True)
+    edit_terminals
+            A callback for editing the terminals before parse.
+    import_paths
+            A List of either paths or loader functions to specify from where grammars are imported
+    source_path
+            Override the source of from where the grammar was loaded. Useful for relative imports and unconventional grammar loading
+    **=== End of Options ===**
+    """
+    if __doc__:
+        __doc__ += OPTIONS_DOC
+
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    _defaults: Dict[str, Any] = {
+        'debug': False,
+        'strict': False,
+        'keep_all_tokens': False,
+        'tree_class': None,
+        'cache': False,
+        'cache_grammar': False,
+        'postlex': None,
+        'parser': 'earley',
+        'lexer': 'auto',
+        'transformer': None,
+        'start': 'start',
+        'priority': 'auto',
+        'ambiguity': 'auto',
+        'regex': False,
+        'propagate_positions': False,
+        'lexer_callbacks': {},
+        'maybe_placeholders': True,
+        'edit_terminals': None,
+        'g_regex_flags': 0,
+        'use_bytes': False,
+        'ordered_sets': True,
+        'import_paths': [],
+        'source_path': None,
+        '_plugins': {},
+    }
+
+    def __init__(self, options_dict: Dict[str, Any]) -> None:
+        o = dict(options_dict)
+
+        options = {}
+        for name, default in self._defaults.items():
+            if name in o:
+                value = o.pop(name)
+                if isinstance(default, bool) and name not in ('cache', 'use_bytes', 'propagate_positions'):
+                    value = bool(value)
+            else:
+                value = default
+
+            options[name] = value
+
+        if isinstance(options['start'], str):
+            options['start'] = [options['start']]
+
+        self.__dict__['options'] = options
+
+
+        assert_config(self.parser, ('earley', 'lalr', 'cyk', None))
+
+        if self.parser == 'earley' and self.transformer:
+            raise ConfigurationError('Cannot specify an embedded transformer when using the Earley algorithm. '
+                             'Please use your transformer on the resulting parse tree, or use a different algorithm (i.e. LALR)')
+
+        if self.cache_grammar and not self.cache:
+            raise ConfigurationError('cache_grammar cannot be set when cache is disabled')
+
+        if o:
+            raise ConfigurationError("Unknown options: %s" % o.keys())
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__['options'][name]
+        except KeyError as e:
+            raise AttributeError(e)
+
+    def __setattr__(self, name: str, value: str) -> None:
+        assert_config(name, self.options.keys(), "%r isn't a valid option. Expected one of: %s")
+        self.options[name] = value
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        return self.options
+
+    @classmethod
+    def deserialize(cls, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]]) -> "LarkOptions":
+        return cls(data)
+
+
+##
+
+##
+
+_LOAD_ALLOWED_OPTIONS = {'postlex', 'transformer', 'lexer_callbacks', 'use_bytes', 'debug', 'g_regex_flags', 'regex', 'propagate_positions', 'tree_class', '_plugins'}
+
+_VALID_PRIORITY_OPTIONS = ('auto', 'normal', 'invert', None)
+_VALID_AMBIGUITY_OPTIONS = ('auto', 'resolve', 'explicit', 'forest')
+
+
+_T = TypeVar('_T', bound="Lark")
+
+class Lark(Serialize):
+    #--
+
+    source_path: str
+    source_grammar: str
+    grammar: 'Grammar'
+    options: LarkOptions
+    lexer: Lexer
+    parser: 'ParsingFrontend'
+    terminals: Collection[TerminalDef]
+
+    __serialize_fields__ = ['parser', 'rules', 'options']
+
+    def __init__(self, grammar: 'Union[Grammar, str, IO[str]]', **options) -> None:
+        self.options = LarkOptions(options)
+        re_module: types.ModuleType
+
+        ##
+
+        if self.options.cache_grammar:
+            self.__serialize_fields__ = self.__serialize_fields__ + ['grammar']
+
+        ##
+
+        use_regex = self.options.regex
+        if use_regex:
+            if _has_regex:
+                re_module = regex
+            else:
+                raise ImportError('`regex` module must be installed if calling `Lark(regex=True)`.')
+        else:
+            re_module = re
+
+        ##
+
+        if self.options.source_path is None:
+            try:
+                self.source_path = grammar.name  ##
+
+            except AttributeError:
+                self.source_path = '<string>'
+        else:
+            self.source_path = self.options.source_path
+
+        ##
+
+        try:
+            read = grammar.read  ##
+
+        except AttributeError:
+            pass
+        else:
+            grammar = read()
+
+        cache_fn = None
+        cache_sha256 = None
+        if isinstance(grammar, str):
+            self.source_grammar = grammar
+            if self.options.use_bytes:
+                if not grammar.isascii():
+                    raise ConfigurationError("Grammar must be ascii only, when use_bytes=True")
+
+            if self.options.cache:
+                if self.options.parser != 'lalr':
+                    raise ConfigurationError("cache only works with parser='lalr' for now")
+
+                unhashable = ('transformer', 'postlex', 'lexer_callbacks', 'edit_terminals', '_plugins')
+                options_str = ''.join(k+str(v) for k, v in options.items() if k not in unhashable)
+                from . import __version__
+                s = grammar + options_str + __version__ + str(sys.version_info[:2])
+                cache_sha256 = sha256_digest(s)
+
+                if isinstance(self.options.cache, str):
+                    cache_fn = self.options.cache
+                else:
+                    if self.options.cache is not True:
+                        raise ConfigurationError("cache argument must be bool or str")
+
+                    try:
+                        username = getpass.getuser()
+                    except Exception:
+                        ##
+
+                        ##
+
+                        ##
+
+                        username = "unknown"
+
+
+                    cache_fn = tempfile.gettempdir() + "/.lark_%s_%s_%s_%s_%s.tmp" % (
+                        "cache_grammar" if self.options.cache_grammar else "cache", username, cache_sha256, *sys.version_info[:2])
+
+                old_options = self.options
+                try:
+                    with FS.open(cache_fn, 'rb') as f:
+                        logger.debug('Loading grammar from cache: %s', cache_fn)
+                        ##
+
+                        for name in (set(options) - _LOAD_ALLOWED_OPTIONS):
+                            del options[name]
+                        file_sha256 = f.readline().rstrip(b'\n')
+                        cached_used_files = pickle.load(f)
+                        if file_sha256 == cache_sha256.encode('utf8') and verify_used_files(cached_used_files):
+                            cached_parser_data = pickle.load(f)
+                            self._load(cached_parser_data, **options)
+                            return
+                except FileNotFoundError:
+                    ##
+
+                    pass
+                except Exception: ##
+
+                    logger.exception("Failed to load Lark from cache: %r. We will try to carry on.", cache_fn)
+
+                    ##
+
+                    ##
+
+                    self.options = old_options
+
+
+            ##
+
+            self.grammar, used_files = load_grammar(grammar, self.source_path, self.options.import_paths, self.options.keep_all_tokens)
+        else:
+            assert isinstance(grammar, Grammar)
+            self.grammar = grammar
+
+
+        if self.options.lexer == 'auto':
+            if self.options.parser == 'lalr':
+                self.options.lexer = 'contextual'
+            elif self.options.parser == 'earley':
+                if self.options.postlex is not None:
+                    logger.info("postlex can't be used with the dynamic lexer, so we use 'basic' instead. "
+                                "Consider using lalr with contextual instead of earley")
+                    self.options.lexer = 'basic'
+                else:
+                    self.options.lexer = 'dynamic'
+            elif self.options.parser == 'cyk':
+                self.options.lexer = 'basic'
+            else:
+                assert False, self.options.parser
+        lexer = self.options.lexer
+        if isinstance(lexer, type):
+            assert issubclass(lexer, Lexer)     ##
+
+        else:
+            assert_config(lexer, ('basic', 'contextual', 'dynamic', 'dynamic_complete'))
+            if self.options.postlex is not None and 'dynamic' in lexer:
+                raise ConfigurationError("Can't use postlex with a dynamic lexer. Use basic or contextual instead")
+
+        if self.options.ambiguity == 'auto':
+            if self.options.parser == 'earley':
+                self.options.ambiguity = 'resolve'
+        else:
+            assert_config(self.options.parser, ('earley', 'cyk'), "%r doesn't support disambiguation. Use one of these parsers instead: %s")
+
+        if self.options.priority == 'auto':
+            self.options.priority = 'normal'
+
+        if self.options.priority not in _VALID_PRIORITY_OPTIONS:
+            raise ConfigurationError("invalid priority option: %r. Must be one of %r" % (self.options.priority, _VALID_PRIORITY_OPTIONS))
+        if self.options.ambiguity not in _VALID_AMBIGUITY_OPTIONS:
+            raise ConfigurationError("invalid ambiguity option: %r. Must be one of %r" % (self.options.ambiguity, _VALID_AMBIGUITY_OPTIONS))
+
+        if self.options.parser is None:
+            terminals_to_keep = '*'     ##
+
+        elif self.options.postlex is not None:
+            terminals_to_keep = set(self.options.postlex.always_accept)
+        else:
+            terminals_to_keep = set()
+
+        ##
+
+        self.terminals, self.rules, self.ignore_tokens = self.grammar.compile(self.options.start, terminals_to_keep)
+
+        if self.options.edit_terminals:
+            for t in self.terminals:
+                self.options.edit_terminals(t)
+
+        self._terminals_dict = {t.name: t for t in self.terminals}
+
+        ##
+
+        if self.options.priority == 'invert':
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = -rule.options.priority
+            for term in self.terminals:
+                term.priority = -term.priority
+        ##
+
+        ##
+
+        ##
+
+        elif self.options.priority is None:
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = None
+            for term in self.terminals:
+                term.priority = 0
+
+        ##
+
+        self.lexer_conf = LexerConf(
+                self.terminals, re_module, self.ignore_tokens, self.options.postlex,
+                self.options.lexer_callbacks, self.options.g_regex_flags, use_bytes=self.options.use_bytes, strict=self.options.strict
+            )
+
+        if self.options.parser:
+            self.parser = self._build_parser()
+        elif lexer:
+            self.lexer = self._build_lexer()
+
+        if cache_fn:
+            logger.debug('Saving grammar to cache: %s', cache_fn)
+            try:
+                with FS.open(cache_fn, 'wb') as f:
+                    assert cache_sha256 is not None
+                    f.write(cache_sha256.encode('utf8') + b'\n')
+                    pickle.dump(used_files, f)
+                    self.save(f, _LOAD_ALLOWED_OPTIONS)
+            except IOError as e:
+                logger.exception("Failed to save Lark to cache: %r.", cache_fn, e)
+
+    if __doc__:
+        __doc__ += "\n\n" + LarkOptions.OPTIONS_DOC
+
+    def _build_lexer(self, dont_ignore: bool=False) -> BasicLexer:
+        lexer_conf = self.lexer_conf
+        if dont_ignore:
+            from copy import copy
+            lexer_conf = copy(lexer_conf)
+            lexer_conf.ignore = ()
+        return BasicLexer(lexer_conf)
+
+    def _prepare_callbacks(self) -> None:
+        self._callbacks = {}
+        ##
+
+        if self.options.ambiguity != 'forest':
+            self._parse_tree_builder = ParseTreeBuilder(
+                    self.rules,
+                    self.options.tree_class or Tree,
+                    self.options.propagate_positions,
+                    self.options.parser != 'lalr' and self.options.ambiguity == 'explicit',
+                    self.options.maybe_placeholders
+                )
+            self._callbacks = self._parse_tree_builder.create_callback(self.options.transformer)
+        self._callbacks.update(_get_lexer_callbacks(self.options.transformer, self.terminals))
+
+    def _build_parser(self) -> "ParsingFrontend":
+        self._prepare_callbacks()
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        parser_conf = ParserConf(self.rules, self._callbacks, self.options.start)
+        return _construct_parsing_frontend(
+            self.options.parser,
+            self.options.lexer,
+            self.lexer_conf,
+            parser_conf,
+            options=self.options
+        )
+
+    def save(self, f, exclude_options: Collection[str] = ()) -> None:
+        #--
+        if self.options.parser != 'lalr':
+            raise NotImplementedError("Lark.save() is only implemented for the LALR(1) parser.")
+        data, m = self.memo_serialize([TerminalDef, Rule])
+        if exclude_options:
+            data["options"] = {n: v for n, v in data["options"].items() if n not in exclude_options}
+        pickle.dump({'data': data, 'memo': m}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls: Type[_T], f) -> _T:
+        #--
+        inst = cls.__new__(cls)
+        return inst._load(f)
+
+    def _deserialize_lexer_conf(self, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]], options: LarkOptions) -> LexerConf:
+        lexer_conf = LexerConf.deserialize(data['lexer_conf'], memo)
+        lexer_conf.callbacks = options.lexer_callbacks or {}
+        lexer_conf.re_module = regex if options.regex else re
+        lexer_conf.use_bytes = options.use_bytes
+        lexer_conf.g_regex_flags = options.g_regex_flags
+        lexer_conf.skip_validation = True
+        lexer_conf.postlex = options.postlex
+        return lexer_conf
+
+    def _load(self: _T, f: Any, **kwargs) -> _T:
+        if isinstance(f, dict):
+            d = f
+        else:
+            d = pickle.load(f)
+        memo_json = d['memo']
+        data = d['data']
+
+        assert memo_json
+        memo = SerializeMemoizer.deserialize(memo_json, {'Rule': Rule, 'TerminalDef': TerminalDef}, {})
+        if 'grammar' in data:
+            self.grammar = Grammar.deserialize(data['grammar'], memo)
+        options = dict(data['options'])
+        if (set(kwargs) - _LOAD_ALLOWED_OPTIONS) & set(LarkOptions._defaults):
+            raise ConfigurationError("Some options are not allowed when loading a Parser: {}"
+                             .format(set(kwargs) - _LOAD_ALLOWED_OPTIONS))
+        options.update(kwargs)
+        self.options = LarkOptions.deserialize(options, memo)
+        self.rules = [Rule.deserialize(r, memo) for r in data['rules']]
+        self.source_path = '<deserialized>'
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        self.lexer_conf = self._deserialize_lexer_conf(data['parser'], memo, self.options)
+        self.terminals = self.lexer_conf.terminals
+        self._prepare_callbacks()
+        self._terminals_dict = {t.name: t for t in self.terminals}
+        self.parser = _deserialize_parsing_frontend(
+            data['parser'],
+            memo,
+            self.lexer_conf,
+            self._callbacks,
+            self.options,  ##
+
+        )
+        return self
+
+    @classmethod
+    def _load_from_dict(cls, data, memo, **kwargs):
+        inst = cls.__new__(cls)
+        return inst._load({'data': data, 'memo': memo}, **kwargs)
+
+    @classmethod
+    def open(cls: Type[_T], grammar_filename: str, rel_to: Optional[str]=None, **options) -> _T:
+        #--
+        if rel_to:
+            basepath = os.path.dirname(rel_to)
+            grammar_filename = os.path.join(basepath, grammar_filename)
+        with open(grammar_filename, encoding='utf8') as f:
+            return cls(f, **options)
+
+    @classmethod
+    def open_from_package(cls: Type[_T], package: str, grammar_path: str, search_paths: 'Sequence[str]'=[""], **options) -> _T:
+        #--
+        package_loader = FromPackageLoader(package, search_paths)
+        full_path, text = package_loader(None, grammar_path)
+        options.setdefault('source_path', full_path)
+        options.setdefault('import_paths', [])
+        options['import_paths'].append(package_loader)
+        return cls(text, **options)
+
+    def __repr__(self):
+        return 'Lark(open(%r), parser=%r, lexer=%r, ...)' % (self.source_path, self.options.parser, self.options.lexer)
+
+
+    def lex(self, text: TextOrSlice, dont_ignore: bool=False) -> Iterator[Token]:
+        #--
+        lexer: Lexer
+        if not hasattr(self, 'lexer') or dont_ignore:
+            lexer = self._build_lexer(dont_ignore)
+        else:
+            lexer = self.lexer
+        lexer_thread = LexerThread.from_text(lexer, text)
+        stream = lexer_thread.lex(None)
+        if self.options.postlex:
+            return self.options.postlex.process(stream)
+        return stream
+
+    def get_terminal(self, name: str) -> TerminalDef:
+        #--
+        return self._terminals_dict[name]
+
+    def parse_interactive(self, text: Optional[LarkInput]=None, start: Optional[str]=None) -> 'InteractiveParser':
+        #--
+        return self.parser.parse_interactive(text, start=start)
+
+    def parse(self, text: LarkInput, start: Optional[str]=None, on_error: 'Optional[Callable[[UnexpectedInput], bool]]'=None) -> 'ParseTree':
+        #--
+        if on_error is not None and self.options.parser != 'lalr':
+            raise NotImplementedError("The on_error option is only implemented for the LALR(1) parser.")
+        return self.parser.parse(text, start=start, on_error=on_error)
+
+
+
+
+class DedentError(LarkError):
+    pass
+
+class Indenter(PostLex, ABC):
+    #--
+    paren_level: int
+    indent_level: List[int]
+
+    def __init__(self) -> None:
+        self.paren_level = 0
+        self.indent_level = [0]
+        assert self.tab_len > 0
+
+    def handle_NL(self, token: Token) -> Iterator[Token]:
+        if self.paren_level > 0:
+            return
+
+        yield token
+
+        indent_str = token.rsplit('\n', 1)[1] ##
+
+        indent = indent_str.count(' ') + indent_str.count('\t') * self.tab_len
+
+        if indent > self.indent_level[-1]:
+            self.indent_level.append(indent)
+            yield Token.new_borrow_pos(self.INDENT_type, indent_str, token)
+        else:
+            while indent < self.indent_level[-1]:
+                self.indent_level.pop()
+                yield Token.new_borrow_pos(self.DEDENT_type, indent_str, token)
+
+            if indent != self.indent_level[-1]:
+                raise DedentError('Unexpected dedent to column %s. Expected dedent to %s' % (indent, self.indent_level[-1]))
+
+    def _process(self, stream):
+        token = None
+        for token in stream:
+            if token.type == self.NL_type:
+                yield from self.handle_NL(token)
+            else:
+                yield token
+
+            if token.type in self.OPEN_PAREN_types:
+                self.paren_level += 1
+            elif token.type in self.CLOSE_PAREN_types:
+                self.paren_level -= 1
+                assert self.paren_level >= 0
+
+        while len(self.indent_level) > 1:
+            self.indent_level.pop()
+            yield Token.new_borrow_pos(self.DEDENT_type, '', token) if token else Token(self.DEDENT_type, '', 0, 0, 0, 0, 0, 0)
+
+        assert self.indent_level == [0], self.indent_level
+
+    def process(self, stream):
+        self.paren_level = 0
+        self.indent_level = [0]
+        return self._process(stream)
+
+    ##
+
+    @property
+    def always_accept(self):
+        return (self.NL_type,)
+
+    @property
+    @abstractmethod
+    def NL_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def OPEN_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def CLOSE_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def INDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def DEDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def tab_len(self) -> int:
+        #--
+        raise NotImplementedError()
+
+
+class PythonIndenter(Indenter):
+    #--
+
+    NL_type = '_NEWLINE'
+    OPEN_PAREN_types = ['LPAR', 'LSQB', 'LBRACE']
+    CLOSE_PAREN_types = ['RPAR', 'RSQB', 'RBRACE']
+    INDENT_type = '_INDENT'
+    DEDENT_type = '_DEDENT'
+    tab_len = 8
+
+
+import pickle, zlib, base64
+DATA = (
+{'parser': {'lexer_conf': {'terminals': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}, {'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}, {'@': 13}, {'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}, {'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}, {'@': 44}, {'@': 45}, {'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}, {'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}, {'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}], 'ignore': ['LINE_COMMENT', 'WS'], 'g_regex_flags': 0, 'use_bytes': False, 'lexer_type': 'contextual', '__type__': 'LexerConf'}, 'parser_conf': {'rules': [{'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}, {'@': 205}, {'@': 206}, {'@': 207}, {'@': 208}, {'@': 209}, {'@': 210}, {'@': 211}, {'@': 212}, {'@': 213}, {'@': 214}, {'@': 215}, {'@': 216}, {'@': 217}, {'@': 218}, {'@': 219}, {'@': 220}, {'@': 221}, {'@': 222}, {'@': 223}, {'@': 224}, {'@': 225}, {'@': 226}, {'@': 227}, {'@': 228}, {'@': 229}, {'@': 230}, {'@': 231}, {'@': 232}, {'@': 233}, {'@': 234}, {'@': 235}, {'@': 236}, {'@': 237}, {'@': 238}, {'@': 239}, {'@': 240}, {'@': 241}, {'@': 242}, {'@': 243}, {'@': 244}, {'@': 245}, {'@': 246}, {'@': 247}, {'@': 248}, {'@': 249}, {'@': 250}, {'@': 251}, {'@': 252}, {'@': 253}, {'@': 254}, {'@': 255}, {'@': 256}, {'@': 257}, {'@': 258}, {'@': 259}, {'@': 260}, {'@': 261}, {'@': 262}, {'@': 263}, {'@': 264}, {'@': 265}, {'@': 266}, {'@': 267}, {'@': 268}, {'@': 269}, {'@': 270}, {'@': 271}, {'@': 272}, {'@': 273}, {'@': 274}, {'@': 275}, {'@': 276}, {'@': 277}, {'@': 278}, {'@': 279}, {'@': 280}, {'@': 281}, {'@': 282}, {'@': 283}, {'@': 284}, {'@': 285}, {'@': 286}, {'@': 287}, {'@': 288}, {'@': 289}, {'@': 290}, {'@': 291}, {'@': 292}, {'@': 293}, {'@': 294}, {'@': 295}, {'@': 296}, {'@': 297}, {'@': 298}, {'@': 299}, {'@': 300}, {'@': 301}, {'@': 302}, {'@': 303}, {'@': 304}, {'@': 305}, {'@': 306}, {'@': 307}, {'@': 308}, {'@': 309}, {'@': 310}, {'@': 311}, {'@': 312}, {'@': 313}, {'@': 314}, {'@': 315}, {'@': 316}, {'@': 317}, {'@': 318}, {'@': 319}, {'@': 320}, {'@': 321}, {'@': 322}, {'@': 323}, {'@': 324}], 'start': ['start'], 'parser_type': 'lalr', '__type__': 'ParserConf'}, 'parser': {'tokens': {0: 'TEMPLATE', 1: 'SCHEDULE', 2: 'PACKAGE', 3: 'USE', 4: 'IMPORT', 5: 'IF', 6: 'SYNC', 7: 'PRIVATE', 8: 'ALIAS', 9: 'AT', 10: 'ARM', 11: '$END', 12: 'HOLIDAYS', 13: 'SEMICOLON', 14: 'RULE', 15: 'syncopts', 16: 'LBRACE', 17: 'timepoint', 18: 'CNAME', 19: 'OP', 20: 'NOT_BY', 21: 'IS', 22: '__ANON_0', 23: 'RPAR', 24: 'FOR', 25: '__ANON_1', 26: 'DOT', 27: 'NUMBER', 28: '__attr_assign_star_3', 29: 'COMMA', 30: 'term', 31: 'BANG', 32: 'comparison', 33: 'entity', 34: 'LPAR', 35: 'STRING', 36: 'operand', 37: 'STATE', 38: 'template_param', 39: 'template_params', 40: 'rule_schedule_inline', 41: 'arm_clause', 42: 'at_clause', 43: 'if_clause', 44: 'rule_clause', 45: 'rule_schedule_use', 46: 'LSQB', 47: 'ON', 48: 'UNIT', 49: 'RSQB', 50: 'RBRACE', 51: 'THEN', 52: 'TO', 53: 'UNTIL', 54: 'THIS', 55: 'ANY_HASSL', 56: 'dur', 57: 'INT', 58: 'qualifier', 59: 'DURING', 60: 'schedule_op', 61: 'schedule_legacy_clause', 62: 'ENABLE', 63: 'DISABLE', 64: 'schedule_clause', 65: 'period', 66: 'sched_holiday_only', 67: 'schedule_window_clause', 68: 'OFFSET', 69: 'MMDD', 70: 'mmdd_range', 71: 'EQUAL', 72: '__excludelist_star_11', 73: 'action', 74: 'actions', 75: 'tagact', 76: 'attr_assign', 77: 'TAG', 78: 'rulectrl', 79: 'WAIT', 80: 'waitact', 81: 'assign', 82: 'ATTRIBUTE', 83: '__schedule_decl_plus_4', 84: 'ALL', 85: 'SHARED', 86: 'DIMMER', 87: 'schedule_body', 88: 'sync_body', 89: 'synctype', 90: 'rule_body', 91: 'template_body', 92: '__rule_plus_1', 93: 'ONOFF', 94: '__entity_list_star_7', 95: 'event_keyword', 96: '__name_list_star_6', 97: '__call_args_star_14', 98: 'holidays_decl', 99: 'template_decl', 100: 'use_template_stmt', 101: 'import_stmt', 102: 'schedule_decl', 103: 'package_decl', 104: 'rule', 105: 'alias', 106: 'sync', 107: 'stmt', 108: 'module_ref', 109: 'member', 110: 'entity_list', 111: '__daylist_star_10', 112: '__actions_star_2', 113: 'WHEN', 114: 'call_arg', 115: 'call_args', 116: 'SUNSET', 117: 'SUNRISE', 118: 'value', 119: 'sun_spec', 120: 'TIME_HHMM', 121: '__start_star_0', 122: 'start', 123: 'template_kind', 124: 'name', 125: 'expr', 126: 'andexpr', 127: 'YMD', 128: 'time_spec', 129: 'COLON', 130: '__datestr_list_star_12', 131: 'MONTH', 132: 'schedule_transition', 133: 'AS', 134: 'holiday_mod', 135: 'EXCEPT', 136: 'ymd_range', 137: 'MINUS', 138: 'name_list', 139: 'SCHEDULE_TRANSITION', 140: 'template_default', 141: 'day_selector', 142: 'DAILY', 143: 'WEEKDAYS', 144: 'WEEKENDS', 145: 'import_item', 146: 'month_range', 147: 'PROVINCE', 148: 'REMOVE', 149: 'COUNTRY', 150: 'holi_kv', 151: 'WORKDAYS', 152: 'ADD', 153: 'EXCLUDES', 154: '__ANON_2', 155: '__month_range_star_5', 156: 'DATESTR', 157: 'FROM', 158: '__ANON_3', 159: 'time_range', 160: '__template_params_star_13', 161: '__holidays_decl_star_9', 162: 'datestr_list', 163: 'import_list', 164: 'condition', 165: 'import_tail', 166: 'INVERT', 167: 'HOLIDAY', 168: 'SAT', 169: 'SUN', 170: 'excludelist', 171: 'DATES', 172: 'RANGE', 173: 'MONTHS', 174: '__import_list_star_8', 175: 'DAY', 176: 'schedule_end', 177: 'daylist'}, 'states': {0: {0: (1, {'@': 161}), 1: (1, {'@': 161}), 2: (1, {'@': 161}), 3: (1, {'@': 161}), 4: (1, {'@': 161}), 5: (1, {'@': 161}), 6: (1, {'@': 161}), 7: (1, {'@': 161}), 8: (1, {'@': 161}), 9: (1, {'@': 161}), 10: (1, {'@': 161}), 11: (1, {'@': 161}), 12: (1, {'@': 161}), 13: (1, {'@': 161}), 14: (1, {'@': 161})}, 1: {0: (1, {'@': 97}), 1: (1, {'@': 97}), 2: (1, {'@': 97}), 3: (1, {'@': 97}), 7: (1, {'@': 97}), 4: (1, {'@': 97}), 6: (1, {'@': 97}), 8: (1, {'@': 97}), 11: (1, {'@': 97}), 12: (1, {'@': 97}), 14: (1, {'@': 97})}, 2: {0: (1, {'@': 168}), 1: (1, {'@': 168}), 2: (1, {'@': 168}), 3: (1, {'@': 168}), 4: (1, {'@': 168}), 5: (1, {'@': 168}), 6: (1, {'@': 168}), 7: (1, {'@': 168}), 8: (1, {'@': 168}), 9: (1, {'@': 168}), 10: (1, {'@': 168}), 11: (1, {'@': 168}), 12: (1, {'@': 168}), 13: (1, {'@': 168}), 14: (1, {'@': 168})}, 3: {15: (0, 402), 16: (0, 354), 0: (1, {'@': 102}), 1: (1, {'@': 102}), 2: (1, {'@': 102}), 3: (1, {'@': 102}), 7: (1, {'@': 102}), 4: (1, {'@': 102}), 6: (1, {'@': 102}), 8: (1, {'@': 102}), 11: (1, {'@': 102}), 12: (1, {'@': 102}), 14: (1, {'@': 102})}, 4: {17: (0, 2), 18: (0, 42)}, 5: {19: (1, {'@': 145}), 20: (1, {'@': 145}), 21: (1, {'@': 145}), 22: (1, {'@': 145}), 23: (1, {'@': 145}), 24: (1, {'@': 145}), 25: (1, {'@': 145})}, 6: {26: (0, 52)}, 7: {0: (1, {'@': 98}), 1: (1, {'@': 98}), 2: (1, {'@': 98}), 3: (1, {'@': 98}), 7: (1, {'@': 98}), 4: (1, {'@': 98}), 6: (1, {'@': 98}), 8: (1, {'@': 98}), 11: (1, {'@': 98}), 12: (1, {'@': 98}), 14: (1, {'@': 98})}, 8: {27: (0, 148)}, 9: {0: (1, {'@': 227}), 1: (1, {'@': 227}), 2: (1, {'@': 227}), 3: (1, {'@': 227}), 7: (1, {'@': 227}), 4: (1, {'@': 227}), 6: (1, {'@': 227}), 8: (1, {'@': 227}), 11: (1, {'@': 227}), 12: (1, {'@': 227}), 14: (1, {'@': 227})}, 10: {28: (0, 60), 26: (0, 365), 19: (1, {'@': 146}), 20: (1, {'@': 146}), 21: (1, {'@': 146}), 22: (1, {'@': 146}), 23: (1, {'@': 146}), 24: (1, {'@': 146}), 25: (1, {'@': 146})}, 11: {27: (0, 0)}, 12: {29: (1, {'@': 321}), 23: (1, {'@': 321})}, 13: {2: (1, {'@': 296}), 4: (1, {'@': 296}), 5: (1, {'@': 296}), 6: (1, {'@': 296}), 9: (1, {'@': 296}), 10: (1, {'@': 296}), 11: (1, {'@': 296}), 13: (1, {'@': 296}), 0: (1, {'@': 296}), 1: (1, {'@': 296}), 3: (1, {'@': 296}), 7: (1, {'@': 296}), 8: (1, {'@': 296}), 12: (1, {'@': 296}), 14: (1, {'@': 296})}, 14: {2: (1, {'@': 272}), 4: (1, {'@': 272}), 6: (1, {'@': 272}), 11: (1, {'@': 272}), 0: (1, {'@': 272}), 1: (1, {'@': 272}), 3: (1, {'@': 272}), 7: (1, {'@': 272}), 8: (1, {'@': 272}), 12: (1, {'@': 272}), 14: (1, {'@': 272})}, 15: {0: (1, {'@': 169}), 1: (1, {'@': 169}), 2: (1, {'@': 169}), 3: (1, {'@': 169}), 4: (1, {'@': 169}), 5: (1, {'@': 169}), 6: (1, {'@': 169}), 7: (1, {'@': 169}), 8: (1, {'@': 169}), 9: (1, {'@': 169}), 10: (1, {'@': 169}), 11: (1, {'@': 169}), 12: (1, {'@': 169}), 13: (1, {'@': 169}), 14: (1, {'@': 169})}, 16: {30: (0, 225), 31: (0, 16), 18: (0, 10), 32: (0, 49), 33: (0, 5), 34: (0, 193), 35: (0, 18), 36: (0, 40), 37: (0, 46), 27: (0, 97)}, 17: {38: (0, 305), 18: (0, 428), 39: (0, 386), 23: (0, 256)}, 18: {19: (1, {'@': 149}), 20: (1, {'@': 149}), 21: (1, {'@': 149}), 22: (1, {'@': 149}), 23: (1, {'@': 149}), 24: (1, {'@': 149}), 25: (1, {'@': 149})}, 19: {0: (1, {'@': 170}), 1: (1, {'@': 170}), 2: (1, {'@': 170}), 3: (1, {'@': 170}), 4: (1, {'@': 170}), 5: (1, {'@': 170}), 6: (1, {'@': 170}), 7: (1, {'@': 170}), 8: (1, {'@': 170}), 9: (1, {'@': 170}), 10: (1, {'@': 170}), 11: (1, {'@': 170}), 12: (1, {'@': 170}), 13: (1, {'@': 170}), 14: (1, {'@': 170})}, 20: {1: (0, 197), 10: (0, 149), 40: (0, 122), 5: (0, 94), 41: (0, 207), 42: (0, 247), 43: (0, 78), 44: (0, 399), 9: (0, 223), 45: (0, 131), 0: (1, {'@': 273}), 2: (1, {'@': 273}), 3: (1, {'@': 273}), 4: (1, {'@': 273}), 7: (1, {'@': 273}), 6: (1, {'@': 273}), 8: (1, {'@': 273}), 11: (1, {'@': 273}), 12: (1, {'@': 273}), 14: (1, {'@': 273})}, 21: {46: (0, 347)}, 22: {0: (1, {'@': 157}), 1: (1, {'@': 157}), 2: (1, {'@': 157}), 3: (1, {'@': 157}), 4: (1, {'@': 157}), 5: (1, {'@': 157}), 6: (1, {'@': 157}), 7: (1, {'@': 157}), 8: (1, {'@': 157}), 9: (1, {'@': 157}), 10: (1, {'@': 157}), 11: (1, {'@': 157}), 12: (1, {'@': 157}), 13: (1, {'@': 157}), 14: (1, {'@': 157})}, 23: {0: (1, {'@': 91}), 1: (1, {'@': 91}), 2: (1, {'@': 91}), 3: (1, {'@': 91}), 7: (1, {'@': 91}), 4: (1, {'@': 91}), 6: (1, {'@': 91}), 8: (1, {'@': 91}), 11: (1, {'@': 91}), 12: (1, {'@': 91}), 14: (1, {'@': 91})}, 24: {29: (1, {'@': 301}), 47: (1, {'@': 301})}, 25: {48: (0, 47)}, 26: {28: (0, 60), 26: (0, 365), 29: (1, {'@': 224}), 49: (1, {'@': 224}), 50: (1, {'@': 224})}, 27: {13: (0, 184)}, 28: {18: (0, 213)}, 29: {34: (0, 394)}, 30: {29: (0, 349), 47: (1, {'@': 191})}, 31: {0: (1, {'@': 167}), 1: (1, {'@': 167}), 2: (1, {'@': 167}), 3: (1, {'@': 167}), 4: (1, {'@': 167}), 5: (1, {'@': 167}), 6: (1, {'@': 167}), 7: (1, {'@': 167}), 8: (1, {'@': 167}), 9: (1, {'@': 167}), 10: (1, {'@': 167}), 11: (1, {'@': 167}), 12: (1, {'@': 167}), 13: (1, {'@': 167}), 14: (1, {'@': 167})}, 32: {29: (1, {'@': 219}), 23: (1, {'@': 219}), 13: (1, {'@': 219}), 51: (1, {'@': 219}), 52: (1, {'@': 219}), 53: (1, {'@': 219})}, 33: {54: (0, 288), 14: (0, 181), 55: (0, 383)}, 34: {0: (1, {'@': 120}), 1: (1, {'@': 120}), 2: (1, {'@': 120}), 3: (1, {'@': 120}), 4: (1, {'@': 120}), 5: (1, {'@': 120}), 6: (1, {'@': 120}), 7: (1, {'@': 120}), 8: (1, {'@': 120}), 9: (1, {'@': 120}), 10: (1, {'@': 120}), 11: (1, {'@': 120}), 12: (1, {'@': 120}), 14: (1, {'@': 120})}, 35: {56: (0, 31), 57: (0, 25)}, 36: {29: (1, {'@': 302}), 47: (1, {'@': 302})}, 37: {0: (1, {'@': 115}), 1: (1, {'@': 115}), 2: (1, {'@': 115}), 3: (1, {'@': 115}), 4: (1, {'@': 115}), 5: (1, {'@': 115}), 6: (1, {'@': 115}), 7: (1, {'@': 115}), 8: (1, {'@': 115}), 9: (1, {'@': 115}), 10: (1, {'@': 115}), 11: (1, {'@': 115}), 12: (1, {'@': 115}), 14: (1, {'@': 115})}, 38: {50: (0, 55)}, 39: {0: (1, {'@': 293}), 1: (1, {'@': 293}), 2: (1, {'@': 293}), 3: (1, {'@': 293}), 4: (1, {'@': 293}), 5: (1, {'@': 293}), 7: (1, {'@': 293}), 6: (1, {'@': 293}), 8: (1, {'@': 293}), 9: (1, {'@': 293}), 10: (1, {'@': 293}), 11: (1, {'@': 293}), 12: (1, {'@': 293}), 14: (1, {'@': 293})}, 40: {21: (0, 100), 19: (0, 83), 20: (1, {'@': 142}), 22: (1, {'@': 142}), 23: (1, {'@': 142}), 24: (1, {'@': 142}), 25: (1, {'@': 142})}, 41: {0: (1, {'@': 257}), 1: (1, {'@': 257}), 2: (1, {'@': 257}), 3: (1, {'@': 257}), 7: (1, {'@': 257}), 4: (1, {'@': 257}), 6: (1, {'@': 257}), 8: (1, {'@': 257}), 11: (1, {'@': 257}), 12: (1, {'@': 257}), 14: (1, {'@': 257})}, 42: {2: (1, {'@': 175}), 4: (1, {'@': 175}), 5: (1, {'@': 175}), 6: (1, {'@': 175}), 9: (1, {'@': 175}), 10: (1, {'@': 175}), 11: (1, {'@': 175}), 13: (1, {'@': 175}), 0: (1, {'@': 175}), 1: (1, {'@': 175}), 3: (1, {'@': 175}), 7: (1, {'@': 175}), 8: (1, {'@': 175}), 12: (1, {'@': 175}), 14: (1, {'@': 175})}, 43: {18: (0, 324)}, 44: {29: (1, {'@': 320}), 49: (1, {'@': 320})}, 45: {23: (0, 157), 58: (0, 156), 22: (0, 203), 20: (0, 33)}, 46: {19: (1, {'@': 147}), 20: (1, {'@': 147}), 21: (1, {'@': 147}), 22: (1, {'@': 147}), 23: (1, {'@': 147}), 24: (1, {'@': 147}), 25: (1, {'@': 147})}, 47: {2: (1, {'@': 174}), 4: (1, {'@': 174}), 5: (1, {'@': 174}), 6: (1, {'@': 174}), 9: (1, {'@': 174}), 10: (1, {'@': 174}), 11: (1, {'@': 174}), 13: (1, {'@': 174}), 0: (1, {'@': 174}), 1: (1, {'@': 174}), 3: (1, {'@': 174}), 7: (1, {'@': 174}), 8: (1, {'@': 174}), 12: (1, {'@': 174}), 14: (1, {'@': 174}), 23: (1, {'@': 174})}, 48: {24: (1, {'@': 165})}, 49: {20: (1, {'@': 139}), 22: (1, {'@': 139}), 23: (1, {'@': 139}), 24: (1, {'@': 139}), 25: (1, {'@': 139})}, 50: {23: (1, {'@': 132}), 51: (1, {'@': 132}), 24: (1, {'@': 132}), 2: (1, {'@': 132}), 4: (1, {'@': 132}), 5: (1, {'@': 132}), 6: (1, {'@': 132}), 9: (1, {'@': 132}), 10: (1, {'@': 132}), 11: (1, {'@': 132}), 13: (1, {'@': 132}), 0: (1, {'@': 132}), 1: (1, {'@': 132}), 3: (1, {'@': 132}), 7: (1, {'@': 132}), 8: (1, {'@': 132}), 12: (1, {'@': 132}), 14: (1, {'@': 132})}, 51: {0: (1, {'@': 122}), 1: (1, {'@': 122}), 2: (1, {'@': 122}), 3: (1, {'@': 122}), 4: (1, {'@': 122}), 5: (1, {'@': 122}), 6: (1, {'@': 122}), 7: (1, {'@': 122}), 8: (1, {'@': 122}), 9: (1, {'@': 122}), 10: (1, {'@': 122}), 11: (1, {'@': 122}), 12: (1, {'@': 122}), 14: (1, {'@': 122})}, 52: {18: (0, 150)}, 53: {59: (0, 375), 60: (0, 317), 61: (0, 290), 62: (0, 285), 63: (0, 307), 64: (0, 158), 47: (0, 434), 65: (0, 436), 66: (0, 321), 67: (0, 357), 0: (1, {'@': 176}), 1: (1, {'@': 176}), 2: (1, {'@': 176}), 3: (1, {'@': 176}), 7: (1, {'@': 176}), 4: (1, {'@': 176}), 6: (1, {'@': 176}), 8: (1, {'@': 176}), 11: (1, {'@': 176}), 12: (1, {'@': 176}), 14: (1, {'@': 176})}, 54: {0: (1, {'@': 100}), 1: (1, {'@': 100}), 2: (1, {'@': 100}), 3: (1, {'@': 100}), 7: (1, {'@': 100}), 4: (1, {'@': 100}), 6: (1, {'@': 100}), 8: (1, {'@': 100}), 11: (1, {'@': 100}), 12: (1, {'@': 100}), 14: (1, {'@': 100})}, 55: {2: (1, {'@': 108}), 4: (1, {'@': 108}), 6: (1, {'@': 108}), 11: (1, {'@': 108}), 0: (1, {'@': 108}), 1: (1, {'@': 108}), 3: (1, {'@': 108}), 7: (1, {'@': 108}), 8: (1, {'@': 108}), 12: (1, {'@': 108}), 14: (1, {'@': 108})}, 56: {68: (0, 32), 29: (1, {'@': 220}), 23: (1, {'@': 220}), 13: (1, {'@': 220}), 51: (1, {'@': 220}), 52: (1, {'@': 220}), 53: (1, {'@': 220})}, 57: {69: (0, 432), 70: (0, 407)}, 58: {0: (1, {'@': 116}), 1: (1, {'@': 116}), 2: (1, {'@': 116}), 3: (1, {'@': 116}), 4: (1, {'@': 116}), 5: (1, {'@': 116}), 6: (1, {'@': 116}), 7: (1, {'@': 116}), 8: (1, {'@': 116}), 9: (1, {'@': 116}), 10: (1, {'@': 116}), 11: (1, {'@': 116}), 12: (1, {'@': 116}), 14: (1, {'@': 116})}, 59: {35: (0, 84), 56: (0, 75), 57: (0, 25), 18: (0, 62)}, 60: {26: (0, 88), 19: (1, {'@': 225}), 20: (1, {'@': 225}), 21: (1, {'@': 225}), 22: (1, {'@': 225}), 23: (1, {'@': 225}), 24: (1, {'@': 225}), 25: (1, {'@': 225}), 29: (1, {'@': 225}), 49: (1, {'@': 225}), 2: (1, {'@': 225}), 4: (1, {'@': 225}), 6: (1, {'@': 225}), 11: (1, {'@': 225}), 0: (1, {'@': 225}), 1: (1, {'@': 225}), 3: (1, {'@': 225}), 7: (1, {'@': 225}), 8: (1, {'@': 225}), 12: (1, {'@': 225}), 14: (1, {'@': 225}), 5: (1, {'@': 225}), 9: (1, {'@': 225}), 10: (1, {'@': 225}), 13: (1, {'@': 225}), 50: (1, {'@': 225}), 51: (1, {'@': 225}), 52: (1, {'@': 225}), 53: (1, {'@': 225})}, 61: {71: (0, 8), 26: (1, {'@': 297})}, 62: {23: (0, 115)}, 63: {18: (0, 270)}, 64: {57: (0, 25), 56: (0, 15)}, 65: {29: (1, {'@': 223}), 49: (1, {'@': 223}), 50: (1, {'@': 223})}, 66: {29: (1, {'@': 306}), 50: (1, {'@': 306}), 49: (1, {'@': 306})}, 67: {0: (1, {'@': 173}), 1: (1, {'@': 173}), 2: (1, {'@': 173}), 3: (1, {'@': 173}), 4: (1, {'@': 173}), 5: (1, {'@': 173}), 6: (1, {'@': 173}), 7: (1, {'@': 173}), 8: (1, {'@': 173}), 9: (1, {'@': 173}), 10: (1, {'@': 173}), 11: (1, {'@': 173}), 12: (1, {'@': 173}), 13: (1, {'@': 173}), 14: (1, {'@': 173})}, 68: {0: (1, {'@': 159}), 1: (1, {'@': 159}), 2: (1, {'@': 159}), 3: (1, {'@': 159}), 4: (1, {'@': 159}), 5: (1, {'@': 159}), 6: (1, {'@': 159}), 7: (1, {'@': 159}), 8: (1, {'@': 159}), 9: (1, {'@': 159}), 10: (1, {'@': 159}), 11: (1, {'@': 159}), 12: (1, {'@': 159}), 13: (1, {'@': 159}), 14: (1, {'@': 159})}, 69: {29: (1, {'@': 265}), 23: (1, {'@': 265})}, 70: {29: (1, {'@': 285}), 23: (1, {'@': 285})}, 71: {29: (0, 398), 72: (0, 335), 49: (1, {'@': 253})}, 72: {0: (1, {'@': 171}), 1: (1, {'@': 171}), 2: (1, {'@': 171}), 3: (1, {'@': 171}), 4: (1, {'@': 171}), 5: (1, {'@': 171}), 6: (1, {'@': 171}), 7: (1, {'@': 171}), 8: (1, {'@': 171}), 9: (1, {'@': 171}), 10: (1, {'@': 171}), 11: (1, {'@': 171}), 12: (1, {'@': 171}), 13: (1, {'@': 171}), 14: (1, {'@': 171})}, 73: {18: (0, 42), 17: (0, 19)}, 74: {24: (0, 81), 0: (1, {'@': 158}), 1: (1, {'@': 158}), 2: (1, {'@': 158}), 3: (1, {'@': 158}), 4: (1, {'@': 158}), 5: (1, {'@': 158}), 6: (1, {'@': 158}), 7: (1, {'@': 158}), 8: (1, {'@': 158}), 9: (1, {'@': 158}), 10: (1, {'@': 158}), 11: (1, {'@': 158}), 12: (1, {'@': 158}), 13: (1, {'@': 158}), 14: (1, {'@': 158})}, 75: {23: (0, 126)}, 76: {18: (0, 61)}, 77: {53: (0, 73), 24: (0, 64)}, 78: {2: (1, {'@': 110}), 4: (1, {'@': 110}), 5: (1, {'@': 110}), 6: (1, {'@': 110}), 9: (1, {'@': 110}), 10: (1, {'@': 110}), 11: (1, {'@': 110}), 0: (1, {'@': 110}), 1: (1, {'@': 110}), 3: (1, {'@': 110}), 7: (1, {'@': 110}), 8: (1, {'@': 110}), 12: (1, {'@': 110}), 14: (1, {'@': 110})}, 79: {29: (0, 398), 72: (0, 362), 49: (1, {'@': 249})}, 80: {0: (1, {'@': 124}), 1: (1, {'@': 124}), 2: (1, {'@': 124}), 3: (1, {'@': 124}), 4: (1, {'@': 124}), 5: (1, {'@': 124}), 6: (1, {'@': 124}), 7: (1, {'@': 124}), 8: (1, {'@': 124}), 9: (1, {'@': 124}), 10: (1, {'@': 124}), 11: (1, {'@': 124}), 12: (1, {'@': 124}), 14: (1, {'@': 124})}, 81: {57: (0, 25), 56: (0, 22)}, 82: {49: (0, 384)}, 83: {36: (0, 372), 18: (0, 10), 33: (0, 5), 35: (0, 18), 37: (0, 46), 27: (0, 97)}, 84: {23: (0, 138)}, 85: {29: (1, {'@': 287}), 23: (1, {'@': 287})}, 86: {0: (1, {'@': 241}), 1: (1, {'@': 241}), 2: (1, {'@': 241}), 3: (1, {'@': 241}), 4: (1, {'@': 241}), 7: (1, {'@': 241}), 6: (1, {'@': 241}), 8: (1, {'@': 241}), 11: (1, {'@': 241}), 29: (1, {'@': 241}), 12: (1, {'@': 241}), 14: (1, {'@': 241})}, 87: {0: (1, {'@': 117}), 1: (1, {'@': 117}), 2: (1, {'@': 117}), 3: (1, {'@': 117}), 4: (1, {'@': 117}), 5: (1, {'@': 117}), 6: (1, {'@': 117}), 7: (1, {'@': 117}), 8: (1, {'@': 117}), 9: (1, {'@': 117}), 10: (1, {'@': 117}), 11: (1, {'@': 117}), 12: (1, {'@': 117}), 14: (1, {'@': 117})}, 88: {18: (0, 336)}, 89: {16: (0, 354), 15: (0, 186), 0: (1, {'@': 275}), 1: (1, {'@': 275}), 2: (1, {'@': 275}), 3: (1, {'@': 275}), 4: (1, {'@': 275}), 7: (1, {'@': 275}), 6: (1, {'@': 275}), 8: (1, {'@': 275}), 11: (1, {'@': 275}), 12: (1, {'@': 275}), 14: (1, {'@': 275})}, 90: {29: (1, {'@': 312}), 49: (1, {'@': 312})}, 91: {62: (0, 140), 18: (0, 141), 73: (0, 144), 74: (0, 37), 75: (0, 107), 63: (0, 147), 76: (0, 168), 77: (0, 171), 78: (0, 155), 79: (0, 178), 80: (0, 163), 81: (0, 180)}, 92: {1: (0, 197), 10: (0, 149), 64: (0, 294), 60: (0, 317), 82: (0, 441), 61: (0, 290), 40: (0, 122), 5: (0, 94), 41: (0, 207), 59: (0, 375), 83: (0, 194), 84: (0, 422), 85: (0, 427), 86: (0, 403), 42: (0, 247), 87: (0, 14), 88: (0, 230), 89: (0, 21), 62: (0, 285), 63: (0, 307), 47: (0, 434), 90: (0, 119), 43: (0, 78), 91: (0, 430), 92: (0, 20), 93: (0, 319), 9: (0, 223), 66: (0, 321), 65: (0, 436), 44: (0, 39), 45: (0, 131), 67: (0, 357)}, 93: {1: (0, 197), 10: (0, 149), 40: (0, 122), 5: (0, 94), 41: (0, 207), 42: (0, 247), 43: (0, 78), 9: (0, 223), 44: (0, 39), 92: (0, 221), 45: (0, 131)}, 94: {34: (0, 278)}, 95: {94: (0, 277), 29: (0, 302), 49: (1, {'@': 222}), 50: (1, {'@': 222})}, 96: {28: (0, 60), 26: (0, 365), 2: (1, {'@': 210}), 4: (1, {'@': 210}), 5: (1, {'@': 210}), 6: (1, {'@': 210}), 9: (1, {'@': 210}), 10: (1, {'@': 210}), 11: (1, {'@': 210}), 29: (1, {'@': 210}), 13: (1, {'@': 210}), 0: (1, {'@': 210}), 1: (1, {'@': 210}), 3: (1, {'@': 210}), 7: (1, {'@': 210}), 8: (1, {'@': 210}), 12: (1, {'@': 210}), 14: (1, {'@': 210})}, 97: {19: (1, {'@': 148}), 20: (1, {'@': 148}), 21: (1, {'@': 148}), 22: (1, {'@': 148}), 23: (1, {'@': 148}), 24: (1, {'@': 148}), 25: (1, {'@': 148})}, 98: {0: (0, 212)}, 99: {29: (1, {'@': 286}), 23: (1, {'@': 286})}, 100: {35: (0, 329), 18: (0, 388), 95: (0, 392)}, 101: {22: (0, 203), 23: (0, 423)}, 102: {29: (0, 176), 96: (0, 196), 2: (1, {'@': 209}), 4: (1, {'@': 209}), 5: (1, {'@': 209}), 6: (1, {'@': 209}), 9: (1, {'@': 209}), 10: (1, {'@': 209}), 11: (1, {'@': 209}), 13: (1, {'@': 209}), 0: (1, {'@': 209}), 1: (1, {'@': 209}), 3: (1, {'@': 209}), 7: (1, {'@': 209}), 8: (1, {'@': 209}), 12: (1, {'@': 209}), 14: (1, {'@': 209})}, 103: {49: (0, 373)}, 104: {97: (0, 146), 29: (0, 188), 23: (1, {'@': 282})}, 105: {29: (0, 398), 72: (0, 337), 49: (1, {'@': 251})}, 106: {23: (0, 50)}, 107: {0: (1, {'@': 156}), 1: (1, {'@': 156}), 2: (1, {'@': 156}), 3: (1, {'@': 156}), 4: (1, {'@': 156}), 5: (1, {'@': 156}), 6: (1, {'@': 156}), 7: (1, {'@': 156}), 8: (1, {'@': 156}), 9: (1, {'@': 156}), 10: (1, {'@': 156}), 11: (1, {'@': 156}), 12: (1, {'@': 156}), 13: (1, {'@': 156}), 14: (1, {'@': 156})}, 108: {69: (0, 257)}, 109: {7: (0, 245), 98: (0, 233), 3: (0, 98), 99: (0, 1), 100: (0, 7), 101: (0, 23), 1: (0, 28), 8: (0, 63), 12: (0, 169), 4: (0, 124), 6: (0, 218), 102: (0, 241), 103: (0, 211), 104: (0, 229), 0: (0, 164), 105: (0, 165), 14: (0, 267), 2: (0, 411), 106: (0, 360), 107: (0, 341), 11: (1, {'@': 88})}, 110: {49: (0, 273)}, 111: {0: (1, {'@': 126}), 1: (1, {'@': 126}), 2: (1, {'@': 126}), 3: (1, {'@': 126}), 4: (1, {'@': 126}), 5: (1, {'@': 126}), 6: (1, {'@': 126}), 7: (1, {'@': 126}), 8: (1, {'@': 126}), 9: (1, {'@': 126}), 10: (1, {'@': 126}), 11: (1, {'@': 126}), 12: (1, {'@': 126}), 14: (1, {'@': 126})}, 112: {13: (1, {'@': 205})}, 113: {29: (1, {'@': 268}), 23: (1, {'@': 268})}, 114: {2: (1, {'@': 211}), 4: (1, {'@': 211}), 5: (1, {'@': 211}), 6: (1, {'@': 211}), 9: (1, {'@': 211}), 10: (1, {'@': 211}), 11: (1, {'@': 211}), 29: (1, {'@': 211}), 13: (1, {'@': 211}), 0: (1, {'@': 211}), 1: (1, {'@': 211}), 3: (1, {'@': 211}), 7: (1, {'@': 211}), 8: (1, {'@': 211}), 12: (1, {'@': 211}), 14: (1, {'@': 211})}, 115: {62: (0, 140), 18: (0, 141), 75: (0, 107), 63: (0, 147), 76: (0, 168), 77: (0, 171), 78: (0, 155), 79: (0, 178), 80: (0, 163), 81: (0, 180), 73: (0, 123)}, 116: {0: (1, {'@': 206}), 1: (1, {'@': 206}), 2: (1, {'@': 206}), 3: (1, {'@': 206}), 4: (1, {'@': 206}), 5: (1, {'@': 206}), 6: (1, {'@': 206}), 7: (1, {'@': 206}), 8: (1, {'@': 206}), 9: (1, {'@': 206}), 10: (1, {'@': 206}), 11: (1, {'@': 206}), 12: (1, {'@': 206}), 14: (1, {'@': 206})}, 117: {49: (0, 313)}, 118: {1: (0, 197), 10: (0, 149), 64: (0, 294), 60: (0, 317), 82: (0, 441), 61: (0, 290), 91: (0, 41), 40: (0, 122), 5: (0, 94), 41: (0, 207), 59: (0, 375), 83: (0, 194), 84: (0, 422), 85: (0, 427), 86: (0, 403), 42: (0, 247), 87: (0, 14), 88: (0, 230), 89: (0, 21), 62: (0, 285), 63: (0, 307), 47: (0, 434), 90: (0, 119), 43: (0, 78), 92: (0, 20), 93: (0, 319), 9: (0, 223), 66: (0, 321), 65: (0, 436), 44: (0, 39), 45: (0, 131), 67: (0, 357)}, 119: {2: (1, {'@': 270}), 4: (1, {'@': 270}), 6: (1, {'@': 270}), 11: (1, {'@': 270}), 0: (1, {'@': 270}), 1: (1, {'@': 270}), 3: (1, {'@': 270}), 7: (1, {'@': 270}), 8: (1, {'@': 270}), 12: (1, {'@': 270}), 14: (1, {'@': 270})}, 120: {0: (1, {'@': 164}), 1: (1, {'@': 164}), 2: (1, {'@': 164}), 3: (1, {'@': 164}), 4: (1, {'@': 164}), 5: (1, {'@': 164}), 6: (1, {'@': 164}), 7: (1, {'@': 164}), 8: (1, {'@': 164}), 9: (1, {'@': 164}), 10: (1, {'@': 164}), 11: (1, {'@': 164}), 12: (1, {'@': 164}), 13: (1, {'@': 164}), 14: (1, {'@': 164})}, 121: {18: (0, 279)}, 122: {2: (1, {'@': 113}), 4: (1, {'@': 113}), 5: (1, {'@': 113}), 6: (1, {'@': 113}), 9: (1, {'@': 113}), 10: (1, {'@': 113}), 11: (1, {'@': 113}), 0: (1, {'@': 113}), 1: (1, {'@': 113}), 3: (1, {'@': 113}), 7: (1, {'@': 113}), 8: (1, {'@': 113}), 12: (1, {'@': 113}), 14: (1, {'@': 113})}, 123: {0: (1, {'@': 163}), 1: (1, {'@': 163}), 2: (1, {'@': 163}), 3: (1, {'@': 163}), 4: (1, {'@': 163}), 5: (1, {'@': 163}), 6: (1, {'@': 163}), 7: (1, {'@': 163}), 8: (1, {'@': 163}), 9: (1, {'@': 163}), 10: (1, {'@': 163}), 11: (1, {'@': 163}), 12: (1, {'@': 163}), 13: (1, {'@': 163}), 14: (1, {'@': 163})}, 124: {18: (0, 429), 108: (0, 352)}, 125: {29: (1, {'@': 305}), 50: (1, {'@': 305}), 49: (1, {'@': 305})}, 126: {62: (0, 140), 18: (0, 141), 75: (0, 107), 63: (0, 147), 76: (0, 168), 77: (0, 171), 78: (0, 155), 79: (0, 178), 80: (0, 163), 81: (0, 180), 73: (0, 129)}, 127: {18: (0, 26), 109: (0, 95), 110: (0, 192), 33: (0, 65)}, 128: {13: (0, 116), 0: (1, {'@': 207}), 1: (1, {'@': 207}), 2: (1, {'@': 207}), 3: (1, {'@': 207}), 4: (1, {'@': 207}), 5: (1, {'@': 207}), 6: (1, {'@': 207}), 7: (1, {'@': 207}), 8: (1, {'@': 207}), 9: (1, {'@': 207}), 10: (1, {'@': 207}), 11: (1, {'@': 207}), 12: (1, {'@': 207}), 14: (1, {'@': 207})}, 129: {0: (1, {'@': 162}), 1: (1, {'@': 162}), 2: (1, {'@': 162}), 3: (1, {'@': 162}), 4: (1, {'@': 162}), 5: (1, {'@': 162}), 6: (1, {'@': 162}), 7: (1, {'@': 162}), 8: (1, {'@': 162}), 9: (1, {'@': 162}), 10: (1, {'@': 162}), 11: (1, {'@': 162}), 12: (1, {'@': 162}), 13: (1, {'@': 162}), 14: (1, {'@': 162})}, 130: {18: (0, 428), 38: (0, 369)}, 131: {2: (1, {'@': 112}), 4: (1, {'@': 112}), 5: (1, {'@': 112}), 6: (1, {'@': 112}), 9: (1, {'@': 112}), 10: (1, {'@': 112}), 11: (1, {'@': 112}), 0: (1, {'@': 112}), 1: (1, {'@': 112}), 3: (1, {'@': 112}), 7: (1, {'@': 112}), 8: (1, {'@': 112}), 12: (1, {'@': 112}), 14: (1, {'@': 112})}, 132: {29: (1, {'@': 284}), 23: (1, {'@': 284})}, 133: {29: (0, 130), 23: (1, {'@': 263})}, 134: {111: (0, 339), 29: (0, 420), 49: (1, {'@': 247})}, 135: {38: (0, 12), 18: (0, 428)}, 136: {27: (0, 68)}, 137: {58: (0, 449), 23: (0, 374), 22: (0, 203), 20: (0, 33)}, 138: {73: (0, 120), 62: (0, 140), 18: (0, 141), 75: (0, 107), 63: (0, 147), 76: (0, 168), 77: (0, 171), 78: (0, 155), 79: (0, 178), 80: (0, 163), 81: (0, 180)}, 139: {0: (1, {'@': 308}), 1: (1, {'@': 308}), 2: (1, {'@': 308}), 3: (1, {'@': 308}), 4: (1, {'@': 308}), 7: (1, {'@': 308}), 6: (1, {'@': 308}), 8: (1, {'@': 308}), 11: (1, {'@': 308}), 29: (1, {'@': 308}), 12: (1, {'@': 308}), 14: (1, {'@': 308})}, 140: {14: (0, 379)}, 141: {26: (0, 363), 71: (0, 380)}, 142: {23: (0, 391)}, 143: {2: (1, {'@': 310}), 4: (1, {'@': 310}), 6: (1, {'@': 310}), 11: (1, {'@': 310}), 29: (1, {'@': 310}), 0: (1, {'@': 310}), 1: (1, {'@': 310}), 3: (1, {'@': 310}), 7: (1, {'@': 310}), 8: (1, {'@': 310}), 12: (1, {'@': 310}), 14: (1, {'@': 310})}, 144: {112: (0, 376), 13: (0, 367), 2: (1, {'@': 151}), 4: (1, {'@': 151}), 5: (1, {'@': 151}), 6: (1, {'@': 151}), 9: (1, {'@': 151}), 10: (1, {'@': 151}), 11: (1, {'@': 151}), 0: (1, {'@': 151}), 1: (1, {'@': 151}), 3: (1, {'@': 151}), 7: (1, {'@': 151}), 8: (1, {'@': 151}), 12: (1, {'@': 151}), 14: (1, {'@': 151})}, 145: {62: (0, 140), 18: (0, 141), 74: (0, 175), 73: (0, 144), 75: (0, 107), 63: (0, 147), 76: (0, 168), 77: (0, 171), 78: (0, 155), 79: (0, 178), 80: (0, 163), 81: (0, 180)}, 146: {29: (0, 410), 23: (1, {'@': 281})}, 147: {14: (0, 387)}, 148: {0: (1, {'@': 160}), 1: (1, {'@': 160}), 2: (1, {'@': 160}), 3: (1, {'@': 160}), 4: (1, {'@': 160}), 5: (1, {'@': 160}), 6: (1, {'@': 160}), 7: (1, {'@': 160}), 8: (1, {'@': 160}), 9: (1, {'@': 160}), 10: (1, {'@': 160}), 11: (1, {'@': 160}), 12: (1, {'@': 160}), 13: (1, {'@': 160}), 14: (1, {'@': 160})}, 149: {113: (0, 268)}, 150: {71: (0, 136), 26: (1, {'@': 298})}, 151: {114: (0, 104), 18: (0, 187), 115: (0, 142), 116: (0, 56), 27: (0, 70), 35: (0, 99), 117: (0, 173), 33: (0, 85), 118: (0, 132), 23: (0, 227), 119: (0, 234), 120: (0, 237)}, 152: {13: (1, {'@': 204})}, 153: {33: (0, 293), 18: (0, 296)}, 154: {7: (0, 245), 98: (0, 233), 3: (0, 98), 99: (0, 1), 100: (0, 7), 101: (0, 23), 1: (0, 28), 8: (0, 63), 121: (0, 109), 12: (0, 169), 4: (0, 124), 6: (0, 218), 102: (0, 241), 103: (0, 211), 107: (0, 215), 104: (0, 229), 0: (0, 164), 105: (0, 165), 14: (0, 267), 2: (0, 411), 122: (0, 295), 106: (0, 360), 11: (1, {'@': 89})}, 155: {0: (1, {'@': 155}), 1: (1, {'@': 155}), 2: (1, {'@': 155}), 3: (1, {'@': 155}), 4: (1, {'@': 155}), 5: (1, {'@': 155}), 6: (1, {'@': 155}), 7: (1, {'@': 155}), 8: (1, {'@': 155}), 9: (1, {'@': 155}), 10: (1, {'@': 155}), 11: (1, {'@': 155}), 12: (1, {'@': 155}), 13: (1, {'@': 155}), 14: (1, {'@': 155})}, 156: {23: (0, 437)}, 157: {51: (0, 145), 58: (0, 425), 20: (0, 33)}, 158: {0: (1, {'@': 300}), 1: (1, {'@': 300}), 2: (1, {'@': 300}), 3: (1, {'@': 300}), 4: (1, {'@': 300}), 59: (1, {'@': 300}), 7: (1, {'@': 300}), 6: (1, {'@': 300}), 62: (1, {'@': 300}), 63: (1, {'@': 300}), 8: (1, {'@': 300}), 11: (1, {'@': 300}), 12: (1, {'@': 300}), 47: (1, {'@': 300}), 14: (1, {'@': 300}), 5: (1, {'@': 300}), 9: (1, {'@': 300}), 10: (1, {'@': 300})}, 159: {0: (1, {'@': 186}), 1: (1, {'@': 186}), 2: (1, {'@': 186}), 3: (1, {'@': 186}), 4: (1, {'@': 186}), 7: (1, {'@': 186}), 6: (1, {'@': 186}), 59: (1, {'@': 186}), 62: (1, {'@': 186}), 63: (1, {'@': 186}), 8: (1, {'@': 186}), 11: (1, {'@': 186}), 12: (1, {'@': 186}), 47: (1, {'@': 186}), 14: (1, {'@': 186}), 5: (1, {'@': 186}), 9: (1, {'@': 186}), 10: (1, {'@': 186})}, 160: {2: (1, {'@': 303}), 4: (1, {'@': 303}), 5: (1, {'@': 303}), 6: (1, {'@': 303}), 9: (1, {'@': 303}), 10: (1, {'@': 303}), 11: (1, {'@': 303}), 29: (1, {'@': 303}), 13: (1, {'@': 303}), 0: (1, {'@': 303}), 1: (1, {'@': 303}), 3: (1, {'@': 303}), 7: (1, {'@': 303}), 8: (1, {'@': 303}), 12: (1, {'@': 303}), 14: (1, {'@': 303})}, 161: {34: (0, 17)}, 162: {30: (0, 323), 31: (0, 16), 18: (0, 10), 32: (0, 49), 33: (0, 5), 34: (0, 193), 35: (0, 18), 36: (0, 40), 37: (0, 46), 27: (0, 97)}, 163: {0: (1, {'@': 154}), 1: (1, {'@': 154}), 2: (1, {'@': 154}), 3: (1, {'@': 154}), 4: (1, {'@': 154}), 5: (1, {'@': 154}), 6: (1, {'@': 154}), 7: (1, {'@': 154}), 8: (1, {'@': 154}), 9: (1, {'@': 154}), 10: (1, {'@': 154}), 11: (1, {'@': 154}), 12: (1, {'@': 154}), 13: (1, {'@': 154}), 14: (1, {'@': 154})}, 164: {14: (0, 262), 123: (0, 393), 1: (0, 264), 6: (0, 255)}, 165: {0: (1, {'@': 92}), 1: (1, {'@': 92}), 2: (1, {'@': 92}), 3: (1, {'@': 92}), 7: (1, {'@': 92}), 4: (1, {'@': 92}), 6: (1, {'@': 92}), 8: (1, {'@': 92}), 11: (1, {'@': 92}), 12: (1, {'@': 92}), 14: (1, {'@': 92})}, 166: {0: (1, {'@': 181}), 1: (1, {'@': 181}), 2: (1, {'@': 181}), 3: (1, {'@': 181}), 4: (1, {'@': 181}), 7: (1, {'@': 181}), 6: (1, {'@': 181}), 59: (1, {'@': 181}), 62: (1, {'@': 181}), 63: (1, {'@': 181}), 8: (1, {'@': 181}), 11: (1, {'@': 181}), 12: (1, {'@': 181}), 47: (1, {'@': 181}), 14: (1, {'@': 181}), 5: (1, {'@': 181}), 9: (1, {'@': 181}), 10: (1, {'@': 181})}, 167: {18: (0, 316)}, 168: {0: (1, {'@': 153}), 1: (1, {'@': 153}), 2: (1, {'@': 153}), 3: (1, {'@': 153}), 4: (1, {'@': 153}), 5: (1, {'@': 153}), 6: (1, {'@': 153}), 7: (1, {'@': 153}), 8: (1, {'@': 153}), 9: (1, {'@': 153}), 10: (1, {'@': 153}), 11: (1, {'@': 153}), 12: (1, {'@': 153}), 13: (1, {'@': 153}), 14: (1, {'@': 153})}, 169: {18: (0, 300)}, 170: {51: (0, 91)}, 171: {18: (0, 371)}, 172: {0: (1, {'@': 119}), 1: (1, {'@': 119}), 2: (1, {'@': 119}), 3: (1, {'@': 119}), 4: (1, {'@': 119}), 5: (1, {'@': 119}), 6: (1, {'@': 119}), 7: (1, {'@': 119}), 8: (1, {'@': 119}), 9: (1, {'@': 119}), 10: (1, {'@': 119}), 11: (1, {'@': 119}), 12: (1, {'@': 119}), 14: (1, {'@': 119})}, 173: {68: (0, 419), 29: (1, {'@': 218}), 23: (1, {'@': 218}), 13: (1, {'@': 218}), 51: (1, {'@': 218}), 52: (1, {'@': 218}), 53: (1, {'@': 218})}, 174: {0: (1, {'@': 187}), 1: (1, {'@': 187}), 2: (1, {'@': 187}), 3: (1, {'@': 187}), 4: (1, {'@': 187}), 7: (1, {'@': 187}), 6: (1, {'@': 187}), 59: (1, {'@': 187}), 62: (1, {'@': 187}), 63: (1, {'@': 187}), 8: (1, {'@': 187}), 11: (1, {'@': 187}), 12: (1, {'@': 187}), 47: (1, {'@': 187}), 14: (1, {'@': 187}), 5: (1, {'@': 187}), 9: (1, {'@': 187}), 10: (1, {'@': 187})}, 175: {0: (1, {'@': 118}), 1: (1, {'@': 118}), 2: (1, {'@': 118}), 3: (1, {'@': 118}), 4: (1, {'@': 118}), 5: (1, {'@': 118}), 6: (1, {'@': 118}), 7: (1, {'@': 118}), 8: (1, {'@': 118}), 9: (1, {'@': 118}), 10: (1, {'@': 118}), 11: (1, {'@': 118}), 12: (1, {'@': 118}), 14: (1, {'@': 118})}, 176: {33: (0, 114), 124: (0, 160), 18: (0, 96)}, 177: {33: (0, 65), 18: (0, 26), 109: (0, 66)}, 178: {34: (0, 330)}, 179: {0: (1, {'@': 259}), 1: (1, {'@': 259}), 2: (1, {'@': 259}), 3: (1, {'@': 259}), 7: (1, {'@': 259}), 4: (1, {'@': 259}), 6: (1, {'@': 259}), 8: (1, {'@': 259}), 11: (1, {'@': 259}), 12: (1, {'@': 259}), 14: (1, {'@': 259})}, 180: {0: (1, {'@': 152}), 1: (1, {'@': 152}), 2: (1, {'@': 152}), 3: (1, {'@': 152}), 4: (1, {'@': 152}), 5: (1, {'@': 152}), 6: (1, {'@': 152}), 7: (1, {'@': 152}), 8: (1, {'@': 152}), 9: (1, {'@': 152}), 10: (1, {'@': 152}), 11: (1, {'@': 152}), 12: (1, {'@': 152}), 13: (1, {'@': 152}), 14: (1, {'@': 152})}, 181: {34: (0, 389)}, 182: {18: (0, 3)}, 183: {29: (1, {'@': 316}), 49: (1, {'@': 316})}, 184: {0: (1, {'@': 185}), 1: (1, {'@': 185}), 2: (1, {'@': 185}), 3: (1, {'@': 185}), 4: (1, {'@': 185}), 7: (1, {'@': 185}), 6: (1, {'@': 185}), 59: (1, {'@': 185}), 62: (1, {'@': 185}), 63: (1, {'@': 185}), 8: (1, {'@': 185}), 11: (1, {'@': 185}), 12: (1, {'@': 185}), 47: (1, {'@': 185}), 14: (1, {'@': 185}), 5: (1, {'@': 185}), 9: (1, {'@': 185}), 10: (1, {'@': 185})}, 185: {25: (0, 162), 22: (1, {'@': 134}), 23: (1, {'@': 134}), 20: (1, {'@': 134}), 24: (1, {'@': 134})}, 186: {0: (1, {'@': 274}), 1: (1, {'@': 274}), 2: (1, {'@': 274}), 3: (1, {'@': 274}), 4: (1, {'@': 274}), 7: (1, {'@': 274}), 6: (1, {'@': 274}), 8: (1, {'@': 274}), 11: (1, {'@': 274}), 12: (1, {'@': 274}), 14: (1, {'@': 274})}, 187: {28: (0, 60), 71: (0, 413), 26: (0, 365), 29: (1, {'@': 288}), 23: (1, {'@': 288})}, 188: {118: (0, 132), 120: (0, 237), 18: (0, 187), 116: (0, 56), 119: (0, 234), 35: (0, 99), 117: (0, 173), 33: (0, 85), 27: (0, 70), 114: (0, 217)}, 189: {26: (0, 76), 28: (0, 6), 71: (0, 11)}, 190: {28: (0, 60), 26: (0, 365), 29: (1, {'@': 288}), 23: (1, {'@': 288})}, 191: {22: (0, 203), 20: (0, 33), 58: (0, 48), 24: (1, {'@': 166})}, 192: {49: (0, 289)}, 193: {30: (0, 274), 31: (0, 16), 125: (0, 101), 18: (0, 10), 32: (0, 49), 33: (0, 5), 27: (0, 97), 34: (0, 193), 35: (0, 18), 126: (0, 185), 37: (0, 46), 36: (0, 40)}, 194: {59: (0, 375), 60: (0, 317), 61: (0, 290), 62: (0, 285), 63: (0, 307), 64: (0, 158), 47: (0, 434), 65: (0, 436), 66: (0, 321), 67: (0, 357), 0: (1, {'@': 276}), 1: (1, {'@': 276}), 2: (1, {'@': 276}), 3: (1, {'@': 276}), 4: (1, {'@': 276}), 7: (1, {'@': 276}), 6: (1, {'@': 276}), 8: (1, {'@': 276}), 11: (1, {'@': 276}), 12: (1, {'@': 276}), 14: (1, {'@': 276})}, 195: {14: (0, 262), 123: (0, 405), 1: (0, 264), 6: (0, 255)}, 196: {29: (0, 310), 2: (1, {'@': 208}), 4: (1, {'@': 208}), 5: (1, {'@': 208}), 6: (1, {'@': 208}), 9: (1, {'@': 208}), 10: (1, {'@': 208}), 11: (1, {'@': 208}), 13: (1, {'@': 208}), 0: (1, {'@': 208}), 1: (1, {'@': 208}), 3: (1, {'@': 208}), 7: (1, {'@': 208}), 8: (1, {'@': 208}), 12: (1, {'@': 208}), 14: (1, {'@': 208})}, 197: {64: (0, 294), 60: (0, 317), 61: (0, 290), 59: (0, 375), 62: (0, 285), 63: (0, 307), 47: (0, 434), 3: (0, 253), 66: (0, 321), 83: (0, 292), 65: (0, 436), 67: (0, 357)}, 198: {0: (1, {'@': 172}), 1: (1, {'@': 172}), 2: (1, {'@': 172}), 3: (1, {'@': 172}), 4: (1, {'@': 172}), 5: (1, {'@': 172}), 6: (1, {'@': 172}), 7: (1, {'@': 172}), 8: (1, {'@': 172}), 9: (1, {'@': 172}), 10: (1, {'@': 172}), 11: (1, {'@': 172}), 12: (1, {'@': 172}), 13: (1, {'@': 172}), 14: (1, {'@': 172})}, 199: {0: (1, {'@': 279}), 1: (1, {'@': 279}), 2: (1, {'@': 279}), 3: (1, {'@': 279}), 7: (1, {'@': 279}), 4: (1, {'@': 279}), 6: (1, {'@': 279}), 8: (1, {'@': 279}), 11: (1, {'@': 279}), 12: (1, {'@': 279}), 14: (1, {'@': 279})}, 200: {59: (0, 375), 64: (0, 294), 60: (0, 317), 61: (0, 290), 62: (0, 285), 63: (0, 307), 47: (0, 434), 65: (0, 436), 83: (0, 53), 66: (0, 321), 67: (0, 357)}, 201: {0: (1, {'@': 128}), 1: (1, {'@': 128}), 2: (1, {'@': 128}), 3: (1, {'@': 128}), 4: (1, {'@': 128}), 5: (1, {'@': 128}), 6: (1, {'@': 128}), 7: (1, {'@': 128}), 8: (1, {'@': 128}), 9: (1, {'@': 128}), 10: (1, {'@': 128}), 11: (1, {'@': 128}), 12: (1, {'@': 128}), 14: (1, {'@': 128})}, 202: {29: (1, {'@': 283}), 23: (1, {'@': 283})}, 203: {30: (0, 274), 31: (0, 16), 126: (0, 438), 18: (0, 10), 32: (0, 49), 33: (0, 5), 34: (0, 193), 35: (0, 18), 36: (0, 40), 37: (0, 46), 27: (0, 97)}, 204: {62: (0, 140), 74: (0, 58), 18: (0, 141), 73: (0, 144), 75: (0, 107), 63: (0, 147), 76: (0, 168), 77: (0, 171), 78: (0, 155), 79: (0, 178), 80: (0, 163), 81: (0, 180)}, 205: {24: (0, 59)}, 206: {127: (0, 443)}, 207: {2: (1, {'@': 114}), 4: (1, {'@': 114}), 5: (1, {'@': 114}), 6: (1, {'@': 114}), 9: (1, {'@': 114}), 10: (1, {'@': 114}), 11: (1, {'@': 114}), 0: (1, {'@': 114}), 1: (1, {'@': 114}), 3: (1, {'@': 114}), 7: (1, {'@': 114}), 8: (1, {'@': 114}), 12: (1, {'@': 114}), 14: (1, {'@': 114})}, 208: {120: (0, 269)}, 209: {120: (0, 315), 18: (0, 308), 128: (0, 112), 116: (0, 56), 117: (0, 173), 119: (0, 359), 33: (0, 272)}, 210: {0: (1, {'@': 182}), 1: (1, {'@': 182}), 2: (1, {'@': 182}), 3: (1, {'@': 182}), 4: (1, {'@': 182}), 7: (1, {'@': 182}), 6: (1, {'@': 182}), 59: (1, {'@': 182}), 62: (1, {'@': 182}), 63: (1, {'@': 182}), 8: (1, {'@': 182}), 11: (1, {'@': 182}), 12: (1, {'@': 182}), 47: (1, {'@': 182}), 14: (1, {'@': 182}), 5: (1, {'@': 182}), 9: (1, {'@': 182}), 10: (1, {'@': 182})}, 211: {0: (1, {'@': 90}), 1: (1, {'@': 90}), 2: (1, {'@': 90}), 3: (1, {'@': 90}), 7: (1, {'@': 90}), 4: (1, {'@': 90}), 6: (1, {'@': 90}), 8: (1, {'@': 90}), 11: (1, {'@': 90}), 12: (1, {'@': 90}), 14: (1, {'@': 90})}, 212: {18: (0, 311)}, 213: {129: (0, 370)}, 214: {29: (0, 281), 130: (0, 440), 49: (1, {'@': 255})}, 215: {0: (1, {'@': 291}), 1: (1, {'@': 291}), 2: (1, {'@': 291}), 3: (1, {'@': 291}), 7: (1, {'@': 291}), 4: (1, {'@': 291}), 6: (1, {'@': 291}), 8: (1, {'@': 291}), 11: (1, {'@': 291}), 12: (1, {'@': 291}), 14: (1, {'@': 291})}, 216: {62: (0, 140), 18: (0, 141), 75: (0, 107), 63: (0, 147), 76: (0, 168), 77: (0, 171), 78: (0, 155), 79: (0, 178), 80: (0, 163), 81: (0, 180), 73: (0, 13)}, 217: {29: (1, {'@': 323}), 23: (1, {'@': 323})}, 218: {93: (0, 319), 89: (0, 416), 84: (0, 422), 82: (0, 441), 85: (0, 427), 86: (0, 403)}, 219: {13: (0, 166)}, 220: {120: (0, 315), 18: (0, 308), 116: (0, 56), 117: (0, 173), 119: (0, 359), 128: (0, 152), 33: (0, 272)}, 221: {1: (0, 197), 10: (0, 149), 40: (0, 122), 5: (0, 94), 41: (0, 207), 42: (0, 247), 43: (0, 78), 44: (0, 399), 9: (0, 223), 45: (0, 131), 0: (1, {'@': 109}), 2: (1, {'@': 109}), 3: (1, {'@': 109}), 7: (1, {'@': 109}), 4: (1, {'@': 109}), 6: (1, {'@': 109}), 8: (1, {'@': 109}), 11: (1, {'@': 109}), 12: (1, {'@': 109}), 14: (1, {'@': 109})}, 222: {131: (0, 24)}, 223: {120: (0, 315), 1: (0, 254), 18: (0, 308), 116: (0, 56), 117: (0, 173), 119: (0, 359), 132: (0, 265), 128: (0, 445), 33: (0, 272)}, 224: {110: (0, 38), 18: (0, 26), 109: (0, 95), 33: (0, 65)}, 225: {20: (1, {'@': 137}), 22: (1, {'@': 137}), 23: (1, {'@': 137}), 24: (1, {'@': 137}), 25: (1, {'@': 137})}, 226: {18: (0, 366)}, 227: {133: (0, 409), 0: (1, {'@': 280}), 1: (1, {'@': 280}), 2: (1, {'@': 280}), 3: (1, {'@': 280}), 7: (1, {'@': 280}), 4: (1, {'@': 280}), 6: (1, {'@': 280}), 8: (1, {'@': 280}), 11: (1, {'@': 280}), 12: (1, {'@': 280}), 14: (1, {'@': 280})}, 228: {29: (0, 349), 47: (1, {'@': 193})}, 229: {0: (1, {'@': 94}), 1: (1, {'@': 94}), 2: (1, {'@': 94}), 3: (1, {'@': 94}), 7: (1, {'@': 94}), 4: (1, {'@': 94}), 6: (1, {'@': 94}), 8: (1, {'@': 94}), 11: (1, {'@': 94}), 12: (1, {'@': 94}), 14: (1, {'@': 94})}, 230: {2: (1, {'@': 271}), 4: (1, {'@': 271}), 6: (1, {'@': 271}), 11: (1, {'@': 271}), 0: (1, {'@': 271}), 1: (1, {'@': 271}), 3: (1, {'@': 271}), 7: (1, {'@': 271}), 8: (1, {'@': 271}), 12: (1, {'@': 271}), 14: (1, {'@': 271})}, 231: {29: (1, {'@': 317}), 49: (1, {'@': 317})}, 232: {29: (1, {'@': 267}), 23: (1, {'@': 267})}, 233: {0: (1, {'@': 96}), 1: (1, {'@': 96}), 2: (1, {'@': 96}), 3: (1, {'@': 96}), 7: (1, {'@': 96}), 4: (1, {'@': 96}), 6: (1, {'@': 96}), 8: (1, {'@': 96}), 11: (1, {'@': 96}), 12: (1, {'@': 96}), 14: (1, {'@': 96})}, 234: {29: (1, {'@': 290}), 23: (1, {'@': 290})}, 235: {131: (0, 396)}, 236: {18: (0, 198), 27: (0, 67), 35: (0, 72)}, 237: {29: (1, {'@': 289}), 23: (1, {'@': 289})}, 238: {13: (0, 174)}, 239: {29: (1, {'@': 318}), 49: (1, {'@': 318})}, 240: {13: (0, 51), 0: (1, {'@': 123}), 1: (1, {'@': 123}), 2: (1, {'@': 123}), 3: (1, {'@': 123}), 4: (1, {'@': 123}), 5: (1, {'@': 123}), 6: (1, {'@': 123}), 7: (1, {'@': 123}), 8: (1, {'@': 123}), 9: (1, {'@': 123}), 10: (1, {'@': 123}), 11: (1, {'@': 123}), 12: (1, {'@': 123}), 14: (1, {'@': 123})}, 241: {0: (1, {'@': 95}), 1: (1, {'@': 95}), 2: (1, {'@': 95}), 3: (1, {'@': 95}), 7: (1, {'@': 95}), 4: (1, {'@': 95}), 6: (1, {'@': 95}), 8: (1, {'@': 95}), 11: (1, {'@': 95}), 12: (1, {'@': 95}), 14: (1, {'@': 95})}, 242: {13: (0, 309), 134: (0, 353), 135: (0, 244)}, 243: {53: (0, 4), 24: (0, 35)}, 244: {12: (0, 43)}, 245: {1: (0, 226), 0: (0, 195), 8: (0, 167)}, 246: {2: (1, {'@': 295}), 4: (1, {'@': 295}), 5: (1, {'@': 295}), 6: (1, {'@': 295}), 9: (1, {'@': 295}), 10: (1, {'@': 295}), 11: (1, {'@': 295}), 13: (1, {'@': 295}), 0: (1, {'@': 295}), 1: (1, {'@': 295}), 3: (1, {'@': 295}), 7: (1, {'@': 295}), 8: (1, {'@': 295}), 12: (1, {'@': 295}), 14: (1, {'@': 295})}, 247: {2: (1, {'@': 111}), 4: (1, {'@': 111}), 5: (1, {'@': 111}), 6: (1, {'@': 111}), 9: (1, {'@': 111}), 10: (1, {'@': 111}), 11: (1, {'@': 111}), 0: (1, {'@': 111}), 1: (1, {'@': 111}), 3: (1, {'@': 111}), 7: (1, {'@': 111}), 8: (1, {'@': 111}), 12: (1, {'@': 111}), 14: (1, {'@': 111})}, 248: {127: (0, 424), 136: (0, 439)}, 249: {62: (0, 140), 18: (0, 141), 74: (0, 87), 73: (0, 144), 75: (0, 107), 63: (0, 147), 76: (0, 168), 77: (0, 171), 78: (0, 155), 79: (0, 178), 80: (0, 163), 81: (0, 180)}, 250: {137: (0, 208)}, 251: {0: (1, {'@': 277}), 1: (1, {'@': 277}), 2: (1, {'@': 277}), 3: (1, {'@': 277}), 7: (1, {'@': 277}), 4: (1, {'@': 277}), 6: (1, {'@': 277}), 8: (1, {'@': 277}), 11: (1, {'@': 277}), 12: (1, {'@': 277}), 14: (1, {'@': 277})}, 252: {120: (1, {'@': 197})}, 253: {33: (0, 114), 18: (0, 96), 124: (0, 102), 138: (0, 128)}, 254: {139: (0, 258)}, 255: {18: (1, {'@': 261})}, 256: {129: (0, 118)}, 257: {47: (1, {'@': 195})}, 258: {51: (1, {'@': 121})}, 259: {18: (0, 306), 27: (0, 232), 140: (0, 69), 35: (0, 113)}, 260: {141: (0, 304), 142: (0, 333), 143: (0, 252), 144: (0, 414)}, 261: {18: (0, 415), 145: (0, 342)}, 262: {18: (1, {'@': 260})}, 263: {29: (0, 348), 0: (1, {'@': 234}), 1: (1, {'@': 234}), 2: (1, {'@': 234}), 3: (1, {'@': 234}), 4: (1, {'@': 234}), 7: (1, {'@': 234}), 6: (1, {'@': 234}), 8: (1, {'@': 234}), 11: (1, {'@': 234}), 12: (1, {'@': 234}), 14: (1, {'@': 234})}, 264: {18: (1, {'@': 262})}, 265: {51: (0, 395)}, 266: {131: (0, 276), 146: (0, 401)}, 267: {18: (0, 447)}, 268: {34: (0, 303)}, 269: {13: (1, {'@': 200}), 135: (1, {'@': 200})}, 270: {71: (0, 282)}, 271: {147: (0, 297), 148: (0, 421), 149: (0, 346), 150: (0, 328), 151: (0, 444), 152: (0, 312), 153: (0, 450)}, 272: {13: (1, {'@': 215}), 51: (1, {'@': 215}), 52: (1, {'@': 215}), 53: (1, {'@': 215})}, 273: {0: (1, {'@': 242}), 1: (1, {'@': 242}), 2: (1, {'@': 242}), 3: (1, {'@': 242}), 4: (1, {'@': 242}), 7: (1, {'@': 242}), 6: (1, {'@': 242}), 8: (1, {'@': 242}), 11: (1, {'@': 242}), 29: (1, {'@': 242}), 12: (1, {'@': 242}), 14: (1, {'@': 242})}, 274: {22: (1, {'@': 136}), 23: (1, {'@': 136}), 25: (1, {'@': 136}), 20: (1, {'@': 136}), 24: (1, {'@': 136})}, 275: {29: (0, 298), 0: (1, {'@': 238}), 1: (1, {'@': 238}), 2: (1, {'@': 238}), 3: (1, {'@': 238}), 7: (1, {'@': 238}), 4: (1, {'@': 238}), 6: (1, {'@': 238}), 8: (1, {'@': 238}), 11: (1, {'@': 238}), 12: (1, {'@': 238}), 14: (1, {'@': 238})}, 276: {154: (0, 235), 155: (0, 228), 29: (0, 222), 47: (1, {'@': 194})}, 277: {29: (0, 177), 49: (1, {'@': 221}), 50: (1, {'@': 221})}, 278: {30: (0, 274), 125: (0, 45), 18: (0, 10), 37: (0, 46), 31: (0, 16), 32: (0, 49), 33: (0, 5), 36: (0, 40), 34: (0, 193), 35: (0, 18), 126: (0, 185), 27: (0, 97)}, 279: {2: (1, {'@': 233}), 4: (1, {'@': 233}), 6: (1, {'@': 233}), 11: (1, {'@': 233}), 0: (1, {'@': 233}), 1: (1, {'@': 233}), 3: (1, {'@': 233}), 7: (1, {'@': 233}), 8: (1, {'@': 233}), 12: (1, {'@': 233}), 14: (1, {'@': 233})}, 280: {18: (0, 251)}, 281: {156: (0, 397)}, 282: {33: (0, 54), 18: (0, 296)}, 283: {1: (0, 197), 10: (0, 149), 64: (0, 294), 60: (0, 317), 82: (0, 441), 61: (0, 290), 40: (0, 122), 5: (0, 94), 41: (0, 207), 59: (0, 375), 83: (0, 194), 84: (0, 422), 85: (0, 427), 86: (0, 403), 42: (0, 247), 87: (0, 14), 88: (0, 230), 89: (0, 21), 62: (0, 285), 63: (0, 307), 47: (0, 434), 90: (0, 119), 43: (0, 78), 92: (0, 20), 93: (0, 319), 9: (0, 223), 66: (0, 321), 91: (0, 179), 65: (0, 436), 44: (0, 39), 45: (0, 131), 67: (0, 357)}, 284: {23: (0, 390)}, 285: {157: (1, {'@': 202})}, 286: {0: (1, {'@': 226}), 1: (1, {'@': 226}), 2: (1, {'@': 226}), 3: (1, {'@': 226}), 7: (1, {'@': 226}), 4: (1, {'@': 226}), 6: (1, {'@': 226}), 8: (1, {'@': 226}), 11: (1, {'@': 226}), 12: (1, {'@': 226}), 14: (1, {'@': 226})}, 287: {129: (0, 283)}, 288: {23: (1, {'@': 130}), 51: (1, {'@': 130}), 24: (1, {'@': 130}), 2: (1, {'@': 130}), 4: (1, {'@': 130}), 5: (1, {'@': 130}), 6: (1, {'@': 130}), 9: (1, {'@': 130}), 10: (1, {'@': 130}), 11: (1, {'@': 130}), 13: (1, {'@': 130}), 0: (1, {'@': 130}), 1: (1, {'@': 130}), 3: (1, {'@': 130}), 7: (1, {'@': 130}), 8: (1, {'@': 130}), 12: (1, {'@': 130}), 14: (1, {'@': 130})}, 289: {133: (0, 182)}, 290: {0: (1, {'@': 178}), 1: (1, {'@': 178}), 2: (1, {'@': 178}), 3: (1, {'@': 178}), 4: (1, {'@': 178}), 7: (1, {'@': 178}), 6: (1, {'@': 178}), 59: (1, {'@': 178}), 62: (1, {'@': 178}), 63: (1, {'@': 178}), 8: (1, {'@': 178}), 11: (1, {'@': 178}), 12: (1, {'@': 178}), 47: (1, {'@': 178}), 14: (1, {'@': 178}), 5: (1, {'@': 178}), 9: (1, {'@': 178}), 10: (1, {'@': 178})}, 291: {26: (0, 88), 2: (1, {'@': 229}), 4: (1, {'@': 229}), 133: (1, {'@': 229}), 6: (1, {'@': 229}), 158: (1, {'@': 229}), 11: (1, {'@': 229}), 0: (1, {'@': 229}), 1: (1, {'@': 229}), 3: (1, {'@': 229}), 7: (1, {'@': 229}), 8: (1, {'@': 229}), 129: (1, {'@': 229}), 12: (1, {'@': 229}), 14: (1, {'@': 229})}, 292: {59: (0, 375), 60: (0, 317), 61: (0, 290), 62: (0, 285), 63: (0, 307), 64: (0, 158), 47: (0, 434), 65: (0, 436), 66: (0, 321), 67: (0, 357), 0: (1, {'@': 212}), 1: (1, {'@': 212}), 2: (1, {'@': 212}), 3: (1, {'@': 212}), 4: (1, {'@': 212}), 5: (1, {'@': 212}), 6: (1, {'@': 212}), 7: (1, {'@': 212}), 8: (1, {'@': 212}), 9: (1, {'@': 212}), 10: (1, {'@': 212}), 11: (1, {'@': 212}), 12: (1, {'@': 212}), 14: (1, {'@': 212})}, 293: {0: (1, {'@': 99}), 1: (1, {'@': 99}), 2: (1, {'@': 99}), 3: (1, {'@': 99}), 7: (1, {'@': 99}), 4: (1, {'@': 99}), 6: (1, {'@': 99}), 8: (1, {'@': 99}), 11: (1, {'@': 99}), 12: (1, {'@': 99}), 14: (1, {'@': 99})}, 294: {0: (1, {'@': 299}), 1: (1, {'@': 299}), 2: (1, {'@': 299}), 3: (1, {'@': 299}), 4: (1, {'@': 299}), 59: (1, {'@': 299}), 7: (1, {'@': 299}), 6: (1, {'@': 299}), 62: (1, {'@': 299}), 63: (1, {'@': 299}), 8: (1, {'@': 299}), 11: (1, {'@': 299}), 12: (1, {'@': 299}), 47: (1, {'@': 299}), 14: (1, {'@': 299}), 5: (1, {'@': 299}), 9: (1, {'@': 299}), 10: (1, {'@': 299})}, 295: {}, 296: {28: (0, 60), 26: (0, 365)}, 297: {71: (0, 338)}, 298: {150: (0, 143), 147: (0, 297), 148: (0, 421), 149: (0, 346), 151: (0, 444), 152: (0, 312), 153: (0, 450)}, 299: {159: (0, 238), 120: (0, 250)}, 300: {129: (0, 314)}, 301: {29: (1, {'@': 324}), 23: (1, {'@': 324})}, 302: {33: (0, 65), 109: (0, 125), 18: (0, 26)}, 303: {125: (0, 137), 30: (0, 274), 18: (0, 10), 37: (0, 46), 31: (0, 16), 32: (0, 49), 33: (0, 5), 36: (0, 40), 34: (0, 193), 35: (0, 18), 126: (0, 185), 27: (0, 97)}, 304: {159: (0, 242), 120: (0, 250)}, 305: {160: (0, 133), 29: (0, 135), 23: (1, {'@': 264})}, 306: {29: (1, {'@': 269}), 23: (1, {'@': 269})}, 307: {157: (1, {'@': 203})}, 308: {28: (0, 60), 26: (0, 365), 13: (1, {'@': 216}), 51: (1, {'@': 216}), 52: (1, {'@': 216}), 53: (1, {'@': 216})}, 309: {0: (1, {'@': 184}), 1: (1, {'@': 184}), 2: (1, {'@': 184}), 3: (1, {'@': 184}), 4: (1, {'@': 184}), 7: (1, {'@': 184}), 6: (1, {'@': 184}), 59: (1, {'@': 184}), 62: (1, {'@': 184}), 63: (1, {'@': 184}), 8: (1, {'@': 184}), 11: (1, {'@': 184}), 12: (1, {'@': 184}), 47: (1, {'@': 184}), 14: (1, {'@': 184}), 5: (1, {'@': 184}), 9: (1, {'@': 184}), 10: (1, {'@': 184})}, 310: {33: (0, 114), 18: (0, 96), 124: (0, 332)}, 311: {34: (0, 151)}, 312: {71: (0, 412)}, 313: {0: (1, {'@': 245}), 1: (1, {'@': 245}), 2: (1, {'@': 245}), 3: (1, {'@': 245}), 4: (1, {'@': 245}), 7: (1, {'@': 245}), 6: (1, {'@': 245}), 8: (1, {'@': 245}), 11: (1, {'@': 245}), 29: (1, {'@': 245}), 12: (1, {'@': 245}), 14: (1, {'@': 245})}, 314: {147: (0, 297), 148: (0, 421), 149: (0, 346), 150: (0, 318), 151: (0, 444), 152: (0, 312), 153: (0, 450)}, 315: {13: (1, {'@': 213}), 51: (1, {'@': 213}), 52: (1, {'@': 213}), 53: (1, {'@': 213})}, 316: {71: (0, 153)}, 317: {157: (0, 331)}, 318: {161: (0, 275), 29: (0, 271), 0: (1, {'@': 239}), 1: (1, {'@': 239}), 2: (1, {'@': 239}), 3: (1, {'@': 239}), 7: (1, {'@': 239}), 4: (1, {'@': 239}), 6: (1, {'@': 239}), 8: (1, {'@': 239}), 11: (1, {'@': 239}), 12: (1, {'@': 239}), 14: (1, {'@': 239})}, 319: {46: (1, {'@': 103})}, 320: {162: (0, 117), 156: (0, 214)}, 321: {0: (1, {'@': 180}), 1: (1, {'@': 180}), 2: (1, {'@': 180}), 3: (1, {'@': 180}), 4: (1, {'@': 180}), 7: (1, {'@': 180}), 6: (1, {'@': 180}), 59: (1, {'@': 180}), 62: (1, {'@': 180}), 63: (1, {'@': 180}), 8: (1, {'@': 180}), 11: (1, {'@': 180}), 12: (1, {'@': 180}), 47: (1, {'@': 180}), 14: (1, {'@': 180}), 5: (1, {'@': 180}), 9: (1, {'@': 180}), 10: (1, {'@': 180})}, 322: {0: (1, {'@': 183}), 1: (1, {'@': 183}), 2: (1, {'@': 183}), 3: (1, {'@': 183}), 4: (1, {'@': 183}), 7: (1, {'@': 183}), 6: (1, {'@': 183}), 59: (1, {'@': 183}), 62: (1, {'@': 183}), 63: (1, {'@': 183}), 8: (1, {'@': 183}), 11: (1, {'@': 183}), 12: (1, {'@': 183}), 47: (1, {'@': 183}), 14: (1, {'@': 183}), 5: (1, {'@': 183}), 9: (1, {'@': 183}), 10: (1, {'@': 183})}, 323: {22: (1, {'@': 135}), 23: (1, {'@': 135}), 25: (1, {'@': 135}), 20: (1, {'@': 135}), 24: (1, {'@': 135})}, 324: {13: (1, {'@': 201})}, 325: {46: (0, 364)}, 326: {18: (0, 415), 145: (0, 385), 163: (0, 355)}, 327: {62: (0, 140), 18: (0, 141), 73: (0, 144), 75: (0, 107), 63: (0, 147), 76: (0, 168), 77: (0, 171), 78: (0, 155), 79: (0, 178), 80: (0, 163), 74: (0, 172), 81: (0, 180)}, 328: {2: (1, {'@': 309}), 4: (1, {'@': 309}), 6: (1, {'@': 309}), 11: (1, {'@': 309}), 29: (1, {'@': 309}), 0: (1, {'@': 309}), 1: (1, {'@': 309}), 3: (1, {'@': 309}), 7: (1, {'@': 309}), 8: (1, {'@': 309}), 12: (1, {'@': 309}), 14: (1, {'@': 309})}, 329: {20: (1, {'@': 144}), 22: (1, {'@': 144}), 23: (1, {'@': 144}), 24: (1, {'@': 144}), 25: (1, {'@': 144})}, 330: {30: (0, 274), 164: (0, 205), 18: (0, 10), 125: (0, 191), 37: (0, 46), 31: (0, 16), 32: (0, 49), 33: (0, 5), 36: (0, 40), 34: (0, 193), 35: (0, 18), 126: (0, 185), 27: (0, 97)}, 331: {120: (0, 315), 128: (0, 417), 18: (0, 308), 116: (0, 56), 117: (0, 173), 119: (0, 359), 33: (0, 272)}, 332: {2: (1, {'@': 304}), 4: (1, {'@': 304}), 5: (1, {'@': 304}), 6: (1, {'@': 304}), 9: (1, {'@': 304}), 10: (1, {'@': 304}), 11: (1, {'@': 304}), 29: (1, {'@': 304}), 13: (1, {'@': 304}), 0: (1, {'@': 304}), 1: (1, {'@': 304}), 3: (1, {'@': 304}), 7: (1, {'@': 304}), 8: (1, {'@': 304}), 12: (1, {'@': 304}), 14: (1, {'@': 304})}, 333: {120: (1, {'@': 199})}, 334: {29: (1, {'@': 311}), 49: (1, {'@': 311})}, 335: {29: (0, 358), 49: (1, {'@': 252})}, 336: {20: (1, {'@': 298}), 26: (1, {'@': 298}), 21: (1, {'@': 298}), 22: (1, {'@': 298}), 23: (1, {'@': 298}), 19: (1, {'@': 298}), 24: (1, {'@': 298}), 25: (1, {'@': 298}), 50: (1, {'@': 298}), 49: (1, {'@': 298}), 29: (1, {'@': 298}), 2: (1, {'@': 298}), 4: (1, {'@': 298}), 5: (1, {'@': 298}), 6: (1, {'@': 298}), 9: (1, {'@': 298}), 10: (1, {'@': 298}), 11: (1, {'@': 298}), 13: (1, {'@': 298}), 0: (1, {'@': 298}), 1: (1, {'@': 298}), 3: (1, {'@': 298}), 7: (1, {'@': 298}), 8: (1, {'@': 298}), 12: (1, {'@': 298}), 14: (1, {'@': 298}), 52: (1, {'@': 298}), 51: (1, {'@': 298}), 53: (1, {'@': 298}), 133: (1, {'@': 298}), 158: (1, {'@': 298}), 129: (1, {'@': 298})}, 337: {29: (0, 358), 49: (1, {'@': 250})}, 338: {35: (0, 86)}, 339: {29: (0, 400), 49: (1, {'@': 246})}, 340: {46: (0, 446)}, 341: {0: (1, {'@': 292}), 1: (1, {'@': 292}), 2: (1, {'@': 292}), 3: (1, {'@': 292}), 7: (1, {'@': 292}), 4: (1, {'@': 292}), 6: (1, {'@': 292}), 8: (1, {'@': 292}), 11: (1, {'@': 292}), 12: (1, {'@': 292}), 14: (1, {'@': 292})}, 342: {0: (1, {'@': 307}), 1: (1, {'@': 307}), 2: (1, {'@': 307}), 3: (1, {'@': 307}), 4: (1, {'@': 307}), 7: (1, {'@': 307}), 6: (1, {'@': 307}), 8: (1, {'@': 307}), 11: (1, {'@': 307}), 29: (1, {'@': 307}), 12: (1, {'@': 307}), 14: (1, {'@': 307})}, 343: {29: (1, {'@': 314}), 49: (1, {'@': 314})}, 344: {162: (0, 103), 156: (0, 214)}, 345: {58: (0, 240), 20: (0, 33), 13: (0, 80), 0: (1, {'@': 125}), 1: (1, {'@': 125}), 2: (1, {'@': 125}), 3: (1, {'@': 125}), 4: (1, {'@': 125}), 5: (1, {'@': 125}), 6: (1, {'@': 125}), 7: (1, {'@': 125}), 8: (1, {'@': 125}), 9: (1, {'@': 125}), 10: (1, {'@': 125}), 11: (1, {'@': 125}), 12: (1, {'@': 125}), 14: (1, {'@': 125})}, 346: {71: (0, 431)}, 347: {18: (0, 26), 109: (0, 95), 110: (0, 377), 33: (0, 65)}, 348: {18: (0, 415), 145: (0, 139)}, 349: {131: (0, 36)}, 350: {129: (0, 224)}, 351: {0: (1, {'@': 256}), 1: (1, {'@': 256}), 2: (1, {'@': 256}), 3: (1, {'@': 256}), 7: (1, {'@': 256}), 4: (1, {'@': 256}), 6: (1, {'@': 256}), 8: (1, {'@': 256}), 11: (1, {'@': 256}), 12: (1, {'@': 256}), 14: (1, {'@': 256})}, 352: {129: (0, 326), 158: (0, 356), 165: (0, 9), 133: (0, 121), 0: (1, {'@': 228}), 1: (1, {'@': 228}), 2: (1, {'@': 228}), 3: (1, {'@': 228}), 7: (1, {'@': 228}), 4: (1, {'@': 228}), 6: (1, {'@': 228}), 8: (1, {'@': 228}), 11: (1, {'@': 228}), 12: (1, {'@': 228}), 14: (1, {'@': 228})}, 353: {13: (0, 322)}, 354: {166: (0, 350)}, 355: {2: (1, {'@': 232}), 4: (1, {'@': 232}), 6: (1, {'@': 232}), 11: (1, {'@': 232}), 0: (1, {'@': 232}), 1: (1, {'@': 232}), 3: (1, {'@': 232}), 7: (1, {'@': 232}), 8: (1, {'@': 232}), 12: (1, {'@': 232}), 14: (1, {'@': 232})}, 356: {2: (1, {'@': 231}), 4: (1, {'@': 231}), 6: (1, {'@': 231}), 11: (1, {'@': 231}), 0: (1, {'@': 231}), 1: (1, {'@': 231}), 3: (1, {'@': 231}), 7: (1, {'@': 231}), 8: (1, {'@': 231}), 12: (1, {'@': 231}), 14: (1, {'@': 231})}, 357: {0: (1, {'@': 179}), 1: (1, {'@': 179}), 2: (1, {'@': 179}), 3: (1, {'@': 179}), 4: (1, {'@': 179}), 7: (1, {'@': 179}), 6: (1, {'@': 179}), 59: (1, {'@': 179}), 62: (1, {'@': 179}), 63: (1, {'@': 179}), 8: (1, {'@': 179}), 11: (1, {'@': 179}), 12: (1, {'@': 179}), 47: (1, {'@': 179}), 14: (1, {'@': 179}), 5: (1, {'@': 179}), 9: (1, {'@': 179}), 10: (1, {'@': 179})}, 358: {167: (0, 239), 168: (0, 183), 169: (0, 231)}, 359: {13: (1, {'@': 214}), 51: (1, {'@': 214}), 52: (1, {'@': 214}), 53: (1, {'@': 214})}, 360: {0: (1, {'@': 93}), 1: (1, {'@': 93}), 2: (1, {'@': 93}), 3: (1, {'@': 93}), 7: (1, {'@': 93}), 4: (1, {'@': 93}), 6: (1, {'@': 93}), 8: (1, {'@': 93}), 11: (1, {'@': 93}), 12: (1, {'@': 93}), 14: (1, {'@': 93})}, 361: {20: (1, {'@': 297}), 26: (1, {'@': 297}), 21: (1, {'@': 297}), 22: (1, {'@': 297}), 23: (1, {'@': 297}), 19: (1, {'@': 297}), 24: (1, {'@': 297}), 25: (1, {'@': 297}), 50: (1, {'@': 297}), 49: (1, {'@': 297}), 29: (1, {'@': 297}), 2: (1, {'@': 297}), 4: (1, {'@': 297}), 5: (1, {'@': 297}), 6: (1, {'@': 297}), 9: (1, {'@': 297}), 10: (1, {'@': 297}), 11: (1, {'@': 297}), 13: (1, {'@': 297}), 0: (1, {'@': 297}), 1: (1, {'@': 297}), 3: (1, {'@': 297}), 7: (1, {'@': 297}), 8: (1, {'@': 297}), 12: (1, {'@': 297}), 14: (1, {'@': 297}), 52: (1, {'@': 297}), 51: (1, {'@': 297}), 53: (1, {'@': 297}), 133: (1, {'@': 297}), 158: (1, {'@': 297}), 129: (1, {'@': 297})}, 362: {29: (0, 358), 49: (1, {'@': 248})}, 363: {18: (0, 189)}, 364: {167: (0, 71), 169: (0, 105), 168: (0, 79), 170: (0, 82)}, 365: {18: (0, 361)}, 366: {129: (0, 200)}, 367: {62: (0, 140), 18: (0, 141), 73: (0, 246), 75: (0, 107), 63: (0, 147), 76: (0, 168), 77: (0, 171), 78: (0, 155), 79: (0, 178), 80: (0, 163), 81: (0, 180)}, 368: {29: (1, {'@': 313}), 49: (1, {'@': 313})}, 369: {29: (1, {'@': 322}), 23: (1, {'@': 322})}, 370: {83: (0, 404), 59: (0, 375), 64: (0, 294), 60: (0, 317), 61: (0, 290), 62: (0, 285), 63: (0, 307), 47: (0, 434), 65: (0, 436), 66: (0, 321), 67: (0, 357)}, 371: {71: (0, 236)}, 372: {20: (1, {'@': 141}), 22: (1, {'@': 141}), 23: (1, {'@': 141}), 24: (1, {'@': 141}), 25: (1, {'@': 141})}, 373: {0: (1, {'@': 244}), 1: (1, {'@': 244}), 2: (1, {'@': 244}), 3: (1, {'@': 244}), 4: (1, {'@': 244}), 7: (1, {'@': 244}), 6: (1, {'@': 244}), 8: (1, {'@': 244}), 11: (1, {'@': 244}), 29: (1, {'@': 244}), 12: (1, {'@': 244}), 14: (1, {'@': 244})}, 374: {58: (0, 435), 20: (0, 33), 13: (0, 201), 0: (1, {'@': 129}), 1: (1, {'@': 129}), 2: (1, {'@': 129}), 3: (1, {'@': 129}), 4: (1, {'@': 129}), 5: (1, {'@': 129}), 6: (1, {'@': 129}), 7: (1, {'@': 129}), 8: (1, {'@': 129}), 9: (1, {'@': 129}), 10: (1, {'@': 129}), 11: (1, {'@': 129}), 12: (1, {'@': 129}), 14: (1, {'@': 129})}, 375: {171: (0, 57), 172: (0, 248), 173: (0, 266)}, 376: {13: (0, 216), 2: (1, {'@': 150}), 4: (1, {'@': 150}), 5: (1, {'@': 150}), 6: (1, {'@': 150}), 9: (1, {'@': 150}), 10: (1, {'@': 150}), 11: (1, {'@': 150}), 0: (1, {'@': 150}), 1: (1, {'@': 150}), 3: (1, {'@': 150}), 7: (1, {'@': 150}), 8: (1, {'@': 150}), 12: (1, {'@': 150}), 14: (1, {'@': 150})}, 377: {49: (0, 89)}, 378: {129: (0, 382)}, 379: {18: (0, 77)}, 380: {37: (0, 74)}, 381: {0: (1, {'@': 236}), 1: (1, {'@': 236}), 2: (1, {'@': 236}), 3: (1, {'@': 236}), 4: (1, {'@': 236}), 7: (1, {'@': 236}), 6: (1, {'@': 236}), 8: (1, {'@': 236}), 11: (1, {'@': 236}), 29: (1, {'@': 236}), 12: (1, {'@': 236}), 14: (1, {'@': 236})}, 382: {1: (0, 197), 10: (0, 149), 64: (0, 294), 60: (0, 317), 82: (0, 441), 61: (0, 290), 40: (0, 122), 5: (0, 94), 91: (0, 351), 41: (0, 207), 59: (0, 375), 83: (0, 194), 84: (0, 422), 85: (0, 427), 86: (0, 403), 42: (0, 247), 87: (0, 14), 88: (0, 230), 89: (0, 21), 62: (0, 285), 63: (0, 307), 47: (0, 434), 90: (0, 119), 43: (0, 78), 92: (0, 20), 93: (0, 319), 9: (0, 223), 66: (0, 321), 65: (0, 436), 44: (0, 39), 45: (0, 131), 67: (0, 357)}, 383: {23: (1, {'@': 131}), 51: (1, {'@': 131}), 24: (1, {'@': 131}), 2: (1, {'@': 131}), 4: (1, {'@': 131}), 5: (1, {'@': 131}), 6: (1, {'@': 131}), 9: (1, {'@': 131}), 10: (1, {'@': 131}), 11: (1, {'@': 131}), 13: (1, {'@': 131}), 0: (1, {'@': 131}), 1: (1, {'@': 131}), 3: (1, {'@': 131}), 7: (1, {'@': 131}), 8: (1, {'@': 131}), 12: (1, {'@': 131}), 14: (1, {'@': 131})}, 384: {0: (1, {'@': 243}), 1: (1, {'@': 243}), 2: (1, {'@': 243}), 3: (1, {'@': 243}), 4: (1, {'@': 243}), 7: (1, {'@': 243}), 6: (1, {'@': 243}), 8: (1, {'@': 243}), 11: (1, {'@': 243}), 29: (1, {'@': 243}), 12: (1, {'@': 243}), 14: (1, {'@': 243})}, 385: {174: (0, 263), 29: (0, 261), 0: (1, {'@': 235}), 1: (1, {'@': 235}), 2: (1, {'@': 235}), 3: (1, {'@': 235}), 4: (1, {'@': 235}), 7: (1, {'@': 235}), 6: (1, {'@': 235}), 8: (1, {'@': 235}), 11: (1, {'@': 235}), 12: (1, {'@': 235}), 14: (1, {'@': 235})}, 386: {23: (0, 378)}, 387: {18: (0, 243)}, 388: {20: (1, {'@': 143}), 22: (1, {'@': 143}), 23: (1, {'@': 143}), 24: (1, {'@': 143}), 25: (1, {'@': 143})}, 389: {18: (0, 106)}, 390: {129: (0, 92)}, 391: {133: (0, 280), 0: (1, {'@': 278}), 1: (1, {'@': 278}), 2: (1, {'@': 278}), 3: (1, {'@': 278}), 7: (1, {'@': 278}), 4: (1, {'@': 278}), 6: (1, {'@': 278}), 8: (1, {'@': 278}), 11: (1, {'@': 278}), 12: (1, {'@': 278}), 14: (1, {'@': 278})}, 392: {20: (1, {'@': 140}), 22: (1, {'@': 140}), 23: (1, {'@': 140}), 24: (1, {'@': 140}), 25: (1, {'@': 140})}, 393: {18: (0, 29)}, 394: {38: (0, 305), 18: (0, 428), 23: (0, 287), 39: (0, 284)}, 395: {62: (0, 140), 18: (0, 141), 73: (0, 144), 75: (0, 107), 63: (0, 147), 74: (0, 34), 76: (0, 168), 77: (0, 171), 78: (0, 155), 79: (0, 178), 80: (0, 163), 81: (0, 180)}, 396: {155: (0, 30), 29: (0, 222), 47: (1, {'@': 192})}, 397: {29: (1, {'@': 319}), 49: (1, {'@': 319})}, 398: {169: (0, 343), 168: (0, 368), 167: (0, 426)}, 399: {0: (1, {'@': 294}), 1: (1, {'@': 294}), 2: (1, {'@': 294}), 3: (1, {'@': 294}), 4: (1, {'@': 294}), 5: (1, {'@': 294}), 7: (1, {'@': 294}), 6: (1, {'@': 294}), 8: (1, {'@': 294}), 9: (1, {'@': 294}), 10: (1, {'@': 294}), 11: (1, {'@': 294}), 12: (1, {'@': 294}), 14: (1, {'@': 294})}, 400: {175: (0, 90)}, 401: {47: (1, {'@': 188})}, 402: {0: (1, {'@': 101}), 1: (1, {'@': 101}), 2: (1, {'@': 101}), 3: (1, {'@': 101}), 7: (1, {'@': 101}), 4: (1, {'@': 101}), 6: (1, {'@': 101}), 8: (1, {'@': 101}), 11: (1, {'@': 101}), 12: (1, {'@': 101}), 14: (1, {'@': 101})}, 403: {46: (1, {'@': 104})}, 404: {59: (0, 375), 60: (0, 317), 61: (0, 290), 62: (0, 285), 63: (0, 307), 64: (0, 158), 47: (0, 434), 65: (0, 436), 66: (0, 321), 67: (0, 357), 0: (1, {'@': 177}), 1: (1, {'@': 177}), 2: (1, {'@': 177}), 3: (1, {'@': 177}), 7: (1, {'@': 177}), 4: (1, {'@': 177}), 6: (1, {'@': 177}), 8: (1, {'@': 177}), 11: (1, {'@': 177}), 12: (1, {'@': 177}), 14: (1, {'@': 177})}, 405: {18: (0, 161)}, 406: {159: (0, 433), 120: (0, 250)}, 407: {47: (1, {'@': 189})}, 408: {156: (0, 44)}, 409: {18: (0, 199)}, 410: {118: (0, 132), 114: (0, 301), 120: (0, 237), 18: (0, 187), 116: (0, 56), 119: (0, 234), 35: (0, 99), 117: (0, 173), 33: (0, 85), 27: (0, 70)}, 411: {33: (0, 286), 18: (0, 296)}, 412: {46: (0, 344)}, 413: {120: (0, 237), 18: (0, 190), 116: (0, 56), 119: (0, 234), 35: (0, 99), 117: (0, 173), 118: (0, 202), 33: (0, 85), 27: (0, 70)}, 414: {120: (1, {'@': 198})}, 415: {133: (0, 418), 0: (1, {'@': 237}), 1: (1, {'@': 237}), 2: (1, {'@': 237}), 3: (1, {'@': 237}), 4: (1, {'@': 237}), 7: (1, {'@': 237}), 6: (1, {'@': 237}), 8: (1, {'@': 237}), 11: (1, {'@': 237}), 29: (1, {'@': 237}), 12: (1, {'@': 237}), 14: (1, {'@': 237})}, 416: {46: (0, 127)}, 417: {13: (0, 210), 53: (0, 209), 176: (0, 219), 52: (0, 220)}, 418: {18: (0, 381)}, 419: {29: (1, {'@': 217}), 23: (1, {'@': 217}), 13: (1, {'@': 217}), 51: (1, {'@': 217}), 52: (1, {'@': 217}), 53: (1, {'@': 217})}, 420: {175: (0, 334)}, 421: {71: (0, 448)}, 422: {46: (1, {'@': 107})}, 423: {20: (1, {'@': 138}), 22: (1, {'@': 138}), 23: (1, {'@': 138}), 24: (1, {'@': 138}), 25: (1, {'@': 138})}, 424: {154: (0, 206)}, 425: {51: (0, 249)}, 426: {29: (1, {'@': 315}), 49: (1, {'@': 315})}, 427: {46: (1, {'@': 106})}, 428: {71: (0, 259), 29: (1, {'@': 266}), 23: (1, {'@': 266})}, 429: {28: (0, 291), 26: (0, 365), 2: (1, {'@': 230}), 4: (1, {'@': 230}), 133: (1, {'@': 230}), 6: (1, {'@': 230}), 158: (1, {'@': 230}), 11: (1, {'@': 230}), 0: (1, {'@': 230}), 1: (1, {'@': 230}), 3: (1, {'@': 230}), 7: (1, {'@': 230}), 8: (1, {'@': 230}), 129: (1, {'@': 230}), 12: (1, {'@': 230}), 14: (1, {'@': 230})}, 430: {0: (1, {'@': 258}), 1: (1, {'@': 258}), 2: (1, {'@': 258}), 3: (1, {'@': 258}), 7: (1, {'@': 258}), 4: (1, {'@': 258}), 6: (1, {'@': 258}), 8: (1, {'@': 258}), 11: (1, {'@': 258}), 12: (1, {'@': 258}), 14: (1, {'@': 258})}, 431: {35: (0, 442)}, 432: {154: (0, 108)}, 433: {134: (0, 27), 13: (0, 159), 135: (0, 244)}, 434: {12: (0, 451), 141: (0, 406), 142: (0, 333), 143: (0, 252), 144: (0, 414)}, 435: {13: (0, 111), 0: (1, {'@': 127}), 1: (1, {'@': 127}), 2: (1, {'@': 127}), 3: (1, {'@': 127}), 4: (1, {'@': 127}), 5: (1, {'@': 127}), 6: (1, {'@': 127}), 7: (1, {'@': 127}), 8: (1, {'@': 127}), 9: (1, {'@': 127}), 10: (1, {'@': 127}), 11: (1, {'@': 127}), 12: (1, {'@': 127}), 14: (1, {'@': 127})}, 436: {47: (0, 260)}, 437: {58: (0, 170), 20: (0, 33), 51: (0, 204)}, 438: {25: (0, 162), 22: (1, {'@': 133}), 23: (1, {'@': 133}), 20: (1, {'@': 133}), 24: (1, {'@': 133})}, 439: {47: (1, {'@': 190})}, 440: {29: (0, 408), 49: (1, {'@': 254})}, 441: {46: (1, {'@': 105})}, 442: {0: (1, {'@': 240}), 1: (1, {'@': 240}), 2: (1, {'@': 240}), 3: (1, {'@': 240}), 4: (1, {'@': 240}), 7: (1, {'@': 240}), 6: (1, {'@': 240}), 8: (1, {'@': 240}), 11: (1, {'@': 240}), 29: (1, {'@': 240}), 12: (1, {'@': 240}), 14: (1, {'@': 240})}, 443: {47: (1, {'@': 196})}, 444: {71: (0, 340)}, 445: {51: (0, 327)}, 446: {175: (0, 134), 177: (0, 110)}, 447: {129: (0, 93)}, 448: {46: (0, 320)}, 449: {23: (0, 345)}, 450: {71: (0, 325)}, 451: {18: (0, 299)}}, 'start_states': {'start': 154}, 'end_states': {'start': 295}}, '__type__': 'ParsingFrontend'}, 'rules': [{'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}, {'@': 205}, {'@': 206}, {'@': 207}, {'@': 208}, {'@': 209}, {'@': 210}, {'@': 211}, {'@': 212}, {'@': 213}, {'@': 214}, {'@': 215}, {'@': 216}, {'@': 217}, {'@': 218}, {'@': 219}, {'@': 220}, {'@': 221}, {'@': 222}, {'@': 223}, {'@': 224}, {'@': 225}, {'@': 226}, {'@': 227}, {'@': 228}, {'@': 229}, {'@': 230}, {'@': 231}, {'@': 232}, {'@': 233}, {'@': 234}, {'@': 235}, {'@': 236}, {'@': 237}, {'@': 238}, {'@': 239}, {'@': 240}, {'@': 241}, {'@': 242}, {'@': 243}, {'@': 244}, {'@': 245}, {'@': 246}, {'@': 247}, {'@': 248}, {'@': 249}, {'@': 250}, {'@': 251}, {'@': 252}, {'@': 253}, {'@': 254}, {'@': 255}, {'@': 256}, {'@': 257}, {'@': 258}, {'@': 259}, {'@': 260}, {'@': 261}, {'@': 262}, {'@': 263}, {'@': 264}, {'@': 265}, {'@': 266}, {'@': 267}, {'@': 268}, {'@': 269}, {'@': 270}, {'@': 271}, {'@': 272}, {'@': 273}, {'@': 274}, {'@': 275}, {'@': 276}, {'@': 277}, {'@': 278}, {'@': 279}, {'@': 280}, {'@': 281}, {'@': 282}, {'@': 283}, {'@': 284}, {'@': 285}, {'@': 286}, {'@': 287}, {'@': 288}, {'@': 289}, {'@': 290}, {'@': 291}, {'@': 292}, {'@': 293}, {'@': 294}, {'@': 295}, {'@': 296}, {'@': 297}, {'@': 298}, {'@': 299}, {'@': 300}, {'@': 301}, {'@': 302}, {'@': 303}, {'@': 304}, {'@': 305}, {'@': 306}, {'@': 307}, {'@': 308}, {'@': 309}, {'@': 310}, {'@': 311}, {'@': 312}, {'@': 313}, {'@': 314}, {'@': 315}, {'@': 316}, {'@': 317}, {'@': 318}, {'@': 319}, {'@': 320}, {'@': 321}, {'@': 322}, {'@': 323}, {'@': 324}], 'options': {'debug': False, 'strict': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'cache_grammar': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['start'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': False, 'lexer_callbacks': {}, 'maybe_placeholders': False, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'ordered_sets': True, 'import_paths': [], 'source_path': None, '_plugins': {}}, '__type__': 'Lark'}
+)
+MEMO = (
+{0: {'name': 'INT', 'pattern': {'value': '(?:[0-9])+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 1: {'name': 'STRING', 'pattern': {'value': '".*?(?<!\\\\)(\\\\\\\\)*?"', 'flags': [], 'raw': None, '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 2: {'name': 'WS', 'pattern': {'value': '(?:[ \t\x0c\r\n])+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 3: {'name': 'OP', 'pattern': {'value': '(?:==|!=|<=|>=|<|>)', 'flags': [], 'raw': None, '_width': [1, 2], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 4: {'name': 'STATE', 'pattern': {'value': '(?:off|on)', 'flags': [], 'raw': None, '_width': [2, 3], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 5: {'name': 'NUMBER', 'pattern': {'value': '(?:(?:(?:\\+|\\-))?(?:(?:(?:[0-9])+(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+|(?:(?:[0-9])+\\.(?:(?:[0-9])+)?|\\.(?:[0-9])+)(?:(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+)?)|(?:[0-9])+)|(?:[0-9])+)', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 6: {'name': 'UNIT', 'pattern': {'value': '(?:ms|s|m|h|d)', 'flags': [], 'raw': None, '_width': [1, 2], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 7: {'name': 'MONTH', 'pattern': {'value': '(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)', 'flags': [], 'raw': None, '_width': [3, 3], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 8: {'name': 'MMDD', 'pattern': {'value': '\\d{2}-\\d{2}', 'flags': [], 'raw': '/\\d{2}-\\d{2}/', '_width': [5, 5], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 9: {'name': 'YMD', 'pattern': {'value': '\\d{4}-\\d{2}-\\d{2}', 'flags': [], 'raw': '/\\d{4}-\\d{2}-\\d{2}/', '_width': [10, 10], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 10: {'name': 'SCHEDULE', 'pattern': {'value': 'schedule', 'flags': [], 'raw': '"schedule"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 11: {'name': 'SCHEDULE_TRANSITION', 'pattern': {'value': '(?:start|stop)', 'flags': [], 'raw': None, '_width': [4, 5], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 12: {'name': 'USE', 'pattern': {'value': 'use', 'flags': [], 'raw': '"use"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 13: {'name': 'FROM', 'pattern': {'value': 'from', 'flags': [], 'raw': '"from"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 14: {'name': 'TO', 'pattern': {'value': 'to', 'flags': [], 'raw': '"to"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 15: {'name': 'UNTIL', 'pattern': {'value': 'until', 'flags': [], 'raw': '"until"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 16: {'name': 'ENABLE', 'pattern': {'value': 'enable', 'flags': [], 'raw': '"enable"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 17: {'name': 'DISABLE', 'pattern': {'value': 'disable', 'flags': [], 'raw': '"disable"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 18: {'name': 'SUNRISE', 'pattern': {'value': 'sunrise', 'flags': [], 'raw': '"sunrise"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 19: {'name': 'SUNSET', 'pattern': {'value': 'sunset', 'flags': [], 'raw': '"sunset"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 20: {'name': 'PRIVATE', 'pattern': {'value': 'private', 'flags': [], 'raw': '"private"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 21: {'name': 'TEMPLATE', 'pattern': {'value': 'template', 'flags': [], 'raw': '"template"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 22: {'name': 'ONOFF', 'pattern': {'value': 'onoff', 'flags': [], 'raw': '"onoff"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 23: {'name': 'DIMMER', 'pattern': {'value': 'dimmer', 'flags': [], 'raw': '"dimmer"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 24: {'name': 'ATTRIBUTE', 'pattern': {'value': 'attribute', 'flags': [], 'raw': '"attribute"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 25: {'name': 'SHARED', 'pattern': {'value': 'shared', 'flags': [], 'raw': '"shared"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 26: {'name': 'ALL', 'pattern': {'value': 'all', 'flags': [], 'raw': '"all"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 27: {'name': 'WEEKDAYS', 'pattern': {'value': 'weekdays', 'flags': [], 'raw': '"weekdays"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 28: {'name': 'WEEKENDS', 'pattern': {'value': 'weekends', 'flags': [], 'raw': '"weekends"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 29: {'name': 'DAILY', 'pattern': {'value': 'daily', 'flags': [], 'raw': '"daily"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 30: {'name': 'CNAME', 'pattern': {'value': '[a-zA-Z_][a-zA-Z0-9_]*', 'flags': [], 'raw': '/[a-zA-Z_][a-zA-Z0-9_]*/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 31: {'name': 'TIME_HHMM', 'pattern': {'value': '[0-2]?\\d:[0-5]\\d', 'flags': [], 'raw': '/[0-2]?\\d:[0-5]\\d/', '_width': [4, 5], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 32: {'name': 'OFFSET', 'pattern': {'value': '[+-]\\d+(ms|s|m|h|d)', 'flags': [], 'raw': '/[+-]\\d+(ms|s|m|h|d)/', '_width': [3, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 33: {'name': 'LINE_COMMENT', 'pattern': {'value': '\\/\\/[^\n]*', 'flags': [], 'raw': '/\\/\\/[^\\n]*/', '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 34: {'name': 'DAY', 'pattern': {'value': '(?:mon|tue|wed|thu|fri|sat|sun)', 'flags': [], 'raw': None, '_width': [3, 3], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 35: {'name': 'DATESTR', 'pattern': {'value': '"\\d{4}-\\d{2}-\\d{2}"', 'flags': [], 'raw': '/"\\d{4}-\\d{2}-\\d{2}"/', '_width': [12, 12], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 36: {'name': 'ALIAS', 'pattern': {'value': 'alias', 'flags': [], 'raw': '"alias"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 37: {'name': 'EQUAL', 'pattern': {'value': '=', 'flags': [], 'raw': '"="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 38: {'name': 'SYNC', 'pattern': {'value': 'sync', 'flags': [], 'raw': '"sync"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 39: {'name': 'LSQB', 'pattern': {'value': '[', 'flags': [], 'raw': '"["', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 40: {'name': 'RSQB', 'pattern': {'value': ']', 'flags': [], 'raw': '"]"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 41: {'name': 'AS', 'pattern': {'value': 'as', 'flags': [], 'raw': '"as"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 42: {'name': 'INVERT', 'pattern': {'value': 'invert', 'flags': [], 'raw': '"invert"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 43: {'name': 'COLON', 'pattern': {'value': ':', 'flags': [], 'raw': '":"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 44: {'name': 'LBRACE', 'pattern': {'value': '{', 'flags': [], 'raw': '"{"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 45: {'name': 'RBRACE', 'pattern': {'value': '}', 'flags': [], 'raw': '"}"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 46: {'name': 'RULE', 'pattern': {'value': 'rule', 'flags': [], 'raw': '"rule"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 47: {'name': 'IF', 'pattern': {'value': 'if', 'flags': [], 'raw': '"if"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 48: {'name': 'LPAR', 'pattern': {'value': '(', 'flags': [], 'raw': '"("', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 49: {'name': 'RPAR', 'pattern': {'value': ')', 'flags': [], 'raw': '")"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 50: {'name': 'THEN', 'pattern': {'value': 'then', 'flags': [], 'raw': '"then"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 51: {'name': 'AT', 'pattern': {'value': 'at', 'flags': [], 'raw': '"at"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 52: {'name': 'SEMICOLON', 'pattern': {'value': ';', 'flags': [], 'raw': '";"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 53: {'name': 'ARM', 'pattern': {'value': 'arm', 'flags': [], 'raw': '"arm"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 54: {'name': 'WHEN', 'pattern': {'value': 'when', 'flags': [], 'raw': '"when"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 55: {'name': 'THIS', 'pattern': {'value': 'this', 'flags': [], 'raw': '"this"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 56: {'name': 'ANY_HASSL', 'pattern': {'value': 'any_hassl', 'flags': [], 'raw': '"any_hassl"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 57: {'name': 'NOT_BY', 'pattern': {'value': 'not_by', 'flags': [], 'raw': '"not_by"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 58: {'name': '__ANON_0', 'pattern': {'value': '||', 'flags': [], 'raw': '"||"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 59: {'name': '__ANON_1', 'pattern': {'value': '&&', 'flags': [], 'raw': '"&&"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 60: {'name': 'BANG', 'pattern': {'value': '!', 'flags': [], 'raw': '"!"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 61: {'name': 'IS', 'pattern': {'value': 'is', 'flags': [], 'raw': '"is"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 62: {'name': 'FOR', 'pattern': {'value': 'for', 'flags': [], 'raw': '"for"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 63: {'name': 'DOT', 'pattern': {'value': '.', 'flags': [], 'raw': '"."', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 64: {'name': 'WAIT', 'pattern': {'value': 'wait', 'flags': [], 'raw': '"wait"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 65: {'name': 'TAG', 'pattern': {'value': 'tag', 'flags': [], 'raw': '"tag"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 66: {'name': 'ON', 'pattern': {'value': 'on', 'flags': [], 'raw': '"on"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 67: {'name': 'HOLIDAYS', 'pattern': {'value': 'holidays', 'flags': [], 'raw': '"holidays"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 68: {'name': 'DURING', 'pattern': {'value': 'during', 'flags': [], 'raw': '"during"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 69: {'name': 'MONTHS', 'pattern': {'value': 'months', 'flags': [], 'raw': '"months"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 70: {'name': 'DATES', 'pattern': {'value': 'dates', 'flags': [], 'raw': '"dates"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 71: {'name': 'RANGE', 'pattern': {'value': 'range', 'flags': [], 'raw': '"range"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 72: {'name': '__ANON_2', 'pattern': {'value': '..', 'flags': [], 'raw': '".."', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 73: {'name': 'COMMA', 'pattern': {'value': ',', 'flags': [], 'raw': '","', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 74: {'name': 'MINUS', 'pattern': {'value': '-', 'flags': [], 'raw': '"-"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 75: {'name': 'EXCEPT', 'pattern': {'value': 'except', 'flags': [], 'raw': '"except"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 76: {'name': 'PACKAGE', 'pattern': {'value': 'package', 'flags': [], 'raw': '"package"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 77: {'name': 'IMPORT', 'pattern': {'value': 'import', 'flags': [], 'raw': '"import"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 78: {'name': '__ANON_3', 'pattern': {'value': '.*', 'flags': [], 'raw': '".*"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 79: {'name': 'WORKDAYS', 'pattern': {'value': 'workdays', 'flags': [], 'raw': '"workdays"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 80: {'name': 'EXCLUDES', 'pattern': {'value': 'excludes', 'flags': [], 'raw': '"excludes"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 81: {'name': 'COUNTRY', 'pattern': {'value': 'country', 'flags': [], 'raw': '"country"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 82: {'name': 'PROVINCE', 'pattern': {'value': 'province', 'flags': [], 'raw': '"province"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 83: {'name': 'ADD', 'pattern': {'value': 'add', 'flags': [], 'raw': '"add"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 84: {'name': 'REMOVE', 'pattern': {'value': 'remove', 'flags': [], 'raw': '"remove"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 85: {'name': 'SAT', 'pattern': {'value': 'sat', 'flags': [], 'raw': '"sat"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 86: {'name': 'SUN', 'pattern': {'value': 'sun', 'flags': [], 'raw': '"sun"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 87: {'name': 'HOLIDAY', 'pattern': {'value': 'holiday', 'flags': [], 'raw': '"holiday"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 88: {'origin': {'name': 'start', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__start_star_0', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 89: {'origin': {'name': 'start', '__type__': 'NonTerminal'}, 'expansion': [], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 90: {'origin': {'name': 'stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'package_decl', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 91: {'origin': {'name': 'stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'import_stmt', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 92: {'origin': {'name': 'stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'alias', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 93: {'origin': {'name': 'stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sync', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 94: {'origin': {'name': 'stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'rule', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 95: {'origin': {'name': 'stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'schedule_decl', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 96: {'origin': {'name': 'stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'holidays_decl', '__type__': 'NonTerminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 97: {'origin': {'name': 'stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'template_decl', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 98: {'origin': {'name': 'stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'use_template_stmt', '__type__': 'NonTerminal'}], 'order': 8, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 99: {'origin': {'name': 'alias', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PRIVATE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'ALIAS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'entity', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 100: {'origin': {'name': 'alias', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ALIAS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'entity', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 101: {'origin': {'name': 'sync', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SYNC', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'synctype', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'entity_list', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'AS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'syncopts', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 102: {'origin': {'name': 'sync', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SYNC', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'synctype', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'entity_list', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'AS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 103: {'origin': {'name': 'synctype', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ONOFF', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 104: {'origin': {'name': 'synctype', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DIMMER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 105: {'origin': {'name': 'synctype', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ATTRIBUTE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 106: {'origin': {'name': 'synctype', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SHARED', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 107: {'origin': {'name': 'synctype', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ALL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 108: {'origin': {'name': 'syncopts', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'INVERT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'entity_list', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 109: {'origin': {'name': 'rule', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'RULE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__rule_plus_1', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 110: {'origin': {'name': 'rule_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_clause', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 111: {'origin': {'name': 'rule_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'at_clause', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 112: {'origin': {'name': 'rule_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'rule_schedule_use', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 113: {'origin': {'name': 'rule_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'rule_schedule_inline', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 114: {'origin': {'name': 'rule_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'arm_clause', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 115: {'origin': {'name': 'if_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expr', '__type__': 'NonTerminal'}, {'name': 'qualifier', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'qualifier', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'actions', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 116: {'origin': {'name': 'if_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expr', '__type__': 'NonTerminal'}, {'name': 'qualifier', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'THEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'actions', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 117: {'origin': {'name': 'if_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expr', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'qualifier', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'actions', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 118: {'origin': {'name': 'if_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expr', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'THEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'actions', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 119: {'origin': {'name': 'at_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'AT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'time_spec', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'actions', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 120: {'origin': {'name': 'at_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'AT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'schedule_transition', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'actions', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 121: {'origin': {'name': 'schedule_transition', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SCHEDULE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'SCHEDULE_TRANSITION', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 122: {'origin': {'name': 'arm_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ARM', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'WHEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expr', '__type__': 'NonTerminal'}, {'name': 'qualifier', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'qualifier', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 123: {'origin': {'name': 'arm_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ARM', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'WHEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expr', '__type__': 'NonTerminal'}, {'name': 'qualifier', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'qualifier', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 124: {'origin': {'name': 'arm_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ARM', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'WHEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expr', '__type__': 'NonTerminal'}, {'name': 'qualifier', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 125: {'origin': {'name': 'arm_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ARM', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'WHEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expr', '__type__': 'NonTerminal'}, {'name': 'qualifier', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 126: {'origin': {'name': 'arm_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ARM', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'WHEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expr', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'qualifier', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 127: {'origin': {'name': 'arm_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ARM', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'WHEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expr', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'qualifier', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 128: {'origin': {'name': 'arm_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ARM', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'WHEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expr', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 129: {'origin': {'name': 'arm_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ARM', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'WHEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expr', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 130: {'origin': {'name': 'qualifier', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NOT_BY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'THIS', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 131: {'origin': {'name': 'qualifier', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NOT_BY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'ANY_HASSL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 132: {'origin': {'name': 'qualifier', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NOT_BY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RULE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 133: {'origin': {'name': 'expr', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expr', '__type__': 'NonTerminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'andexpr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'or_', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 134: {'origin': {'name': 'expr', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'andexpr', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 135: {'origin': {'name': 'andexpr', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'andexpr', '__type__': 'NonTerminal'}, {'name': '__ANON_1', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'term', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'and_', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 136: {'origin': {'name': 'andexpr', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'term', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 137: {'origin': {'name': 'term', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BANG', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'term', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'not_', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 138: {'origin': {'name': 'term', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expr', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 139: {'origin': {'name': 'term', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 140: {'origin': {'name': 'comparison', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'operand', '__type__': 'NonTerminal'}, {'name': 'IS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'event_keyword', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'event_match', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 141: {'origin': {'name': 'comparison', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'operand', '__type__': 'NonTerminal'}, {'name': 'OP', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'operand', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 142: {'origin': {'name': 'comparison', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'operand', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'bare_operand', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 143: {'origin': {'name': 'event_keyword', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 144: {'origin': {'name': 'event_keyword', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 145: {'origin': {'name': 'operand', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'entity', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 146: {'origin': {'name': 'operand', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 147: {'origin': {'name': 'operand', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STATE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 148: {'origin': {'name': 'operand', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 149: {'origin': {'name': 'operand', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 150: {'origin': {'name': 'actions', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'action', '__type__': 'NonTerminal'}, {'name': '__actions_star_2', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 151: {'origin': {'name': 'actions', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'action', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 152: {'origin': {'name': 'action', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assign', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 153: {'origin': {'name': 'action', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'attr_assign', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 154: {'origin': {'name': 'action', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'waitact', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 155: {'origin': {'name': 'action', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'rulectrl', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 156: {'origin': {'name': 'action', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tagact', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 157: {'origin': {'name': 'assign', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STATE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'dur', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 158: {'origin': {'name': 'assign', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STATE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 159: {'origin': {'name': 'attr_assign', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__attr_assign_star_3', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 160: {'origin': {'name': 'attr_assign', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 161: {'origin': {'name': 'attr_assign', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 162: {'origin': {'name': 'waitact', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WAIT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'condition', '__type__': 'NonTerminal'}, {'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'dur', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'action', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 163: {'origin': {'name': 'waitact', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WAIT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'condition', '__type__': 'NonTerminal'}, {'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'action', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 164: {'origin': {'name': 'waitact', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WAIT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'condition', '__type__': 'NonTerminal'}, {'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'action', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 165: {'origin': {'name': 'condition', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expr', '__type__': 'NonTerminal'}, {'name': 'qualifier', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 166: {'origin': {'name': 'condition', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expr', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 167: {'origin': {'name': 'rulectrl', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DISABLE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RULE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'dur', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 168: {'origin': {'name': 'rulectrl', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DISABLE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RULE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'UNTIL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'timepoint', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 169: {'origin': {'name': 'rulectrl', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ENABLE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RULE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'dur', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 170: {'origin': {'name': 'rulectrl', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ENABLE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RULE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'UNTIL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'timepoint', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 171: {'origin': {'name': 'tagact', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TAG', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 172: {'origin': {'name': 'tagact', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TAG', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 173: {'origin': {'name': 'tagact', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TAG', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 174: {'origin': {'name': 'dur', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'INT', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'UNIT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 175: {'origin': {'name': 'timepoint', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 176: {'origin': {'name': 'schedule_decl', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PRIVATE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'SCHEDULE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__schedule_decl_plus_4', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 177: {'origin': {'name': 'schedule_decl', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SCHEDULE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__schedule_decl_plus_4', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 178: {'origin': {'name': 'schedule_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'schedule_legacy_clause', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 179: {'origin': {'name': 'schedule_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'schedule_window_clause', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 180: {'origin': {'name': 'schedule_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sched_holiday_only', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 181: {'origin': {'name': 'schedule_legacy_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'schedule_op', '__type__': 'NonTerminal'}, {'name': 'FROM', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'time_spec', '__type__': 'NonTerminal'}, {'name': 'schedule_end', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 182: {'origin': {'name': 'schedule_legacy_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'schedule_op', '__type__': 'NonTerminal'}, {'name': 'FROM', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'time_spec', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 183: {'origin': {'name': 'schedule_window_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'period', '__type__': 'NonTerminal'}, {'name': 'ON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'day_selector', '__type__': 'NonTerminal'}, {'name': 'time_range', '__type__': 'NonTerminal'}, {'name': 'holiday_mod', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 184: {'origin': {'name': 'schedule_window_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'period', '__type__': 'NonTerminal'}, {'name': 'ON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'day_selector', '__type__': 'NonTerminal'}, {'name': 'time_range', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 185: {'origin': {'name': 'schedule_window_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'day_selector', '__type__': 'NonTerminal'}, {'name': 'time_range', '__type__': 'NonTerminal'}, {'name': 'holiday_mod', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 186: {'origin': {'name': 'schedule_window_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'day_selector', '__type__': 'NonTerminal'}, {'name': 'time_range', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 187: {'origin': {'name': 'sched_holiday_only', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'HOLIDAYS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'time_range', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 188: {'origin': {'name': 'period', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DURING', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'MONTHS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'month_range', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 189: {'origin': {'name': 'period', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DURING', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'DATES', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'mmdd_range', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 190: {'origin': {'name': 'period', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DURING', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RANGE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'ymd_range', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 191: {'origin': {'name': 'month_range', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MONTH', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_2', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'MONTH', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__month_range_star_5', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 192: {'origin': {'name': 'month_range', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MONTH', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_2', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'MONTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 193: {'origin': {'name': 'month_range', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MONTH', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__month_range_star_5', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 194: {'origin': {'name': 'month_range', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MONTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 195: {'origin': {'name': 'mmdd_range', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MMDD', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_2', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'MMDD', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 196: {'origin': {'name': 'ymd_range', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'YMD', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_2', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'YMD', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 197: {'origin': {'name': 'day_selector', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WEEKDAYS', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 198: {'origin': {'name': 'day_selector', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WEEKENDS', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 199: {'origin': {'name': 'day_selector', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DAILY', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 200: {'origin': {'name': 'time_range', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TIME_HHMM', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'MINUS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'TIME_HHMM', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 201: {'origin': {'name': 'holiday_mod', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'EXCEPT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'HOLIDAYS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 202: {'origin': {'name': 'schedule_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ENABLE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 203: {'origin': {'name': 'schedule_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DISABLE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 204: {'origin': {'name': 'schedule_end', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TO', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'time_spec', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'schedule_to', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 205: {'origin': {'name': 'schedule_end', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'UNTIL', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'time_spec', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'schedule_until', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 206: {'origin': {'name': 'rule_schedule_use', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SCHEDULE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'USE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'name_list', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 207: {'origin': {'name': 'rule_schedule_use', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SCHEDULE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'USE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'name_list', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 208: {'origin': {'name': 'name_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'name', '__type__': 'NonTerminal'}, {'name': '__name_list_star_6', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 209: {'origin': {'name': 'name_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'name', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 210: {'origin': {'name': 'name', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 211: {'origin': {'name': 'name', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'entity', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 212: {'origin': {'name': 'rule_schedule_inline', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SCHEDULE', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__schedule_decl_plus_4', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 213: {'origin': {'name': 'time_spec', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TIME_HHMM', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'time_clock', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 214: {'origin': {'name': 'time_spec', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sun_spec', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 215: {'origin': {'name': 'time_spec', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'entity', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 216: {'origin': {'name': 'time_spec', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 217: {'origin': {'name': 'sun_spec', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUNRISE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'OFFSET', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'time_sun', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 218: {'origin': {'name': 'sun_spec', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUNRISE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'time_sun', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 219: {'origin': {'name': 'sun_spec', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUNSET', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'OFFSET', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': 'time_sun', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 220: {'origin': {'name': 'sun_spec', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUNSET', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': 'time_sun', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 221: {'origin': {'name': 'entity_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'member', '__type__': 'NonTerminal'}, {'name': '__entity_list_star_7', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 222: {'origin': {'name': 'entity_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'member', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 223: {'origin': {'name': 'member', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'entity', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 224: {'origin': {'name': 'member', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 225: {'origin': {'name': 'entity', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__attr_assign_star_3', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 226: {'origin': {'name': 'package_decl', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PACKAGE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'entity', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 227: {'origin': {'name': 'import_stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IMPORT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'module_ref', '__type__': 'NonTerminal'}, {'name': 'import_tail', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 228: {'origin': {'name': 'import_stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IMPORT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'module_ref', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 229: {'origin': {'name': 'module_ref', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__attr_assign_star_3', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 230: {'origin': {'name': 'module_ref', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 231: {'origin': {'name': 'import_tail', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_3', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 232: {'origin': {'name': 'import_tail', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'import_list', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 233: {'origin': {'name': 'import_tail', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'AS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 234: {'origin': {'name': 'import_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'import_item', '__type__': 'NonTerminal'}, {'name': '__import_list_star_8', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 235: {'origin': {'name': 'import_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'import_item', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 236: {'origin': {'name': 'import_item', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'AS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 237: {'origin': {'name': 'import_item', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 238: {'origin': {'name': 'holidays_decl', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'HOLIDAYS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'holi_kv', '__type__': 'NonTerminal'}, {'name': '__holidays_decl_star_9', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 239: {'origin': {'name': 'holidays_decl', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'HOLIDAYS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'holi_kv', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 240: {'origin': {'name': 'holi_kv', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COUNTRY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 241: {'origin': {'name': 'holi_kv', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PROVINCE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 242: {'origin': {'name': 'holi_kv', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WORKDAYS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'daylist', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': 'holi_workdays', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 243: {'origin': {'name': 'holi_kv', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'EXCLUDES', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'excludelist', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'holi_excludes', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 244: {'origin': {'name': 'holi_kv', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ADD', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'datestr_list', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 245: {'origin': {'name': 'holi_kv', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'REMOVE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'datestr_list', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 246: {'origin': {'name': 'daylist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DAY', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__daylist_star_10', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 247: {'origin': {'name': 'daylist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DAY', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 248: {'origin': {'name': 'excludelist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SAT', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__excludelist_star_11', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 249: {'origin': {'name': 'excludelist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SAT', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 250: {'origin': {'name': 'excludelist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUN', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__excludelist_star_11', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 251: {'origin': {'name': 'excludelist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SUN', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 252: {'origin': {'name': 'excludelist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'HOLIDAY', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__excludelist_star_11', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 253: {'origin': {'name': 'excludelist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'HOLIDAY', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 254: {'origin': {'name': 'datestr_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DATESTR', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__datestr_list_star_12', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 255: {'origin': {'name': 'datestr_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DATESTR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 256: {'origin': {'name': 'template_decl', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PRIVATE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'TEMPLATE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'template_kind', '__type__': 'NonTerminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'template_params', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'template_body', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 257: {'origin': {'name': 'template_decl', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PRIVATE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'TEMPLATE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'template_kind', '__type__': 'NonTerminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'template_body', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 258: {'origin': {'name': 'template_decl', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TEMPLATE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'template_kind', '__type__': 'NonTerminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'template_params', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'template_body', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 259: {'origin': {'name': 'template_decl', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TEMPLATE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'template_kind', '__type__': 'NonTerminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'template_body', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 260: {'origin': {'name': 'template_kind', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'RULE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 261: {'origin': {'name': 'template_kind', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SYNC', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 262: {'origin': {'name': 'template_kind', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SCHEDULE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 263: {'origin': {'name': 'template_params', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'template_param', '__type__': 'NonTerminal'}, {'name': '__template_params_star_13', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 264: {'origin': {'name': 'template_params', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'template_param', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 265: {'origin': {'name': 'template_param', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'template_default', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 266: {'origin': {'name': 'template_param', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 267: {'origin': {'name': 'template_default', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 268: {'origin': {'name': 'template_default', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 269: {'origin': {'name': 'template_default', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 270: {'origin': {'name': 'template_body', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'rule_body', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'template_rule_body', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 271: {'origin': {'name': 'template_body', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sync_body', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'template_sync_body', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 272: {'origin': {'name': 'template_body', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'schedule_body', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'template_schedule_body', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 273: {'origin': {'name': 'rule_body', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__rule_plus_1', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 274: {'origin': {'name': 'sync_body', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'synctype', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'entity_list', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'syncopts', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 275: {'origin': {'name': 'sync_body', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'synctype', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'entity_list', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 276: {'origin': {'name': 'schedule_body', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__schedule_decl_plus_4', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 277: {'origin': {'name': 'use_template_stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'USE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'TEMPLATE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'call_args', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'AS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 278: {'origin': {'name': 'use_template_stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'USE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'TEMPLATE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'call_args', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 279: {'origin': {'name': 'use_template_stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'USE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'TEMPLATE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'AS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 280: {'origin': {'name': 'use_template_stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'USE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'TEMPLATE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 281: {'origin': {'name': 'call_args', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'call_arg', '__type__': 'NonTerminal'}, {'name': '__call_args_star_14', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 282: {'origin': {'name': 'call_args', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'call_arg', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 283: {'origin': {'name': 'call_arg', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'value', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 284: {'origin': {'name': 'call_arg', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'value', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 285: {'origin': {'name': 'value', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 286: {'origin': {'name': 'value', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 287: {'origin': {'name': 'value', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'entity', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 288: {'origin': {'name': 'value', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 289: {'origin': {'name': 'value', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TIME_HHMM', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': 'time_clock', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 290: {'origin': {'name': 'value', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sun_spec', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 291: {'origin': {'name': '__start_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'stmt', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 292: {'origin': {'name': '__start_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__start_star_0', '__type__': 'NonTerminal'}, {'name': 'stmt', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 293: {'origin': {'name': '__rule_plus_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'rule_clause', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 294: {'origin': {'name': '__rule_plus_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__rule_plus_1', '__type__': 'NonTerminal'}, {'name': 'rule_clause', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 295: {'origin': {'name': '__actions_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'action', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 296: {'origin': {'name': '__actions_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__actions_star_2', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'action', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 297: {'origin': {'name': '__attr_assign_star_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 298: {'origin': {'name': '__attr_assign_star_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__attr_assign_star_3', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 299: {'origin': {'name': '__schedule_decl_plus_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'schedule_clause', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 300: {'origin': {'name': '__schedule_decl_plus_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__schedule_decl_plus_4', '__type__': 'NonTerminal'}, {'name': 'schedule_clause', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 301: {'origin': {'name': '__month_range_star_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'MONTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 302: {'origin': {'name': '__month_range_star_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__month_range_star_5', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'MONTH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 303: {'origin': {'name': '__name_list_star_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 304: {'origin': {'name': '__name_list_star_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__name_list_star_6', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'name', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 305: {'origin': {'name': '__entity_list_star_7', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'member', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 306: {'origin': {'name': '__entity_list_star_7', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__entity_list_star_7', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'member', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 307: {'origin': {'name': '__import_list_star_8', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'import_item', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 308: {'origin': {'name': '__import_list_star_8', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__import_list_star_8', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'import_item', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 309: {'origin': {'name': '__holidays_decl_star_9', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'holi_kv', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 310: {'origin': {'name': '__holidays_decl_star_9', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__holidays_decl_star_9', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'holi_kv', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 311: {'origin': {'name': '__daylist_star_10', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'DAY', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 312: {'origin': {'name': '__daylist_star_10', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__daylist_star_10', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'DAY', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 313: {'origin': {'name': '__excludelist_star_11', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SAT', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 314: {'origin': {'name': '__excludelist_star_11', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SUN', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 315: {'origin': {'name': '__excludelist_star_11', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'HOLIDAY', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 316: {'origin': {'name': '__excludelist_star_11', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__excludelist_star_11', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SAT', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 317: {'origin': {'name': '__excludelist_star_11', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__excludelist_star_11', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SUN', 'filter_out': True, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 318: {'origin': {'name': '__excludelist_star_11', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__excludelist_star_11', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'HOLIDAY', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 319: {'origin': {'name': '__datestr_list_star_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'DATESTR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 320: {'origin': {'name': '__datestr_list_star_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__datestr_list_star_12', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'DATESTR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 321: {'origin': {'name': '__template_params_star_13', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'template_param', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 322: {'origin': {'name': '__template_params_star_13', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__template_params_star_13', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'template_param', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 323: {'origin': {'name': '__call_args_star_14', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'call_arg', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 324: {'origin': {'name': '__call_args_star_14', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__call_args_star_14', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'call_arg', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}}
+)
+Shift = 0
+Reduce = 1
+def Lark_StandAlone(**kwargs):
+  return Lark._load_from_dict(DATA, MEMO, **kwargs)
@@ -0,0 +1,67 @@
+# hassl/parser/headers.py
+"""
+Header-only parsing of modules that are only needed for their exports.
+
+An imported package contributes nothing to its importers but its package
+id, its imports and its public aliases, schedules and templates. Rules,
+syncs and `use template` statements are by far the bulk of a typical
+shared library, and they are skipped here without being lexed or parsed:
+
+The source is cut at lines that open a statement unambiguously (`rule x:`,
+`alias x =`, `sync onoff [`, `template rule t(` ...; a keyword alone is
+not enough, e.g. `schedule use` continues a rule). Chunks opened by rule,
+sync and use are dropped; the rest is parsed in one go with the regular
+parser, so the declarations that are kept come out exactly as in a full
+parse.
+
+A dropped chunk must not hide a declaration, e.g. a statement written on
+the same line as the end of a rule. If one contains anything that could
+start an export (alias, private, template, holidays, package, import, or a
+`schedule` that is not a rule clause), the whole source is parsed
+normally instead.
+"""
+import re
+
+from .loader import get_parser
+from ..ast.nodes import Program
+
+_SKIP = r"(?:rule\s+\w+\s*:|sync\s+\w+\s*\[|use\s+template\b)"
+_KEEP = (r"(?:package\s+\w|import\s+[\w.]|holidays\s+\w+\s*:"
+         r"|(?:private\s+)?(?:alias\s+\w+\s*=|schedule\s+\w+\s*:|template\s+\w+\s+\w+\s*\())")
+_HEADER = re.compile(r"[ \t\f\r]*(?:(?P<skip>%s)|(?P<keep>%s))" % (_SKIP, _KEEP))
+
+# could open an export (or a module-level statement) inside a dropped chunk
+_SUSPECT = re.compile(r"\b(?:alias|private|template|holidays|package|import)\b"
+                      r"|\bschedule\b(?!\s*$|\s+(?:use|enable|disable|on|during)\b)")
+_RULE_SCHEDULE = re.compile(r"\bschedule\s*$")          # clause continues on the next line
+_CLAUSE_START = re.compile(r"\s*(?:use|enable|disable|on|during)\b")
+
+def parse_header(text: str) -> Program:
+    """Program with the package, imports and every declaration of text except rules, syncs and template uses."""
+    kept = []        # kept chunks, and one blank line per dropped line
+    in_rule = skipping = open_schedule = False
+    for line in text.splitlines(keepends=True):
+        if open_schedule and line.strip():
+            if not _CLAUSE_START.match(line):
+                return get_parser(inline=True).parse(text)
+            open_schedule = False
+        m = _HEADER.match(line)
+        if m:
+            if m.group("skip") is None and in_rule and line.lstrip().startswith("schedule"):
+                # a bare `schedule x:` right after a rule is read as a rule
+                # clause by the full parser (a syntax error): let it say so
+                return get_parser(inline=True).parse(text)
+            skipping = m.group("skip") is not None
+            in_rule = skipping and line.lstrip().startswith("rule")
+            rest = m.end()
+        else:
+            rest = 0
+        if not skipping:
+            kept.append(line)
+            continue
+        if _SUSPECT.search(line, rest):
+            return get_parser(inline=True).parse(text)
+        open_schedule = _RULE_SCHEDULE.search(line, rest) is not None
+        # keep the line count so parse errors point at the right line
+        kept.append("\n" if line.endswith("\n") else "")
+    return get_parser(inline=True).parse("".join(kept))
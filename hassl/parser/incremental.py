@@ -0,0 +1,105 @@
+# hassl/parser/incremental.py
+"""
+Statement-level incremental reparsing for editor integrations.
+
+IncrementalParse keeps the Program of a source together with the source
+span of every top-level statement. After an edit only the statements the
+edit touches are re-parsed, together with one unchanged neighbour on each
+side ("anchors"), and the result is spliced into the previous statement
+list.
+
+The anchors are what makes the splice safe. A statement's extent can
+depend on what follows it (a rule keeps absorbing clauses), so the edited
+region is re-parsed from the start of the anchor before it to the end of
+the anchor after it. If both anchors come back with exactly their old
+spans, the parse of everything outside the region is unaffected and the
+spliced Program is identical to a full parse; otherwise -- or when the
+region does not parse on its own -- the whole text is re-parsed, which
+also yields the same errors a full parse would.
+"""
+from typing import List, Tuple
+
+from ..ast.nodes import Program
+from .loader import get_parser
+from .transform import TreeTransformer, make_program
+
+Span = Tuple[int, int]
+
+def parse_with_spans(text: str, offset: int = 0) -> Tuple[List[object], List[Span]]:
+    """Top-level statements of text and their [start, end) offsets (shifted by offset)."""
+    tree = get_parser(positions=True).parse(text)
+    spans = [(offset + t.meta.start_pos, offset + t.meta.end_pos) for t in tree.children]
+    statements = TreeTransformer().transform(tree).statements
+    if len(statements) != len(spans):
+        raise ValueError("incremental: statement/span count mismatch")
+    return statements, spans
+
+class IncrementalParse:
+    def __init__(self, text: str):
+        self.text = text
+        self.statements, self.spans = parse_with_spans(text)
+        self.program: Program = make_program(list(self.statements))
+        # Diagnostics for the last edit: how many statements were re-parsed,
+        # and whether it had to fall back to a full parse.
+        self.reparsed = len(self.statements)
+        self.full_reparse = True
+
+    def update(self, new_text: str) -> Program:
+        """Re-parse after the source changed to new_text (the changed range is diffed out)."""
+        old = self.text
+        n = min(len(old), len(new_text))
+        start = 0
+        while start < n and old[start] == new_text[start]:
+            start += 1
+        end_old, end_new = len(old), len(new_text)
+        while end_old > start and end_new > start and old[end_old - 1] == new_text[end_new - 1]:
+            end_old -= 1
+            end_new -= 1
+        return self.edit(start, end_old, new_text[start:end_new])
+
+    def edit(self, start: int, end: int, replacement: str) -> Program:
+        """Replace text[start:end] with replacement and re-parse the affected statements."""
+        if not 0 <= start <= end <= len(self.text):
+            raise ValueError(f"incremental: bad edit range {start}..{end}")
+        new_text = self.text[:start] + replacement + self.text[end:]
+        delta = len(replacement) - (end - start)
+
+        spans = self.spans
+        # statements touching the edit (an edit right at a boundary may extend it)
+        lo = next((i for i, (_, e) in enumerate(spans) if e >= start), len(spans))
+        hi = next((i for i in range(len(spans) - 1, -1, -1) if spans[i][0] <= end), -1)
+        before = lo - 1           # anchor before the region, if any
+        after = max(hi, lo - 1) + 1  # anchor after the region, if any
+
+        region_start = spans[before][0] if before >= 0 else 0
+        region_end = spans[after][1] + delta if after < len(spans) else len(new_text)
+        try:
+            stmts, new_spans = parse_with_spans(new_text[region_start:region_end], region_start)
+        except Exception:
+            return self._full(new_text)
+
+        if before >= 0 and (not new_spans or new_spans[0] != spans[before]):
+            return self._full(new_text)
+        if after < len(spans):
+            expected = (spans[after][0] + delta, spans[after][1] + delta)
+            if not new_spans or new_spans[-1] != expected:
+                return self._full(new_text)
+
+        keep_from = after + 1 if after < len(spans) else len(spans)
+        keep_to = max(before, 0)
+        self.statements = self.statements[:keep_to] + stmts + self.statements[keep_from:]
+        self.spans = (spans[:keep_to] + new_spans
+                      + [(s + delta, e + delta) for s, e in spans[keep_from:]])
+        self.text = new_text
+        self.program = make_program(list(self.statements))
+        self.reparsed = len(stmts)
+        self.full_reparse = False
+        return self.program
+
+    def _full(self, new_text: str) -> Program:
+        self.statements, self.spans = parse_with_spans(new_text)
+        self.text = new_text
+        self.program = make_program(list(self.statements))
+        self.reparsed = len(self.statements)
+        self.full_reparse = True
+        return self.program
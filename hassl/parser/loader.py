@@ -1,6 +1,143 @@
 # hassl/parser/loader.py
+import hashlib
+import os
+import sys
+import tempfile
+import threading
 from importlib.resources import files
+from pathlib import Path
+from typing import Optional
+
+# Process-wide LALR parser. Building the tables dominates the cost of parsing
+# small files, so it is built once and shared. Lark's LALR parser keeps all
+# per-parse state in the call frame, which makes one instance safe to use
+# from several threads at once.
+#
+# By default the parser comes from the generated hassl_standalone module (see
+# runtime.py); the lark package is only imported for the dynamic fallback.
+#
+# The inline parser carries a HasslTransformer and builds the AST while
+# parsing, so no intermediate parse tree is materialized; the positions parser
+# records source offsets on every tree node (incremental reparsing). All
+# variants share the parse tables (same grammar, same cache entry), they only
+# differ in load-time options. Keyed by (inline, positions).
+_PARSERS = {}
+_PARSER_LOCK = threading.Lock()
+
+# Options the parser is built with; part of the on-disk cache key.
+_PARSER_OPTIONS = {"start": "start", "parser": "lalr", "maybe_placeholders": False}
 
 def load_grammar_text():
     """Read the embedded hassl.lark grammar safely from the installed package."""
     return (files("hassl.parser") / "hassl.lark").read_text(encoding="utf-8")
+
+def grammar_sha(grammar: Optional[str] = None) -> str:
+    """SHA-256 of the grammar text (hex)."""
+    text = load_grammar_text() if grammar is None else grammar
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def parser_cache_dir() -> Optional[Path]:
+    """
+    Directory for serialized parse tables, or None when caching is disabled.
+    HASSL_CACHE_DIR wins, then $XDG_CACHE_HOME/hassl, then ~/.cache/hassl.
+    Set HASSL_NO_PARSER_CACHE=1 to always build the tables in memory.
+    """
+    if os.environ.get("HASSL_NO_PARSER_CACHE"):
+        return None
+    root = os.environ.get("HASSL_CACHE_DIR")
+    if root:
+        return Path(root)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    return Path(xdg) / "hassl" if xdg else Path.home() / ".cache" / "hassl"
+
+def parser_cache_path(grammar: str) -> Optional[Path]:
+    """Cache file for this grammar + Lark version + parser options."""
+    import lark
+    cache_dir = parser_cache_dir()
+    if cache_dir is None:
+        return None
+    key = hashlib.sha256()
+    key.update(grammar_sha(grammar).encode("ascii"))
+    key.update(lark.__version__.encode("ascii"))
+    key.update(repr(sorted(_PARSER_OPTIONS.items())).encode("utf-8"))
+    key.update(repr(sys.version_info[:2]).encode("ascii"))
+    return cache_dir / f"parser-{key.hexdigest()[:24]}.lark"
+
+def _load_cached(path: Path, **kwargs):
+    from lark import Lark
+    try:
+        with open(path, "rb") as f:
+            # Lark.load() takes no options; _load() is what it wraps and also
+            # accepts the load-time ones (transformer, ...).
+            return Lark.__new__(Lark)._load(f, **kwargs)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # truncated/corrupt/incompatible cache entry: rebuild and overwrite it
+        return None
+
+def _store_cached(parser, path: Path) -> None:
+    # Write to a temp file and rename so concurrent hasslc runs never
+    # observe a half-written table.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=path.name, suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                parser.save(f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass  # read-only home, full disk, ...: caching is best effort
+
+def build_dynamic_parser(**load_options):
+    """
+    Build the parser from hassl.lark with the lark package, via the on-disk table cache.
+    load_options are Lark options that do not affect the tables (transformer, propagate_positions).
+    """
+    from lark import Lark
+    grammar = load_grammar_text()
+    path = parser_cache_path(grammar)
+    if path is not None:
+        parser = _load_cached(path, **load_options)
+        if parser is not None:
+            return parser
+    parser = Lark(grammar, **_PARSER_OPTIONS, **load_options)
+    if path is not None:
+        _store_cached(parser, path)
+    return parser
+
+def _build_parser(inline: bool, positions: bool):
+    from .runtime import STANDALONE
+    # transformer is always given: a cached table file carries the options
+    # of whichever variant stored it, transformer included
+    options = {"propagate_positions": positions, "transformer": None}
+    if inline:
+        from .transform import HasslTransformer
+        options["transformer"] = HasslTransformer()
+    if STANDALONE is not None:
+        return STANDALONE.Lark_StandAlone(**options)
+    return build_dynamic_parser(**options)
+
+def get_parser(inline: bool = False, positions: bool = False):
+    """
+    Return the shared LALR parser, building (or loading) it on first use.
+    With inline=True, parse() returns a Program directly instead of a Tree;
+    with positions=True, tree nodes carry .meta source offsets.
+    """
+    key = (inline, positions)
+    parser = _PARSERS.get(key)
+    if parser is not None:
+        return parser
+    with _PARSER_LOCK:
+        parser = _PARSERS.get(key)
+        if parser is None:
+            parser = _PARSERS[key] = _build_parser(inline, positions)
+        return parser
+
+def reset_parser():
+    """Drop the shared parsers so the next get_parser() rebuilds them (tests, grammar work)."""
+    with _PARSER_LOCK:
+        _PARSERS.clear()
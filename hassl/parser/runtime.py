@@ -0,0 +1,42 @@
+# hassl/parser/runtime.py
+"""
+Pick the Lark runtime used by the parser and the transformer.
+
+hassl_standalone (generated by .tools/gen_standalone_parser.py) ships the
+pre-built LALR tables, so the default parse path neither compiles the grammar
+nor imports the lark package. It is used only while its recorded grammar hash
+matches hassl.lark; after a grammar edit, or with HASSL_DYNAMIC_PARSER=1, the
+lark package builds the parser instead (see loader.get_parser).
+
+The choice is made once per process: Token/Tree produced by one runtime are
+different classes from the other's, and the transformer's isinstance checks
+must agree with whichever parser produced the tree.
+"""
+import os
+
+from .loader import grammar_sha
+
+def _standalone_module():
+    if os.environ.get("HASSL_DYNAMIC_PARSER"):
+        return None
+    try:
+        from . import hassl_standalone
+    except ImportError:
+        return None
+    if getattr(hassl_standalone, "GRAMMAR_SHA256", None) != grammar_sha():
+        return None  # stale: grammar edited since the module was generated
+    return hassl_standalone
+
+STANDALONE = _standalone_module()
+
+if STANDALONE is not None:
+    _lark = STANDALONE
+else:
+    import lark as _lark
+
+Transformer = _lark.Transformer
+Transformer_NonRecursive = _lark.Transformer_NonRecursive
+v_args = _lark.v_args
+Token = _lark.Token
+Tree = _lark.Tree
+UnexpectedInput = _lark.UnexpectedInput
@@ -0,0 +1,176 @@
+# hassl/parser/sources.py
+"""
+Index of the .hassl sources under a directory (the input tree or
+--module-root).
+
+The tree is walked once with os.scandir; the result maps module ids
+('home/hall/aliases.hassl' -> 'home.hall.aliases') to paths, so resolving
+an import is a dict lookup instead of a stat per candidate file.
+Precompiled bundles (.hasslpkg) are indexed the same way.
+
+Hidden entries (dotfiles, .hassl-cache, .git, ...) are skipped like
+glob('**') does, and so is anything matched by a .hasslignore file at the
+root of the tree: one fnmatch pattern per line, '#' comments, a trailing
+'/' to match directories only; a pattern containing '/' is matched
+against the path relative to the root, any other against the entry name.
+
+The walk is cached in <cache_dir>/sources/ together with the mtime of
+every directory it visited. A directory's mtime changes whenever an entry
+is added, removed or renamed in it, so on the next run the cached listing
+is reused if none of them (nor .hasslignore) changed: one stat per
+directory instead of a full listing.
+"""
+import fnmatch
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+IGNORE_FILE = ".hasslignore"
+SUFFIX = ".hassl"
+BUNDLE_SUFFIX = ".hasslpkg"   # precompiled packages, see codegen/bundle.py
+
+# Bump when the layout of the cached index changes.
+INDEX_FORMAT = 2
+
+def _mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+class _IgnoreRules:
+    def __init__(self, text: str = ""):
+        self.rules = []
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            dir_only = line.endswith("/")
+            pat = line.rstrip("/").lstrip("/")
+            if pat:
+                self.rules.append((pat, "/" in pat, dir_only))
+
+    def ignored(self, rel: str, name: str, is_dir: bool) -> bool:
+        for pat, anchored, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if fnmatch.fnmatchcase(rel if anchored else name, pat):
+                return True
+        return False
+
+class SourceIndex:
+    def __init__(self, root, cache_dir=None):
+        self.root = Path(root)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.files: List[Path] = []
+        self.modules: Dict[str, Path] = {}
+        self.bundles: Dict[str, Path] = {}
+        self.from_cache = False
+        self._load()
+
+    def lookup(self, module: str) -> Optional[Path]:
+        """Path of the source for module id a.b.c, else of its bundle, if the tree has either."""
+        return self.modules.get(module) or self.bundles.get(module)
+
+    # ---- walking ----
+
+    def _walk(self):
+        root = os.fspath(self.root)
+        try:
+            with open(os.path.join(root, IGNORE_FILE), "r", encoding="utf-8") as f:
+                rules = _IgnoreRules(f.read())
+        except OSError:
+            rules = _IgnoreRules()
+
+        files: List[str] = []
+        dirs: Dict[str, Optional[int]] = {}
+        todo = [""]
+        while todo:
+            rel_dir = todo.pop()
+            abs_dir = os.path.join(root, rel_dir) if rel_dir else root
+            try:
+                dirs[rel_dir] = os.stat(abs_dir).st_mtime_ns
+                with os.scandir(abs_dir) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if rules.ignored(rel, name, is_dir):
+                    continue
+                if is_dir:
+                    todo.append(rel)
+                elif name.endswith(SUFFIX) or name.endswith(BUNDLE_SUFFIX):
+                    files.append(rel)
+        files.sort()
+        return files, dirs
+
+    # ---- cache ----
+
+    def _cache_path(self) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha256(os.fspath(self.root.resolve()).encode("utf-8")).hexdigest()
+        return self.cache_dir / "sources" / f"{key[:32]}.json"
+
+    def _read_cache(self, path: Path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("format") != INDEX_FORMAT:
+            return None
+        root = os.fspath(self.root)
+        if data.get("ignore") != _mtime(os.path.join(root, IGNORE_FILE)):
+            return None
+        for rel_dir, mtime in data.get("dirs", {}).items():
+            if _mtime(os.path.join(root, rel_dir) if rel_dir else root) != mtime:
+                return None
+        return data.get("files")
+
+    def _write_cache(self, path: Path, files, dirs):
+        data = {
+            "format": INDEX_FORMAT,
+            "root": os.fspath(self.root.resolve()),
+            "ignore": _mtime(os.path.join(os.fspath(self.root), IGNORE_FILE)),
+            "dirs": dirs,
+            "files": files,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=path.name, suffix=".tmp", dir=path.parent)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass  # caching is best effort
+
+    def _load(self):
+        cache_path = self._cache_path()
+        files = self._read_cache(cache_path) if cache_path is not None else None
+        if files is not None:
+            self.from_cache = True
+        else:
+            files, dirs = self._walk()
+            if cache_path is not None:
+                self._write_cache(cache_path, files, dirs)
+        sources = [rel for rel in files if rel.endswith(SUFFIX)]
+        self.files = [self.root / rel for rel in sources]
+        self.modules = {rel[:-len(SUFFIX)].replace("/", "."): self.root / rel for rel in sources}
+        self.bundles = {rel[:-len(BUNDLE_SUFFIX)].replace("/", "."): self.root / rel
+                        for rel in files if rel.endswith(BUNDLE_SUFFIX)}
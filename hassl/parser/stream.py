@@ -0,0 +1,135 @@
+# hassl/parser/stream.py
+"""
+Statement-at-a-time parsing for very large sources.
+
+iter_statements() reads its input line by line and yields top-level
+statements as soon as they are complete, so peak memory depends on the
+largest statement rather than on the file size.
+
+Lines that start with a statement keyword (alias, rule, schedule, ...) are
+only *candidate* boundaries: `schedule` also opens a rule clause, and a
+keyword can be a plain name inside a statement. A candidate is accepted
+the way the LALR parser itself would decide it: every line's tokens are fed
+to one interactive parser as the line is read, and the parse table is
+consulted for what the keyword token would do next; only if it reduces the
+pending statement(s) down to the top level is the pending text finished
+and yielded, and a new parser started. Otherwise the line is a
+continuation and its tokens join the pending parse. The statements are
+therefore exactly those of a full parse. No token of the grammar spans a
+newline, so lexing line by line gives the tokens of the whole text.
+"""
+import mmap
+import os
+import re
+from typing import Iterator
+
+from .loader import get_parser
+from .runtime import UnexpectedInput
+from .transform import make_program
+from ..ast.nodes import Program
+
+_KEYWORDS = ("package", "import", "alias", "private", "sync", "rule",
+             "schedule", "holidays", "template", "use")
+_CANDIDATE = re.compile(r"[ \t\f\r]*(%s)(?![A-Za-z0-9_])" % "|".join(_KEYWORDS))
+
+def _iter_lines(source) -> Iterator[str]:
+    """Lines (with their newline) of a path, a text/binary file, or an mmap/bytes buffer."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "r", encoding="utf-8") as f:
+            yield from f
+        return
+    if isinstance(source, (mmap.mmap, bytes, bytearray)):
+        # slice lines out of the buffer without moving the mmap's file position
+        pos, size = 0, len(source)
+        while pos < size:
+            nl = source.find(b"\n", pos)
+            end = size if nl < 0 else nl + 1
+            yield source[pos:end].decode("utf-8")
+            pos = end
+        return
+    for line in source:
+        yield line.decode("utf-8") if isinstance(line, bytes) else line
+
+class _Pending:
+    """Statement(s) being accumulated: their lines are lexed and fed to an interactive parser."""
+
+    def __init__(self, first_line: int):
+        self.first_line = first_line   # 1-based line number of the first line
+        self.offset = 0                # character offset of the first line
+        self.size = 0                  # characters fed so far
+        self.lines = 0                 # lines fed so far
+        self._ip = get_parser(inline=True).parse_interactive("")
+
+    def add(self, line: str):
+        # Lex the new line only, with a fresh interactive parser whose parser
+        # state is the pending one: the contextual lexer sees what the pending
+        # statement expects, and the tokens advance its parse. Positions are
+        # relative to the line and fixed up on errors.
+        lexer = get_parser(inline=True).parse_interactive(line)
+        lexer.parser_state = self._ip.parser_state
+        base, self.size = self.size, self.size + len(line)
+        self._relocate(lexer.exhaust_lexer, base, self.lines)
+        self.lines += 1
+
+    def ends_before(self, keyword: str) -> bool:
+        """True if the LALR parser would close the pending statements on `keyword`."""
+        # A syntax error inside the pending text cannot be repaired by more
+        # input (LALR detects errors at the earliest possible token), so it
+        # has propagated from add() already.
+        state = self._ip.parser_state
+        states = state.parse_conf.states
+        term = keyword.upper()
+        # Replay the reductions the keyword would trigger on a copy of the
+        # state stack (no values, no callbacks) until it would be shifted.
+        stack = list(state.state_stack)
+        while True:
+            action, arg = states[stack[-1]].get(term, (None, None))
+            if action is None:
+                return False          # not acceptable here: let the full parse report it
+            if not hasattr(arg, "expansion"):  # shift (arg is the next state), not a reduce by a rule
+                return len(stack) <= 2  # only the start state and the statement list below
+            if arg.expansion:
+                del stack[-len(arg.expansion):]
+            stack.append(states[stack[-1]][arg.origin.name][1])
+
+    def finish(self) -> list:
+        prog = self._relocate(self._ip.feed_eof)
+        return prog.statements
+
+    def _relocate(self, fn, base: int = 0, line: int = 0):
+        # Report errors against the whole input, not the line being lexed;
+        # base and line are its character offset and line index in the chunk.
+        try:
+            return fn()
+        except UnexpectedInput as e:
+            if getattr(e, "line", -1) and e.line > 0:
+                e.line += self.first_line - 1 + line
+            if getattr(e, "pos_in_stream", None) is not None:
+                e.pos_in_stream += self.offset + base
+            token = getattr(e, "token", None)
+            if token is not None and getattr(token, "line", None):
+                token.line += self.first_line - 1 + line
+            raise
+
+def iter_statements(source) -> Iterator[object]:
+    """
+    Yield the top-level statements of source one by one.
+    source: a path, an open text/binary file, or an mmap/bytes buffer.
+    """
+    pending = _Pending(1)
+    lineno, offset = 0, 0
+    for line in _iter_lines(source):
+        lineno += 1
+        m = _CANDIDATE.match(line)
+        if m and pending.size and pending.ends_before(m.group(1)):
+            yield from pending.finish()
+            pending = _Pending(lineno)
+            pending.offset = offset
+        pending.add(line)
+        offset += len(line)
+    if pending.size:
+        yield from pending.finish()
+
+def parse_stream(source) -> Program:
+    """Program built from iter_statements() (the statement list itself is kept, the parse is not)."""
+    return make_program(list(iter_statements(source)))
@@ -1,6 +1,13 @@
-from lark import Transformer, v_args, Token, Tree
+from sys import intern
+
+from .runtime import Transformer, Transformer_NonRecursive, v_args, Token, Tree
 from ..ast import nodes
 
+# Identifiers and entity ids repeat across every statement that mentions
+# them; interning makes all occurrences share one str object.
+def _ident(x):
+    return intern(str(x))
+
 def _atom(val):
     if isinstance(val, Token):
         t = val.type
@@ -13,51 +20,62 @@ def _atom(val):
             except ValueError:
                 return float(s)
         if t in ("CNAME", "STATE", "UNIT", "ONOFF", "DIMMER", "ATTRIBUTE", "SHARED", "ALL"):
-            return s
+            return intern(s)
         if t == "STRING":
             return s[1:-1]
     return val
 
 def _flatten_entity_tree(val):
     if isinstance(val, Tree) and getattr(val, "data", None) == "entity":
-        return ".".join(str(c) for c in val.children)
+        return intern(".".join(str(c) for c in val.children))
     return val
 
 def _to_str(x):
     return str(x) if not isinstance(x, Token) else str(x)
 
+def make_program(statements):
+    """Program from top-level statements; the last package wins, imports are collected in order."""
+    package = None
+    imports = []
+    for s in statements:
+        if isinstance(s, dict):
+            if s.get("type") == "package":
+                package = s["name"]
+            elif s.get("type") == "import":
+                imports.append(dict(s))
+    try:
+        return nodes.Program(statements=statements, package=package, imports=imports)
+    except TypeError:
+        return nodes.Program(statements=statements)
+
 @v_args(inline=True)
 class HasslTransformer(Transformer):
-    def __init__(self):
-        super().__init__()
-        self.stmts = []
-        self.package = None
-        self.imports = []
-        # sticky token for day words if the parser inlines them oddly
-        self._last_day_token = None
+    """
+    Builds the AST bottom-up. Every method returns its node and keeps no
+    per-parse state, so one instance can be handed to the LALR parser and
+    applied while parsing (see loader.get_parser(inline=True)), and shared
+    between threads.
+    """
 
     # If your .lark declares these tokens (recommended), these hooks will fire:
-    def WEEKDAYS(self, t): self._last_day_token = "weekdays"; return "weekdays"
-    def WEEKENDS(self, t): self._last_day_token = "weekends"; return "weekends"
-    def DAILY(self, t):    self._last_day_token = "daily";    return "daily"
+    def WEEKDAYS(self, t): return "weekdays"
+    def WEEKENDS(self, t): return "weekends"
+    def DAILY(self, t):    return "daily"
 
     # ============ Program root ============
     def start(self, *stmts):
-        try:
-            return nodes.Program(statements=self.stmts, package=self.package, imports=self.imports)
-        except TypeError:
-            return nodes.Program(statements=self.stmts)
+        return make_program([s for s in stmts if s is not None])
+
+    def stmt(self, s): return s
 
     # ============ Package / Import ============
     def package_decl(self, *children):
         if not children: raise ValueError("package_decl: missing children")
         dotted = children[-1]
-        self.package = str(dotted)
-        self.stmts.append({"type": "package", "name": self.package})
-        return self.package
+        return {"type": "package", "name": _ident(dotted)}
 
     def module_ref(self, *parts):
-        return ".".join(str(p) for p in parts)
+        return intern(".".join(str(p) for p in parts))
 
     def import_stmt(self, *children):
         if not children: return None
@@ -84,10 +102,7 @@ class HasslTransformer(Transformer):
                 if isinstance(norm, tuple) and len(norm) == 3:
                     kind, items, as_name = norm
 
-        imp = {"type": "import", "module": module, "kind": kind, "items": items, "as": as_name}
-        self.imports.append(imp)
-        self.stmts.append({"type": "import", **imp})
-        return imp
+        return {"type": "import", "module": module, "kind": kind, "items": items, "as": as_name}
 
     def import_tail(self, *args):
         if len(args) == 1 and isinstance(args[0], Token) and str(args[0]) == ".*":
@@ -116,7 +131,7 @@ class HasslTransformer(Transformer):
 
     # ============ Templates (NEW) ============
     # These are no-ops unless your grammar includes template_* rules.
-    # They simply build nodes and push them into self.stmts so the analyzer can expand them.
+    # They simply build nodes and hand them to start() so the analyzer can expand them.
 
     # template_decl: PRIVATE? TEMPLATE template_kind CNAME "(" template_params? ")" ":" template_body
     def template_decl(self, *parts):
@@ -135,9 +150,7 @@ class HasslTransformer(Transformer):
             # the first non-token/non-list after ':' should be the body node (Rule/Sync/Schedule body)
             if not isinstance(p, (list, Token, str)) and p is not None:
                 body = p
-        t = nodes.TemplateDecl(kind=kind, name=str(name) if name else "", params=params, body=body, private=private)
-        self.stmts.append(t)
-        return t
+        return nodes.TemplateDecl(kind=kind, name=_ident(name) if name else "", params=params, body=body, private=private)
 
     def template_kind(self, *toks):
         if not toks:
@@ -180,12 +193,13 @@ class HasslTransformer(Transformer):
         name = None
         as_name = None
         args = []
-        seen_as = False
         for p in parts:
             if isinstance(p, Token) and p.type == "CNAME":
                 if name is None:
                     name = str(p)
-                elif seen_as and as_name is None:
+                elif as_name is None:
+                    # the anonymous "as" keyword is filtered out by lark, so
+                    # a second CNAME can only be the 'as <name>'
                     as_name = str(p)
                 # else: ignore stray CNAMEs (shouldn't happen if grammar is strict)
                 continue
@@ -193,12 +207,7 @@ class HasslTransformer(Transformer):
                 # call_args comes in as a list
                 args = p
                 continue
-            if isinstance(p, str) and p == "as":
-                seen_as = True
-                continue
-        u = nodes.UseTemplate(name=str(name) if name else "", args=args, as_name=as_name)
-        self.stmts.append(u)
-        return u
+        return nodes.UseTemplate(name=_ident(name) if name else "", args=args, as_name=as_name)
 
     # call_args: call_arg ("," call_arg)*
     def call_args(self, *items):
@@ -224,28 +233,22 @@ class HasslTransformer(Transformer):
             priv_tok, name, entity = args
             private = (isinstance(priv_tok, Token) and priv_tok.type == "PRIVATE") or bool(priv_tok)
         entity = _flatten_entity_tree(entity)
-        a = nodes.Alias(name=str(name), entity=str(entity), private=private)
-        self.stmts.append(a)
-        return a
+        return nodes.Alias(name=_ident(name), entity=_ident(entity), private=private)
 
     def sync(self, synctype, members, name, syncopts=None):
         invert = syncopts if isinstance(syncopts, list) else []
-        s = nodes.Sync(kind=str(synctype), members=members, name=str(name), invert=invert)
-        self.stmts.append(s)
-        return s
+        return nodes.Sync(kind=str(synctype), members=members, name=_ident(name), invert=invert)
 
     def synctype(self, tok): return str(tok)
     def syncopts(self, *args): return list(args)[-1] if args else []
-    def entity_list(self, *entities): return [str(e) for e in entities]
+    def entity_list(self, *entities): return [_ident(e) for e in entities]
     def member(self, val): return val
 
-    def entity(self, *parts): return ".".join(str(p) for p in parts)
+    def entity(self, *parts): return intern(".".join(str(p) for p in parts))
 
     # ============ Rules ============
     def rule(self, name, *clauses):
-        r = nodes.Rule(name=str(name), clauses=list(clauses))
-        self.stmts.append(r)
-        return r
+        return nodes.Rule(name=_ident(name), clauses=list(clauses))
 
     def if_clause(self, *parts):
         actions = parts[-1]
@@ -283,13 +286,26 @@ class HasslTransformer(Transformer):
             return {"not_by": {"rule": sargs[1]}}
         return {"not_by": "this"}
 
-    def or_(self, left, right):  return {"op": "or", "left": left, "right": right}
-    def and_(self, left, right): return {"op": "and", "left": left, "right": right}
+    # and/or are n-ary: the left-recursive grammar hands us a || b || c as
+    # or_(or_(a, b), c), so extend the node just built instead of nesting
+    def _junction(self, op, left, right):
+        if isinstance(left, dict) and left.get("op") == op and "args" in left:
+            node = left
+        else:
+            node = {"op": op, "args": [left]}
+        if isinstance(right, dict) and right.get("op") == op and "args" in right:
+            node["args"].extend(right["args"])
+        else:
+            node["args"].append(right)
+        return node
+
+    def or_(self, left, right):  return self._junction("or", left, right)
+    def and_(self, left, right): return self._junction("and", left, right)
     def not_(self, term):        return {"op": "not", "value": term}
 
     def comparison(self, left, op=None, right=None):
         if op is None: return left
-        return {"op": str(op), "left": left, "right": right}
+        return {"op": _ident(op), "left": left, "right": right}
 
     def event_keyword(self, val): return _atom(val)
     def event_match(self, left, event_type):
@@ -297,7 +313,7 @@ class HasslTransformer(Transformer):
 
     def bare_operand(self, val): return _atom(val)
     def operand(self, val): return _atom(val)
-    def OP(self, tok): return str(tok)
+    def OP(self, tok): return intern(str(tok))
 
     def actions(self, *acts): return list(acts)
     def action(self, act): return act
@@ -305,15 +321,15 @@ class HasslTransformer(Transformer):
     def dur(self, n, unit): return f"{int(str(n))}{str(unit)}"
 
     def assign(self, name, state, *for_parts):
-        act = {"type": "assign", "target": str(name), "state": str(state)}
+        act = {"type": "assign", "target": _ident(name), "state": _ident(state)}
         if for_parts: act["for"] = for_parts[0]
         return act
 
     def attr_assign(self, *parts):
         value = _atom(parts[-1])
-        cnames = [str(p) for p in parts[:-1]]
+        cnames = [_ident(p) for p in parts[:-1]]
         attr = cnames[-1]
-        entity = ".".join(cnames[:-1])
+        entity = intern(".".join(cnames[:-1]))
         return {"type": "attr_assign", "entity": entity, "attr": attr, "value": value}
 
     def waitact(self, cond, dur, action):
@@ -366,14 +382,12 @@ class HasslTransformer(Transformer):
             idx += 1
         if idx >= len(parts):
             raise ValueError("schedule_decl: missing schedule name")
-        name = str(parts[idx]); idx += 1
+        name = _ident(parts[idx]); idx += 1
         if idx < len(parts) and isinstance(parts[idx], Token) and str(parts[idx]) == ":":
             idx += 1
         clauses = [c for c in parts[idx:] if isinstance(c, dict) and c.get("type") == "schedule_clause"]
         windows = [w for w in parts[idx:] if isinstance(w, nodes.ScheduleWindow)]
-        sched = nodes.Schedule(name=name, clauses=clauses, windows=windows, private=private)
-        self.stmts.append(sched)
-        return sched
+        return nodes.Schedule(name=name, clauses=clauses, windows=windows, private=private)
 
     def rule_schedule_use(self, *args):
         names = None
@@ -411,8 +425,8 @@ class HasslTransformer(Transformer):
     def schedule_op(self, tok): return str(tok).lower()
     def schedule_to(self, _to_kw, ts): return {"to": ts}
     def schedule_until(self, _until_kw, ts): return {"until": ts}
-    def name_list(self, *names): return [n if isinstance(n, str) else str(n) for n in names]
-    def name(self, val): return str(val)
+    def name_list(self, *names): return [_ident(n) for n in names]
+    def name(self, val): return _ident(val)
 
     def time_clock(self, tok): return {"kind": "clock", "value": str(tok)}
     def time_sun(self, event_tok, offset_tok=None):
@@ -425,9 +439,6 @@ class HasslTransformer(Transformer):
 
     # -------- New windows & periods --------
     def schedule_window_clause(self, *parts):
-        # Reset sticky day for each clause
-        self._last_day_token = None
-
         psel = None
         day = None
         start = None
@@ -485,8 +496,6 @@ class HasslTransformer(Transformer):
                     prev_holidays = False; prev_except = False
                     continue
 
-        if day is None and self._last_day_token:
-            day = self._last_day_token
         if day is None:
             day = "daily"
 
@@ -541,9 +550,7 @@ class HasslTransformer(Transformer):
 
     def day_selector(self, *args):
         if not args:
-            val = self._last_day_token
-            self._last_day_token = None
-            return val or "daily"
+            return "daily"
         tok = str(args[0]).lower()
         if tok in ("weekday", "wd", "mon-fri", "monfri"): return "weekdays"
         if tok in ("weekend", "we", "sat-sun", "satsun"): return "weekends"
@@ -551,7 +558,6 @@ class HasslTransformer(Transformer):
         return tok
 
     def time_range(self, *args):
-        from lark import Token
         parts = [a for a in args if not (isinstance(a, Token) and str(a) == "-")]
         times = [str(p) for p in parts if isinstance(p, Token) and p.type == "TIME_HHMM"]
         if len(times) >= 2: return ("time", times[0], times[1])
@@ -603,10 +609,8 @@ class HasslTransformer(Transformer):
         workdays = params["workdays"] or ["mon", "tue", "wed", "thu", "fri"]
         excludes = params["excludes"] or ["sat", "sun", "holiday"]
 
-        hs = nodes.HolidaySet(id=str(ident) if ident is not None else "", country=country, province=province,
-                              add=add, remove=remove, workdays=workdays, excludes=excludes)
-        self.stmts.append(hs)
-        return hs
+        return nodes.HolidaySet(id=str(ident) if ident is not None else "", country=country, province=province,
+                                add=add, remove=remove, workdays=workdays, excludes=excludes)
 
     def holi_country(self, s): return ("country", str(s))
     def holi_province(self, s): return ("province", str(s))
@@ -619,3 +623,10 @@ class HasslTransformer(Transformer):
     def excludelist(self, *xs): return [str(x) for x in xs]
     def datestr_list(self, *xs): return [str(x) for x in xs]
     def DATESTR(self, t): return str(t)
+
+class TreeTransformer(Transformer_NonRecursive, HasslTransformer):
+    """
+    HasslTransformer for a parse tree that has already been built. The tree
+    of a wide condition is as deep as it has operands, so it is walked
+    without recursion.
+    """
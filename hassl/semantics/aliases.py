@@ -0,0 +1,177 @@
+# hassl/semantics/aliases.py
+"""
+Alias resolution, compiled once per package.
+
+AliasResolver turns an alias map (plus an optional resolver for qualified
+'ns.alias' names) into a memoized name -> entity function and applies it
+to whole trees in one pass. Subtrees without anything to resolve are
+returned as they are instead of being rebuilt.
+
+resolve_package() is the codegen side: it resolves every rule of a
+package IR once -- condition and arm expressions, their entity sets, the
+targets of all actions -- and generate_rules() reads the result instead
+of walking the expressions itself.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from .exprs import ExprTable, expr_children, fold_tree, is_junction, junction, rebuild
+
+_MISSING = object()
+
+class AliasResolver:
+    def __init__(self, amap: Mapping[str, str],
+                 qualified: Optional[Callable[[str], Optional[str]]] = None,
+                 bare: bool = True):
+        """
+        amap: alias -> entity for bare (undotted) names; ignored if bare=False.
+        qualified: resolves dotted 'ns.alias' names (None if not an alias).
+        """
+        self.amap = amap if bare else {}
+        self.qualified = qualified
+        self._memo: Dict[str, str] = {}
+
+    def name(self, s: str) -> str:
+        hit = self._memo.get(s, _MISSING)
+        if hit is not _MISSING:
+            return hit
+        out = s
+        if "." not in s:
+            out = self.amap.get(s, s)
+        elif self.qualified is not None:
+            out = self.qualified(s) or s
+        self._memo[s] = out
+        return out
+
+    def tree(self, obj: Any) -> Any:
+        """Resolve every string in a dict/list tree (values only, keys kept)."""
+        if not self.amap and self.qualified is None:
+            return obj                  # nothing it could resolve
+        return fold_tree(obj, self._leaf, rebuild)
+
+    def _leaf(self, x: Any) -> Any:
+        return self.name(x) if isinstance(x, str) else x
+
+@dataclass(slots=True)
+class ResolvedExpr:
+    expr: Any                                  # expression with aliases replaced by entities
+    entities: List[str]                        # sorted entity ids it references
+
+@dataclass(slots=True)
+class ResolvedRule:
+    conditions: Dict[int, ResolvedExpr] = field(default_factory=dict)   # clause index -> condition
+    arm: Optional[ResolvedExpr] = None
+    targets: Dict[int, List[Any]] = field(default_factory=dict)         # clause index -> per-action entity
+    waits: Dict[Tuple[int, int], ResolvedExpr] = field(default_factory=dict)  # (clause, action) -> wait condition
+
+@dataclass(slots=True)
+class ResolvedPackage:
+    ir: Any                                    # the IR dict this was computed for
+    aliases: Dict[str, str]
+    rules: List[ResolvedRule]                  # in the order of ir["rules"]
+
+def _is_entity(s: str) -> bool:
+    return "." in s and all(s.split("."))
+
+def _expr_operands(node: Any) -> Optional[List[Any]]:
+    # like expr_children, but comparison operands are walked too
+    if isinstance(node, dict) and "op" in node:
+        kids = expr_children(node)
+        return kids if kids is not None else [node.get("left"), node.get("right")]
+    return node if isinstance(node, list) else None
+
+def _rebuild_expr(node: Any, results: List[Any]) -> Any:
+    if isinstance(node, list):
+        return list(results)
+    op = node["op"]
+    if is_junction(node):
+        if "args" in node:
+            return junction(op, results)
+        return {"op": op, "left": results[0], "right": results[1]}
+    if op == "not":
+        return {"op": "not", "value": results[0]}
+    return {"op": op, "left": results[0], "right": results[1]}
+
+def resolve_expr(node: Any, aliases: Mapping[str, str], exprs: Optional[ExprTable] = None) -> ResolvedExpr:
+    """
+    Resolve bare alias operands of an analyzer expression tree.
+    Logical and comparison nodes are rebuilt with only their operator and
+    operands (op/args, op/left/right, op/value); other dicts are left
+    untouched. With an ExprTable the resolved expression is interned in it.
+    """
+    entities = set()
+
+    def resolve(n):
+        if isinstance(n, str) and "." not in n and n in aliases:
+            return aliases[n]
+        return n
+
+    def collect(x):
+        # entity ids anywhere in the resolved tree
+        if isinstance(x, str) and _is_entity(x):
+            entities.add(x)
+        return x
+
+    expr = fold_tree(node, resolve, _rebuild_expr, _expr_operands)
+    fold_tree(expr, collect, lambda n, results: n)
+    if exprs is not None:
+        expr = exprs.intern(expr)
+    return ResolvedExpr(expr=expr, entities=sorted(entities))
+
+def _target(name: Any, aliases: Mapping[str, str]) -> str:
+    return aliases.get(str(name), str(name))
+
+def _action_target(act: dict, aliases: Mapping[str, str]) -> Optional[str]:
+    kind = act.get("type")
+    if kind == "assign":
+        return _target(act["target"], aliases)
+    if kind == "attr_assign":
+        return _target(act["entity"], aliases)
+    if kind == "wait":
+        inner = act.get("then") or {}
+        if inner.get("type") == "assign":
+            return _target(inner["target"], aliases)
+    return None
+
+def resolve_package(ir: dict, aliases: Dict[str, str], exprs: Optional[ExprTable] = None) -> ResolvedPackage:
+    """
+    Resolve all rules of a package IR dict against its codegen alias map,
+    once. Conditions shared between rules (interned by the analyzer) are
+    resolved once; with an ExprTable the results are interned too.
+    """
+    rules: List[ResolvedRule] = []
+    seen: Dict[int, Tuple[Any, ResolvedExpr]] = {}
+
+    def resolve(expr):
+        hit = seen.get(id(expr))
+        if hit is not None and hit[0] is expr:
+            return hit[1]
+        res = resolve_expr(expr, aliases, exprs)
+        seen[id(expr)] = (expr, res)
+        return res
+
+    def resolve_condition(cond):
+        # A simplified condition keeps the expression as written in
+        # "trigger_expr": its entities, not the simplified ones, trigger the
+        # automation (absorbing `lux < 10` must not drop the lux trigger)
+        res = resolve(cond.get("expr", {}))
+        if "trigger_expr" not in cond:
+            return res
+        return ResolvedExpr(expr=res.expr, entities=resolve(cond["trigger_expr"]).entities)
+
+    for rule in ir.get("rules", []) or []:
+        rr = ResolvedRule()
+        arm_when = rule.get("arm_when")
+        if arm_when:
+            rr.arm = resolve_condition(arm_when)
+        for idx, clause in enumerate(rule.get("clauses", []) or []):
+            if clause.get("type") != "at":
+                rr.conditions[idx] = resolve_condition(clause["condition"])
+            actions = clause.get("actions") or []
+            rr.targets[idx] = [_action_target(a, aliases) for a in actions]
+            for j, act in enumerate(actions):
+                if act.get("type") == "wait":
+                    cond = act["condition"]
+                    rr.waits[(idx, j)] = resolve(cond.get("expr", cond))
+        rules.append(rr)
+    return ResolvedPackage(ir=ir, aliases=aliases, rules=rules)
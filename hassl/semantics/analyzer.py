@@ -1,12 +1,16 @@
-from dataclasses import dataclass, field, is_dataclass, asdict
+from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Tuple
-import copy
 from ..ast.nodes import (
     Program, Alias, Sync, Rule, Schedule,
     HolidaySet, ScheduleWindow, PeriodSelector,
     TemplateDecl, UseTemplate,
     )
 from .domains import DOMAIN_PROPS, domain_of
+from .aliases import AliasResolver
+from .exports import ExportRegistry
+from . import intervals
+from .exprs import ExprTable, expr_children, fold_tree, is_junction, junction, operands, rebuild
+from .templates import TemplateCache
 
 @dataclass
 class IRSyncedProp:
@@ -42,6 +46,12 @@ class IRProgram:
     holidays: Optional[Dict[str, dict]] = None
     # NEW: structured windows keyed by schedule name
     schedules_windows: Optional[Dict[str, List[dict]]] = None  # NEW
+    # What condition simplification eliminated, per clause (not part of to_dict):
+    # [{"rule": name, "clause": 1-based index or "arm", "eliminated": [...], "unreachable": bool}]
+    simplified: List[Dict[str, Any]] = field(default_factory=list)
+    # Schedules whose windows or legacy clauses were merged (not part of to_dict):
+    # [{"schedule": name, "kind": "windows" or "clauses", "before": n, "after": m}]
+    merged_schedules: List[Dict[str, Any]] = field(default_factory=list)
     
     def to_dict(self):
         return {
@@ -64,29 +74,231 @@ class IRProgram:
             "schedules_windows": self.schedules_windows or {},  # NEW
         }
 
-def _resolve_module_id(raw_mod: str) -> str:
+def _exports() -> Optional[ExportRegistry]:
+    """GLOBAL_EXPORTS as an ExportRegistry (a plain dict set by a caller is indexed here), or None."""
+    if 'GLOBAL_EXPORTS' not in globals():
+        return None
+    return ExportRegistry.of(globals()['GLOBAL_EXPORTS'])
+
+def _resolve_module_id(raw_mod: str, exports: Optional[ExportRegistry] = None) -> str:
     """
     Map a raw import like 'hall.aliases' to the actual package id present in GLOBAL_EXPORTS,
     e.g. 'home.hall.aliases'. If multiple candidates match, keep raw (fail gently).
     """
-    if 'GLOBAL_EXPORTS' not in globals() or not raw_mod:
-        return raw_mod
-    # exact hit?
-    if any(pkg == raw_mod for (pkg, _k, _n) in globals()['GLOBAL_EXPORTS']):
+    if exports is None:
+        exports = _exports()
+    if exports is None or not raw_mod:
         return raw_mod
-    # suffix match (common when files declare 'home.hall.aliases' but source wrote 'hall.aliases')
-    candidates = {pkg for (pkg, _k, _n) in globals()['GLOBAL_EXPORTS'] if pkg.endswith("." + raw_mod)}
-    return next(iter(candidates)) if len(candidates) == 1 else raw_mod
+    # exact hit, or the unique suffix match (common when files declare
+    # 'home.hall.aliases' but source wrote 'hall.aliases')
+    return exports.resolve_module(raw_mod)
 
 def _resolve_alias(e: str, amap: Dict[str,str]) -> str:
     if "." not in e and e in amap: return amap[e]
     return e
 
-def _walk_alias(obj: Any, amap: Dict[str,str]) -> Any:
-    if isinstance(obj, dict): return {k:_walk_alias(v,amap) for k,v in obj.items()}
-    if isinstance(obj, list): return [_walk_alias(x,amap) for x in obj]
-    if isinstance(obj, str) and "." not in obj and obj in amap: return amap[obj]
-    return obj
+# ---- condition simplification ----
+# Folds constants, double negation, duplicate operands, absorption and
+# x && !x / x || !x, and splices nested and/or of the same kind. Constants
+# are True/False; a bare number operand is true when non-zero, as
+# _expr_to_template renders it. Comparisons are only folded between two
+# numbers: any string may still be an alias.
+_CMP = {
+    "==": lambda a, b: a == b, "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b, ">": lambda a, b: a > b,
+    "<=": lambda a, b: a <= b, ">=": lambda a, b: a >= b,
+}
+
+def _is_number(x: Any) -> bool:
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+def _foldable(node: Any, keys: ExprTable) -> bool:
+    """
+    Cheap pre-check for _simplify_expr: False when node has no constant, no
+    negation, no and/or directly inside one of the same kind and no and/or
+    with a repeated or absorbed operand, i.e. nothing that could fold.
+    """
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if isinstance(n, bool) or _is_number(n):
+            return True
+        if isinstance(n, list):
+            stack.extend(n)
+        elif not isinstance(n, dict):
+            continue
+        elif n.get("op") == "not":
+            return True
+        elif is_junction(n):
+            args = operands(n)
+            seen = {keys.key(a) for a in args}
+            if len(seen) < len(args):
+                return True
+            for a in args:
+                if is_junction(a) and (a["op"] == n["op"] or any(keys.key(x) in seen for x in operands(a))):
+                    return True
+            stack.extend(args)
+        elif n.get("op") in _CMP and _is_number(n.get("left")) and _is_number(n.get("right")):
+            return True
+    return False
+
+def _simplify_expr(node: Any, notes: List[str], keys: Optional[ExprTable] = None) -> Any:
+    """
+    Simplified boolean expression node; what was eliminated is appended to
+    notes. keys gives the structural identity of operands (duplicates,
+    complements, absorption): the build's ExprTable, so the keys computed
+    here are the ones the condition is interned with afterwards.
+    """
+    if keys is None:
+        keys = ExprTable()
+    if not _foldable(node, keys):
+        return node
+
+    def leaf(n):
+        if isinstance(n, bool):
+            return n
+        if _is_number(n):
+            notes.append(f"constant {n}")
+            return n != 0
+        if (isinstance(n, dict) and n.get("op") in _CMP
+                and _is_number(n.get("left")) and _is_number(n.get("right"))):
+            notes.append("constant comparison")
+            return _CMP[n["op"]](n["left"], n["right"])
+        return n
+
+    def combine(n, results):
+        if isinstance(n, list):
+            return rebuild(n, results)
+        if n["op"] == "not":
+            v = results[0]
+            if isinstance(v, bool):
+                notes.append("constant negation")
+                return not v
+            if isinstance(v, dict) and v.get("op") == "not":
+                notes.append("double negation")
+                return v["value"]
+            return n if v is n["value"] else {"op": "not", "value": v}
+        op = n["op"]
+        unit, zero = (True, False) if op == "and" else (False, True)
+        dual = "or" if op == "and" else "and"
+        flat: List[Any] = []
+        for a in results:
+            flat.extend(operands(a) if is_junction(a) and a["op"] == op else [a])
+        if any(a is zero for a in flat):
+            notes.append(f"constant {op}")
+            return zero
+        kept = [a for a in flat if a is not unit]
+        if len(kept) < len(flat):
+            notes.append(f"constant {op}")
+        seen = set()
+        uniq: List[Any] = []
+        for a in kept:
+            k = keys.key(a)
+            if k not in seen:
+                seen.add(k)
+                uniq.append(a)
+        if len(uniq) < len(kept):
+            notes.append("duplicate operand")
+        for a in uniq:
+            if isinstance(a, dict) and a.get("op") == "not" and keys.key(a["value"]) in seen:
+                notes.append("contradiction" if op == "and" else "tautology")
+                return zero
+        absorbed = {id(b) for b in uniq
+                    if is_junction(b) and b["op"] == dual and any(keys.key(x) in seen for x in operands(b))}
+        if absorbed:
+            notes.append("absorption")
+            uniq = [b for b in uniq if id(b) not in absorbed]
+        if not uniq:
+            return unit
+        if len(uniq) == 1:
+            return uniq[0]
+        original = operands(n)
+        if len(uniq) == len(original) and all(a is b for a, b in zip(uniq, original)):
+            return n
+        return junction(op, uniq)
+
+    return fold_tree(node, leaf, combine, expr_children)
+
+# ---- schedule window merging ----
+# Windows of a schedule are ORed, so within one (day selector, period,
+# holiday) bucket overlapping, touching and duplicate clock windows can be
+# merged (see intervals.py); each window costs codegen two edge automations
+# and a branch of the per-minute maintenance condition.
+def _window_bucket(w: dict) -> Tuple[Any, ...]:
+    period = w.get("period")
+    pkey = repr(sorted(period.items(), key=repr)) if isinstance(period, dict) else repr(period)
+    return (w.get("day_selector"), pkey, w.get("holiday_ref"), w.get("holiday_mode"))
+
+def _clock_like(ts: Any, minute: int) -> Any:
+    # same shape as the value it replaces: "HH:MM" or a clock time spec
+    if isinstance(ts, dict):
+        return {**ts, "value": intervals.hhmm(minute)}
+    return intervals.hhmm(minute)
+
+def _normalize_windows(wins: List[dict]) -> List[dict]:
+    """
+    Schedule windows with every (day selector, period, holiday) bucket
+    reduced to its fewest disjoint clock windows. A bucket that cannot be
+    reduced (already minimal, or with a non-clock time) is kept as written,
+    and buckets stay in the order of their first window.
+    """
+    buckets: Dict[Tuple[Any, ...], List[dict]] = {}
+    for w in wins:
+        buckets.setdefault(_window_bucket(w), []).append(w)
+    merged: Dict[Tuple[Any, ...], List[dict]] = {}
+    for key, group in buckets.items():
+        spans = [(intervals.clock_minutes(w.get("start")), intervals.clock_minutes(w.get("end")))
+                 for w in group]
+        if len(group) < 2 or any(s is None or e is None for s, e in spans):
+            continue
+        reduced = intervals.normalize_windows(spans)
+        if len(reduced) < len(group):
+            first = group[0]
+            merged[key] = [{**first, "start": _clock_like(first.get("start"), s),
+                            "end": _clock_like(first.get("end"), e)} for s, e in reduced]
+    if not merged:
+        return wins
+    out: List[dict] = []
+    for w in wins:
+        key = _window_bucket(w)
+        if key not in merged:
+            out.append(w)
+        elif buckets[key][0] is w:
+            out.extend(merged[key])
+    return out
+
+def _normalize_clauses(clauses: List[Any]) -> List[Any]:
+    """
+    Legacy enable/disable clauses of a schedule as the fewest `enable`
+    clauses on the same minutes (ON = any enable and no disable), when all
+    of them are clock-to-clock windows; otherwise the clauses as written.
+    """
+    enable: List[intervals.Interval] = []
+    disable: List[intervals.Interval] = []
+    has_enable = False
+    for c in clauses:
+        if not isinstance(c, dict) or c.get("type") != "schedule_clause":
+            return clauses
+        s = intervals.clock_minutes(c.get("from"))
+        e = intervals.clock_minutes(c.get("to", c.get("until")))
+        op = (c.get("op") or "enable").lower()
+        if s is None or e is None or op not in ("enable", "disable"):
+            return clauses
+        if op == "enable":
+            has_enable = True
+        (enable if op == "enable" else disable).extend(intervals.window_intervals(s, e))
+    # no enable clause means enabled all day, less the disables
+    on = intervals.subtract(enable if has_enable else [(0, intervals.DAY)], disable)
+    reduced = intervals.to_windows(on)
+    if len(reduced) >= len(clauses):
+        return clauses
+    def clock(m):
+        return {"kind": "clock", "value": intervals.hhmm(m)}
+    if not reduced:
+        # never on: a whole-day disable, as no clauses at all would mean always on
+        return [{"type": "schedule_clause", "op": "disable", "from": clock(0), "to": clock(0)}]
+    return [{"type": "schedule_clause", "op": "enable", "from": clock(s), "to": clock(e)}
+            for s, e in reduced]
 
 def _props_for_sync(kind: str, members: List[str]) -> List[IRSyncedProp]:
     domains = [domain_of(m) for m in members]
@@ -110,7 +322,7 @@ def _props_for_sync(kind: str, members: List[str]) -> List[IRSyncedProp]:
         return [IRSyncedProp(p) for p in sorted(base)]
     return []
 
-def analyze(prog: Program) -> IRProgram:
+def analyze(prog: Program, ctx=None) -> IRProgram:
     """
     Import + package semantics
     -------------------------
@@ -122,8 +334,11 @@ def analyze(prog: Program) -> IRProgram:
         GLOBAL_EXPORTS: Dict[(pkg, kind, name), node]
       where kind ∈ {"alias","schedule"} and node is Alias|Schedule.
       Falls back to intra-file visibility if GLOBAL_EXPORTS absent.
+    - ctx: the build's CompileContext; when given, its export registry is
+      used instead of the module-level GLOBAL_EXPORTS.
     """
     package_name: str = prog.package or ""
+    exports = ctx.exports if ctx is not None else _exports()
 
     # Local (this file) exports — public only (private stays local)
     local_aliases: Dict[str, str] = {}
@@ -141,7 +356,7 @@ def analyze(prog: Program) -> IRProgram:
         if not isinstance(imp, dict) or imp.get("type") != "import":
             continue
         raw_mod = imp.get("module", "")
-        mod = _resolve_module_id(raw_mod)
+        mod = _resolve_module_id(raw_mod, exports)
         
         if not mod:
             continue
@@ -155,48 +370,10 @@ def analyze(prog: Program) -> IRProgram:
         if kind in ("glob", "list", "alias"):
             imported_modules.add(mod)
 
-    # Helper: build arg map (params -> values) using defaults
-    def _bind_args(t: TemplateDecl, call_args: List[Any]) -> Dict[str, Any]:
-        params = list(t.params or [])
-        # normalize params: [{"name":..., "default":...}, ...]
-        pnames = [p.get("name") for p in params]
-        defaults = {p.get("name"): p.get("default") for p in params}
-        bound: Dict[str, Any] = dict(defaults)
-        # split named vs positional args from transformer
-        pos: List[Any] = []
-        named: Dict[str, Any] = {}
-        for a in call_args or []:
-            if isinstance(a, dict) and "name" in a:
-                named[str(a["name"])] = a.get("value")
-            else:
-                pos.append(a)
-        # apply positional
-        for i, v in enumerate(pos):
-            if i < len(pnames):
-                bound[pnames[i]] = v
-        # apply named (wins over positional/default)
-        for k, v in named.items():
-            if k in pnames:
-                bound[k] = v
-        return bound
-
-    # Deep substitute param identifiers appearing as bare strings in nested dict/list trees
-    def _deep_subst(obj: Any, subst: Dict[str, Any]) -> Any:
-        # strings: replace only if exactly matches a parameter name
-        if isinstance(obj, str):
-            replacement = subst.get(obj, obj)
-            if isinstance(replacement, (dict, list)):
-                return copy.deepcopy(replacement)
-            return str(replacement)
-        # dicts/lists: walk recursively
-        if isinstance(obj, dict):
-            return {k: _deep_subst(v, subst) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [_deep_subst(x, subst) for x in obj]
-        # leave everything else as-is (numbers, bools, None)
-        return obj
-
-    # Expand a single UseTemplate into a concrete node (Rule/Sync/Schedule)
+    # Expand a single UseTemplate into a concrete node (Rule/Sync/Schedule);
+    # expansions are memoized per (template, arguments) for the whole build
+    template_cache = ctx.templates if ctx is not None else TemplateCache()
+
     def _instantiate(use: UseTemplate) -> Optional[Any]:
         # Find matching template by name across kinds (prefer rule->sync->schedule)
         t = None
@@ -206,46 +383,7 @@ def analyze(prog: Program) -> IRProgram:
                 break
         if not t:
             return None
-        argmap = _bind_args(t, list(getattr(use, "args", []) or []))
-
-        if t.body is None:
-            # Provide minimal empty bodies so deep_subst & constructors don’t break
-            if t.kind == "rule":
-                t.body = Rule(name="", clauses=[])
-            elif t.kind == "sync":
-                t.body = Sync(kind="onoff", members=[], name="", invert=[])
-            elif t.kind == "schedule":
-                t.body = Schedule(name="", clauses=[], windows=[], private=False)
-        original = copy.deepcopy(t.body)
-        # Plainify dataclasses/objects so deep_subst can walk them
-        if is_dataclass(original):
-            plain = asdict(original)
-        elif hasattr(original, "__dict__"):
-            # shallow mapping of fields; they will typically be lists/dicts we can walk
-            plain = copy.deepcopy(vars(original))
-        else:
-            plain = original
-        subbed = _deep_subst(plain, argmap)
-
-        # Rename resulting node if caller provided "as <name>"
-        # Rename resulting node if caller provided "as <name>" or passed name= param
-        new_name = getattr(use, "as_name", None) or str(argmap.get("name") or t.name)
-
-        # Construct concrete AST node of same kind
-        if isinstance(t.body, Rule) or (getattr(t.body, "__class__", None).__name__ == "Rule"):
-            # subbed is a dict after plainify/subst
-            return Rule(name=new_name, clauses=subbed.get("clauses", getattr(original, "clauses", [])))
-        if isinstance(t.body, Sync) or (getattr(t.body, "__class__", None).__name__ == "Sync"):
-            return Sync(kind=subbed.get("kind", getattr(original, "kind", "onoff")),
-                        members=subbed.get("members", getattr(original, "members", [])),
-                        name=new_name,
-                        invert=subbed.get("invert", getattr(original, "invert", [])))
-        if isinstance(t.body, Schedule) or (getattr(t.body, "__class__", None).__name__ == "Schedule"):
-            return Schedule(name=new_name,
-                            clauses=subbed.get("clauses", getattr(original, "clauses", [])),
-                            windows=subbed.get("windows", getattr(original, "windows", [])),
-                            private=subbed.get("private", getattr(original, "private", False)))
-        return None
+        return template_cache.instantiate(t, use)
 
     # Scan once to collect templates
     for s in getattr(prog, "statements", []) or []:
@@ -254,10 +392,8 @@ def analyze(prog: Program) -> IRProgram:
             if kind in templates_by_kind:
                 templates_by_kind[kind][s.name] = s
 
-    if 'GLOBAL_EXPORTS' in globals():
-        for (pkg, kind, name), node in globals()['GLOBAL_EXPORTS'].items():
-            if kind != "template":
-                continue
+    if exports is not None:
+        for (pkg, name), node in exports.of_kind("template"):
             # bring templates from any imported module
             if pkg in imported_modules and isinstance(node, TemplateDecl):
                 tkind = (node.kind or "rule").lower()
@@ -311,8 +447,8 @@ def analyze(prog: Program) -> IRProgram:
     # Helper to resolve from global exports if available; otherwise, from locals only
     def _get_export(mod: str, kind: str, name: str) -> Optional[Any]:
         key = (mod, kind, name)
-        if 'GLOBAL_EXPORTS' in globals():
-            return globals()['GLOBAL_EXPORTS'].get(key)
+        if exports is not None:
+            return exports.get(key)
         # intra-file fallback: only resolve if the target module == this file's package
         if mod == package_name:
             return local_public.get(key)
@@ -321,10 +457,9 @@ def analyze(prog: Program) -> IRProgram:
         # Warn or raise if imported modules aren't in GLOBAL_EXPORTS
     def _check_import_exists(mod: str):
         """Emit a warning if module not found in GLOBAL_EXPORTS (user likely compiled only a subdir)."""
-        if 'GLOBAL_EXPORTS' not in globals():
+        if exports is None:
             return  # single-file compile, skip
-        exists = any(pkg == mod for (pkg, _kind, _name) in globals()['GLOBAL_EXPORTS'])
-        if not exists:
+        if not exports.has_package(mod):
             import sys
             print(f"[hasslc] WARNING: imported module '{mod}' not found in build inputs "
                   f"(run hasslc from a directory that includes it)", file=sys.stderr)
@@ -335,7 +470,7 @@ def analyze(prog: Program) -> IRProgram:
             # transformer may also append sentinels to statements; ignore here
             continue
         raw_mod = imp.get("module", "")
-        mod = _resolve_module_id(raw_mod)
+        mod = _resolve_module_id(raw_mod, exports)
         
         kind = imp.get("kind")
         # Be generous: if transformer emitted "none" or omitted kind, infer it.
@@ -350,14 +485,12 @@ def analyze(prog: Program) -> IRProgram:
         _check_import_exists(mod)
         if kind == "glob":
             # bring in all public aliases & schedules from 'mod'
-            source = globals().get('GLOBAL_EXPORTS', local_public)
-            for (pkg, k, nm), node in source.items():
-                if pkg != mod or k not in ("alias", "schedule"):
-                    continue
-                if k == "alias" and isinstance(node, Alias):
+            source = exports if exports is not None else ExportRegistry(local_public)
+            for nm, node in source.module_exports(mod, "alias").items():
+                if isinstance(node, Alias):
                     injected_aliases[nm] = node.entity
-                elif k == "schedule":
-                    imported_schedules[nm] = (pkg, nm)
+            for nm in source.module_exports(mod, "schedule"):
+                imported_schedules[nm] = (mod, nm)
         elif kind == "list":
             for it in imp.get("items") or []:
                 nm = it.get("name")
@@ -522,36 +655,38 @@ def analyze(prog: Program) -> IRProgram:
         # unknown — leave as-is (analyzer will not fail here; emitter/runner can)
         return nm
 
-    # Upgrade alias resolution to support qualified 'ns.aliasName' in expr/actions
-    def _walk_alias_with_qualified(obj: Any) -> Any:
-        if isinstance(obj, dict):
-            return {k: _walk_alias_with_qualified(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [_walk_alias_with_qualified(x) for x in obj]
-        if isinstance(obj, str):
-            # first try local/unqualified map
-            if "." not in obj and obj in amap:
-                return amap[obj]
-            # then try qualified import alias
-            ent = _resolve_qualified_alias(obj)
-            if ent:
-                return ent
-        return obj
-
-    # Resolve only qualified aliases (ns.alias) and leave unqualified aliases intact.
-    # This keeps existing IR expectations while making qualified references usable.
-    def _walk_qualified_only(obj: Any) -> Any:
-        if isinstance(obj, dict):
-            return {k: _walk_qualified_only(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [_walk_qualified_only(x) for x in obj]
-        if isinstance(obj, str):
-            if "." in obj:
-                ent = _resolve_qualified_alias(obj)
-                if ent:
-                    return ent
-        return obj
-    
+    # One memoized resolver per mode, built once the alias map is complete:
+    # - full: local/unqualified aliases, then qualified 'ns.aliasName'
+    # - qualified only: leaves unqualified aliases intact (existing IR
+    #   expectations) while making qualified references usable by codegen;
+    #   without an `import ... as ns` there are none, and it is a no-op
+    full_aliases = AliasResolver(amap, _resolve_qualified_alias)
+    qualified_aliases = AliasResolver(amap, _resolve_qualified_alias if qualified_prefixes else None,
+                                      bare=False)
+    # Conditions are hash-consed: equal subexpressions share one node build-wide
+    exprs = ctx.exprs if ctx is not None else ExprTable()
+
+    # Simplify a clause condition before interning it. A condition that is
+    # always false stays in the IR as expr False (so later clauses keep their
+    # automation ids); codegen emits no automation for it. The expression as
+    # written is kept as "trigger_expr": the automation still triggers on
+    # every entity it mentions, even those simplification removed.
+    simplified: List[Dict[str, Any]] = []
+
+    def _simplify_condition(cond: Any, rule: str, clause_no: int) -> Any:
+        if not isinstance(cond, dict) or "expr" not in cond:
+            return cond
+        notes: List[str] = []
+        expr = _simplify_expr(cond["expr"], notes, exprs)
+        if not notes:
+            return cond
+        simplified.append({"rule": rule, "clause": clause_no, "eliminated": notes,
+                           "unreachable": expr is False})
+        out = dict(cond)
+        out["expr"] = expr
+        out["trigger_expr"] = cond["expr"]
+        return out
+
     for s in expanded_statements:
         if isinstance(s, Rule):
             clauses: List[dict] = []
@@ -566,8 +701,9 @@ def analyze(prog: Program) -> IRProgram:
                 if hasattr(c, "condition") and hasattr(c, "actions"):
                     # Keep alias identifiers intact for tests & codegen (resolve later)
                     # But resolve qualified aliases (ns.alias) so codegen gets real entities
-                    cond = _walk_qualified_only(c.condition)
-                    acts = _walk_qualified_only(c.actions)
+                    cond = _simplify_condition(qualified_aliases.tree(c.condition), s.name, len(clauses) + 1)
+                    cond = exprs.intern(cond)
+                    acts = qualified_aliases.tree(c.actions)
                     clauses.append({"condition": cond, "actions": acts})
                 elif isinstance(c, dict) and c.get("type") == "schedule_use":
                     # {"type":"schedule_use","names":[...]}
@@ -589,16 +725,27 @@ def analyze(prog: Program) -> IRProgram:
                 elif isinstance(c, dict) and c.get("type") == "arm_when":
                     if arm_when is not None:
                         raise ValueError(f"rule '{s.name}': only one 'arm when' clause is allowed")
-                    arm_when = _walk_qualified_only(c.get("condition") or {})
+                    arm_when = qualified_aliases.tree(c.get("condition") or {})
+                    arm_notes: List[str] = []
+                    arm_expr = _simplify_expr(arm_when.get("expr"), arm_notes, exprs) if "expr" in arm_when else None
+                    # a constant arm condition would leave nothing to trigger on: keep it as written
+                    if arm_notes and not isinstance(arm_expr, bool):
+                        simplified.append({"rule": s.name, "clause": "arm", "eliminated": arm_notes,
+                                           "unreachable": False})
+                        arm_when = dict(arm_when)
+                        arm_when["trigger_expr"] = arm_when["expr"]
+                        arm_when["expr"] = arm_expr
+                    arm_when = exprs.intern(arm_when)
                 elif isinstance(c, dict) and c.get("type") == "at":
                     clauses.append({
                         "type": "at",
-                        "time": _walk_qualified_only(c.get("time")),
-                        "actions": _walk_alias_with_qualified(c.get("actions") or []),
+                        "time": qualified_aliases.tree(c.get("time")),
+                        "actions": full_aliases.tree(c.get("actions") or []),
                     })
                 elif isinstance(c, dict) and "condition" in c and "actions" in c:
-                    cond = _walk_alias_with_qualified(c["condition"])
-                    acts = _walk_alias_with_qualified(c["actions"])
+                    cond = _simplify_condition(full_aliases.tree(c["condition"]), s.name, len(clauses) + 1)
+                    cond = exprs.intern(cond)
+                    acts = full_aliases.tree(c["actions"])
                     clauses.append({"condition": cond, "actions": acts})
                 else:
                     # ignore unknown fragments
@@ -655,6 +802,17 @@ def analyze(prog: Program) -> IRProgram:
                 if href not in local_holidays:
                     raise ValueError(f"schedule '{sched_name}': unknown holidays '{href}'")
 
+    # -------- merge overlapping / touching / cancelled windows --------
+    merged_schedules: List[Dict[str, Any]] = []
+    for kind, table, normalize in (("windows", sched_windows, _normalize_windows),
+                                   ("clauses", scheds, _normalize_clauses)):
+        for sched_name, items in table.items():
+            reduced = normalize(items)
+            if reduced is not items:
+                table[sched_name] = reduced
+                merged_schedules.append({"schedule": sched_name, "kind": kind,
+                                         "before": len(items), "after": len(reduced)})
+
     # materialize holidays into plain dicts for IR
     holidays_ir: Dict[str, dict] = {}
     for hid, h in local_holidays.items():
@@ -674,5 +832,7 @@ def analyze(prog: Program) -> IRProgram:
         rules=rules,
         schedules=scheds,
         schedules_windows=sched_windows,
-        holidays=holidays_ir
+        holidays=holidays_ir,
+        simplified=simplified,
+        merged_schedules=merged_schedules,
     )
@@ -0,0 +1,135 @@
+# hassl/semantics/exports.py
+"""
+Registry of the public symbols of every package in a build.
+
+It is a mapping (pkg, kind, name) -> node, like the plain dict the CLI
+used to publish as analyzer.GLOBAL_EXPORTS, and can be used wherever that
+dict was. On top of it the registry keeps:
+
+- per package, per kind: name -> node, so a glob import reads one module's
+  exports and a lookup never scans the whole project;
+- per kind: (pkg, name) -> node, in insertion order, for the codegen
+  passes that want e.g. every exported alias;
+- a trie over the *reversed* segments of the package ids, so the partial
+  module ids users write ('hall.aliases' for 'home.hall.aliases') resolve
+  in time proportional to the number of segments.
+"""
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+Key = Tuple[str, str, str]
+
+_EMPTY: Dict[str, Any] = {}
+
+class _SuffixNode:
+    __slots__ = ("children", "packages")
+
+    def __init__(self):
+        self.children: Dict[str, "_SuffixNode"] = {}
+        self.packages = set()   # every package whose id ends with the path to this node
+
+class ExportRegistry(MutableMapping):
+    def __init__(self, items: Optional[Mapping[Key, Any]] = None):
+        self._items: Dict[Key, Any] = {}
+        self._by_pkg: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._by_kind: Dict[str, Dict[Tuple[str, str], Any]] = {}
+        self._suffixes = _SuffixNode()
+        if items:
+            self.update(items)
+
+    @classmethod
+    def of(cls, exports: Optional[Mapping[Key, Any]]) -> "ExportRegistry":
+        """exports itself if it already is a registry, else a registry built from it."""
+        if isinstance(exports, cls):
+            return exports
+        return cls(exports or None)
+
+    # ---- mapping protocol ----
+
+    def __getitem__(self, key: Key) -> Any:
+        return self._items[key]
+
+    def __setitem__(self, key: Key, node: Any) -> None:
+        pkg, kind, name = key
+        if pkg not in self._by_pkg:
+            self._by_pkg[pkg] = {}
+            self._trie_add(pkg)
+        self._by_pkg[pkg].setdefault(kind, {})[name] = node
+        self._by_kind.setdefault(kind, {})[(pkg, name)] = node
+        self._items[key] = node
+
+    def __delitem__(self, key: Key) -> None:
+        del self._items[key]
+        pkg, kind, name = key
+        kinds = self._by_pkg[pkg]
+        del kinds[kind][name]
+        if not kinds[kind]:
+            del kinds[kind]
+        if not kinds:
+            del self._by_pkg[pkg]
+            self._trie_remove(pkg)
+        del self._by_kind[kind][(pkg, name)]
+
+    def __iter__(self) -> Iterator[Key]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key) -> bool:
+        return key in self._items
+
+    def get(self, key, default=None):
+        return self._items.get(key, default)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._items!r})"
+
+    # ---- indexes ----
+
+    def has_package(self, pkg: str) -> bool:
+        return pkg in self._by_pkg
+
+    def packages(self):
+        return self._by_pkg.keys()
+
+    def module_exports(self, pkg: str, kind: str) -> Dict[str, Any]:
+        """name -> node for the exports of one kind from pkg (read-only view)."""
+        return self._by_pkg.get(pkg, _EMPTY).get(kind, _EMPTY)
+
+    def of_kind(self, kind: str):
+        """((pkg, name), node) for every export of a kind, in insertion order."""
+        return self._by_kind.get(kind, _EMPTY).items()
+
+    def resolve_module(self, raw_mod: str) -> str:
+        """
+        Package id for an import of raw_mod: raw_mod itself if it is a
+        package, else the one package whose id ends with '.' + raw_mod.
+        Ambiguous or unknown ids are returned unchanged.
+        """
+        if not raw_mod or raw_mod in self._by_pkg:
+            return raw_mod
+        node = self._suffixes
+        for seg in reversed(raw_mod.split(".")):
+            node = node.children.get(seg)
+            if node is None:
+                return raw_mod
+        if len(node.packages) == 1:
+            return next(iter(node.packages))
+        return raw_mod
+
+    def _trie_add(self, pkg: str) -> None:
+        node = self._suffixes
+        for seg in reversed(pkg.split(".")):
+            node = node.children.setdefault(seg, _SuffixNode())
+            node.packages.add(pkg)
+
+    def _trie_remove(self, pkg: str) -> None:
+        node = self._suffixes
+        for seg in reversed(pkg.split(".")):
+            child = node.children[seg]
+            child.packages.discard(pkg)
+            if not child.packages:
+                del node.children[seg]
+                return
+            node = child
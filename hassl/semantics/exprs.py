@@ -0,0 +1,222 @@
+# hassl/semantics/exprs.py
+"""
+Expression trees: shape helpers, an iterative tree fold and hash-consing.
+
+Conditions are plain dict trees. Comparisons are {"op": "<", "left": ...,
+"right": ...}, negation is {"op": "not", "value": ...}, and `and`/`or`
+are n-ary: {"op": "and", "args": [...]}, flattened by the parser, so 200
+OR'd sensors are one node with 200 operands instead of a 200-level chain.
+The older binary form {"op": "or", "left": ..., "right": ...} (cached
+ASTs, hand-built trees) is still accepted everywhere: use operands().
+
+fold_tree() walks a tree with an explicit stack, so no walker depends on
+the recursion limit, and visits each distinct container once.
+
+ExprTable interns trees: intern() returns, for any dict/list tree, the one
+canonical node of that structure, so equal subexpressions -- `lux < 50` in
+fifty rules -- become a single shared object with a small integer
+structural id. With the table on the CompileContext this holds across all
+packages of a build.
+
+Interned nodes are shared, so they are read-only; a node of a new
+structure becomes canonical itself rather than being copied, so a tree is
+read-only once it has been interned. Key order is part of the structure,
+so an interned tree serializes exactly like the original.
+
+Codegen keys its memos on the structural id (see memo()): a subexpression
+is rendered once per build no matter how many rules contain it.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+JUNCTIONS = ("and", "or")
+
+def is_junction(node: Any) -> bool:
+    """True for an and/or node, n-ary or binary."""
+    return (isinstance(node, dict) and node.get("op") in JUNCTIONS
+            and ("args" in node or "left" in node))
+
+def operands(node: dict) -> List[Any]:
+    """Operands of an and/or node: its args, or [left, right] in the binary form."""
+    args = node.get("args")
+    if args is not None:
+        return args
+    return [node.get("left"), node.get("right")]
+
+def junction(op: str, args: List[Any]) -> Dict[str, Any]:
+    return {"op": op, "args": args}
+
+def expr_children(node: Any) -> Optional[List[Any]]:
+    """
+    Children of a boolean expression node for fold_tree: the operands of
+    and/or, the value of not, the items of a list. Comparisons and any
+    other value are leaves.
+    """
+    if isinstance(node, dict) and "op" in node:
+        if is_junction(node):
+            return operands(node)
+        if node["op"] == "not":
+            return [node["value"]]
+        return None
+    if isinstance(node, list):
+        return node
+    return None
+
+def _tree_children(node: Any) -> Optional[List[Any]]:
+    if isinstance(node, dict):
+        return list(node.values())
+    if isinstance(node, list):
+        return node
+    return None
+
+def fold_tree(root: Any, leaf: Callable[[Any], Any], combine: Callable[[Any, List[Any]], Any],
+              children: Callable[[Any], Optional[List[Any]]] = _tree_children) -> Any:
+    """
+    Bottom-up fold without recursion. children(n) is None for a leaf
+    (folded with leaf(n)), else the nodes combine(n, results) receives the
+    results of, in order. By default every dict value and list item is a
+    child. A container reached twice (a shared subtree) is folded once.
+    """
+    top = children(root)
+    if top is None:
+        return leaf(root)
+    done: Dict[int, Any] = {}
+    stack: List[Tuple[Any, List[Any], bool]] = [(root, top, False)]
+    while stack:
+        node, kids, ready = stack.pop()
+        if id(node) in done:
+            continue
+        if not ready:
+            stack.append((node, kids, True))
+            # reversed, so the leftmost subtree is finished first
+            for child in reversed(kids):
+                if id(child) not in done:
+                    sub = children(child)
+                    if sub is not None:
+                        stack.append((child, sub, False))
+            continue
+        results = []
+        for child in kids:
+            hit = done.get(id(child), _MISSING)
+            results.append(leaf(child) if hit is _MISSING else hit)
+        done[id(node)] = combine(node, results)
+    return done[id(root)]
+
+_MISSING = object()
+
+def rebuild(node: Any, results: List[Any]) -> Any:
+    """combine() for fold_tree that copies a container only if one of its values changed."""
+    if isinstance(node, dict):
+        if all(r is v for r, v in zip(results, node.values())):
+            return node
+        return dict(zip(node.keys(), results))
+    if all(r is v for r, v in zip(results, node)):
+        return node
+    return list(results)
+
+def _leaf_key(value: Any) -> Tuple[str, Any]:
+    # type-tagged so 1, 1.0, True and "1" stay distinct
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))      # unhashable leaf: only shared with itself
+    return (type(value).__name__, value)
+
+class ExprTable:
+    def __init__(self):
+        self._by_key: Dict[Tuple[Any, ...], int] = {}
+        self._ids: Dict[int, int] = {}        # id(canonical node) -> structural id
+        self._nodes: List[Any] = []           # structural id -> canonical node
+        # id(tree interned before) -> (tree, canonical): interning it again is a lookup
+        self._seen: Dict[int, Tuple[Any, Any]] = {}
+        self._memos: Dict[str, Dict[int, Any]] = {}
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def id_of(self, node: Any) -> Optional[int]:
+        """Structural id of an interned node, None for anything else."""
+        return self._ids.get(id(node))
+
+    def node(self, sid: int) -> Any:
+        return self._nodes[sid]
+
+    def key(self, value: Any) -> Tuple[str, Any]:
+        """Hashable structural key of any value; containers are interned for it."""
+        if isinstance(value, (dict, list)):
+            return ("#", self._ids[id(self.intern(value))])
+        return _leaf_key(value)
+
+    def memo(self, name: str) -> Dict[int, Any]:
+        """A per-build memo keyed by structural id (e.g. one per renderer)."""
+        return self._memos.setdefault(name, {})
+
+    def intern(self, node: Any) -> Any:
+        """The canonical node equal to node (scalars are returned as they are)."""
+        if not isinstance(node, (dict, list)):
+            return node
+        canon = self._lookup(node)
+        if canon is not None:
+            return canon
+        # Post-order walk with an explicit stack (see fold_tree): a node is
+        # pushed back under a None marker while its containers are interned
+        # first. Containers interned before, by this call or an earlier one,
+        # are never entered again.
+        ids, seen = self._ids, self._seen
+        stack: List[Any] = [node]
+        while stack:
+            n = stack.pop()
+            if n is None:
+                self._canon(stack.pop())
+                continue
+            waiting = False
+            for v in (n.values() if isinstance(n, dict) else n):
+                if isinstance(v, (dict, list)) and id(v) not in ids:
+                    hit = seen.get(id(v))
+                    if hit is None or hit[0] is not v:
+                        if not waiting:
+                            stack.extend((n, None))
+                            waiting = True
+                        stack.append(v)
+            if not waiting and self._lookup(n) is None:   # (a container may be reached twice)
+                self._canon(n)
+        return self._lookup(node)
+
+    def _lookup(self, node: Any) -> Any:
+        # the canonical node of a container interned before, else None
+        if id(node) in self._ids:
+            return node
+        hit = self._seen.get(id(node))
+        if hit is not None and hit[0] is node:
+            return hit[1]
+        return None
+
+    def _canon(self, node: Any) -> None:
+        # node's containers are all interned: find or add its canonical node
+        if self._lookup(node) is not None:
+            return
+        is_dict = isinstance(node, dict)
+        items: List[Any] = []
+        parts: List[Any] = ["d" if is_dict else "l"]
+        for k, v in (node.items() if is_dict else enumerate(node)):
+            if isinstance(v, (dict, list)):
+                v = self._lookup(v)
+                part = ("#", self._ids[id(v)])
+            else:
+                part = v if type(v) is str else _leaf_key(v)   # a str is its own key
+            items.append(v)
+            parts.append((k, part) if is_dict else part)
+        key = tuple(parts)
+        sid = self._by_key.get(key)
+        if sid is not None:
+            self.hits += 1
+            self._seen[id(node)] = (node, self._nodes[sid])
+            return
+        if any(a is not b for a, b in zip(items, node.values() if is_dict else node)):
+            canon = dict(zip(node.keys(), items)) if is_dict else items
+            self._seen[id(node)] = (node, canon)
+        else:
+            canon = node              # nothing to replace: the node itself is canonical
+        self._ids[id(canon)] = len(self._nodes)
+        self._nodes.append(canon)
+        self._by_key[key] = self._ids[id(canon)]
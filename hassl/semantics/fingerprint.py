@@ -0,0 +1,186 @@
+# hassl/semantics/fingerprint.py
+"""
+Fingerprints for incremental builds.
+
+A package has two:
+
+- its *source* fingerprint covers everything parsed for it (the Programs of
+  all its files), so any edit changes it;
+- its *interface* fingerprint covers only its public exports (aliases,
+  schedules, templates, as collected by cli._collect_public_exports), so
+  editing a private alias or any rule leaves it unchanged.
+
+A package's output depends on its own source, on the interfaces of the
+packages it imports and on the exported aliases/schedules named in its
+source (codegen resolves bare names against every package's exports, see
+codegen_fingerprint), nothing else. BuildState records these per package
+after a build; on the next build a package whose source fingerprint and
+dependencies are all unchanged is left as it is -- like a compiler that
+only recompiles dependents when an interface file changes.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional, Set, Tuple
+
+from .. import __version__
+from ..ast.nodes import UseTemplate
+from ..codegen.json_emit import _default
+from .exprs import fold_tree
+
+# Bump when the fingerprint inputs or the state layout change.
+STATE_FORMAT = 4
+
+EXPORT_KINDS = ("alias", "schedule", "template")
+
+def _canonical(obj) -> bytes:
+    return json.dumps(obj, default=_default, sort_keys=True, separators=(",", ":"),
+                      ensure_ascii=False).encode("utf-8")
+
+def source_fingerprint(programs: Iterable) -> str:
+    """Hash of the parsed Programs of one package (in file order)."""
+    return _source(programs)[0]
+
+def _source(programs: Iterable) -> Tuple[str, Set[str]]:
+    # the source fingerprint, and the bare names (and heads of dotted
+    # names) the Programs mention, from one serialization of each
+    h = hashlib.sha256()
+    names: Set[str] = set()
+    for prog in programs:
+        data = _canonical(prog)
+        h.update(data)
+        h.update(b"\0")
+        _mentions(json.loads(data), names)
+    return h.hexdigest(), names
+
+def _mentions(tree, names: Set[str]) -> None:
+    """Add to names the bare names (and heads of dotted names) in a JSON tree."""
+    def leaf(value):
+        if isinstance(value, str):
+            names.add(value.split(".", 1)[0])
+        return None
+    fold_tree(tree, leaf, lambda _node, _results: None)
+
+def interface_fingerprint(exports, pkg: str) -> str:
+    """Hash of pkg's public exports in an ExportRegistry; the package id itself is not part of it."""
+    h = hashlib.sha256()
+    for kind in EXPORT_KINDS:
+        table = exports.module_exports(pkg, kind)
+        for name in sorted(table):
+            h.update(f"{kind}\0{name}\0".encode("utf-8"))
+            h.update(_canonical(table[name]))
+            h.update(b"\0")
+    return h.hexdigest()
+
+def codegen_fingerprint(exports, names: Optional[Set[str]] = None) -> str:
+    """
+    Hash of the exports codegen reads project-wide: rules_min resolves
+    aliases against every exported alias and validates `schedule use`
+    against every exported schedule name, imported or not. With names,
+    only the exports of those names count -- the ones a package's source
+    can refer to, so editing any other public alias does not touch it.
+    """
+    h = hashlib.sha256()
+    for (pkg, name), node in sorted(exports.of_kind("alias"), key=lambda kv: kv[0]):
+        if names is None or name in names:
+            h.update(f"{pkg}\0{name}\0{getattr(node, 'entity', '')}\0".encode("utf-8"))
+    h.update(b"\1")
+    for (pkg, name) in sorted(k for k, _ in exports.of_kind("schedule")):
+        if names is None or name in names:
+            h.update(f"{pkg}\0{name}\0".encode("utf-8"))
+    return h.hexdigest()
+
+def package_fingerprints(nodes, exports) -> Dict[str, Tuple[str, Dict[str, Optional[str]]]]:
+    """
+    package -> (source fingerprint, {dependency: interface fingerprint}) for
+    the ModuleGraph nodes of a build. Dependencies are the packages its
+    imports resolve to the way analyze() resolves them (None when no
+    package exports under that id), plus '*' for codegen_fingerprint() of
+    the names its source mentions, and those in the bodies of the imported
+    templates it uses (expanded into the package, they resolve there).
+    """
+    interfaces: Dict[str, Optional[str]] = {}
+    out = {}
+    for pkg, node in nodes.items():
+        programs = [prog for _path, prog in node.sources]
+        source, names = _source(programs)
+        used = {s.name for prog in programs for s in getattr(prog, "statements", []) or []
+                if isinstance(s, UseTemplate)}
+        deps: Dict[str, Optional[str]] = {}
+        for prog in programs:
+            for imp in getattr(prog, "imports", []) or []:
+                if not isinstance(imp, dict) or imp.get("type") != "import" or not imp.get("module"):
+                    continue
+                dep = exports.resolve_module(imp["module"])
+                if dep == pkg or dep in deps:
+                    continue
+                if dep not in interfaces:
+                    interfaces[dep] = interface_fingerprint(exports, dep) if exports.has_package(dep) else None
+                deps[dep] = interfaces[dep]
+                templates = exports.module_exports(dep, "template")
+                for name in used & templates.keys():
+                    _mentions(json.loads(_canonical(templates[name].body)), names)
+        deps["*"] = codegen_fingerprint(exports, names)
+        out[pkg] = (source, deps)
+    return out
+
+class BuildState:
+    """
+    Per-output-directory record of the last build:
+    package -> {"source": fp, "deps": {imported package: interface fp or None}},
+    plus, when tree shaking, "shake": the package's shake.package_graph and
+    what was dropped from it (needed to shake packages that are skipped).
+    Stored as JSON in <cache_dir>/build/; `salt` (compiler version, output
+    options) invalidates the whole record when it changes.
+    """
+
+    def __init__(self, cache_dir, out_root, salt: str = ""):
+        key = hashlib.sha256(os.fspath(Path(out_root).resolve()).encode("utf-8")).hexdigest()
+        self.path = Path(cache_dir) / "build" / f"{key[:32]}.json"
+        self.salt = f"{STATE_FORMAT}\0{__version__}\0{salt}"
+        self.packages: Dict[str, dict] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("salt") == self.salt:
+            self.packages = data.get("packages") or {}
+
+    def up_to_date(self, pkg: str, source: str, deps: Mapping[str, Optional[str]]) -> bool:
+        prev = self.packages.get(pkg)
+        return prev is not None and prev.get("source") == source and prev.get("deps") == dict(deps)
+
+    def record(self, pkg: str, source: str, deps: Mapping[str, Optional[str]],
+               shake: Optional[dict] = None) -> None:
+        entry = {"source": source, "deps": dict(deps)}
+        if shake is not None:
+            entry["shake"] = shake
+        self.packages[pkg] = entry
+
+    def shake_info(self, pkg: str) -> Optional[dict]:
+        """The tree-shaking record of pkg's last build, if any."""
+        return (self.packages.get(pkg) or {}).get("shake")
+
+    def save(self, keep: Optional[Iterable[str]] = None) -> None:
+        """Write the state; keep: packages still in the build (others are dropped)."""
+        if keep is not None:
+            keep = set(keep)
+            self.packages = {k: v for k, v in self.packages.items() if k in keep}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=self.path.name, suffix=".tmp", dir=self.path.parent)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"salt": self.salt, "packages": self.packages}, f)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass  # best effort: the next build is simply a full one
@@ -0,0 +1,104 @@
+# hassl/semantics/intervals.py
+"""
+Clock window algebra for schedules.
+
+A clock window "S-E" is on for minutes S <= now < E of a day; E < S wraps
+past midnight (on for now >= S or now < E) and E == S is the whole day --
+the same reading codegen gives it (see _clock_between_cond). As a set of
+minutes of one day a window is one or two half-open intervals in
+[0, 1440), and schedules are unions (and, with legacy `disable`,
+differences) of such sets.
+
+The emitted conditions check the day selector, holiday and period on the
+current day, so the part of a wrapping window after midnight belongs to
+the same bucket as the part before it: windows in one bucket can be
+merged minute-wise. normalize_windows() turns the windows of one bucket
+into the fewest disjoint windows covering the same minutes: overlapping
+and touching windows are merged, duplicates dropped, and a set reaching
+both midnights is written back as one wrapping window.
+
+Only zero-padded HH:MM clock values take part; anything else (sun times,
+entities, seconds) is None from clock_minutes() and left to the caller.
+"""
+import re
+from typing import Any, Iterable, List, Optional, Tuple
+
+DAY = 24 * 60
+
+Interval = Tuple[int, int]
+
+_HHMM = re.compile(r"^([01]\d|2[0-3]):([0-5]\d)$")
+
+def clock_minutes(ts: Any) -> Optional[int]:
+    """Minute of day of "HH:MM" or {"kind": "clock", "value": "HH:MM"}, else None."""
+    if isinstance(ts, dict):
+        if ts.get("kind") != "clock":
+            return None
+        ts = ts.get("value")
+    if not isinstance(ts, str):
+        return None
+    m = _HHMM.match(ts)
+    if m is None:
+        return None
+    return int(m.group(1)) * 60 + int(m.group(2))
+
+def hhmm(minute: int) -> str:
+    return "%02d:%02d" % divmod(minute % DAY, 60)
+
+def window_intervals(start: int, end: int) -> List[Interval]:
+    """The minutes of window start-end as sorted half-open intervals."""
+    if start < end:
+        return [(start, end)]
+    if start == end:
+        return [(0, DAY)]
+    return [(0, end), (start, DAY)] if end else [(start, DAY)]
+
+def merge(intervals: Iterable[Interval]) -> List[Interval]:
+    """Sorted, disjoint union of intervals; touching ones are joined."""
+    out: List[Interval] = []
+    for s, e in sorted(i for i in intervals if i[0] < i[1]):
+        if out and s <= out[-1][1]:
+            if e > out[-1][1]:
+                out[-1] = (out[-1][0], e)
+        else:
+            out.append((s, e))
+    return out
+
+def subtract(base: Iterable[Interval], cut: Iterable[Interval]) -> List[Interval]:
+    """Minutes of base that are not in cut, merged."""
+    out: List[Interval] = []
+    cuts = merge(cut)
+    for s, e in merge(base):
+        for cs, ce in cuts:
+            if ce <= s or cs >= e:
+                continue
+            if cs > s:
+                out.append((s, cs))
+            s = max(s, ce)
+            if s >= e:
+                break
+        if s < e:
+            out.append((s, e))
+    return out
+
+def to_windows(intervals: List[Interval]) -> List[Tuple[int, int]]:
+    """
+    (start, end) windows for merged intervals: one per interval, except
+    that a set touching both midnights becomes a single wrapping window
+    and the whole day is (0, 0).
+    """
+    if intervals == [(0, DAY)]:
+        return [(0, 0)]
+    spans = list(intervals)
+    wrap = None
+    if len(spans) > 1 and spans[0][0] == 0 and spans[-1][1] == DAY:
+        wrap = (spans[-1][0], spans[0][1])
+        spans = spans[1:-1]
+    windows = [(s, e % DAY) for s, e in spans]
+    if wrap is not None:
+        windows.append(wrap)
+    return windows
+
+def normalize_windows(windows: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """The fewest disjoint (start, end) windows on the same minutes as windows."""
+    return to_windows(merge(i for s, e in windows for i in window_intervals(s, e)))
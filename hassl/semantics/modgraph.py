@@ -0,0 +1,215 @@
+# hassl/semantics/modgraph.py
+"""
+Package dependency graph.
+
+One node per package, one edge per (normalized) import of another package
+in the build. Strongly connected components are found with an iterative
+Tarjan pass, which also yields them dependencies-first, so the build order
+(analysis, then codegen) falls out of the same walk. Missing imports are
+autoloaded from --module-root with a worklist: each import is looked at
+once, when its importer enters the graph.
+
+Everything is linear in packages + imports.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..ast.nodes import Program
+from ..parser.sources import BUNDLE_SUFFIX
+
+def _normalize_module(importing_pkg: str, mod: str) -> str:
+    """
+    Resolve Python-like relative module notation to an absolute dotted id.
+    Examples (importing_pkg='home.addie.automations'):
+      '.shared'   -> 'home.addie.shared'
+      '..shared'  -> 'home.shared'
+      'std.shared' (absolute) stays 'std.shared'
+    """
+    if not mod:
+        return mod
+    if not mod.startswith("."):
+        return mod  # already absolute
+    # Count leading dots
+    i = 0
+    while i < len(mod) and mod[i] == ".":
+        i += 1
+    rel = mod[i:]  # tail after dots (may be '')
+    base_parts = (importing_pkg or "").split(".")
+    # Pop one level per dot
+    up = i - 1  # '.x' means stay at same depth + replace last segment -> up=0
+    if up > 0 and up <= len(base_parts):
+        base_parts = base_parts[:len(base_parts) - up]
+    elif up > len(base_parts):
+        base_parts = []
+    if rel:
+        return ".".join([p for p in base_parts if p] + [rel])
+    return ".".join([p for p in base_parts if p])
+
+def _module_to_path(module_root: Path, module: str) -> Path:
+    return (module_root / Path(module.replace(".", "/"))).with_suffix(".hassl")
+
+def imported_modules(prog: Program, pkg: str) -> Iterator[str]:
+    """Absolute module ids imported by prog (in source order, duplicates kept)."""
+    for imp in getattr(prog, "imports", []) or []:
+        if not isinstance(imp, dict) or imp.get("type") != "import":
+            continue
+        raw_mod = imp.get("module", "")
+        if raw_mod:
+            yield _normalize_module(pkg, raw_mod)
+
+@dataclass
+class ModuleNode:
+    package: str
+    sources: List[Tuple[Path, Program]] = field(default_factory=list)
+    imports: List[str] = field(default_factory=list)   # absolute module ids, first-seen order
+
+class ModuleGraph:
+    def __init__(self):
+        self.nodes: Dict[str, ModuleNode] = {}
+        self.loaded_as: Dict[str, str] = {}   # module id -> package of the file autoloaded for it
+        self._paths = set()
+        self._pending: List[str] = []         # packages whose imports autoload() has not seen yet
+
+    def add(self, path: Path, prog: Program, pkg: str) -> ModuleNode:
+        node = self.nodes.get(pkg)
+        if node is None:
+            node = self.nodes[pkg] = ModuleNode(pkg)
+        node.sources.append((path, prog))
+        self._paths.add(Path(path).resolve())
+        seen = set(node.imports)
+        for mod in imported_modules(prog, pkg):
+            if mod not in seen:
+                seen.add(mod)
+                node.imports.append(mod)
+        self._pending.append(pkg)
+        return node
+
+    def resolve(self, mod: str) -> Optional[str]:
+        """Package in the graph that satisfies an import of mod, if any."""
+        if mod in self.nodes:
+            return mod
+        return self.loaded_as.get(mod)
+
+    def autoload(self, module_root: Optional[Path], load: Callable[[Path], Program],
+                 log: Callable[[str], None] = print, index=None) -> List[ModuleNode]:
+        """
+        Parse the files of imported packages that are not in the graph yet,
+        looking them up as <module_root>/<a>/<b>.hassl (or the precompiled
+        <b>.hasslpkg) for module a.b, and follow their imports in turn. load(path) returns the parsed Program.
+        index: a parser.sources.SourceIndex of module_root; lookups then
+        come from it instead of the filesystem.
+        Returns the nodes that were added.
+        """
+        added = []
+        tried = set()
+        while self._pending:
+            importer = self._pending.pop()
+            for mod in self.nodes[importer].imports:
+                if mod == importer or mod in tried or self.resolve(mod) is not None:
+                    continue
+                tried.add(mod)
+                if not module_root:
+                    continue
+                if index is not None:
+                    candidate = index.lookup(mod)
+                    found = candidate is not None
+                    if not found:
+                        candidate = _module_to_path(module_root, mod)
+                else:
+                    candidate = _module_to_path(module_root, mod)
+                    found = candidate.exists()
+                    if not found and candidate.with_suffix(BUNDLE_SUFFIX).exists():
+                        candidate, found = candidate.with_suffix(BUNDLE_SUFFIX), True
+                if not found:
+                    log(f"[hasslc] Autoload candidate MISS for '{mod}': {candidate}")
+                    continue
+                if candidate.resolve() in self._paths:
+                    log(f"[hasslc] Autoload candidate SKIP (already loaded) for '{mod}': {candidate}")
+                    continue
+                log(f"[hasslc] Autoload candidate FOUND for '{mod}': {candidate}")
+                prog = load(candidate)
+                # prefer declared package; otherwise bind to module id
+                pkg = prog.package or mod
+                prog.package = pkg
+                self.loaded_as[mod] = pkg
+                added.append(self.add(candidate, prog, pkg))
+        return added
+
+    def edges(self, pkg: str) -> List[str]:
+        """Packages in the graph that pkg imports, in import order (self-imports ignored)."""
+        out = []
+        for mod in self.nodes[pkg].imports:
+            dep = self.resolve(mod)
+            if dep is not None and dep != pkg and dep not in out:
+                out.append(dep)
+        return out
+
+    def components(self) -> List[List[str]]:
+        """
+        Strongly connected components, dependencies before dependents
+        (Tarjan emits a component only after everything it reaches).
+        Iterative, so deep import chains cannot hit the recursion limit.
+        """
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        on_stack = set()
+        stack: List[str] = []
+        out: List[List[str]] = []
+        succ = {pkg: self.edges(pkg) for pkg in self.nodes}
+
+        for root in self.nodes:
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(succ[root]))]
+            while work:
+                v, it = work[-1]
+                for w in it:
+                    if w not in index:
+                        index[w] = low[w] = len(index)
+                        stack.append(w)
+                        on_stack.add(w)
+                        work.append((w, iter(succ[w])))
+                        break
+                    if w in on_stack and index[w] < low[v]:
+                        low[v] = index[w]
+                else:
+                    work.pop()
+                    if work:
+                        u = work[-1][0]
+                        if low[v] < low[u]:
+                            low[u] = low[v]
+                    if low[v] == index[v]:
+                        comp = []
+                        while True:
+                            w = stack.pop()
+                            on_stack.discard(w)
+                            comp.append(w)
+                            if w == v:
+                                break
+                        comp.reverse()
+                        out.append(comp)
+        return out
+
+    def cycles(self) -> List[List[str]]:
+        """Components that are import cycles, i.e. hold more than one package."""
+        return [c for c in self.components() if len(c) > 1]
+
+    def order(self) -> List[str]:
+        """Packages in build order: every package after the ones it imports (cycles kept together)."""
+        return [pkg for comp in self.components() for pkg in comp]
+
+    def build_order(self) -> Tuple[List[Tuple[Path, Program, str]], List[List[str]]]:
+        """
+        (path, program, package) triples in build order, plus the import
+        cycles found on the way -- one Tarjan pass for both.
+        """
+        comps = self.components()
+        cycles = [c for c in comps if len(c) > 1]
+        programs = [(path, prog, pkg)
+                    for comp in comps for pkg in comp
+                    for path, prog in self.nodes[pkg].sources]
+        return programs, cycles
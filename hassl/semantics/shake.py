@@ -0,0 +1,173 @@
+# hassl/semantics/shake.py
+"""
+Project-wide tree shaking of schedules, holiday sets and aliases.
+
+Every declared schedule costs Home Assistant a helper (input_boolean or
+template binary_sensor), mirror sensors, period sensors and per-minute
+maintenance automations, and every holiday set its sensors, whether or
+not anything uses them. This pass keeps only what is reachable:
+
+- roots are the rules and syncs of all packages in the build: the
+  schedules their `schedule use` clauses resolve to (IRRule.schedule_gates),
+  the names and entities they mention, and so the aliases of any package
+  these stand for, and any HASSL helper entity they mention directly;
+- a live schedule makes its windows' holiday sets live, and whatever its
+  clauses mention;
+- `--keep` patterns (fnmatch on "pkg.name", e.g. std.shared.* or
+  home.hall.night) keep declarations that are consumed outside HASSL --
+  dashboards, hand-written automations.
+
+Declarations are identified as "kind:pkg.name" (kind schedule, holiday or
+alias). References are "name:<bare name>", "target:<entity id>" and
+"entity:<helper entity id>". The graph of a package (package_graph) is
+plain JSON so incremental builds can record it for packages they do not
+re-analyze.
+
+An alias is reached by its name, from any package: codegen resolves bare
+names against the aliases exported by every package of the build, so
+`landing_light` in home.landing keeps std.shared's alias. It is reached
+by its entity too, since the analyzer replaces qualified `ns.alias`
+references with the entity.
+
+Templates need no pass of their own: they are expanded during analysis
+and never reach codegen.
+"""
+import re
+from dataclasses import replace
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .exprs import fold_tree
+
+KINDS = ("schedule", "holiday", "alias")
+_DECL_PREFIXES = tuple(f"{kind}:" for kind in KINDS)
+
+def _slug(s: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", str(s).lower()).strip("_")
+
+def _entity(eid: str) -> str:
+    domain, _, obj = eid.partition(".")
+    return f"entity:{domain.lower()}.{_slug(obj)}"
+
+def _decl(kind: str, pkg: str, name: str) -> str:
+    return f"{kind}:{pkg}.{name}" if pkg else f"{kind}:{name}"
+
+def decl_entities(decl: str) -> List[str]:
+    """Helper entity refs that stand for a schedule or holiday declaration in generated YAML."""
+    kind, _, qualified = decl.partition(":")
+    pkg, _, name = qualified.rpartition(".")
+    if kind == "schedule":
+        eids = [f"input_boolean.hassl_sched_{_slug(pkg)}_{_slug(name)}",
+                f"binary_sensor.hassl_schedule_{_slug(pkg)}_{_slug(name)}_active",
+                f"binary_sensor.hassl_schedule_automations_{_slug(name)}_active"]
+    elif kind == "holiday":
+        eids = [f"binary_sensor.hassl_holiday_{_slug(name)}",
+                f"binary_sensor.hassl_{_slug(name)}_not_holiday"]
+    else:
+        return []
+    return [_entity(e) for e in eids]
+
+def _refs(tree: Any, out: Set[str]) -> None:
+    """Add to out what the strings in tree may refer to: alias names, entities and HASSL helpers."""
+    def leaf(value):
+        if isinstance(value, str) and value:
+            head, dot, _ = value.partition(".")
+            out.add(f"name:{head}")
+            if dot:
+                out.add(f"target:{value}")
+            if value.startswith(("input_boolean.hassl_", "binary_sensor.hassl_")):
+                out.add(_entity(value))
+        return None
+    fold_tree(tree, leaf, lambda _node, _results: None)
+
+def package_graph(pkg: str, ir: Any) -> Dict[str, Any]:
+    """
+    {"uses": [refs of the rules and syncs], "decls": {decl: [refs]},
+    "aliases": {alias decl: entity}} for one analyzed package.
+    """
+    aliases = getattr(ir, "aliases", None) or {}
+    uses: Set[str] = set()
+    for r in getattr(ir, "rules", None) or []:
+        for gate in r.schedule_gates or []:
+            resolved = str(gate.get("resolved") or "")
+            if resolved:
+                pkg_part, _, name = resolved.rpartition(".")
+                uses.add(_decl("schedule", pkg_part or pkg, name))
+        _refs([r.clauses, r.arm_when, r.schedules_inline, r.schedule_uses], uses)
+    for s in getattr(ir, "syncs", None) or []:
+        _refs([s.members, s.invert], uses)
+
+    decls: Dict[str, List[str]] = {_decl("alias", pkg, name): [] for name in aliases}
+    for hid in getattr(ir, "holidays", None) or {}:
+        decls[_decl("holiday", pkg, hid)] = []
+    legacy = getattr(ir, "schedules", None) or {}
+    windows = getattr(ir, "schedules_windows", None) or {}
+    for name in list(legacy) + [n for n in windows if n not in legacy]:
+        refs: Set[str] = set()
+        for w in windows.get(name) or []:
+            if w.get("holiday_ref"):
+                refs.add(_decl("holiday", pkg, w["holiday_ref"]))
+        _refs([legacy.get(name) or [], windows.get(name) or []], refs)
+        decls[_decl("schedule", pkg, name)] = sorted(refs)
+    return {"uses": sorted(uses), "decls": decls,
+            "aliases": {_decl("alias", pkg, name): str(entity) for name, entity in aliases.items()}}
+
+def keep_matches(decl: str, keep: Iterable[str]) -> bool:
+    """True if a --keep pattern names decl, as "pkg.name" or "kind:pkg.name"."""
+    qualified = decl.partition(":")[2]
+    return any(fnmatchcase(qualified, p) or fnmatchcase(decl, p) for p in keep)
+
+def reachable(graphs: Dict[str, Dict[str, Any]], keep: Iterable[str] = (),
+              roots: Iterable[str] = ()) -> Set[str]:
+    """The live declarations of a build, given each package's graph."""
+    keep = list(keep)
+    edges: Dict[str, List[str]] = {}
+    for g in graphs.values():
+        for decl, refs in g["decls"].items():
+            edges[decl] = refs
+            for ent in decl_entities(decl):
+                edges.setdefault(ent, []).append(decl)
+        for decl, entity in g.get("aliases", {}).items():
+            edges.setdefault(f"name:{decl.rpartition('.')[2]}", []).append(decl)
+            edges.setdefault(f"target:{entity}", []).append(decl)
+    todo = list(roots)
+    for g in graphs.values():
+        todo.extend(g["uses"])
+    todo.extend(d for d in edges if d.startswith(_DECL_PREFIXES) and keep_matches(d, keep))
+    live: Set[str] = set()
+    while todo:
+        ref = todo.pop()
+        if ref in live:
+            continue
+        live.add(ref)
+        todo.extend(edges.get(ref, ()))
+    return {ref for ref in live if ref.startswith(_DECL_PREFIXES)}
+
+def dropped(graph: Dict[str, Any], live: Set[str]) -> List[str]:
+    """The declarations of one package's graph that are not live."""
+    return sorted(d for d in graph["decls"] if d not in live)
+
+def shake(ir: Any, pkg: str, drop: Iterable[str]) -> Any:
+    """ir without the declarations in drop (ir itself when there are none)."""
+    drop = set(drop)
+    if not drop:
+        return ir
+
+    def kept(kind: str, table: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if table is None:
+            return None
+        return {k: v for k, v in table.items() if _decl(kind, pkg, k) not in drop}
+
+    return replace(ir,
+                   aliases=kept("alias", ir.aliases),
+                   schedules=kept("schedule", ir.schedules),
+                   schedules_windows=kept("schedule", ir.schedules_windows),
+                   holidays=kept("holiday", ir.holidays))
+
+def describe(drop: Iterable[str]) -> str:
+    """'schedule a, b; holiday c' for a list of dropped declarations."""
+    by_kind: Dict[str, List[str]] = {}
+    for d in drop:
+        kind, _, qualified = d.partition(":")
+        by_kind.setdefault(kind, []).append(qualified.rpartition(".")[2])
+    return "; ".join(f"{kind} {', '.join(by_kind[kind])}" for kind in KINDS if kind in by_kind)
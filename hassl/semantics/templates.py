@@ -0,0 +1,226 @@
+# hassl/semantics/templates.py
+"""
+Template instantiation for `use template` statements.
+
+Expanding a use binds the call arguments to the template parameters,
+substitutes them through a plain (dict/list) copy of the template body and
+builds a concrete Rule, Sync or Schedule from the result.
+
+TemplateCache memoizes the expanded body per (template, bound arguments):
+a template used many times with the same arguments -- in one package or
+across a build, when the cache lives on the CompileContext -- is expanded
+once, and every use gets its own node (named after `as <name>`, the
+`name=` argument or the template) around the shared body.
+
+Different arguments go through the template's SubstitutionPlan, compiled
+once: the paths at which parameter names occur in the body. An expansion
+copies the containers on those paths and writes the arguments in, instead
+of deep-copying the body and comparing every string to the parameters.
+Expanded bodies share the rest with the plan and with each other, so they
+are read-only from here on; nothing downstream mutates AST nodes.
+"""
+import copy
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..ast.nodes import Rule, Schedule, Sync, TemplateDecl, UseTemplate
+
+def bind_args(t: TemplateDecl, call_args: List[Any]) -> Dict[str, Any]:
+    """Build the arg map (params -> values) of a use, defaults first."""
+    params = list(t.params or [])
+    # normalize params: [{"name":..., "default":...}, ...]
+    pnames = [p.get("name") for p in params]
+    defaults = {p.get("name"): p.get("default") for p in params}
+    bound: Dict[str, Any] = dict(defaults)
+    # split named vs positional args from transformer
+    pos: List[Any] = []
+    named: Dict[str, Any] = {}
+    for a in call_args or []:
+        if isinstance(a, dict) and "name" in a:
+            named[str(a["name"])] = a.get("value")
+        else:
+            pos.append(a)
+    # apply positional
+    for i, v in enumerate(pos):
+        if i < len(pnames):
+            bound[pnames[i]] = v
+    # apply named (wins over positional/default)
+    for k, v in named.items():
+        if k in pnames:
+            bound[k] = v
+    return bound
+
+def deep_subst(obj: Any, subst: Dict[str, Any]) -> Any:
+    """Deep substitute param identifiers appearing as bare strings in nested dict/list trees."""
+    # strings: replace only if exactly matches a parameter name
+    if isinstance(obj, str):
+        replacement = subst.get(obj, obj)
+        if isinstance(replacement, (dict, list)):
+            return copy.deepcopy(replacement)
+        return str(replacement)
+    # dicts/lists: walk recursively
+    if isinstance(obj, dict):
+        return {k: deep_subst(v, subst) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [deep_subst(x, subst) for x in obj]
+    # leave everything else as-is (numbers, bools, None)
+    return obj
+
+def _freeze(value: Any) -> Any:
+    """
+    Hashable form of a bound argument. Scalars are substituted as str(),
+    so 5 and "5" expand alike and share an entry.
+    """
+    if isinstance(value, dict):
+        return ("d", tuple(sorted(((str(k), _freeze(v)) for k, v in value.items()), key=repr)))
+    if isinstance(value, list):
+        return ("l", tuple(_freeze(v) for v in value))
+    return str(value)
+
+def _kind_of(body: Any) -> Optional[str]:
+    for cls, kind in ((Rule, "rule"), (Sync, "sync"), (Schedule, "schedule")):
+        if isinstance(body, cls) or getattr(body, "__class__", None).__name__ == cls.__name__:
+            return kind
+    return None
+
+def _ensure_body(t: TemplateDecl) -> None:
+    if t.body is None:
+        # Provide minimal empty bodies so deep_subst & constructors don’t break
+        if t.kind == "rule":
+            t.body = Rule(name="", clauses=[])
+        elif t.kind == "sync":
+            t.body = Sync(kind="onoff", members=[], name="", invert=[])
+        elif t.kind == "schedule":
+            t.body = Schedule(name="", clauses=[], windows=[], private=False)
+
+class SubstitutionPlan:
+    """
+    A template body compiled for substitution: its plain (dict/list) form
+    and the paths of the strings that name a parameter, as a trie
+    {key or index: sub-trie, or the parameter name at a slot}.
+    apply() clones only the containers on those paths and writes the
+    arguments into the slots; everything else is shared with the plain
+    body. The result equals deep_subst(plain, argmap).
+    """
+    __slots__ = ("plain", "slots", "_trie")
+
+    def __init__(self, t: TemplateDecl):
+        _ensure_body(t)
+        body = t.body
+        # Plainify dataclasses/objects so the slots can be found by walking them
+        if is_dataclass(body):
+            plain = asdict(body)
+        elif hasattr(body, "__dict__"):
+            # shallow mapping of fields; they will typically be lists/dicts we can walk
+            plain = copy.deepcopy(vars(body))
+        else:
+            plain = copy.deepcopy(body)
+        params = {p.get("name") for p in (t.params or []) if isinstance(p.get("name"), str)}
+        self.plain = plain
+        self.slots: List[Tuple[Tuple[Any, ...], str]] = []
+        self._trie: Dict[Any, Any] = {}
+        # iterative walk: (node, path)
+        todo = [(plain, ())]
+        while todo:
+            node, path = todo.pop()
+            if isinstance(node, dict):
+                todo.extend((v, path + (k,)) for k, v in node.items())
+            elif isinstance(node, list):
+                todo.extend((v, path + (i,)) for i, v in enumerate(node))
+            elif isinstance(node, str) and node in params and path:
+                self.slots.append((path, node))
+        self.slots.sort(key=lambda slot: repr(slot[0]))
+        for path, name in self.slots:
+            trie = self._trie
+            for key in path[:-1]:
+                trie = trie.setdefault(key, {})
+            trie[path[-1]] = name
+
+    def apply(self, argmap: Dict[str, Any]) -> Any:
+        if not isinstance(self.plain, (dict, list)):
+            return deep_subst(self.plain, argmap)
+        return self._clone(self.plain, self._trie, argmap)
+
+    def _clone(self, node: Any, trie: Dict[Any, Any], argmap: Dict[str, Any]) -> Any:
+        out = dict(node) if isinstance(node, dict) else list(node)
+        for key, sub in trie.items():
+            if isinstance(sub, dict):
+                out[key] = self._clone(node[key], sub, argmap)
+                continue
+            replacement = argmap.get(sub, sub)
+            if isinstance(replacement, (dict, list)):
+                out[key] = copy.deepcopy(replacement)
+            else:
+                out[key] = str(replacement)
+        return out
+
+def expand_body(t: TemplateDecl, argmap: Dict[str, Any],
+                plan: Optional[SubstitutionPlan] = None) -> Optional[Dict[str, Any]]:
+    """The constructor fields (all but the name) of t's body with argmap substituted."""
+    if plan is None:
+        plan = SubstitutionPlan(t)
+    subbed = plan.apply(argmap)
+    original = t.body
+    if not isinstance(subbed, dict):
+        subbed = {}
+
+    kind = _kind_of(original)
+    if kind == "rule":
+        return {"clauses": subbed.get("clauses", getattr(original, "clauses", []))}
+    if kind == "sync":
+        return {"kind": subbed.get("kind", getattr(original, "kind", "onoff")),
+                "members": subbed.get("members", getattr(original, "members", [])),
+                "invert": subbed.get("invert", getattr(original, "invert", []))}
+    if kind == "schedule":
+        return {"clauses": subbed.get("clauses", getattr(original, "clauses", [])),
+                "windows": subbed.get("windows", getattr(original, "windows", [])),
+                "private": subbed.get("private", getattr(original, "private", False))}
+    return None
+
+def build_node(t: TemplateDecl, fields: Dict[str, Any], name: str) -> Any:
+    """Concrete AST node of t's kind named `name` around the expanded fields."""
+    kind = _kind_of(t.body)
+    if kind == "rule":
+        return Rule(name=name, **fields)
+    if kind == "sync":
+        return Sync(name=name, **fields)
+    if kind == "schedule":
+        return Schedule(name=name, **fields)
+    return None
+
+class TemplateCache:
+    def __init__(self):
+        # (id(template), frozen args) -> (template, expanded fields); the template
+        # is kept so its id cannot be reused by another object while cached
+        self._entries: Dict[Tuple[int, Any], Tuple[TemplateDecl, Optional[Dict[str, Any]]]] = {}
+        self._plans: Dict[int, Tuple[TemplateDecl, SubstitutionPlan]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def plan(self, t: TemplateDecl) -> SubstitutionPlan:
+        """t's substitution plan, compiled on first use."""
+        entry = self._plans.get(id(t))
+        if entry is None or entry[0] is not t:
+            entry = self._plans[id(t)] = (t, SubstitutionPlan(t))
+        return entry[1]
+
+    def instantiate(self, t: TemplateDecl, use: UseTemplate) -> Any:
+        """Expand one use of t into a Rule/Sync/Schedule (None if the body is of no known kind)."""
+        argmap = bind_args(t, list(getattr(use, "args", []) or []))
+        key = (id(t), tuple(sorted((str(k), _freeze(v)) for k, v in argmap.items())))
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is t:
+            self.hits += 1
+            fields = entry[1]
+        else:
+            self.misses += 1
+            fields = expand_body(t, argmap, self.plan(t))
+            self._entries[key] = (t, fields)
+        if fields is None:
+            return None
+        # Rename resulting node if caller provided "as <name>" or passed name= param
+        new_name = getattr(use, "as_name", None) or str(argmap.get("name") or t.name)
+        return build_node(t, fields, new_name)
@@ -0,0 +1,64 @@
+# tests/test_alias_resolver.py
+from pathlib import Path
+
+from hassl.codegen.rules_min import generate_rules
+from hassl.context import CompileContext
+from hassl.semantics.aliases import AliasResolver, resolve_expr, resolve_package
+
+
+def test_tree_shares_unchanged_subtrees_and_memoizes_names():
+    calls = []
+
+    def qualified(name):
+        calls.append(name)
+        return {"ns.lamp": "light.kitchen"}.get(name)
+
+    r = AliasResolver({"fan": "fan.attic"}, qualified)
+    untouched = {"op": "==", "left": "light.porch", "right": "on"}
+    tree = {"op": "and", "left": untouched, "right": {"op": "==", "left": "fan", "right": "ns.lamp"}}
+    out = r.tree(tree)
+    assert out["left"] is untouched
+    assert out["right"] == {"op": "==", "left": "fan.attic", "right": "light.kitchen"}
+    assert tree["right"]["left"] == "fan"          # input left as it was
+    r.tree(tree)
+    assert calls.count("ns.lamp") == 1
+    assert AliasResolver({"fan": "fan.attic"}, qualified, bare=False).tree("fan") == "fan"
+    assert AliasResolver({"fan": "fan.attic"}, None, bare=False).tree(tree) is tree
+
+
+def test_resolve_expr_resolves_operands_and_collects_entities():
+    res = resolve_expr({"op": "or",
+                        "left": {"op": "==", "left": "motion", "right": "on"},
+                        "right": {"op": "not", "value": "switch.override"}},
+                       {"motion": "binary_sensor.hall", "on": "x.y"})
+    assert res.expr["left"] == {"op": "==", "left": "binary_sensor.hall", "right": "x.y"}
+    assert res.entities == ["binary_sensor.hall", "switch.override", "x.y"]
+
+
+def _ir():
+    return {
+        "aliases": {"lamp": "light.hall"},
+        "rules": [{
+            "name": "r",
+            "clauses": [{
+                "condition": {"expr": {"op": "==", "left": "lamp", "right": "on"}},
+                "actions": [{"type": "assign", "target": "lamp", "state": "off"},
+                            {"type": "attr_assign", "entity": "light.desk", "attr": "brightness", "value": 10}],
+            }],
+        }],
+        "syncs": [],
+    }
+
+
+def test_resolve_package_targets_in_action_order():
+    res = resolve_package(_ir(), {"lamp": "light.hall"})
+    rr = res.rules[0]
+    assert rr.conditions[0].entities == ["light.hall"]
+    assert rr.targets[0] == ["light.hall", "light.desk"]
+
+
+def test_generate_rules_emits_resolved_entities(tmp_path: Path):
+    out = tmp_path / "home"
+    generate_rules(_ir(), str(out), CompileContext())
+    text = (out / "rules_bundled_home.yaml").read_text()
+    assert "light.hall" in text and "lamp" not in text.replace("hassl", "")
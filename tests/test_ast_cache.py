@@ -0,0 +1,82 @@
+# tests/test_ast_cache.py
+import os
+import time
+from pathlib import Path
+
+from hassl import cli
+from hassl.cli import parse_cached, parse_hassl, parse_many
+from hassl.parser import cache as ast_cache
+from hassl.parser.cache import AstCache
+
+SRC = """
+package home.den
+alias lamp = light.den_lamp
+schedule evening:
+  on weekdays 18:00-23:00;
+rule den:
+  schedule use evening;
+  if (lamp == off) then lamp = on
+"""
+
+
+def _no_parse(*a, **kw):
+    raise AssertionError("source re-parsed despite a cache hit")
+
+
+def test_unchanged_source_skips_the_parser(tmp_path: Path, monkeypatch):
+    cache = AstCache(tmp_path / ".hassl-cache")
+    first = parse_cached(SRC, cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    monkeypatch.setattr(cli, "parse_hassl", _no_parse)
+    again = parse_cached(SRC, cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert again.to_dict() == first.to_dict() == parse_hassl(SRC).to_dict()
+    assert again is not first
+
+    programs, stats = parse_many([SRC, SRC], cache=cache)
+    assert stats.cached == 2 and stats.build_seconds == 0.0
+    assert [p.package for p in programs] == ["home.den", "home.den"]
+
+
+def test_key_covers_source_grammar_and_version(tmp_path: Path, monkeypatch):
+    cache = AstCache(tmp_path)
+    base = cache.key(SRC)
+    assert cache.key(SRC + "\n") != base
+
+    monkeypatch.setattr(ast_cache, "__version__", "0.0.0-test")
+    assert AstCache(tmp_path).key(SRC) != base
+    monkeypatch.undo()
+
+    monkeypatch.setattr(ast_cache, "grammar_sha", lambda: "0" * 64)
+    assert AstCache(tmp_path).key(SRC) != base
+
+
+def test_corrupt_entry_is_a_miss(tmp_path: Path):
+    cache = AstCache(tmp_path)
+    parse_cached(SRC, cache)
+    (entry,) = (tmp_path / "ast").glob("*/*.pickle")
+    entry.write_bytes(b"garbage")
+    assert cache.get(SRC) is None
+    assert not entry.exists()
+    assert parse_cached(SRC, cache).package == "home.den"
+
+
+def test_prune_by_age_then_size(tmp_path: Path):
+    cache = AstCache(tmp_path)
+    sources = [SRC.replace("den_lamp", f"lamp_{i}") for i in range(4)]
+    for i, text in enumerate(sources):
+        parse_cached(text, cache)
+        path = cache._path(cache.key(text))
+        stamp = time.time() - (4 - i) * 3600  # sources[0] is the oldest
+        os.utime(path, (stamp, stamp))
+
+    assert cache.prune(max_bytes=None, max_age=3.5 * 3600) == 1
+    assert cache.get(sources[0]) is None
+
+    # a hit refreshes the entry, so sources[1] now outlives sources[2]
+    assert cache.get(sources[1]) is not None
+    size = cache._path(cache.key(sources[1])).stat().st_size
+    assert cache.prune(max_bytes=2 * size, max_age=None) == 1
+    assert cache.get(sources[2]) is None
+    assert cache.get(sources[1]) is not None and cache.get(sources[3]) is not None
@@ -0,0 +1,35 @@
+# tests/test_ast_compact.py
+import pickle
+
+from hassl.ast import nodes
+from hassl.cli import parse_hassl
+
+SRC = """
+package home.compact
+alias lamp = light.den_lamp
+rule a:
+  if (light.den_lamp == on) then lamp = off
+rule b:
+  if (light.den_lamp == off) then lamp = on
+"""
+
+
+def test_nodes_are_slotted():
+    prog = parse_hassl(SRC)
+    for node in [prog, *prog.statements]:
+        assert not hasattr(node, "__dict__")
+    assert all("__slots__" in vars(c) for c in (nodes.Alias, nodes.Rule, nodes.Schedule,
+                                                nodes.ScheduleWindow, nodes.TemplateDecl))
+
+
+def test_identifiers_and_entity_ids_are_shared():
+    alias, rule_a, rule_b = parse_hassl(SRC).statements[1:]
+    left_a = rule_a.clauses[0].condition["expr"]["left"]
+    left_b = rule_b.clauses[0].condition["expr"]["left"]
+    assert left_a is left_b is alias.entity
+    assert rule_a.clauses[0].actions[0]["target"] is alias.name
+
+
+def test_slotted_program_round_trips_through_pickle():
+    prog = parse_hassl(SRC)
+    assert pickle.loads(pickle.dumps(prog)).to_dict() == prog.to_dict()
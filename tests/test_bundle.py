@@ -0,0 +1,77 @@
+# tests/test_bundle.py
+import shutil
+from pathlib import Path
+
+import pytest
+
+import hassl.cli as cli
+from hassl.cli import compile_tree
+from hassl.codegen.bundle import BundleError, MAGIC, bundle_path, read_bundle
+from hassl.context import CompileContext
+
+STD = """package std.shared
+alias landing = light.landing_main
+private alias dbg = light.debug
+schedule wake:
+  enable from 07:00 to 23:00;
+template rule motion(sensor, target):
+  if (sensor == on) then target = on for 5m
+"""
+
+SITE = """package home.site
+import std.shared.*
+rule r:
+  schedule use wake;
+  if (landing == on) then landing = off
+use template motion(sensor=binary_sensor.m, target=light.porch) as porch
+"""
+
+
+def _build_std(tmp_path: Path) -> Path:
+    lib = tmp_path / "lib"
+    (lib / "std").mkdir(parents=True)
+    (lib / "std" / "shared.hassl").write_text(STD)
+    bundles = tmp_path / "bundles"
+    compile_tree(lib, tmp_path / "lib_out", CompileContext(options={"bundle_out": bundles}))
+    return bundle_path(bundles, "std.shared")
+
+
+def test_bundle_holds_exports_and_templates(tmp_path: Path):
+    b = read_bundle(_build_std(tmp_path))
+    assert b.package == "std.shared"
+    assert sorted(b.exports) == [("alias", "landing"), ("schedule", "wake"), ("template", "motion")]
+    assert b.exports[("template", "motion")].body is not None
+
+
+def test_site_build_loads_bundles_without_parsing(tmp_path: Path, monkeypatch):
+    bundle = _build_std(tmp_path)
+    site = tmp_path / "site"
+    (site / "std").mkdir(parents=True)
+    (site / "home").mkdir()
+    shutil.copy(bundle, site / "std" / "shared.hasslpkg")
+    (site / "home" / "site.hassl").write_text(SITE)
+
+    full = compile_tree(site / "home", tmp_path / "ref", CompileContext(), module_root=site)
+
+    def no_parse(*a, **k):
+        raise AssertionError("bundled package was parsed")
+    monkeypatch.setattr(cli, "parse_cached", no_parse)
+    monkeypatch.setattr(cli, "parse_header", no_parse)
+    ctx = CompileContext()
+    built = compile_tree(site / "home", tmp_path / "out", ctx, module_root=site)
+
+    assert [pkg for pkg, _ in built] == ["home.site"]
+    assert not (tmp_path / "out" / "std_shared").exists()
+    assert built[0][1].to_dict() == full[0][1].to_dict()
+    assert len(built[0][1].rules) == 2   # the imported template was instantiated
+
+
+def test_foreign_or_outdated_bundles_are_rejected(tmp_path: Path):
+    bad = tmp_path / "x.hasslpkg"
+    bad.write_bytes(b"not a bundle")
+    with pytest.raises(BundleError):
+        read_bundle(bad)
+    import pickle
+    bad.write_bytes(MAGIC + pickle.dumps({"format": -1}))
+    with pytest.raises(BundleError, match="format"):
+        read_bundle(bad)
@@ -0,0 +1,51 @@
+# tests/test_compile_context.py
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from hassl.cli import compile_tree, parse_hassl
+from hassl.context import CompileContext
+from hassl.semantics import analyzer as sem_analyzer
+from hassl.semantics.analyzer import analyze
+
+
+def _project(root: Path, entity: str) -> Path:
+    (root / "std").mkdir(parents=True)
+    (root / "home").mkdir()
+    (root / "std" / "shared.hassl").write_text(f"package std.shared\nalias lamp = {entity}\n")
+    (root / "home" / "main.hassl").write_text(
+        "package home.main\n"
+        "import std.shared.*\n"
+        "rule r:\n  if (lamp == on) then lamp = off\n"
+    )
+    return root
+
+
+def test_context_exports_win_over_the_module_global():
+    shared = parse_hassl("package std.shared\nalias lamp = light.from_ctx\n")
+    main = parse_hassl("package home.main\nimport std.shared.*\n")
+    ctx = CompileContext()
+    ctx.exports[("std.shared", "alias", "lamp")] = shared.statements[1]
+    sem_analyzer.GLOBAL_EXPORTS = {}
+    assert analyze(main, ctx).aliases == {"lamp": "light.from_ctx"}
+
+
+def test_independent_builds_run_concurrently(tmp_path: Path):
+    jobs = [(_project(tmp_path / f"p{i}", f"light.lamp_{i}"), tmp_path / f"out{i}", f"light.lamp_{i}")
+            for i in range(8)]
+
+    def build(job):
+        src, out, _ = job
+        ctx = CompileContext()
+        compile_tree(src, out, ctx)
+        return ctx
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        contexts = list(pool.map(build, jobs))
+
+    for ctx, (src, out, entity) in zip(contexts, jobs):
+        ir = json.loads((out / "home_main" / "DEBUG_ir.json").read_text())
+        assert ir["aliases"] == {"lamp": entity}
+        rules = "".join(p.read_text() for p in (out / "home_main").glob("rules*.yaml"))
+        assert entity in rules
+        assert ctx.exports[("std.shared", "alias", "lamp")].entity == entity
@@ -0,0 +1,60 @@
+# tests/test_exports.py
+import pytest
+
+from hassl.ast.nodes import Alias, Schedule
+from hassl.cli import parse_hassl
+from hassl.semantics import analyzer as sem_analyzer
+from hassl.semantics.analyzer import analyze
+from hassl.semantics.exports import ExportRegistry
+
+
+def _alias(name, entity):
+    return Alias(name=name, entity=entity, private=False)
+
+
+def test_registry_is_a_drop_in_mapping():
+    plain = {
+        ("home.hall.aliases", "alias", "lamp"): _alias("lamp", "light.hall"),
+        ("home.hall.aliases", "schedule", "night"): Schedule(name="night", clauses=[]),
+        ("std.shared", "alias", "fan"): _alias("fan", "fan.attic"),
+    }
+    reg = ExportRegistry(plain)
+    assert dict(reg) == plain and len(reg) == 3
+    assert reg.get(("std.shared", "alias", "fan")).entity == "fan.attic"
+    assert list(reg.module_exports("home.hall.aliases", "alias")) == ["lamp"]
+    assert [k for k, _ in reg.of_kind("alias")] == [("home.hall.aliases", "lamp"), ("std.shared", "fan")]
+    assert ExportRegistry.of(reg) is reg
+
+    del reg[("std.shared", "alias", "fan")]
+    assert not reg.has_package("std.shared")
+    assert reg.module_exports("std.shared", "alias") == {}
+    assert reg.resolve_module("shared") == "shared"
+
+
+def test_partial_module_ids_resolve_by_suffix():
+    reg = ExportRegistry({
+        ("home.hall.aliases", "alias", "a"): _alias("a", "light.a"),
+        ("home.kitchen.aliases", "alias", "b"): _alias("b", "light.b"),
+        ("std.aliases", "alias", "c"): _alias("c", "light.c"),
+    })
+    assert reg.resolve_module("hall.aliases") == "home.hall.aliases"
+    assert reg.resolve_module("home.hall.aliases") == "home.hall.aliases"
+    assert reg.resolve_module("aliases") == "aliases"             # ambiguous: kept as written
+    assert reg.resolve_module("all.aliases") == "all.aliases"     # segments, not characters
+    assert reg.resolve_module("nowhere") == "nowhere"
+
+
+@pytest.mark.parametrize("wrap", [dict, ExportRegistry])
+def test_analyzer_accepts_plain_dicts_and_registries(wrap):
+    shared = parse_hassl("package home.hall.aliases\nalias lamp = light.hall_lamp\n")
+    main = parse_hassl(
+        "package home.main\n"
+        "import hall.aliases.*\n"
+        "rule r:\n  if (lamp == on) then lamp = off\n"
+    )
+    sem_analyzer.GLOBAL_EXPORTS = wrap({("home.hall.aliases", "alias", "lamp"): shared.statements[1]})
+    try:
+        ir = analyze(main)
+    finally:
+        sem_analyzer.GLOBAL_EXPORTS = {}
+    assert ir.to_dict()["aliases"] == {"lamp": "light.hall_lamp"}
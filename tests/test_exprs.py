@@ -0,0 +1,71 @@
+# tests/test_exprs.py
+from pathlib import Path
+
+from hassl.cli import compile_tree
+from hassl.context import CompileContext
+from hassl.semantics.exprs import ExprTable
+
+
+def test_intern_shares_equal_subtrees_and_keeps_types_apart():
+    t = ExprTable()
+    a = t.intern({"op": "and", "left": {"op": "<", "left": "sensor.lux", "right": 50}, "right": "x.y"})
+    b = t.intern({"op": "<", "left": "sensor.lux", "right": 50})
+    assert a["left"] is b
+    assert t.id_of(b) is not None and t.node(t.id_of(b)) is b
+    assert t.intern({"op": "<", "left": "sensor.lux", "right": 50.0}) is not b
+    assert t.intern({"right": 50, "op": "<", "left": "sensor.lux"}) is not b   # key order is kept
+    assert t.intern(b) is b and t.id_of({"op": "<"}) is None
+
+
+def test_intern_keeps_new_nodes_and_copies_only_to_share():
+    t = ExprTable()
+    lux = {"op": "<", "left": "sensor.lux", "right": 50}
+    tree = {"op": "or", "args": [lux, {"op": "==", "left": "x.y", "right": "on"}]}
+    assert t.intern(tree) is tree and t.intern(tree["args"][0]) is lux
+    again = {"op": "not", "value": {"op": "<", "left": "sensor.lux", "right": 50}}
+    canon = t.intern(again)
+    assert canon is not again and canon["value"] is lux and again["value"] is not lux
+    assert t.key(again) == t.key(canon) == ("#", t.id_of(canon))
+
+
+def test_shared_conditions_render_once_across_packages(tmp_path: Path):
+    src = tmp_path / "src"
+    for pkg in ("den", "hall"):
+        (src / pkg).mkdir(parents=True)
+        (src / pkg / "main.hassl").write_text(
+            f"package home.{pkg}\n"
+            f"alias lamp_{pkg} = light.{pkg}\n"
+            f"rule {pkg}_a:\n  if (sensor.lux < 50 && binary_sensor.m == on) then lamp_{pkg} = on\n"
+            f"rule {pkg}_b:\n  if (sensor.lux < 50 && binary_sensor.m == on) then lamp_{pkg} = off\n"
+        )
+    ctx = CompileContext()
+    built = compile_tree(src, tmp_path / "out", ctx)
+    assert len(built) == 2
+
+    rules = [r for _pkg, ir in built for r in ir.rules]
+    conds = [r.clauses[0]["condition"] for r in rules]
+    assert all(c is conds[0] for c in conds)
+    assert len(ctx.exprs.memo("ha_condition")) > 0
+
+    text = (tmp_path / "out" / "home_den" / "rules_bundled_home_den.yaml").read_text()
+    assert "&id" not in text and "*id" not in text
+    assert text.count("states(''sensor.lux'')|float(0) < 50") == 2
+
+
+def test_or_chains_are_flat_and_compile_without_deep_recursion(tmp_path: Path):
+    import sys
+    from hassl.cli import parse_hassl
+    from hassl.codegen.rules_min import _expr_to_template
+    from tests.util_compile import run_compile
+
+    n = sys.getrecursionlimit() * 2
+    doors = " || ".join(f"binary_sensor.door_{i}" for i in range(n))
+    src = f"package demo.doors\nalias siren = switch.siren\nrule doors:\n  if ({doors}) then siren = on\n"
+    expr = parse_hassl(src).statements[-1].clauses[0].condition["expr"]
+    assert expr["op"] == "or" and len(expr["args"]) == n
+
+    ir = run_compile(src, tmp_path / "out")
+    assert len(ir.rules[0].clauses[0]["condition"]["expr"]["args"]) == n
+    assert _expr_to_template({"op": "and", "args": ["a.b", "c.d", "e.f"]}) == (
+        "{{ (((is_state('a.b','on'))) and ((is_state('c.d','on'))) and ((is_state('e.f','on')))) }}"
+    )
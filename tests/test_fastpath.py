@@ -0,0 +1,56 @@
+# tests/test_fastpath.py
+import pytest
+
+from hassl.cli import parse_hassl
+from hassl.parser import loader
+from hassl.parser.fastpath import try_fast_parse
+
+REGISTRY = """package home.aliases
+
+// generated by dump_to_aliases.py
+alias kitchen_light = light.kitchen
+alias on = light.porch_on
+private alias hall = light . hall   // spaced entity
+alias\tattic_fan = fan.attic.main
+"""
+
+FAST = [
+    REGISTRY,
+    "import home.shared.*\nalias a = light.a\nimport std.x: y, z as w\nimport std.y as yy\nimport aliases\n",
+    "package a.b\npackage c.d\nalias z = q.r\r\n",
+    "\n// nothing but comments\n",
+    "",
+]
+
+SLOW = [
+    "package a\n",                                   # single-segment package: a syntax error
+    "alias x = a.b\n.c\n",                           # statement continues on the next line
+    "alias x = a.b alias y = c.d\n",                 # two statements on one line
+    "import a.b:\n  x, y\n",
+    "alias x = a.b;\n",
+    "alias m = binary_sensor.m\nrule r:\n  if (m == on) then m = off\n",
+]
+
+
+@pytest.mark.parametrize("text", FAST)
+def test_fast_path_matches_full_parse(text):
+    fast = try_fast_parse(text)
+    assert fast is not None
+    assert fast.to_dict() == parse_hassl(text, inline=False).to_dict()
+
+
+@pytest.mark.parametrize("text", SLOW)
+def test_anything_else_falls_back_to_the_grammar(text):
+    assert try_fast_parse(text) is None
+
+
+def test_alias_registry_skips_the_parser(monkeypatch):
+    def no_parser(*a, **kw):
+        raise AssertionError("alias registry went through the LALR parser")
+
+    monkeypatch.setattr(loader, "get_parser", no_parser)
+    text = "package home.aliases\n" + "".join(f"alias e_{i} = sensor.e_{i}\n" for i in range(2000))
+    prog = parse_hassl(text)
+    assert prog.package == "home.aliases"
+    assert len(prog.statements) == 2001
+    assert prog.statements[-1].entity == "sensor.e_1999"
@@ -0,0 +1,101 @@
+# tests/test_fingerprint.py
+from pathlib import Path
+
+from hassl.cli import _collect_public_exports, compile_tree, parse_hassl
+from hassl.context import CompileContext
+from hassl.semantics.exports import ExportRegistry
+from hassl.semantics.fingerprint import interface_fingerprint
+
+SHARED = """package std.shared
+alias lamp = light.lamp
+private alias dbg = light.debug_{n}
+schedule wake:
+  enable from 07:00 to 23:00;
+rule private_rule:
+  if (dbg == on) then dbg = off
+"""
+
+
+def _iface(text):
+    prog = parse_hassl(text)
+    return interface_fingerprint(ExportRegistry(_collect_public_exports(prog, "std.shared")), "std.shared")
+
+
+def test_interface_ignores_private_and_rule_changes():
+    base = _iface(SHARED.format(n=1))
+    assert _iface(SHARED.format(n=2)) == base
+    assert _iface(SHARED.format(n=1).replace("then dbg = off", "then dbg = on")) == base
+    assert _iface(SHARED.format(n=1).replace("light.lamp", "light.other")) != base
+    assert _iface(SHARED.format(n=1).replace("07:00", "08:00")) != base
+
+
+def _build(src, out, cache):
+    return [pkg for pkg, _ in compile_tree(src, out, CompileContext(cache_dir=str(cache)))]
+
+
+def test_dependents_rebuild_only_when_an_interface_changes(tmp_path: Path):
+    src, out, cache = tmp_path / "src", tmp_path / "out", tmp_path / "cache"
+    (src / "std").mkdir(parents=True)
+    (src / "home").mkdir()
+    shared = src / "std" / "shared.hassl"
+    shared.write_text(SHARED.format(n=1))
+    (src / "home" / "main.hassl").write_text(
+        "package home.main\nimport std.shared.*\n"
+        "rule r:\n  schedule use wake;\n  if (lamp == on) then lamp = off\n"
+    )
+
+    assert sorted(_build(src, out, cache)) == ["home.main", "std.shared"]
+    assert _build(src, out, cache) == []
+
+    shared.write_text(SHARED.format(n=2))                      # private change
+    assert _build(src, out, cache) == ["std.shared"]
+
+    shared.write_text(SHARED.format(n=2).replace("07:00", "06:00"))  # exported schedule changes
+    assert _build(src, out, cache) == ["std.shared", "home.main"]
+
+    ctx = CompileContext(cache_dir=str(cache), options={"rebuild": True})
+    assert len(compile_tree(src, out, ctx)) == 2
+
+
+def test_unrelated_public_alias_change_rebuilds_only_its_package(tmp_path: Path):
+    src, out, cache = tmp_path / "src", tmp_path / "out", tmp_path / "cache"
+    (src / "std").mkdir(parents=True)
+    (src / "home").mkdir()
+    (src / "std" / "shared.hassl").write_text(SHARED.format(n=1))
+    other = src / "std" / "other.hassl"
+    other.write_text("package std.other\nalias porch = light.porch\n")
+    (src / "home" / "main.hassl").write_text(
+        "package home.main\nimport std.shared.*\n"
+        "rule r:\n  schedule use wake;\n  if (lamp == on) then lamp = off\n"
+    )
+    assert len(_build(src, out, cache)) == 3
+
+    other.write_text("package std.other\nalias porch = light.porch_2\n")
+    assert _build(src, out, cache) == ["std.other"]
+
+    # a new export of a name the others mention still counts: bare names resolve project-wide
+    other.write_text("package std.other\nalias porch = light.porch_2\nalias lamp = light.other_lamp\n")
+    assert sorted(_build(src, out, cache)) == ["home.main", "std.other", "std.shared"]
+
+
+def test_alias_used_only_in_an_imported_template_rebuilds_its_users(tmp_path: Path):
+    src, out, cache = tmp_path / "src", tmp_path / "out", tmp_path / "cache"
+    (src / "lib").mkdir(parents=True)
+    (src / "site").mkdir()
+    (src / "lib" / "tpl.hassl").write_text(
+        "package lib.tpl\n"
+        "template rule motion_light(light):\n  if (hall_motion == on) then light = on\n"
+    )
+    sensors = src / "lib" / "sensors.hassl"
+    sensors.write_text("package lib.sensors\nalias hall_motion = binary_sensor.hall_motion_v1\n")
+    (src / "site" / "b.hassl").write_text(
+        "package site.b\nimport lib.tpl.*\n"
+        "use template motion_light(light=light.lamp) as hall_light\n"
+    )
+    assert len(_build(src, out, cache)) == 3
+
+    sensors.write_text("package lib.sensors\nalias hall_motion = binary_sensor.hall_motion_v2\n")
+    # lib.tpl mentions hall_motion itself; site.b only through the template it uses
+    assert sorted(_build(src, out, cache)) == ["lib.sensors", "lib.tpl", "site.b"]
+    emitted = "".join(p.read_text() for p in (out / "site_b").glob("*.yaml"))
+    assert "hall_motion_v2" in emitted and "hall_motion_v1" not in emitted
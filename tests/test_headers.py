@@ -0,0 +1,69 @@
+# tests/test_headers.py
+from pathlib import Path
+
+import pytest
+
+from hassl.cli import _collect_public_exports, compile_tree, parse_hassl
+from hassl.context import CompileContext
+from hassl.parser.headers import parse_header
+
+LIB = """package std.lib
+import std.base.*
+alias lamp = light.lamp
+private alias dbg = light.debug
+rule r1:
+  schedule use evening;
+  if (lamp == on && dbg == off) then lamp = off for 5m
+rule r2:
+  schedule
+    enable from 07:00 to 08:00;
+  if (lamp == off) then wait (lamp == on for 2m) lamp = off
+sync onoff [light.a, light.b] as pair
+schedule evening:
+  on weekdays 18:00-23:00;
+template rule motion(sensor, target, delay=5):
+  if (sensor == on) then target = on for 5m
+use template motion(sensor=binary_sensor.m, target=light.t) as porch
+holidays us:
+  country="US"
+"""
+
+
+def _exports(prog):
+    return _collect_public_exports(prog, "std.lib")
+
+
+def test_header_parse_has_the_same_exports_and_imports():
+    full, head = parse_hassl(LIB), parse_header(LIB)
+    assert _exports(head) == _exports(full)
+    assert head.package == full.package and head.imports == full.imports
+    assert not any(type(s).__name__ in ("Rule", "Sync", "UseTemplate") for s in head.statements)
+
+
+def test_rule_bodies_are_not_parsed():
+    src = LIB.replace("if (lamp == off) then", "if (((( lamp ==== then")
+    with pytest.raises(Exception):
+        parse_hassl(src)
+    assert _exports(parse_header(src)) == _exports(parse_hassl(LIB))
+
+
+def test_declarations_hidden_in_skipped_text_fall_back_to_a_full_parse():
+    src = "package std.lib\nsync onoff [a.b, c.d] as s2 alias q = r.s\n"
+    assert list(_exports(parse_header(src))) == [("std.lib", "alias", "q")]
+    with pytest.raises(Exception):
+        parse_header("rule r:\n  if (a == on) then b = on\nschedule s:\n  on daily 07:00-08:00;\n")
+
+
+def test_compile_with_header_only_dependencies(tmp_path: Path):
+    (tmp_path / "std").mkdir()
+    (tmp_path / "home").mkdir()
+    (tmp_path / "std" / "lib.hassl").write_text(LIB.replace("import std.base.*\n", ""))
+    (tmp_path / "home" / "main.hassl").write_text(
+        "package home.main\nimport std.lib.*\nrule r:\n  if (lamp == on) then lamp = off\n")
+
+    out = tmp_path / "out"
+    ctx = CompileContext(options={"header_only_deps": True})
+    built = compile_tree(tmp_path / "home", out, ctx, module_root=tmp_path)
+    assert [pkg for pkg, _ in built] == ["home.main"]
+    assert built[0][1].aliases == {"lamp": "light.lamp"}
+    assert not (out / "std_lib").exists()
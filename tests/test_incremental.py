@@ -0,0 +1,74 @@
+# tests/test_incremental.py
+import pytest
+
+from hassl.cli import parse_hassl
+from hassl.parser.incremental import IncrementalParse
+
+HEADER = """package home.big
+schedule evening:
+  on weekdays 18:00-23:00;
+"""
+
+
+def _rule(i):
+    return (f"alias l{i} = light.l{i}\n"
+            f"rule r{i}:\n"
+            f"  if (l{i} == off) then l{i} = on\n"
+            f"  if (l{i} == on) not_by this then l{i} = off for 5m\n")
+
+
+BIG = HEADER + "".join(_rule(i) for i in range(300))
+
+
+def _check(inc: IncrementalParse):
+    assert inc.program.to_dict() == parse_hassl(inc.text, inline=False).to_dict()
+    assert inc.spans == IncrementalParse(inc.text).spans
+
+
+def test_editing_one_rule_reparses_only_its_neighbourhood():
+    inc = IncrementalParse(BIG)
+    untouched = inc.statements[500]
+    at = BIG.index("rule r150:")
+    at = BIG.index("l150 = on", at)
+    inc.edit(at + len("l150 = "), at + len("l150 = on"), "off")
+    assert not inc.full_reparse and inc.reparsed <= 4
+    assert inc.statements[500] is untouched
+    _check(inc)
+
+
+@pytest.mark.parametrize("old, new", [
+    ("alias l7 = light.l7\n", ""),                                   # delete a statement
+    ("rule r7:\n", "rule r7:\n  schedule use evening;\n"),           # add a clause
+    ("alias l7 = light.l7\n", "alias l7 = light.l7\nalias x = a.b\n"),  # insert a statement
+    ("alias l8 = light.l8\nrule r8:\n", ""),                         # r8's clauses join r7
+    ("package home.big\n", "package home.bigger\n"),                 # first statement
+    ("l9 = off for 5m\n", "l9 = off for 5m\nalias tail = x.y\n"),    # ...and the last
+])
+def test_edits_match_a_full_parse(old, new):
+    text = HEADER + "".join(_rule(i) for i in range(10))
+    inc = IncrementalParse(text)
+    at = text.index(old)
+    inc.edit(at, at + len(old), new)
+    _check(inc)
+
+
+def test_update_diffs_the_change_and_errors_leave_state_alone():
+    text = HEADER + "".join(_rule(i) for i in range(5))
+    inc = IncrementalParse(text)
+    inc.update(text.replace("light.l3", "light.l3_main"))
+    assert not inc.full_reparse
+    _check(inc)
+
+    before = inc.program
+    with pytest.raises(Exception):
+        inc.update(inc.text.replace("rule r2:", "rule r2"))
+    assert inc.program is before
+    _check(inc)
+
+
+def test_wide_conditions_do_not_recurse():
+    wide = "alias x = light.x\nrule r:\n  if (" + " || ".join(f"a{i} == on" for i in range(3000)) + ") then x = on\n"
+    inc = IncrementalParse(wide)
+    _check(inc)
+    inc.update(wide.replace("then x = on", "then x = off"))
+    _check(inc)
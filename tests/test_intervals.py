@@ -0,0 +1,64 @@
+# tests/test_intervals.py
+from pathlib import Path
+
+import yaml
+
+from hassl.semantics.analyzer import _normalize_clauses
+from hassl.semantics.intervals import DAY, merge, normalize_windows, subtract
+from tests.util_compile import run_compile
+
+
+def _m(hhmm):
+    h, m = hhmm.split(":")
+    return int(h) * 60 + int(m)
+
+
+def test_merge_subtract_and_wrapping_windows():
+    assert merge([(60, 120), (120, 180), (30, 90), (300, 400)]) == [(30, 180), (300, 400)]
+    assert subtract([(0, DAY)], [(60, 120), (100, 200)]) == [(0, 60), (200, DAY)]
+    assert subtract([(60, 120)], [(0, DAY)]) == []
+    # 22:00-06:00 and 05:00-07:00 -> one wrapping window 22:00-07:00
+    assert normalize_windows([(_m("22:00"), _m("06:00")), (_m("05:00"), _m("07:00"))]) == [
+        (_m("22:00"), _m("07:00"))]
+    # equal start and end is the whole day and absorbs everything
+    assert normalize_windows([(_m("08:00"), _m("08:00")), (_m("09:00"), _m("10:00"))]) == [(0, 0)]
+    # disjoint windows stay as they are
+    assert normalize_windows([(60, 120), (180, 240)]) == [(60, 120), (180, 240)]
+
+
+def test_legacy_disable_is_subtracted_from_enables():
+    def clause(op, s, e):
+        return {"type": "schedule_clause", "op": op,
+                "from": {"kind": "clock", "value": s}, "to": {"kind": "clock", "value": e}}
+
+    out = _normalize_clauses([clause("enable", "07:00", "12:00"), clause("enable", "11:00", "23:00"),
+                              clause("disable", "07:00", "09:00")])
+    assert out == [clause("enable", "09:00", "23:00")]
+    assert _normalize_clauses([clause("enable", "07:00", "09:00"), clause("disable", "06:00", "10:00")]) == [
+        clause("disable", "00:00", "00:00")]
+    sun = [clause("enable", "07:00", "09:00"),
+           {"type": "schedule_clause", "op": "enable", "from": {"kind": "sun", "event": "sunset", "offset": "0s"},
+            "to": {"kind": "clock", "value": "23:00"}}]
+    assert _normalize_clauses(sun) is sun
+
+
+def test_overlapping_windows_emit_fewer_automations(tmp_path: Path):
+    src = """
+    package demo.windows
+    schedule work:
+      on weekdays 08:00-12:00;
+      on weekdays 11:00-17:00;
+      on weekdays 17:00-18:00;
+      on weekdays 08:00-12:00;
+      on weekends 10:00-12:00;
+    """
+    out = tmp_path / "out"
+    ir = run_compile(src, out)
+    wins = ir.schedules_windows["work"]
+    assert [(w["day_selector"], w["start"], w["end"]) for w in wins] == [
+        ("weekdays", "08:00", "18:00"), ("weekends", "10:00", "12:00")]
+    assert ir.merged_schedules == [{"schedule": "work", "kind": "windows", "before": 5, "after": 2}]
+
+    doc = yaml.safe_load((out / "schedule_out_work.yaml").read_text())
+    aliases = [a["alias"] for a in doc["automation"]]
+    assert sum(" on_" in a for a in aliases) == 2 and sum(" off_" in a for a in aliases) == 2
@@ -0,0 +1,62 @@
+# tests/test_json_emit.py
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from hassl.cli import parse_hassl
+from hassl.codegen import json_emit
+from hassl.codegen.json_emit import dump_json, dumps_json
+from hassl.semantics.analyzer import analyze
+
+SAMPLE = (Path(__file__).resolve().parents[1] / "sample.hassl").read_text()
+EXTRA = """
+package home.json
+holidays us:
+  country="US"
+schedule work:
+  during months Jan..Mar on weekdays 08:00-17:00 except holidays us;
+template rule t(a, b="café"):
+  if (a == on) then a = off
+use template t(a=light.x) as tx
+"""
+
+
+@pytest.mark.parametrize("text", [SAMPLE, EXTRA])
+def test_pretty_output_matches_to_dict_dumps(text):
+    prog = parse_hassl(text)
+    ir = analyze(prog)
+    assert dumps_json(prog) == json.dumps(prog.to_dict(), indent=2)
+    assert dumps_json(ir) == json.dumps(ir.to_dict(), indent=2)
+    assert dumps_json(ir.to_dict()) == json.dumps(ir.to_dict(), indent=2)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_compact_output_is_the_same_with_and_without_orjson(monkeypatch, use_orjson):
+    if use_orjson and json_emit.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(json_emit, "orjson", None)
+    prog = parse_hassl(EXTRA)
+    expected = json.dumps(prog.to_dict(), separators=(",", ":"), ensure_ascii=False)
+    assert dumps_json(prog, "compact") == expected
+
+
+def test_pretty_output_is_streamed_to_the_file():
+    writes = []
+
+    class Sink(io.StringIO):
+        def write(self, s):
+            writes.append(s)
+            return super().write(s)
+
+    sink = Sink()
+    dump_json(parse_hassl(SAMPLE), sink)
+    assert len(writes) > 10
+    assert json.loads(sink.getvalue())["type"] == "Program"
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        dumps_json({}, "yaml")
@@ -0,0 +1,80 @@
+# tests/test_modgraph.py
+from pathlib import Path
+
+from hassl.cli import parse_hassl
+from hassl.semantics.modgraph import ModuleGraph, _normalize_module
+
+
+def _graph(sources):
+    g = ModuleGraph()
+    for pkg, text in sources.items():
+        g.add(Path(f"{pkg}.hassl"), parse_hassl(text), pkg)
+    return g
+
+
+def test_normalize_relative_imports():
+    assert _normalize_module("home.addie.automations", ".shared") == "home.addie.automations.shared"
+    assert _normalize_module("home.addie.automations", "..shared") == "home.addie.shared"
+    assert _normalize_module("home.addie.automations", "std.shared") == "std.shared"
+
+
+def test_build_order_puts_imports_first():
+    g = _graph({
+        "home.app": "package home.app\nimport home.lights.*\nimport std.core.*\n",
+        "home.lights": "package home.lights\nimport home.core.*\nalias a = light.a\n",
+        "home.core": "package home.core\nimport std.core.*\n",
+        "std.core": "package std.core\nalias b = light.b\n",
+        "x.other": "package x.other\nimport not.in.build.*\n",
+    })
+    order = g.order()
+    assert sorted(order) == sorted(g.nodes)
+    pos = {pkg: i for i, pkg in enumerate(order)}
+    for pkg in g.nodes:
+        for dep in g.edges(pkg):
+            assert pos[dep] < pos[pkg]
+    assert g.cycles() == []
+
+
+def test_cycles_are_reported_and_kept_together():
+    g = _graph({
+        "p.a": "package p.a\nimport p.b.*\n",
+        "p.b": "package p.b\nimport p.c.*\n",
+        "p.c": "package p.c\nimport p.a.*\nimport p.d.*\n",
+        "p.d": "package p.d\nimport p.d.*\n",   # a self-import is not a cycle
+    })
+    programs, cycles = g.build_order()
+    assert [sorted(c) for c in cycles] == [["p.a", "p.b", "p.c"]]
+    assert [pkg for _, _, pkg in programs][0] == "p.d"
+
+
+def test_deep_chains_do_not_recurse():
+    n = 5000
+    g = ModuleGraph()
+    for i in range(n):
+        prog = parse_hassl(f"package c.m{i}\nimport c.m{i + 1}.*\n" if i + 1 < n else f"package c.m{i}\n")
+        g.add(Path(f"m{i}.hassl"), prog, f"c.m{i}")
+    assert g.order() == [f"c.m{i}" for i in reversed(range(n))]
+
+
+def test_autoload_follows_imports_from_module_root(tmp_path: Path):
+    (tmp_path / "std").mkdir()
+    (tmp_path / "std" / "shared.hassl").write_text("package std.shared\nimport std.base.*\nalias x = light.x\n")
+    (tmp_path / "std" / "base.hassl").write_text("alias y = light.y\n")   # package from module id
+    main = parse_hassl("package home.main\nimport std.shared.*\nimport std.gone.*\n")
+
+    g = ModuleGraph()
+    g.add(tmp_path / "home.hassl", main, "home.main")
+    loaded, log = [], []
+
+    def load(path):
+        loaded.append(path.name)
+        return parse_hassl(path.read_text())
+
+    g.autoload(tmp_path, load, log.append)
+    assert loaded == ["shared.hassl", "base.hassl"]
+    assert g.order() == ["std.base", "std.shared", "home.main"]
+    assert sum("MISS" in line for line in log) == 1
+
+    # nothing left to load: a second call is a no-op
+    g.autoload(tmp_path, load, log.append)
+    assert loaded == ["shared.hassl", "base.hassl"]
@@ -0,0 +1,137 @@
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from hassl.cli import parse_hassl, parse_many
+from hassl.parser.loader import get_parser, reset_parser
+
+SOURCES = [
+    """
+    package home.kitchen
+    alias light = light.kitchen
+    alias motion = binary_sensor.kitchen_motion
+    rule kitchen_motion:
+      if (motion) then light = on
+    """,
+    """
+    package home.hall
+    import home.kitchen.*
+    schedule evening:
+      enable from 18:00 to 23:00;
+    rule hall:
+      schedule use evening;
+      if (light == off) then light = on
+    """,
+]
+
+
+def test_parser_is_built_once_and_shared():
+    reset_parser()
+    first = get_parser()
+    parse_hassl(SOURCES[0])
+    assert get_parser() is first
+
+
+def test_parse_many_reports_build_and_parse_time_separately():
+    reset_parser()
+    programs, stats = parse_many(SOURCES)
+    assert [p.package for p in programs] == ["home.kitchen", "home.hall"]
+    assert stats.files == 2
+    assert stats.build_seconds > 0.0
+    assert stats.parse_seconds > 0.0
+
+    _, again = parse_many(SOURCES)
+    assert again.build_seconds < stats.build_seconds
+
+
+def test_shared_parser_is_thread_safe():
+    expected = [parse_hassl(s).to_dict() for s in SOURCES]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda s: parse_hassl(s).to_dict(), SOURCES * 16))
+    assert results == expected * 16
+
+
+def test_inline_transform_matches_tree_transform():
+    sample = Path(__file__).resolve().parents[1] / "sample.hassl"
+    extra = """
+    package home.extra
+    import home.kitchen: light as k_light, motion
+    import home.hall as hall
+    private alias porch = light.porch
+    holidays us:
+      country="US", workdays=[mon, tue, wed], add=["2025-11-28"]
+    schedule work:
+      during months Jan..Mar on weekdays 08:00-17:00 except holidays us;
+      on holidays us 10:00-12:00;
+    template rule motion_light(sensor, target, delay=5):
+      if (sensor == on) then target = on for 5m
+    use template motion_light(sensor=binary_sensor.m, target=light.t) as porch_motion
+    """
+    for text in SOURCES + [sample.read_text(), extra]:
+        tree_mode = parse_hassl(text, inline=False)
+        inline = parse_hassl(text, inline=True)
+        assert inline.to_dict() == tree_mode.to_dict()
+        assert repr(inline) == repr(tree_mode)
+    assert get_parser(inline=True) is not get_parser()
+
+
+def test_parse_tables_are_cached_on_disk(tmp_path, monkeypatch):
+    from hassl.parser import loader
+
+    monkeypatch.setenv("HASSL_CACHE_DIR", str(tmp_path))
+    loader.build_dynamic_parser()
+    (cached,) = tmp_path.glob("parser-*.lark")
+
+    import lark
+
+    class NoBuild(lark.Lark):
+        def __init__(self, *a, **kw):
+            raise AssertionError("parse tables rebuilt despite a valid cache")
+
+    monkeypatch.setattr("lark.Lark", NoBuild)
+    assert loader.build_dynamic_parser().parse("alias a = light.a") is not None
+
+
+def test_grammar_change_misses_the_cache(tmp_path, monkeypatch):
+    from hassl.parser import loader
+
+    monkeypatch.setenv("HASSL_CACHE_DIR", str(tmp_path))
+    grammar = loader.load_grammar_text()
+    assert loader.parser_cache_path(grammar) != loader.parser_cache_path(grammar + "\n// edited\n")
+
+    # a corrupt entry is rebuilt rather than trusted
+    loader.parser_cache_path(grammar).write_bytes(b"not a pickle")
+    assert loader.build_dynamic_parser().parse("alias a = light.a") is not None
+    assert loader.parser_cache_path(grammar).stat().st_size > 100
+
+
+def _run(code, **env):
+    root = Path(__file__).resolve().parents[1]
+    base = {k: v for k, v in os.environ.items() if k != "HASSL_DYNAMIC_PARSER"}
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, check=True,
+                         capture_output=True, text=True, env={**base, **env})
+    return out.stdout
+
+
+def test_standalone_parser_is_current_and_skips_lark_import():
+    from hassl.parser import hassl_standalone, loader
+
+    assert hassl_standalone.GRAMMAR_SHA256 == loader.grammar_sha(), \
+        "grammar changed: run python .tools/gen_standalone_parser.py"
+    code = (
+        "import sys; from hassl.cli import parse_hassl; "
+        "parse_hassl('alias a = light.a'); print('lark' in sys.modules)"
+    )
+    assert _run(code).strip() == "False"
+
+
+def test_standalone_and_dynamic_parsers_agree():
+    sample = Path(__file__).resolve().parents[1] / "sample.hassl"
+    code = (
+        "import json, sys; from hassl.cli import parse_hassl; "
+        f"print(json.dumps(parse_hassl(open({str(sample)!r}).read()).to_dict()))"
+    )
+    assert json.loads(_run(code)) == json.loads(_run(code, HASSL_DYNAMIC_PARSER="1"))
@@ -0,0 +1,98 @@
+# tests/test_shake.py
+from pathlib import Path
+
+from hassl.cli import compile_tree
+from hassl.context import CompileContext
+
+LIB = """package std.shared
+alias lamp = light.lamp
+holidays us:
+  country="US"
+holidays de:
+  country="DE"
+schedule work:
+  on weekdays 08:00-17:00 except holidays us;
+schedule night:
+  on weekdays 22:00-06:00;
+schedule legacy:
+  enable from 07:00 to 23:00;
+"""
+
+SITE = """package home.site
+import std.shared.*
+rule r:
+  schedule use {use};
+  if (lamp == on) then lamp = off
+"""
+
+
+def _tree(tmp_path: Path, use: str = "work") -> Path:
+    src = tmp_path / "src"
+    (src / "std").mkdir(parents=True, exist_ok=True)
+    (src / "home").mkdir(exist_ok=True)
+    (src / "std" / "shared.hassl").write_text(LIB)
+    (src / "home" / "site.hassl").write_text(SITE.format(use=use))
+    return src
+
+
+def _lib(built):
+    return dict(built)["std.shared"]
+
+
+def test_unreachable_schedules_and_holidays_are_dropped(tmp_path: Path):
+    src = _tree(tmp_path)
+    ir = _lib(compile_tree(src, tmp_path / "out", CompileContext()))
+    assert list(ir.schedules_windows) == ["work"] and ir.schedules == {}
+    assert list(ir.holidays) == ["us"]          # reached through work's window
+    assert ir.aliases == {"lamp": "light.lamp"}   # used by home.site, which imports it
+    names = {p.name for p in (tmp_path / "out" / "std_shared").iterdir()}
+    assert "schedule_std_shared_work.yaml" in names and "schedule_std_shared_night.yaml" not in names
+
+    ctx = CompileContext(options={"keep": ["std.shared.night", "*.de"]})
+    ir = _lib(compile_tree(src, tmp_path / "keep", ctx))
+    assert sorted(ir.schedules_windows) == ["night", "work"] and sorted(ir.holidays) == ["de", "us"]
+
+    ir = _lib(compile_tree(src, tmp_path / "all", CompileContext(options={"tree_shake": False})))
+    assert sorted(ir.schedules_windows) == ["night", "work"] and list(ir.schedules) == ["legacy"]
+
+
+def test_incremental_build_rebuilds_a_package_whose_dropped_set_changes(tmp_path: Path):
+    cache = tmp_path / "cache"
+    src = _tree(tmp_path)
+
+    def build():
+        return dict(compile_tree(src, tmp_path / "out", CompileContext(cache_dir=str(cache))))
+
+    assert sorted(build()) == ["home.site", "std.shared"]
+    assert build() == {}
+    # only home.site changed, but std.shared must now emit `legacy` and may drop `work`
+    _tree(tmp_path, use="legacy")
+    built = build()
+    assert sorted(built) == ["home.site", "std.shared"]
+    assert list(built["std.shared"].schedules) == ["legacy"] and built["std.shared"].schedules_windows == {}
+    assert build() == {}
+
+
+def test_aliases_used_by_importers_stay(tmp_path: Path, capsys):
+    src = tmp_path / "src"
+    (src / "std").mkdir(parents=True)
+    (src / "home").mkdir()
+    (src / "std" / "shared.hassl").write_text(
+        "package std.shared\n"
+        "alias landing_light = light.landing_main\n"
+        "alias hall = light.hall\n"
+        "alias porch = light.porch\n"
+        "alias unused = light.unused\n"
+        "private alias dbg = light.debug\n"
+    )
+    (src / "home" / "landing.hassl").write_text(
+        "package home.landing\n"
+        "import std.shared: landing_light, hall\n"
+        "import std.shared as shared\n"
+        "rule r:\n  if (hall == on) then landing_light = on\n"
+        "rule q:\n  if (shared.porch == on) then landing_light = off\n"
+    )
+    ir = _lib(compile_tree(src, tmp_path / "out", CompileContext()))
+    assert sorted(ir.aliases) == ["hall", "landing_light", "porch"]
+    log = capsys.readouterr().out
+    assert "Tree shaking std.shared: dropped alias dbg, unused" in log
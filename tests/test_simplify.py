@@ -0,0 +1,81 @@
+# tests/test_simplify.py
+from pathlib import Path
+
+import yaml
+
+from hassl.semantics.analyzer import _foldable, _simplify_expr
+from hassl.semantics.exprs import ExprTable
+from tests.util_compile import run_compile
+
+
+def _s(expr):
+    notes = []
+    return _simplify_expr(expr, notes), notes
+
+
+def test_folds_negation_duplicates_absorption_and_constants():
+    m = {"op": "==", "left": "binary_sensor.m", "right": "on"}
+    assert _s({"op": "not", "value": {"op": "not", "value": "x.y"}}) == ("x.y", ["double negation"])
+    assert _s({"op": "and", "left": m, "right": dict(m)}) == (m, ["duplicate operand"])
+    assert _s({"op": "or", "left": m, "right": {"op": "and", "left": m, "right": "x.y"}}) == (m, ["absorption"])
+    assert _s({"op": "and", "left": m, "right": {"op": "not", "value": m}})[0] is False
+    assert _s({"op": "or", "left": 0, "right": m})[0] == m
+    assert _s({"op": "<", "left": 3, "right": 2})[0] is False
+    # strings may be aliases: never folded
+    assert _s({"op": "==", "left": "a", "right": "a"}) == ({"op": "==", "left": "a", "right": "a"}, [])
+    untouched = {"op": "and", "left": m, "right": "x.y"}
+    assert _s(untouched)[0] is untouched
+
+
+def test_precheck_passes_only_what_can_fold_and_shares_keys():
+    m = {"op": "==", "left": "binary_sensor.m", "right": "on"}
+    t = ExprTable()
+    wide = {"op": "or", "args": [{"op": "==", "left": f"s.x{i}", "right": "on"} for i in range(50)]}
+    assert not _foldable(wide, t) and _simplify_expr(wide, [], t) is wide
+    assert t.id_of(wide["args"][0]) is not None      # keyed once, in the build's table
+    for foldable in ({"op": "and", "args": [m, True]},
+                     {"op": "and", "args": [m, {"op": "not", "value": "x.y"}]},
+                     {"op": "or", "args": [m, {"op": "or", "args": ["x.y", "x.z"]}]},
+                     {"op": "or", "args": [m, dict(m)]},
+                     {"op": "or", "args": [m, {"op": "and", "args": ["x.y", dict(m)]}]},
+                     {"op": "and", "args": [m, {"op": ">", "left": 1, "right": 2}]}):
+        assert _foldable(foldable, t), foldable
+
+
+def test_always_false_clause_emits_no_automation_and_keeps_ids(tmp_path: Path):
+    src = """
+    package demo.simplify
+    alias lamp = light.hall
+    alias motion = binary_sensor.hall
+    rule hall:
+      if (motion == on && 1 > 2) then lamp = on
+      if (!(!motion) && motion) then lamp = off
+    """
+    out = tmp_path / "out"
+    ir = run_compile(src, out)
+    assert [(n["clause"], n["unreachable"]) for n in ir.simplified] == [(1, True), (2, False)]
+    assert ir.rules[0].clauses[1]["condition"]["expr"] == "motion"
+
+    doc = yaml.safe_load((out / "rules_bundled_out.yaml").read_text())
+    assert [a["id"] for a in doc["automation"]] == ["hall__2"]
+
+
+def test_triggers_come_from_the_condition_as_written(tmp_path: Path):
+    src = """
+    package demo.triggers
+    alias lamp = light.hall
+    alias motion = binary_sensor.hall
+    alias lux = sensor.hall_lux
+    rule hall:
+      if (!(!motion) || (motion && lux < 10)) then lamp = on
+      if (motion || !motion) then lamp = off
+    """
+    out = tmp_path / "out"
+    ir = run_compile(src, out)
+    assert [c["condition"]["expr"] for c in ir.rules[0].clauses] == ["motion", True]
+
+    doc = yaml.safe_load((out / "rules_bundled_out.yaml").read_text())
+    triggers = {a["id"]: sorted(t.get("entity_id", t["platform"]) for t in a["trigger"])
+                for a in doc["automation"]}
+    assert triggers == {"hall__1": ["binary_sensor.hall", "sensor.hall_lux"],
+                        "hall__2": ["binary_sensor.hall"]}
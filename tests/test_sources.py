@@ -0,0 +1,67 @@
+# tests/test_sources.py
+import os
+from pathlib import Path
+
+from hassl.parser.sources import SourceIndex
+from hassl.semantics.modgraph import ModuleGraph
+from hassl.cli import parse_hassl
+
+
+def _touch(p: Path, text: str = "alias a = light.a\n"):
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(text)
+
+
+def _tree(root: Path):
+    _touch(root / "home" / "hall" / "aliases.hassl")
+    _touch(root / "home" / "main.hassl")
+    _touch(root / "std" / "shared.hassl")
+    _touch(root / "std" / "notes.txt", "not a source")
+    _touch(root / ".hidden" / "x.hassl")
+    _touch(root / "build" / "gen.hassl")
+    _touch(root / "home" / "scratch_tmp.hassl")
+    (root / ".hasslignore").write_text("# generated output\nbuild/\n*_tmp.hassl\n")
+
+
+def test_index_maps_module_ids_and_honours_hasslignore(tmp_path: Path):
+    _tree(tmp_path)
+    idx = SourceIndex(tmp_path)
+    assert sorted(idx.modules) == ["home.hall.aliases", "home.main", "std.shared"]
+    assert idx.lookup("home.hall.aliases") == tmp_path / "home" / "hall" / "aliases.hassl"
+    assert idx.lookup("home.gone") is None
+    assert idx.files == sorted(idx.files)
+
+
+def test_index_is_reused_until_a_directory_changes(tmp_path: Path):
+    root, cache = tmp_path / "src", tmp_path / "cache"
+    _tree(root)
+    first = SourceIndex(root, cache)
+    again = SourceIndex(root, cache)
+    assert (first.from_cache, again.from_cache) == (False, True)
+    assert again.modules == first.modules
+
+    _touch(root / "home" / "hall" / "new.hassl")
+    d = root / "home" / "hall"
+    st = d.stat()
+    os.utime(d, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))  # coarse-mtime filesystems
+    changed = SourceIndex(root, cache)
+    assert not changed.from_cache
+    assert "home.hall.new" in changed.modules
+
+    (root / ".hasslignore").write_text("")
+    st = (root / ".hasslignore").stat()
+    os.utime(root / ".hasslignore", ns=(st.st_atime_ns, st.st_mtime_ns + 2 * 10**9))
+    assert "home.scratch_tmp" in SourceIndex(root, cache).modules
+
+
+def test_autoload_resolves_imports_through_the_index(tmp_path: Path):
+    _touch(tmp_path / "std" / "shared.hassl", "package std.shared\nalias x = light.x\n")
+    idx = SourceIndex(tmp_path)
+    (tmp_path / "std" / "shared.hassl").rename(tmp_path / "std" / "moved.hassl")
+
+    g = ModuleGraph()
+    g.add(tmp_path / "home.hassl", parse_hassl("package home.main\nimport std.shared.*\n"), "home.main")
+    # the index is authoritative: the (stale) entry is used without probing the filesystem
+    seen = []
+    g.autoload(tmp_path, lambda p: seen.append(p) or parse_hassl("package std.shared\n"), lambda _m: None, index=idx)
+    assert seen == [tmp_path / "std" / "shared.hassl"]
@@ -0,0 +1,113 @@
+# tests/test_stream.py
+import io
+import mmap
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from hassl.cli import _collect_public_exports, parse_hassl
+from hassl.parser.loader import get_parser
+from hassl.parser.stream import iter_statements, parse_stream
+
+SRC = """package home.stream
+// keyword lines that do NOT start a statement:
+alias rule = light.rule_lamp
+rule r1:
+  if (rule == on) then
+  rule = off
+schedule use evening;
+  schedule on weekdays 08:00-09:00;
+holidays us:
+  country="US"
+private schedule evening:
+  on weekdays 18:00-23:00;
+template rule t(a):
+  if (a == on) then a = off
+use template t(a=x.y) as z
+sync onoff [a.b, c.d] as s2 alias q = r.s
+"""
+
+
+def test_stream_matches_full_parse_for_every_source_kind(tmp_path: Path):
+    expected = parse_hassl(SRC, inline=False).to_dict()
+    path = tmp_path / "s.hassl"
+    path.write_text(SRC, encoding="utf-8")
+
+    assert parse_stream(path).to_dict() == expected
+    assert parse_stream(str(path)).to_dict() == expected
+    assert parse_stream(io.StringIO(SRC)).to_dict() == expected
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert parse_stream(mm).to_dict() == expected
+
+
+def test_statements_are_yielded_before_the_input_is_exhausted():
+    def lines():
+        yield "alias a = light.a\n"
+        yield "alias b = light.b\n"
+        raise AssertionError("read past the second statement")
+
+    it = iter_statements(lines())
+    assert next(it).name == "a"
+
+
+def test_errors_report_lines_of_the_whole_input():
+    src = "alias a = b.c\n\nrule r:\n  if (a == on) then\nalias x = y.z\n"
+    with pytest.raises(Exception) as exc:
+        list(iter_statements(io.StringIO(src)))
+    assert exc.value.line == 5
+
+    src = "alias a = b.c\nrule r:\n  if (a == on)\n    then a = ?off\n"
+    with pytest.raises(Exception) as exc:
+        list(iter_statements(io.StringIO(src)))
+    assert (exc.value.line, exc.value.column) == (4, 14)
+    assert src[exc.value.pos_in_stream] == "?"
+
+
+def test_exports_can_be_collected_from_the_stream():
+    exports = _collect_public_exports(iter_statements(io.StringIO(SRC)), "home.stream")
+    assert sorted(k[1:] for k in exports) == [("alias", "q"), ("alias", "rule"), ("template", "t")]
+
+
+def _peak(n):
+    def lines():
+        yield "package big.reg\n"
+        for i in range(n):
+            yield f"alias l{i} = light.l{i}\n"
+            yield f"rule r{i}:\n"
+            yield f"  if (l{i} == on) then l{i} = off\n"
+
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in iter_statements(lines()))
+        return count, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_peak_memory_does_not_grow_with_input_size():
+    list(iter_statements(io.StringIO("alias w = a.b\n")))  # build the parser outside the measurement
+    # intern the input's identifiers up front: growing the interpreter's
+    # interned-string table (sized by whatever ran before) is not the parser's
+    _peak(800)
+    small_count, small = _peak(100)
+    big_count, big = _peak(800)
+    assert (small_count, big_count) == (201, 1601)
+    assert big < 2 * small
+
+
+def test_each_line_is_lexed_once(monkeypatch):
+    # `schedule` lines inside a rule are candidates that do not end it
+    src = "rule r:\n" + "".join(f"  schedule use s{i};\n" for i in range(50)) + "  if (a == on) then a = off\n"
+    ip_class = type(get_parser(inline=True).parse_interactive(""))
+    exhaust = ip_class.exhaust_lexer
+    lexed = []
+
+    def counting(self):
+        tokens = exhaust(self)
+        lexed.extend(tokens)
+        return tokens
+
+    monkeypatch.setattr(ip_class, "exhaust_lexer", counting)
+    assert [s.name for s in iter_statements(io.StringIO(src))] == ["r"]
+    assert len(lexed) == 3 + 50 * 4 + 10
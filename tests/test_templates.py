@@ -54,3 +54,54 @@ def test_template_rule_instantiates_and_gates(tmp_path):
         and a.get("target", {}).get("entity_id") == "light.kitchen_main"
         for a in actions
     ), "Expected action to turn on 'light.kitchen_main'"
+
+
+def test_identical_uses_share_one_expansion():
+    from hassl.cli import parse_hassl
+    from hassl.context import CompileContext
+    from hassl.semantics.analyzer import analyze
+
+    src = """
+    package demo.shared
+
+    template rule night_light(motion, light):
+      if (motion == on) then light = on
+
+    use template night_light(motion=binary_sensor.hall, light=light.hall) as hall_a
+    use template night_light(motion=binary_sensor.hall, light=light.hall) as hall_b
+    use template night_light(motion=binary_sensor.den, light=light.den) as den
+    """
+    ctx = CompileContext()
+    ir = analyze(parse_hassl(src), ctx)
+    names = [r.name for r in ir.rules]
+    assert names == ["hall_a", "hall_b", "den"]
+    assert ir.rules[0].clauses == ir.rules[1].clauses
+    assert ir.rules[2].clauses[0]["actions"][0]["target"] == "light.den"
+    assert (ctx.templates.misses, ctx.templates.hits) == (2, 1)
+
+    # a second package using the same template objects reuses the entries
+    analyze(parse_hassl(src), ctx)
+    assert len(ctx.templates) == 4   # new parse, new template identity
+
+
+def test_substitution_plan_matches_deep_subst():
+    from dataclasses import asdict
+    from hassl.cli import parse_hassl
+    from hassl.ast.nodes import TemplateDecl
+    from hassl.semantics.templates import SubstitutionPlan, bind_args, deep_subst
+
+    prog = parse_hassl("""
+    package demo.plan
+
+    template rule motion_light(motion, light, lux=lux_default):
+      if (motion == on && lux < 50) then light = on; wait (motion == off for 2m) light = off
+    """)
+    t = next(s for s in prog.statements if isinstance(s, TemplateDecl))
+    plan = SubstitutionPlan(t)
+    assert sorted(name for _path, name in plan.slots) == ["light", "light", "lux", "motion", "motion"]
+
+    argmap = bind_args(t, ["binary_sensor.den", {"name": "light", "value": "light.den"}])
+    out = plan.apply(argmap)
+    assert out == deep_subst(asdict(t.body), argmap)
+    assert plan.apply({"motion": "m.a", "light": "l.a", "lux": 5}) != out
+    assert plan.plain == asdict(t.body)   # the compiled body is never written to